@@ -0,0 +1,314 @@
+"""
+성능 벤치마크 (합성 데이터, 네트워크 불필요)
+전 종목 규모 일괄 계산의 소요 시간만 출력하며 pytest 수집 대상이 아님 (정확성 검증은 각 test_*.py)
+
+사용법:
+    python benchmarks.py                  # 전체 실행
+    python benchmarks.py technical_scan   # 이름 지정 실행
+"""
+
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+
+from src.models.panel import PricePanel
+
+
+BENCHMARKS: Dict[str, Callable[[], str]] = {}
+
+
+def benchmark(name: str):
+    """벤치마크 등록 (함수는 출력할 결과 문자열 반환)"""
+    def register(func: Callable[[], str]) -> Callable[[], str]:
+        BENCHMARKS[name] = func
+        return func
+    return register
+
+
+class Timer:
+    """with 블록 소요 시간 (초)"""
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.seconds = time.perf_counter() - self.start
+
+
+def random_close(n_dates: int, n_codes: int, seed: int, vol: float = 0.02) -> np.ndarray:
+    """랜덤워크 종가 (날짜 × 종목)"""
+    rng = np.random.default_rng(seed)
+    return np.round(10000 * np.exp(np.cumsum(rng.normal(0.0003, vol, size=(n_dates, n_codes)), axis=0)))
+
+
+def random_panel(n_dates: int, n_codes: int, seed: int) -> PricePanel:
+    """종가/거래량/거래대금 합성 패널"""
+    rng = np.random.default_rng(seed)
+    close = random_close(n_dates, n_codes, seed)
+    volume = np.round(rng.lognormal(12, 0.5, size=(n_dates, n_codes)))
+    dates = [f"2024{i:04d}" for i in range(n_dates)]
+    codes = [f"{i:06d}" for i in range(n_codes)]
+    return PricePanel(dates=dates, codes=codes, close=close, volume=volume, trading_value=close * volume)
+
+
+# =============================================================================
+# 기술적 분석
+# =============================================================================
+
+@benchmark("technical_scan")
+def bench_technical_scan() -> str:
+    """전 종목 기술적 일괄 스캔"""
+    from src.agents.technical_agent import TechnicalAgent
+    from src.api.krx_client import KrxClient
+
+    agent = TechnicalAgent(krx_client=KrxClient())
+    panel = random_panel(121, 2600, seed=1)
+    with Timer() as t:
+        agent.scan(panel)
+    return f"2600종목 × 121봉 스캔: {t.seconds:.2f}초"
+
+
+@benchmark("alert_update")
+def bench_alert_update() -> str:
+    """알림 엔진 봉 1개 증분 갱신"""
+    from src.analytics.alerts import AlertEngine
+
+    panel = random_panel(121, 2600, seed=2)
+    engine = AlertEngine(panel.codes, AlertEngine.default_rules())
+    engine.warm_up(panel._replace_rows(slice(0, 120)))
+    with Timer() as t:
+        engine.update(panel.dates[-1], panel.close[-1], panel.volume[-1])
+    return f"2600종목 1봉 갱신: {t.seconds * 1000:.1f}ms"
+
+
+# =============================================================================
+# 리스크 분석
+# =============================================================================
+
+@benchmark("risk_metrics")
+def bench_risk_metrics() -> str:
+    """전 종목 3년 구간 변동성/VaR/MDD 일괄 계산"""
+    from src.analytics.risk_engine import compute_risk_metrics
+
+    close = random_close(756, 2600, seed=4, vol=0.022)
+    codes = [f"{i:06d}" for i in range(close.shape[1])]
+    with Timer() as t:
+        compute_risk_metrics(close, codes)
+    return f"2600종목 × 756봉: {t.seconds:.2f}초"
+
+
+@benchmark("weekly_beta")
+def bench_weekly_beta() -> str:
+    """전 종목 156주 Beta 일괄 계산"""
+    from datetime import date, timedelta
+    from src.analytics.beta import ols_beta, weekly_returns
+
+    dates, day = [], date(2021, 1, 4)
+    while len(dates) < 785:
+        if day.weekday() < 5:
+            dates.append(day.strftime("%Y%m%d"))
+        day += timedelta(days=1)
+    close = random_close(785, 2600, seed=8)
+    index_close = random_close(785, 1, seed=9, vol=0.012)[:, 0]
+    codes = [f"{i:06d}" for i in range(close.shape[1])]
+    with Timer() as t:
+        _, stock_returns, market_returns = weekly_returns(dates, close, index_close)
+        ols_beta(stock_returns[-156:], market_returns[-156:], codes)
+    return f"2600종목 × 156주: {t.seconds:.3f}초"
+
+
+@benchmark("portfolio_risk")
+def bench_portfolio_risk() -> str:
+    """500종목 바스켓 공분산/리스크 기여도"""
+    from src.analytics.portfolio_risk import compute_portfolio_risk
+
+    close = random_close(253, 500, seed=3, vol=0.015)
+    codes = [f"{i:06d}" for i in range(close.shape[1])]
+    with Timer() as t:
+        compute_portfolio_risk(close, codes)
+    return f"500종목 × 252일: {t.seconds:.3f}초"
+
+
+@benchmark("monte_carlo_stress")
+def bench_monte_carlo_stress() -> str:
+    """전 종목 팩터 몬테카를로 스트레스 (청크 생성)"""
+    from src.analytics.stress import MonteCarloConfig, build_exposures, monte_carlo_stress
+
+    n = 2600
+    rng = np.random.default_rng(1)
+    codes = [f"{i:06d}" for i in range(n)]
+    sectors = [f"섹터{i % 20}" for i in range(n)]
+    exposures = build_exposures(codes, rng.uniform(0.5, 1.5, n), rng.uniform(0, 2, n), sectors=sectors)
+    with Timer() as t:
+        monte_carlo_stress(exposures, np.full(n, 0.015), MonteCarloConfig(n_paths=10_000, chunk_size=1_000))
+    return f"2600종목 × 10,000경로: {t.seconds:.2f}초"
+
+
+@benchmark("credit_scan")
+def bench_credit_scan() -> str:
+    """2,000개 기업 신용 스크리닝"""
+    from src.agents.risk_agent import RiskAgent
+    from src.analytics.credit import CREDIT_FIELDS
+    from src.models.fundamentals import FundamentalsTable
+
+    rng = np.random.default_rng(1)
+    n = 2000
+    assets = rng.uniform(1e10, 1e13, n)
+    ratios = {field: rng.uniform(-0.2, 1.0, n) for field in CREDIT_FIELDS}
+    ratios["total_assets"] = np.ones(n)
+    records = {
+        f"{i:06d}": {field: float(ratios[field][i] * assets[i]) for field in CREDIT_FIELDS}
+        for i in range(n)
+    }
+    table = FundamentalsTable.from_records(records, CREDIT_FIELDS)
+    agent = RiskAgent()
+    with Timer() as t:
+        metrics = agent.scan_credit_risk(table)
+    return f"2,000개 기업: {t.seconds * 1000:.1f}ms (고위험 {int((metrics.score >= 80).sum())}개)"
+
+
+@benchmark("correlation_clusters")
+def bench_correlation_clusters() -> str:
+    """2,000종목 상관행렬 + 군집"""
+    from src.analytics.concentration import cluster_labels, correlation_matrix
+
+    rng = np.random.default_rng(5)
+    factors = rng.normal(0, 0.02, size=(252, 30))
+    returns = factors[:, rng.integers(0, 30, 2000)] + rng.normal(0, 0.015, size=(252, 2000))
+    with Timer() as t:
+        labels = cluster_labels(correlation_matrix(returns), 0.6)
+    return f"2000종목: 군집 {labels.max() + 1}개, {t.seconds:.2f}초"
+
+
+@benchmark("liquidity")
+def bench_liquidity() -> str:
+    """전 종목 253일 ADTV/회전율/Amihud 일괄 계산"""
+    from src.analytics.liquidity import compute_liquidity_metrics
+
+    panel = random_panel(253, 2600, seed=9)
+    with Timer() as t:
+        compute_liquidity_metrics(panel, np.full(2600, 10_000_000.0))
+    return f"2600종목 × 253일: {t.seconds * 1000:.0f}ms"
+
+
+# =============================================================================
+# 센티먼트
+# =============================================================================
+
+def random_headlines(keywords, n: int, seed: int):
+    """키워드와 일반 단어를 섞은 합성 헤드라인 (일부는 공백 없이 연결)"""
+    rng = np.random.default_rng(seed)
+    vocabulary = list(keywords) + ["삼성전자", "3분기", "시장", "예상", "대비", "발표", "주가", "전년", " "]
+    return [
+        ("" if rng.random() < 0.3 else " ").join(rng.choice(vocabulary, size=rng.integers(3, 10)))
+        for _ in range(n)
+    ]
+
+
+@benchmark("keyword_automaton")
+def bench_keyword_automaton() -> str:
+    """헤드라인 1만 건: 오토마톤 vs 키워드 순차 검사 (확장 사전)"""
+    from src.utils.keyword_automaton import KeywordAutomaton
+
+    rng = np.random.default_rng(3)
+    syllables = list("가나다라마바사아자차카타파하강산전환실적증감")
+    keywords = {"".join(rng.choice(syllables, size=rng.integers(2, 5))): float(rng.uniform(-1, 1))
+                for _ in range(1500)}
+    automaton = KeywordAutomaton(keywords)
+    headlines = random_headlines(list(keywords)[:200], 10000, seed=41)
+
+    with Timer() as fast:
+        automaton.score_many(headlines)
+    with Timer() as naive:
+        for headline in headlines:
+            max(-1, min(1, sum(weight for keyword, weight in keywords.items() if keyword in headline)))
+    return (f"키워드 {len(keywords)}개 × 헤드라인 {len(headlines)}건: 오토마톤 {fast.seconds * 1000:.1f}ms, "
+            f"순차 검사 {naive.seconds * 1000:.1f}ms")
+
+
+@benchmark("consensus_metrics")
+def bench_consensus_metrics() -> str:
+    """2,000종목 × 1년 컨센서스 이력 일괄 지표"""
+    from src.storage.consensus_store import RECORD_DTYPE, compute_consensus_metrics, to_day
+
+    rng = np.random.default_rng(7)
+    start = to_day("2025-10-01")
+    histories = []
+    for _ in range(2000):
+        days = np.sort(rng.choice(365, size=int(rng.integers(0, 120)), replace=False)) + start
+        records = np.zeros(len(days), dtype=RECORD_DTYPE)
+        records["day"] = days
+        records["ratings"] = rng.integers(0, 6, size=(len(days), 5))
+        records["avg_target"] = np.where(rng.random(len(days)) < 0.1, np.nan, rng.normal(50000, 5000, len(days)))
+        records["median_target"] = records["avg_target"]
+        records["eps_current"] = np.round(rng.normal(3000, 300, len(days)), -1)
+        records["eps_next"] = np.nan
+        histories.append(records)
+    codes = [f"{i:06d}" for i in range(len(histories))]
+    with Timer() as t:
+        metrics = compute_consensus_metrics(codes, histories, "2026-09-30")
+    return f"{len(codes)}종목 / 스냅샷 {int(metrics.snapshots.sum()):,}개: {t.seconds * 1000:.1f}ms"
+
+
+@benchmark("keyword_matrix")
+def bench_keyword_matrix() -> str:
+    """과거 헤드라인 5만 개 키워드 행렬 생성 + 가중치 교체 재계산"""
+    from src.agents.sentiment_agent import SentimentAgent
+
+    agent = SentimentAgent(krx_client=object())
+    headlines = random_headlines(list(agent.positive_keywords) + list(agent.negative_keywords), 50000, seed=7)
+    with Timer() as build:
+        matrix = agent.keyword_matrix(headlines)
+    weights = np.random.default_rng(0).normal(size=matrix.n_keywords)
+    with Timer() as rescore:
+        for _ in range(20):
+            agent.score_texts(matrix, weights=weights)
+    return f"행렬 생성 {build.seconds * 1000:.0f}ms, 가중치 교체 재계산 {rescore.seconds / 20 * 1000:.2f}ms/회"
+
+
+@benchmark("sentiment_series")
+def bench_sentiment_series() -> str:
+    """2,000종목 × 1년 뉴스 일별 집계: 최초 로드 + 전 종목 볼륨 z-score 재계산"""
+    import tempfile
+    from src.storage.consensus_store import from_day, to_day
+    from src.storage.sentiment_store import DAILY_DTYPE, SentimentSeriesStore
+
+    rng = np.random.default_rng(7)
+    start = to_day("2025-10-01")
+    codes = [f"{i:06d}" for i in range(2000)]
+    with tempfile.TemporaryDirectory() as tmp:
+        for code in codes:
+            records = np.zeros(365, dtype=DAILY_DTYPE)
+            records["day"] = np.arange(start, start + 365)
+            records["count"] = rng.poisson(rng.uniform(0.5, 8), 365)
+            records["sentiment_sum"] = records["count"] * rng.uniform(-0.5, 0.5, 365)
+            (Path(tmp) / f"{code}.bin").write_bytes(records.tobytes())
+
+        store = SentimentSeriesStore(store_dir=Path(tmp))
+        with Timer() as load:
+            store.metrics(codes, as_of=from_day(start + 364))
+        with Timer() as recompute:
+            metrics = store.metrics(codes, as_of=from_day(start + 364))
+
+    signals = {s: metrics.volume_signal.count(s) for s in ("surge", "above_normal", "normal")}
+    return f"최초 로드 {load.seconds * 1000:.0f}ms, 재계산 {recompute.seconds * 1000:.1f}ms, 시그널 {signals}"
+
+
+def main(names) -> None:
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise SystemExit(f"알 수 없는 벤치마크: {', '.join(unknown)} (사용 가능: {', '.join(BENCHMARKS)})")
+
+    for name in names or list(BENCHMARKS):
+        print(f"{name:>24}: {BENCHMARKS[name]()}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
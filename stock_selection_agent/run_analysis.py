@@ -236,16 +236,22 @@ def run_oversold_screening(orchestrator: MasterOrchestrator, top_n: int = 20, sa
         min_dividend_yield=0
     )
 
-    # 경량 RSI 스크리닝 실행
+    # 경량 RSI 스캔 실행 (분포 1회 계산 후 임계값만 바꿔 적용)
     print("\n⏳ RSI 조회 중... (시총 1조 이상 종목 대상)")
-    oversold_results = orchestrator.run_rsi_screening(criteria, top_n=150, rsi_threshold=30.0)
+    distribution = orchestrator.run_rsi_scan(criteria, top_n=150)
+    oversold_results = distribution.below(30.0)
+
+    summary = distribution.summary()
+    if summary["count"]:
+        print(f"📊 RSI 분포 ({summary['count']}개): 평균 {summary['mean']} / 중앙값 {summary['median']} "
+              f"/ 과매도 {summary['oversold_pct']}% / 과매수 {summary['overbought_pct']}%")
 
     if not oversold_results:
         print("\n⚠️ RSI_14 <= 30인 과매도 종목이 없습니다.")
 
         # RSI 40 이하 종목이라도 보여주기
-        print("\n📊 참고: RSI_14 <= 40 종목 조회 중...")
-        relaxed_results = orchestrator.run_rsi_screening(criteria, top_n=150, rsi_threshold=40.0)
+        print("\n📊 참고: RSI_14 <= 40 종목")
+        relaxed_results = distribution.below(40.0)
 
         if relaxed_results:
             print(f"\n📊 RSI_14 <= 40 상위 {min(10, len(relaxed_results))}개 종목")
@@ -278,7 +284,7 @@ def _print_rsi_table(results: list):
     print("-" * 100)
 
     for i, result in enumerate(results, 1):
-        rsi = result["rsi_14"]
+        rsi = result["rsi"]
         rsi_status = result["rsi_status"]
         price_date_str = get_price_date_str(result)
         current_price_str = f"{result['current_price']:,}원 {price_date_str}"
@@ -305,6 +311,7 @@ def main():
   %(prog)s --screening --top 10              # 상위 10개 스크리닝
   %(prog)s --oversold --top 20               # RSI <= 30 과매도 종목 20개
   %(prog)s --stock 005930 --no-save          # 저장 없이 분석
+  %(prog)s --warm-industry-codes --screening # 업종코드 사전 조회 후 스크리닝
 
 환경 변수:
   DART_API_KEY    DART API 키 (재무 분석용)
@@ -327,6 +334,17 @@ def main():
         action="store_true",
         help="RSI_14 <= 30 과매도 종목 조회 (시총 1조 이상)"
     )
+    parser.add_argument(
+        "--warm-industry-codes",
+        action="store_true",
+        help="분석 전 전 종목 DART 업종코드 사전 조회 (동종업계 비교용, 저장된 종목은 생략)"
+    )
+    parser.add_argument(
+        "--max-dart-requests",
+        type=int,
+        default=None,
+        help="업종코드 사전 조회 최대 DART 호출 수 (기본: 제한 없음)"
+    )
     parser.add_argument(
         "--top", "-t",
         type=int,
@@ -379,14 +397,18 @@ def main():
 
     save = not args.no_save
 
+    if args.warm_industry_codes:
+        fetched = orchestrator.warm_industry_codes(args.max_dart_requests)
+        print(f"\n🏭 업종코드 사전 조회: {fetched}개 종목 신규 저장")
+
     if args.stock:
         analyze_stocks(orchestrator, args.stock, save)
     elif args.oversold:
         run_oversold_screening(orchestrator, args.top, save)
     elif args.screening:
         run_screening(orchestrator, args.top, save)
-    else:
-        # 기본: 삼성전자 분석
+    elif not args.warm_industry_codes:
+        # 기본: 삼성전자 분석 (업종코드 사전 조회만 요청한 경우 생략)
         print("\n💡 사용법: python run_analysis.py --help")
         print("\n📌 기본 예시: 삼성전자 (005930) 분석\n")
         analyze_stocks(orchestrator, ["005930"], save)
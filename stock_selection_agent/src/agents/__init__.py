@@ -7,7 +7,7 @@ from .screening_agent import ScreeningAgent, ScreeningCriteria
 from .financial_agent import FinancialAgent, FinancialAnalysisConfig
 from .valuation_agent import ValuationAgent, ValuationConfig, TargetPriceResult
 from .industry_agent import IndustryAgent, IndustryAnalysisConfig, IndustryAnalysisResult
-from .technical_agent import TechnicalAgent, TechnicalAnalysisConfig, TechnicalAnalysisResult
+from .technical_agent import TechnicalAgent, TechnicalAnalysisConfig, TechnicalAnalysisResult, TechnicalScan
 from .risk_agent import RiskAgent, RiskAnalysisConfig, RiskAnalysisResult
 from .sentiment_agent import SentimentAgent, SentimentAnalysisConfig, SentimentAnalysisResult
 from .master_orchestrator import MasterOrchestrator, OrchestratorConfig
@@ -26,6 +26,7 @@ __all__ = [
     "TechnicalAgent",
     "TechnicalAnalysisConfig",
     "TechnicalAnalysisResult",
+    "TechnicalScan",
     "RiskAgent",
     "RiskAnalysisConfig",
     "RiskAnalysisResult",
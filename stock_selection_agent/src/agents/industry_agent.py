@@ -4,12 +4,15 @@ DART API 및 KRX 데이터를 활용한 업종 분석
 """
 
 from typing import Dict, Any, Optional, List
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 import logging
 
 from ..api.dart_client import DartClient
 from ..api.krx_client import KrxClient
+from ..analytics.market_cap_rank import MarketCapRanks, build_market_cap_ranks
+from ..analytics.sector import SectorMomentum, blend_outlook, compute_sector_momentum
+from ..analytics.sector_valuation import SectorValuations, compute_sector_valuations, peer_comparison
 
 
 @dataclass
@@ -19,6 +22,16 @@ class IndustryAnalysisConfig:
     sector_outlook_weight: float = 0.3  # 업종 전망 가중치
     market_position_weight: float = 0.3  # 시장 내 위치 가중치
 
+    # 업종지수 모멘텀 (0이면 기본 전망 점수만 사용)
+    sector_momentum_weight: float = 0.5  # 업종 전망 점수 중 모멘텀 비중
+    sector_history_days: int = 250  # 업종지수 조회 기간 (달력일, 120거래일 상대강도 포함)
+
+    # 동종업계 밸류에이션 (거래일별 업종 집계)
+    peer_statistic: str = "trimmed_mean"  # 비교 기준: "mean", "median", "trimmed_mean"
+    peer_min_count: int = 5  # 동종업계로 인정할 최소 유효 PER 종목 수
+    position_score_top_n: int = 500  # 시장 위치 점수 기준 (상위 N 내 백분위, 밖은 중립 50)
+    fetch_industry_codes: bool = False  # 분석 중 업종코드 미저장 종목 DART 조회 (기본: 저장 매핑만, 사전 조회는 MasterOrchestrator.warm_industry_codes)
+
 
 @dataclass
 class IndustryAnalysisResult:
@@ -34,14 +47,22 @@ class IndustryAnalysisResult:
     sector_avg_pbr: Optional[float] = None
     per_vs_sector: Optional[float] = None  # +: 고평가, -: 저평가
     pbr_vs_sector: Optional[float] = None
-
-    # 업종 내 순위
+    sector_median_per: Optional[float] = None
+    sector_median_pbr: Optional[float] = None
+    peer_group: Optional[str] = None  # 비교 업종코드 접두어 ("ALL" = 시장 전체)
+    peer_count: Optional[int] = None
+
+    # 시가총액 순위 (전체 / 시장 내 / 업종 내)
+    market_cap_rank: Optional[int] = None
+    total_stocks: Optional[int] = None
+    market_cap_rank_in_market: Optional[int] = None
     market_cap_rank_in_sector: Optional[int] = None
     total_peers_in_sector: Optional[int] = None
 
     # 점수
     peer_comparison_score: float = 50.0
     sector_outlook_score: float = 50.0
+    sector_momentum: Dict[str, Any] = field(default_factory=dict)  # 업종지수 상대강도/추세/변동성
     market_position_score: float = 50.0
     total_score: float = 50.0
 
@@ -56,8 +77,8 @@ class IndustryAgent:
     기능:
     - DART API로 기업 업종 정보 조회
     - 동종업계 평균 밸류에이션 비교
-    - 업종 내 시가총액 순위 분석
-    - 업종 전망 평가
+    - 전체/시장 내/업종 내 시가총액 순위 분석
+    - 업종 전망 평가 (기본 전망 + 업종지수 상대강도/추세/변동성)
 
     사용법:
         agent = IndustryAgent(dart_client=dart, krx_client=krx)
@@ -131,6 +152,26 @@ class IndustryAgent:
         "운송": 50,
     }
 
+    # 섹터 -> KRX 업종지수 코드 (KOSPI 업종지수, 대응 지수가 없는 섹터는 기본 전망 점수만 사용)
+    SECTOR_INDEX = {
+        "IT/전자": "1013",  # 전기전자
+        "IT/소프트웨어": "1026",  # 서비스업
+        "헬스케어": "1009",  # 의약품
+        "자동차": "1015",  # 운수장비
+        "금융": "1021",  # 금융업
+        "소재": "1008",  # 화학
+        "산업재": "1012",  # 기계
+        "필수소비재": "1005",  # 음식료품
+        "경기소비재": "1006",  # 섬유의복
+        "에너지": "1008",  # 화학 (석유정제 포함)
+        "커뮤니케이션": "1020",  # 통신업
+        "유틸리티": "1017",  # 전기가스업
+        "건설": "1018",  # 건설업
+        "유통": "1016",  # 유통업
+        "운송": "1019",  # 운수창고
+    }
+    SECTOR_BENCHMARK = "KOSPI"
+
     def __init__(
         self,
         dart_client: Optional[DartClient] = None,
@@ -153,6 +194,14 @@ class IndustryAgent:
         # 업종별 종목 캐시
         self._sector_stocks_cache: Dict[str, List[Dict[str, Any]]] = {}
 
+        # 업종 모멘텀 (거래일별 1회 계산, 지수 시세는 KrxClient 캐시에서 증분 조회)
+        self.sector_momentum: Optional[SectorMomentum] = None
+        self._sector_momentum_date: Optional[str] = None
+
+        # 거래일 -> 업종별 밸류에이션 집계 / 시가총액 순위 인덱스 (조회 실패 시 None)
+        self._sector_valuations: Dict[str, Optional[SectorValuations]] = {}
+        self._market_cap_ranks: Dict[str, Optional[MarketCapRanks]] = {}
+
     def analyze(self, stock_code: str) -> IndustryAnalysisResult:
         """
         종목의 업종 분석 실행
@@ -176,8 +225,9 @@ class IndustryAgent:
         # 3. 동종업계 비교 분석
         peer_analysis = self._analyze_peers(stock_code, industry_code, sector_name)
 
-        # 4. 업종 전망 점수
-        sector_outlook_score = self.SECTOR_OUTLOOK.get(sector_name, 50)
+        # 4. 업종 전망 점수 (기본 전망 + 업종지수 모멘텀)
+        sector_outlook = self._sector_outlook(sector_name)
+        sector_outlook_score = sector_outlook["score"]
 
         # 5. 시장 내 위치 분석
         market_position = self._analyze_market_position(stock_code, sector_name)
@@ -194,7 +244,8 @@ class IndustryAgent:
 
         # 7. 분석 코멘트 생성
         comment = self._generate_comment(
-            stock_name, sector_name, peer_analysis, sector_outlook_score, market_position
+            stock_name, sector_name, peer_analysis, sector_outlook_score, market_position,
+            sector_outlook.get("momentum")
         )
 
         return IndustryAnalysisResult(
@@ -207,10 +258,18 @@ class IndustryAgent:
             sector_avg_pbr=peer_analysis.get("sector_avg_pbr"),
             per_vs_sector=peer_analysis.get("per_vs_sector"),
             pbr_vs_sector=peer_analysis.get("pbr_vs_sector"),
-            market_cap_rank_in_sector=market_position.get("rank"),
-            total_peers_in_sector=market_position.get("total"),
+            sector_median_per=peer_analysis.get("sector_median_per"),
+            sector_median_pbr=peer_analysis.get("sector_median_pbr"),
+            peer_group=peer_analysis.get("peer_group"),
+            peer_count=peer_analysis.get("peer_count"),
+            market_cap_rank=market_position.get("rank"),
+            total_stocks=market_position.get("total"),
+            market_cap_rank_in_market=market_position.get("market_rank"),
+            market_cap_rank_in_sector=market_position.get("sector_rank"),
+            total_peers_in_sector=market_position.get("sector_total"),
             peer_comparison_score=peer_score,
             sector_outlook_score=sector_outlook_score,
+            sector_momentum=sector_outlook.get("momentum") or {},
             market_position_score=position_score,
             total_score=round(total_score, 1),
             analysis_comment=comment
@@ -245,13 +304,119 @@ class IndustryAgent:
         # 매핑되지 않은 경우
         return (f"업종코드 {industry_code}", "기타")
 
+    def refresh_sector_momentum(self, end_date: Optional[str] = None) -> Optional[SectorMomentum]:
+        """
+        업종지수 패널로 업종 모멘텀 일괄 계산 (거래일별 1회)
+
+        지수 시세는 KrxClient 지수 캐시를 거치므로 다음 거래일 재계산 시
+        새로 추가된 구간만 조회한다.
+
+        Args:
+            end_date: 기준일 (YYYYMMDD, 기본: 최근 거래일)
+
+        Returns:
+            SectorMomentum (조회 실패 시 이전 결과 또는 None)
+        """
+        end_date = end_date or self.krx._get_latest_trade_date()
+        if self._sector_momentum_date == end_date:
+            return self.sector_momentum
+
+        # 조회 실패해도 같은 거래일에는 재시도하지 않음
+        self._sector_momentum_date = end_date
+
+        try:
+            start_dt = datetime.strptime(end_date, "%Y%m%d") - timedelta(days=self.config.sector_history_days)
+            start_date = start_dt.strftime("%Y%m%d")
+
+            panel = self.krx.get_index_panel(self.SECTOR_INDEX, start_date, end_date)
+            benchmark = self.krx.get_index_close_series(self.SECTOR_BENCHMARK, start_date, end_date)
+            if not panel.dates or not benchmark:
+                self.logger.warning("업종지수 시세 없음, 기본 업종 전망 점수 사용")
+                return self.sector_momentum
+
+            benchmark_close = [benchmark.get(d, float("nan")) for d in panel.dates]
+            self.sector_momentum = compute_sector_momentum(panel, benchmark_close, self.SECTOR_BENCHMARK)
+            self.logger.info(f"업종 모멘텀 계산 완료: 상위 {self.sector_momentum.ranking()[:3]}")
+
+        except Exception as e:
+            self.logger.warning(f"업종 모멘텀 계산 실패: {e}")
+
+        return self.sector_momentum
+
+    def _sector_outlook(self, sector_name: str) -> Dict[str, Any]:
+        """업종 전망 점수 (기본 전망 점수와 업종지수 모멘텀 합성)"""
+        static_score = self.SECTOR_OUTLOOK.get(sector_name, 50)
+        result = {"score": static_score, "static_score": static_score, "momentum": None}
+
+        if self.config.sector_momentum_weight <= 0 or sector_name not in self.SECTOR_INDEX:
+            return result
+
+        momentum = self.refresh_sector_momentum()
+        if momentum is None or sector_name not in momentum:
+            return result
+
+        result["momentum"] = momentum.to_dict(sector_name)
+        result["score"] = blend_outlook(
+            static_score, result["momentum"]["momentum_score"], self.config.sector_momentum_weight
+        )
+        return result
+
+    def build_sector_valuations(self, trade_date: Optional[str] = None) -> Optional[SectorValuations]:
+        """
+        거래일 전 종목 PER/PBR 스냅샷을 업종코드별로 집계 (거래일별 1회)
+
+        Args:
+            trade_date: 기준 거래일 (YYYYMMDD, 기본: 최근 거래일)
+
+        Returns:
+            SectorValuations (조회 실패 시 None)
+        """
+        trade_date = trade_date or self.krx._get_latest_trade_date()
+        if trade_date in self._sector_valuations:
+            return self._sector_valuations[trade_date]
+
+        # 조회 실패해도 같은 거래일에는 재시도하지 않음
+        self._sector_valuations[trade_date] = None
+
+        try:
+            df = self.krx.get_market_fundamental_snapshot(trade_date, "ALL")
+            if df is None or df.empty:
+                self.logger.warning(f"{trade_date} 밸류에이션 스냅샷 없음")
+                return None
+
+            codes = [str(code) for code in df.index]
+            industry_codes = self._get_industry_codes(codes)
+            if not industry_codes:
+                self.logger.warning(
+                    "업종코드 매핑 없음: 동종업계 밸류에이션이 시장 전체 평균으로 대체됩니다 "
+                    "(warm_industry_codes 또는 run_analysis.py --warm-industry-codes로 사전 조회)"
+                )
+
+            valuations = compute_sector_valuations(
+                codes,
+                df["PER"].to_numpy(dtype=float),
+                df["PBR"].to_numpy(dtype=float),
+                industry_codes,
+                trade_date=trade_date,
+                min_peers=self.config.peer_min_count
+            )
+            self._sector_valuations[trade_date] = valuations
+            self.logger.info(
+                f"업종 밸류에이션 집계 완료: {len(codes)}개 종목, 업종코드 {len(valuations.industry_codes)}개"
+            )
+            return valuations
+
+        except Exception as e:
+            self.logger.warning(f"업종 밸류에이션 집계 실패: {e}")
+            return None
+
     def _analyze_peers(
         self,
         stock_code: str,
         industry_code: str,
         sector_name: str
     ) -> Dict[str, Any]:
-        """동종업계 비교 분석"""
+        """동종업계 비교 분석 (거래일 업종 집계 조회)"""
         result = {
             "score": 50,
             "sector_avg_per": None,
@@ -261,59 +426,122 @@ class IndustryAgent:
         }
 
         try:
-            # 현재 종목의 밸류에이션
-            stock_val = self.krx.get_stock_valuation(stock_code)
-            stock_per = stock_val.get("per", 0)
-            stock_pbr = stock_val.get("pbr", 0)
-
-            if not stock_per or stock_per <= 0:
+            valuations = self.build_sector_valuations()
+            if valuations is None:
                 return result
 
-            # 전체 시장 밸류에이션 조회
-            kospi_val = self.krx.get_market_valuation("KOSPI")
-            kosdaq_val = self.krx.get_market_valuation("KOSDAQ")
-            all_valuations = kospi_val + kosdaq_val
+            # 현재 종목의 밸류에이션 (스냅샷에 없으면 개별 조회)
+            if stock_code in valuations.stock_per:
+                stock_per = valuations.stock_per[stock_code]
+                stock_pbr = valuations.stock_pbr.get(stock_code)
+            else:
+                stock_val = self.krx.get_stock_valuation(stock_code)
+                stock_per = stock_val.get("per", 0)
+                stock_pbr = stock_val.get("pbr", 0)
 
-            # 섹터 평균 계산 (업종코드 기반 필터링이 어려우므로 전체 시장 평균 사용)
-            # TODO: 업종별 종목 목록을 별도로 관리하여 정확한 섹터 평균 계산
-            valid_pers = [v["per"] for v in all_valuations if v.get("per") and 0 < v["per"] < 100]
-            valid_pbrs = [v["pbr"] for v in all_valuations if v.get("pbr") and 0 < v["pbr"] < 10]
+            group = valuations.peer_group(stock_code, industry_code)
+            result = peer_comparison(stock_per, stock_pbr, group, self.config.peer_statistic)
 
-            if valid_pers:
-                sector_avg_per = sum(valid_pers) / len(valid_pers)
-                result["sector_avg_per"] = round(sector_avg_per, 2)
-                result["per_vs_sector"] = round(stock_per - sector_avg_per, 2)
+        except Exception as e:
+            self.logger.warning(f"동종업계 분석 실패: {e}")
+
+        return result
+
+    def build_market_cap_ranks(self, trade_date: Optional[str] = None) -> Optional[MarketCapRanks]:
+        """
+        시가총액 스냅샷으로 전체/시장 내/업종 내 순위 인덱스 생성 (거래일별 1회)
+
+        Args:
+            trade_date: 기준 거래일 (YYYYMMDD, 기본: 최근 거래일)
 
-            if valid_pbrs:
-                sector_avg_pbr = sum(valid_pbrs) / len(valid_pbrs)
-                result["sector_avg_pbr"] = round(sector_avg_pbr, 2)
-                result["pbr_vs_sector"] = round(stock_pbr - sector_avg_pbr, 2)
+        Returns:
+            MarketCapRanks (조회 실패 시 None)
+        """
+        trade_date = trade_date or self.krx._get_latest_trade_date()
+        if trade_date in self._market_cap_ranks:
+            return self._market_cap_ranks[trade_date]
 
-            # 점수 계산 (저평가일수록 높은 점수)
-            score = 50
-            if result["per_vs_sector"] is not None:
-                # PER이 섹터 평균보다 낮으면 가점
-                per_diff_pct = (result["per_vs_sector"] / sector_avg_per) * 100 if sector_avg_per else 0
-                score += min(25, max(-25, -per_diff_pct))  # -25% ~ +25%
+        # 조회 실패해도 같은 거래일에는 재시도하지 않음
+        self._market_cap_ranks[trade_date] = None
 
-            if result["pbr_vs_sector"] is not None:
-                # PBR이 섹터 평균보다 낮으면 가점
-                pbr_diff_pct = (result["pbr_vs_sector"] / sector_avg_pbr) * 100 if sector_avg_pbr else 0
-                score += min(15, max(-15, -pbr_diff_pct * 0.5))  # -15% ~ +15%
+        try:
+            codes, caps, markets = [], [], []
+            for market in ("KOSPI", "KOSDAQ"):
+                df = self.krx.get_market_cap_snapshot(trade_date, market)
+                if df is None or df.empty:
+                    continue
+                codes.extend(str(code) for code in df.index)
+                caps.extend(df["시가총액"].to_numpy(dtype=float))
+                markets.extend([market] * len(df))
+
+            if not codes:
+                self.logger.warning(f"{trade_date} 시가총액 스냅샷 없음")
+                return None
+
+            industry_codes = self._get_industry_codes(codes)
+            sectors = [
+                self._map_industry_to_sector(industry_codes[code])[1] if code in industry_codes else None
+                for code in codes
+            ]
+            ranks = build_market_cap_ranks(codes, caps, markets, sectors, trade_date)
+            self._market_cap_ranks[trade_date] = ranks
+            return ranks
 
-            result["score"] = max(0, min(100, round(score, 1)))
+        except Exception as e:
+            self.logger.warning(f"시가총액 순위 인덱스 생성 실패: {e}")
+            return None
 
+    def _get_industry_codes(self, stock_codes: List[str]) -> Dict[str, str]:
+        """종목별 DART 업종코드 (저장 매핑, DART 미사용/조회 실패 시 빈 dict)"""
+        if not self.dart:
+            return {}
+        try:
+            if self.config.fetch_industry_codes:
+                self.dart.warm_industry_codes(stock_codes)
+            return self.dart.get_industry_codes(stock_codes)
         except Exception as e:
-            self.logger.warning(f"동종업계 분석 실패: {e}")
+            self.logger.warning(f"업종코드 조회 실패: {e}")
+            return {}
 
-        return result
+    def warm_industry_codes(
+        self,
+        trade_date: Optional[str] = None,
+        max_requests: Optional[int] = None
+    ) -> int:
+        """
+        전 종목 업종코드 사전 조회 (분석 전 1회 실행, 이후 분석은 저장 매핑만 사용)
+
+        Args:
+            trade_date: 종목 목록 기준 거래일 (YYYYMMDD, 기본: 최근 거래일)
+            max_requests: 최대 DART 호출 수 (일일 한도 분할용)
+
+        Returns:
+            신규 저장 종목 수
+        """
+        if not self.dart:
+            self.logger.warning("DART 클라이언트 없음, 업종코드 사전 조회 생략")
+            return 0
+
+        trade_date = trade_date or self.krx._get_latest_trade_date()
+        codes = []
+        for market in ("KOSPI", "KOSDAQ"):
+            df = self.krx.get_market_cap_snapshot(trade_date, market)
+            if df is not None and not df.empty:
+                codes.extend(str(code) for code in df.index)
+
+        fetched = self.dart.warm_industry_codes(codes, max_requests=max_requests)
+        if fetched:
+            # 새 업종코드로 업종 집계/순위 재생성
+            self._sector_valuations.clear()
+            self._market_cap_ranks.clear()
+        return fetched
 
     def _analyze_market_position(
         self,
         stock_code: str,
         sector_name: str
     ) -> Dict[str, Any]:
-        """시장 내 위치 분석"""
+        """시장 내 위치 분석 (거래일 순위 인덱스 조회)"""
         result = {
             "rank": None,
             "total": None,
@@ -321,22 +549,17 @@ class IndustryAgent:
         }
 
         try:
-            # 시가총액 순위 조회
-            market_cap_ranking = self.krx.get_market_cap_ranking("ALL", top_n=500)
-
-            if not market_cap_ranking:
+            ranks = self.build_market_cap_ranks()
+            position = ranks.lookup(stock_code) if ranks else None
+            if not position:
                 return result
 
-            # 현재 종목 순위 찾기
-            for i, stock in enumerate(market_cap_ranking, 1):
-                if stock.get("stock_code") == stock_code:
-                    result["rank"] = i
-                    result["total"] = len(market_cap_ranking)
-                    break
+            result.update(position)
 
-            # 순위 기반 점수 (상위일수록 높은 점수)
-            if result["rank"]:
-                rank_percentile = (result["total"] - result["rank"]) / result["total"] * 100
+            # 순위 기반 점수 (상위일수록 높은 점수, 시가총액 상위 N 내 백분위, 밖은 중립)
+            top_n = min(self.config.position_score_top_n, result["total"])
+            if result["rank"] <= top_n:
+                rank_percentile = (top_n - result["rank"]) / top_n * 100
                 result["score"] = max(30, min(90, 40 + rank_percentile * 0.5))
 
         except Exception as e:
@@ -350,7 +573,8 @@ class IndustryAgent:
         sector_name: str,
         peer_analysis: Dict[str, Any],
         sector_outlook_score: float,
-        market_position: Dict[str, Any]
+        market_position: Dict[str, Any],
+        sector_momentum: Optional[Dict[str, Any]] = None
     ) -> str:
         """분석 코멘트 생성"""
         comments = []
@@ -358,15 +582,16 @@ class IndustryAgent:
         # 섹터 정보
         comments.append(f"{stock_name}은(는) {sector_name} 섹터에 속합니다.")
 
-        # 밸류에이션 비교
+        # 밸류에이션 비교 (동종업계 그룹이 없으면 시장 전체 기준)
         per_vs = peer_analysis.get("per_vs_sector")
+        basis = "시장" if peer_analysis.get("peer_group") in (None, "ALL") else "업종"
         if per_vs is not None:
             if per_vs < -5:
-                comments.append(f"시장 평균 대비 PER이 {abs(per_vs):.1f}배 저평가 상태입니다.")
+                comments.append(f"{basis} 평균 대비 PER이 {abs(per_vs):.1f}배 저평가 상태입니다.")
             elif per_vs > 5:
-                comments.append(f"시장 평균 대비 PER이 {per_vs:.1f}배 고평가 상태입니다.")
+                comments.append(f"{basis} 평균 대비 PER이 {per_vs:.1f}배 고평가 상태입니다.")
             else:
-                comments.append("밸류에이션은 시장 평균 수준입니다.")
+                comments.append(f"밸류에이션은 {basis} 평균 수준입니다.")
 
         # 시장 위치
         rank = market_position.get("rank")
@@ -377,6 +602,21 @@ class IndustryAgent:
             elif rank <= 200:
                 comments.append(f"시가총액 기준 {rank}위로 중형주에 해당합니다.")
 
+        sector_rank = market_position.get("sector_rank")
+        if sector_rank and market_position.get("sector_total"):
+            comments.append(
+                f"{market_position['sector']} 섹터 내 시가총액 {sector_rank}위 "
+                f"({market_position['sector_total']}개 종목 중)입니다."
+            )
+
+        # 업종지수 상대강도
+        rs = (sector_momentum or {}).get("relative_strength", {}).get("60")
+        if rs is not None:
+            direction = "강세" if rs > 0 else "약세"
+            comments.append(
+                f"최근 60거래일 업종지수는 {sector_momentum['benchmark']} 대비 {rs * 100:+.1f}%p {direction}입니다."
+            )
+
         # 섹터 전망
         if sector_outlook_score >= 70:
             comments.append(f"{sector_name} 섹터는 성장 전망이 긍정적입니다.")
@@ -10,6 +10,8 @@ import logging
 import json
 from pathlib import Path
 
+import numpy as np
+
 from .screening_agent import ScreeningAgent, ScreeningCriteria
 from .financial_agent import FinancialAgent, FinancialAnalysisConfig
 from .valuation_agent import ValuationAgent
@@ -19,9 +21,13 @@ from .risk_agent import RiskAgent
 from .sentiment_agent import SentimentAgent
 from ..api.dart_client import DartClient
 from ..api.krx_client import KrxClient
-from ..models.stock import Stock, DataFreshness
-from ..models.analysis import AnalysisResult, AgentScore, ValuationResult, RiskAssessment
+from ..models.stock import Stock, DataFreshness, ScreeningResult
+from ..models.analysis import AnalysisResult, AgentScore, ValuationResult, RiskAssessment, RsiDistribution
+from ..analytics.indicators import forward_fill, history_lengths, wilder_rsi_last
+from ..analytics.portfolio_risk import PortfolioRisk
+from ..analytics.credit import CREDIT_FIELDS
 from ..utils.output_writer import DetailedOutputWriter
+from ..utils.history_planner import HistoryPlanner
 
 
 @dataclass
@@ -31,6 +37,7 @@ class OrchestratorConfig:
     output_dir: str = "output"
     max_data_age_days: int = 3  # 최대 데이터 경과일
     warning_data_age_days: int = 1  # 경고 데이터 경과일
+    concentration_clustering: bool = True  # 스크리닝 종목 상관 군집 (집중 리스크)
 
     # 에이전트 가중치 (Conviction Score 계산용)
     weights: Dict[str, float] = None
@@ -90,7 +97,12 @@ class MasterOrchestrator:
             self.dart_client = DartClient(api_key=self.config.dart_api_key)
 
         # 서브 에이전트 초기화
-        self.screening_agent = ScreeningAgent(krx_client=self.krx_client)
+        self.risk_agent = RiskAgent(krx_client=self.krx_client)
+        # 스크리닝 유동성 필터는 리스크 에이전트와 같은 유동성 조회 (설정 등급 기준, 거래일 캐시 공유)
+        self.screening_agent = ScreeningAgent(
+            krx_client=self.krx_client,
+            liquidity_provider=self.risk_agent.liquidity_provider
+        )
         self.financial_agent = FinancialAgent(
             dart_client=self.dart_client
         ) if self.dart_client else None
@@ -100,12 +112,17 @@ class MasterOrchestrator:
             krx_client=self.krx_client
         )
         self.technical_agent = TechnicalAgent(krx_client=self.krx_client)
-        self.risk_agent = RiskAgent(krx_client=self.krx_client)
         self.sentiment_agent = SentimentAgent(
             krx_client=self.krx_client,
             dart_client=self.dart_client
         )
 
+        # 가격 히스토리 공용 조회 (기술적/리스크 에이전트 요구량 중 최대 구간 1회 조회)
+        self.history_planner = HistoryPlanner(
+            self.krx_client,
+            [self.technical_agent, self.risk_agent]
+        )
+
         # 분석 날짜
         self.analysis_date = datetime.now()
 
@@ -165,11 +182,22 @@ class MasterOrchestrator:
             except Exception as e:
                 self.logger.warning(f"업종 분석 실패: {e}")
 
+        # 5.5. 가격 히스토리 조회 (기술적/리스크 분석 공용)
+        price_history = None
+        try:
+            price_history = self.history_planner.fetch(stock_code)
+        except Exception as e:
+            self.logger.warning(f"가격 히스토리 조회 실패: {e}")
+
         # 6. 기술적 분석 (TechnicalAgent 사용)
         technical_result = None
         if self.technical_agent:
             try:
-                technical_result = self.technical_agent.analyze(stock_code)
+                technical_result = self.technical_agent.analyze(
+                    stock_code,
+                    price_history=self.history_planner.slice_for(price_history, self.technical_agent)
+                    if price_history is not None else None
+                )
                 self.logger.info(f"기술적 분석 완료: {technical_result.overall_signal} ({technical_result.total_score}점)")
             except Exception as e:
                 self.logger.warning(f"기술적 분석 실패: {e}")
@@ -183,24 +211,18 @@ class MasterOrchestrator:
                 if financial_result and "grade" in financial_result:
                     # financial_result를 risk_agent가 사용할 수 있는 형태로 변환
                     financial_data_for_risk = {
-                        "total_assets": financial_result.get("total_assets", 0),
-                        "working_capital": financial_result.get("working_capital", 0),
-                        "retained_earnings": financial_result.get("retained_earnings", 0),
-                        "ebit": financial_result.get("ebit", 0),
-                        "ebitda": financial_result.get("ebitda", 0),
-                        "total_liabilities": financial_result.get("total_liabilities", 0),
-                        "total_debt": financial_result.get("total_debt", 0),
-                        "equity": financial_result.get("equity", 0),
-                        "cash": financial_result.get("cash", 0),
-                        "interest_expense": financial_result.get("interest_expense", 0),
-                        "revenue": financial_result.get("revenue", 0),
-                        "market_cap": price_data.get("market_cap", valuation_data.get("market_cap", 0))
+                        name: financial_result.get(name, 0) for name in CREDIT_FIELDS if name != "market_cap"
                     }
+                    financial_data_for_risk["market_cap"] = price_data.get(
+                        "market_cap", valuation_data.get("market_cap", 0)
+                    )
 
                 risk_result = self.risk_agent.analyze(
                     stock_code,
                     financial_data=financial_data_for_risk,
-                    technical_data=technical_result.__dict__ if technical_result else None
+                    technical_data=technical_result.__dict__ if technical_result else None,
+                    price_history=self.history_planner.slice_for(price_history, self.risk_agent)
+                    if price_history is not None else None
                 )
                 self.logger.info(f"리스크 분석 완료: {risk_result.risk_grade} ({risk_result.total_risk_score}점)")
             except Exception as e:
@@ -292,6 +314,28 @@ class MasterOrchestrator:
 
         return result
 
+    def warm_industry_codes(self, max_requests: Optional[int] = None) -> int:
+        """
+        전 종목 DART 업종코드 사전 조회 (동종업계 밸류에이션/업종 내 순위용, 분석 전 명시적으로 실행)
+
+        업종코드는 저장 매핑만 조회하므로 한 번도 실행하지 않으면 동종업계 비교가 시장 전체 평균으로 대체됨.
+        일일 한도가 있으므로 max_requests로 나누어 여러 번 실행 가능 (저장된 종목은 다시 조회하지 않음)
+
+        Args:
+            max_requests: 최대 DART 호출 수 (None이면 남은 종목 전체)
+
+        Returns:
+            신규 저장 종목 수
+        """
+        if not self.dart_client:
+            self.logger.warning("DART API 키 없음, 업종코드 사전 조회 생략")
+            return 0
+
+        self.logger.info(f"업종코드 사전 조회 시작 (최대 호출 수: {max_requests or '제한 없음'})")
+        fetched = self.industry_agent.warm_industry_codes(max_requests=max_requests)
+        self.logger.info(f"업종코드 사전 조회 완료: {fetched}개 종목 신규 저장")
+        return fetched
+
     def run_full_screening(
         self,
         criteria: Optional[ScreeningCriteria] = None,
@@ -316,6 +360,10 @@ class MasterOrchestrator:
             self.logger.warning("스크리닝 결과가 없습니다.")
             return []
 
+        # 1.5. 스크리닝 종목 상관 군집 (리스크 에이전트 집중 리스크에 사용)
+        if self.config.concentration_clustering:
+            self._scan_concentration(screening_results[:top_n])
+
         # 2. 개별 종목 분석
         results = []
         for i, sr in enumerate(screening_results[:top_n]):
@@ -330,121 +378,162 @@ class MasterOrchestrator:
 
         return results
 
-    def run_rsi_screening(
+    def _scan_concentration(self, screening_results: List[ScreeningResult]) -> None:
+        """스크리닝 종목 시세 패널로 상관 군집 계산 (시가총액 가중)"""
+        market_caps = {
+            sr.stock.code: (sr.price.market_cap or 0) if sr.price else 0
+            for sr in screening_results if sr.stock and sr.stock.code
+        }
+        if len(market_caps) < 2:
+            return
+
+        try:
+            panel = self.krx_client.get_ohlcv_panel(
+                list(market_caps),
+                n_bars=self.risk_agent.config.concentration_window_days + 1
+            )
+            if panel.dates:
+                self.risk_agent.scan_concentration(panel, weights=market_caps)
+        except Exception as e:
+            self.logger.warning(f"상관 군집 계산 실패: {e}")
+
+    def evaluate_portfolio_risk(
+        self,
+        results: List[AnalysisResult],
+        weights: Optional[Dict[str, float]] = None
+    ) -> Optional[PortfolioRisk]:
+        """
+        스크리닝 상위 종목 바스켓의 포트폴리오 리스크
+
+        Args:
+            results: run_full_screening() 결과
+            weights: {종목코드: 비중} (None이면 동일가중)
+
+        Returns:
+            PortfolioRisk (계산 불가 시 None)
+        """
+        codes = [r.stock_code for r in results if r.stock_code]
+        if not codes:
+            return None
+
+        panel = self.krx_client.get_ohlcv_panel(
+            codes,
+            n_bars=self.risk_agent.config.var_period_days + 1
+        )
+        try:
+            portfolio = self.risk_agent.analyze_portfolio(panel, weights=weights)
+        except ValueError as e:
+            self.logger.warning(f"포트폴리오 리스크 계산 실패: {e}")
+            return None
+
+        level = max(portfolio.parametric_var)
+        self.logger.info(
+            f"포트폴리오 리스크: {len(portfolio.codes)}종목, 연변동성 {portfolio.annual_volatility:.1%}, "
+            f"VaR{int(level * 100)} {portfolio.parametric_var[level]:.2%}, "
+            f"분산투자비율 {portfolio.diversification_ratio:.2f}"
+        )
+        return portfolio
+
+    def run_rsi_scan(
         self,
         criteria: Optional[ScreeningCriteria] = None,
         top_n: int = 100,
-        rsi_threshold: float = 30.0
-    ) -> List[Dict[str, Any]]:
+        period: int = 14
+    ) -> RsiDistribution:
         """
-        RSI 기반 경량 스크리닝 (과매도 종목 빠른 조회)
+        RSI 분포 스캔 (유니버스 일괄 계산)
 
-        전체 분석을 실행하지 않고 RSI_14만 계산하여 과매도 종목을 빠르게 조회합니다.
+        스크리닝 대상 종목의 종가 패널(날짜 × 종목)을 한 번 구성하고
+        전 종목 RSI를 배열 연산으로 계산한다. 반환된 분포에 임계값을
+        여러 번 적용해도 재조회/재스크리닝이 필요 없다.
 
         Args:
             criteria: 스크리닝 조건 (시총 등)
             top_n: 분석할 종목 수
-            rsi_threshold: RSI 임계값 (이하인 종목만 반환)
+            period: RSI 기간
 
         Returns:
-            과매도 종목 리스트 (Dict: stock_code, stock_name, rsi_14, current_price, market_cap 등)
+            RsiDistribution (RSI 오름차순)
         """
-        self.logger.info(f"RSI 스크리닝 시작 (RSI <= {rsi_threshold})")
+        self.logger.info(f"RSI 스캔 시작 (RSI_{period})")
 
         # 1. 스크리닝 실행
         screening_results = self.screening_agent.run_screening(market="ALL", criteria=criteria, top_n=top_n)
 
         if not screening_results:
             self.logger.warning("스크리닝 결과가 없습니다.")
-            return []
+            return RsiDistribution(trade_date="", period=period)
 
-        self.logger.info(f"스크리닝 대상: {len(screening_results)}개 종목")
+        universe = {sr.stock.code: sr for sr in screening_results if sr.stock and sr.stock.code}
+        self.logger.info(f"스크리닝 대상: {len(universe)}개 종목")
 
-        # 2. 각 종목에 대해 RSI만 계산 (경량 분석)
-        results = []
-        for sr in screening_results:
-            stock_code = sr.stock.code if sr.stock else None
-            if not stock_code:
-                continue
-
-            try:
-                # 가격 히스토리 조회
-                price_history = self.krx_client.get_stock_price_history(stock_code)
-                if not price_history or len(price_history) < 20:
-                    continue
-
-                prices = [p["close_price"] for p in price_history]
-                current_price = prices[-1]
-
-                # RSI 계산
-                rsi = self._calculate_rsi_only(prices)
-                if rsi is None:
-                    continue
-
-                # 기본 정보 조합
-                stock_name = sr.stock.name if sr.stock else stock_code
-                market_cap = sr.price.market_cap if sr.price and sr.price.market_cap else 0
-
-                # 가격 데이터 날짜
-                price_date = price_history[-1].get("trade_date", "") if price_history else ""
-
-                result = {
-                    "stock_code": stock_code,
-                    "stock_name": stock_name,
-                    "rsi_14": round(rsi, 1),
-                    "rsi_status": "oversold" if rsi <= 30 else ("overbought" if rsi >= 70 else "neutral"),
-                    "current_price": current_price,
-                    "market_cap": market_cap,
-                    "price_date": price_date
-                }
-
-                # RSI 임계값 필터링
-                if rsi <= rsi_threshold:
-                    results.append(result)
-                    self.logger.debug(f"{stock_name}({stock_code}): RSI={rsi:.1f}")
-
-            except Exception as e:
-                self.logger.warning(f"RSI 계산 실패 ({stock_code}): {e}")
+        # 2. 종가 패널 1회 조회 (TechnicalAgent와 같은 히스토리 길이로 RSI 일치)
+        panel = self.krx_client.get_ohlcv_panel(
+            list(universe),
+            n_bars=self.technical_agent.required_history_bars()
+        )
+        if not panel.dates:
+            self.logger.warning("가격 패널이 비어 있습니다.")
+            return RsiDistribution(trade_date="", period=period)
+
+        # 3. 전 종목 RSI 일괄 계산
+        close = forward_fill(panel.close)
+        bars = history_lengths(close)
+        rsi_values = wilder_rsi_last(close, period)
+
+        # 4. 종목별 결과 구성 (가격 데이터 20일 미만 제외)
+        entries = []
+        for col, stock_code in enumerate(panel.codes):
+            rsi = rsi_values[col]
+            if bars[col] < 20 or np.isnan(rsi):
                 continue
 
-        # 3. RSI 낮은 순 정렬
-        results.sort(key=lambda x: x["rsi_14"])
-
-        self.logger.info(f"과매도 종목: {len(results)}개")
-        return results
-
-    def _calculate_rsi_only(self, prices: List[float], period: int = 14) -> Optional[float]:
-        """RSI만 빠르게 계산 (경량 버전)"""
-        if len(prices) < period + 1:
-            return None
+            sr = universe[stock_code]
+            last_row = int(np.flatnonzero(~np.isnan(panel.close[:, col]))[-1])
+            entry = {
+                "stock_code": stock_code,
+                "stock_name": sr.stock.name if sr.stock else stock_code,
+                "rsi": round(float(rsi), 1),
+                "rsi_status": "oversold" if rsi <= 30 else ("overbought" if rsi >= 70 else "neutral"),
+                "current_price": int(close[-1, col]),
+                "market_cap": sr.price.market_cap if sr.price and sr.price.market_cap else 0,
+                "price_date": panel.dates[last_row]
+            }
+            # 기존 키 호환 (RSI_14일 때만, 다른 기간 값을 rsi_14로 표시하지 않음)
+            if period == 14:
+                entry["rsi_14"] = entry["rsi"]
+            entries.append(entry)
 
-        gains = []
-        losses = []
+        # 5. RSI 낮은 순 정렬
+        entries.sort(key=lambda x: x["rsi"])
 
-        for i in range(1, len(prices)):
-            change = prices[i] - prices[i-1]
-            if change > 0:
-                gains.append(change)
-                losses.append(0)
-            else:
-                gains.append(0)
-                losses.append(abs(change))
+        distribution = RsiDistribution(trade_date=panel.dates[-1], period=period, entries=entries)
+        self.logger.info(f"RSI 스캔 완료: {len(entries)}개 종목, 분포 {distribution.summary()}")
+        return distribution
 
-        # 첫 평균
-        avg_gain = sum(gains[:period]) / period
-        avg_loss = sum(losses[:period]) / period
+    def run_rsi_screening(
+        self,
+        criteria: Optional[ScreeningCriteria] = None,
+        top_n: int = 100,
+        rsi_threshold: float = 30.0
+    ) -> List[Dict[str, Any]]:
+        """
+        RSI 기반 경량 스크리닝 (과매도 종목 빠른 조회)
 
-        # EMA 스타일 계산
-        for i in range(period, len(gains)):
-            avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-            avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+        전체 분석을 실행하지 않고 RSI_14만 계산하여 과매도 종목을 빠르게 조회합니다.
+        여러 임계값을 적용할 때는 run_rsi_scan() 결과를 재사용하세요.
 
-        if avg_loss == 0:
-            return 100.0
+        Args:
+            criteria: 스크리닝 조건 (시총 등)
+            top_n: 분석할 종목 수
+            rsi_threshold: RSI 임계값 (이하인 종목만 반환)
 
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
+        Returns:
+            과매도 종목 리스트 (Dict: stock_code, stock_name, rsi, rsi_14, current_price, market_cap 등)
+        """
+        results = self.run_rsi_scan(criteria, top_n=top_n).below(rsi_threshold)
+        self.logger.info(f"과매도 종목 (RSI <= {rsi_threshold}): {len(results)}개")
+        return results
 
     def _validate_data_freshness(
         self,
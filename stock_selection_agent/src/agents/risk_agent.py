@@ -3,7 +3,7 @@ Risk Agent - 리스크 분석 에이전트
 시장 리스크, 신용 리스크, 유동성 리스크, 집중 리스크 분석
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 import logging
@@ -11,6 +11,34 @@ import math
 import numpy as np
 
 from ..api.krx_client import KrxClient
+from ..models.panel import PricePanel
+from ..models.fundamentals import FundamentalsTable
+from ..analytics.risk_engine import RiskMetrics, compute_risk_metrics, simple_returns
+from ..analytics.beta import BetaResult, RollingBeta, ols_beta, weekly_returns
+from ..analytics.concentration import (
+    ConcentrationResult,
+    RollingCorrelation,
+    cluster_concentration,
+    correlation_matrix
+)
+from ..analytics.credit import CreditMetrics, CreditThresholds, CREDIT_FIELDS, compute_credit_metrics
+from ..analytics.liquidity import LiquidityMetrics, LiquidityThresholds, compute_liquidity_metrics
+from ..analytics.portfolio_risk import PortfolioRisk, compute_portfolio_risk
+from ..analytics.stress import (
+    DEFAULT_SCENARIOS,
+    HISTORICAL_SCENARIOS,
+    MonteCarloConfig,
+    MonteCarloResult,
+    Scenario,
+    StressResult,
+    apply_scenarios,
+    build_exposures,
+    monte_carlo_stress,
+    systematic_daily_vol,
+    severity
+)
+from ..utils.history_planner import calendar_start_for_bars
+from ..utils.liquidity_provider import LiquidityProvider
 
 
 def norm_ppf(p: float) -> float:
@@ -55,14 +83,28 @@ class RiskAnalysisConfig:
 
     # Beta 계산 기간
     beta_period_weeks: int = 156  # 3년
+    beta_min_weeks: int = 52  # 최소 주간 표본 (미만이면 Beta 미산출)
 
     # VaR/CVaR 설정
     var_confidence_levels: List[float] = field(default_factory=lambda: [0.95, 0.99])
     var_period_days: int = 252  # 1년
 
-    # MDD 계산 기간
+    # MDD 계산 기간 (거래일)
     mdd_period_days: int = 756  # 3년
 
+    # 포트폴리오 리스크 (Ledoit-Wolf 공분산)
+    portfolio_min_observations: int = 60  # 종목 최소 수익률 개수
+    portfolio_block_size: int = 256  # 공분산 블록 크기 (종목 수)
+
+    # 집중 리스크 (수익률 상관 군집)
+    concentration_window_days: int = 252
+    concentration_min_correlation: float = 0.6  # 군집 최소 평균 상관
+    concentration_crowded_size: int = 3  # 동조화 군집 최소 종목 수
+
+    # 스트레스 테스트
+    stress_scenarios: List[Scenario] = field(default_factory=lambda: list(DEFAULT_SCENARIOS))
+    stress_monte_carlo: MonteCarloConfig = field(default_factory=MonteCarloConfig)
+
     # 신용 리스크 임계값
     z_score_safe: float = 2.99
     z_score_grey: float = 1.81
@@ -108,11 +150,15 @@ class RiskAnalysisResult:
     # 시장 리스크
     beta: Optional[float] = None
     beta_adjusted: Optional[float] = None
+    beta_r_squared: Optional[float] = None
+    beta_benchmark: Optional[str] = None  # "KOSPI", "KOSDAQ"
     annual_volatility: Optional[float] = None
     var_95: Optional[float] = None
     cvar_95: Optional[float] = None
     max_drawdown: Optional[float] = None
     mdd_recovery_days: Optional[int] = None
+    # 신뢰수준별 VaR/CVaR {"0.95": {"parametric_var", "parametric_cvar", "historical_var", "historical_cvar"}}
+    var_by_confidence: Dict[str, Dict[str, float]] = field(default_factory=dict)
 
     # 신용 리스크
     z_score: Optional[float] = None
@@ -127,6 +173,8 @@ class RiskAnalysisResult:
     avg_daily_trading_value: Optional[int] = None
     liquidity_grade: str = "C"  # "A", "B", "C", "D", "F"
     turnover_ratio: Optional[float] = None
+    adtv_by_window: Dict[str, Optional[int]] = field(default_factory=dict)  # {"20": 원, "60": 원, "252": 원}
+    amihud_illiquidity: Dict[str, Optional[float]] = field(default_factory=dict)  # 기간별 Amihud (억원당)
     free_float_ratio: Optional[float] = None
     bid_ask_spread: Optional[float] = None
 
@@ -134,6 +182,7 @@ class RiskAnalysisResult:
     largest_shareholder_pct: Optional[float] = None
     foreign_ownership_pct: Optional[float] = None
     concentration_risks: List[Dict[str, str]] = field(default_factory=list)
+    cluster_exposure: Dict[str, Any] = field(default_factory=dict)  # 상관 군집 노출
 
     # 스트레스 테스트
     stress_test_results: Dict[str, Dict[str, Any]] = field(default_factory=dict)
@@ -176,12 +225,23 @@ class RiskAgent:
         self.krx = krx_client or KrxClient()
         self.config = config or RiskAnalysisConfig()
         self.logger = logging.getLogger(__name__)
+        self._replay_returns: Optional[Dict[str, float]] = None  # 과거 재현 구간 지수 수익률
+        self.concentration: Optional[ConcentrationResult] = None  # 최근 상관 군집 (scan_concentration)
+        self.liquidity: Optional[LiquidityMetrics] = None  # 최근 유니버스 유동성 (scan_liquidity)
+        # 유니버스 유동성 공용 조회 (설정 등급 기준, ScreeningAgent에 전달해 캐시 공유)
+        self.liquidity_provider = LiquidityProvider(self.krx, thresholds=self._liquidity_thresholds())
+
+    def required_history_bars(self) -> int:
+        """분석에 필요한 가격 히스토리 봉 수 (MDD/VaR/Beta 계산 기간 중 가장 긴 쪽)"""
+        beta_bars = self.config.beta_period_weeks * 5 + 5  # 주 5거래일 + 첫 주 기준가
+        return max(self.config.mdd_period_days, self.config.var_period_days, beta_bars)
 
     def analyze(
         self,
         stock_code: str,
         financial_data: Optional[Dict[str, Any]] = None,
-        technical_data: Optional[Dict[str, Any]] = None
+        technical_data: Optional[Dict[str, Any]] = None,
+        price_history: Optional[Sequence[Dict[str, Any]]] = None
     ) -> RiskAnalysisResult:
         """
         종목 리스크 분석 실행
@@ -190,6 +250,7 @@ class RiskAgent:
             stock_code: 종목코드 (6자리)
             financial_data: 재무 분석 데이터 (옵션)
             technical_data: 기술적 분석 데이터 (옵션)
+            price_history: 일별 시세 (None이면 required_history_bars()만큼 조회)
 
         Returns:
             리스크 분석 결과
@@ -205,17 +266,18 @@ class RiskAgent:
         stock_name = self.krx._get_stock_name(stock_code)
 
         # 2. 가격 히스토리 조회
-        from datetime import timedelta
-        end_date = datetime.now().strftime("%Y%m%d")
-        start_date = (datetime.now() - timedelta(days=self.config.mdd_period_days)).strftime("%Y%m%d")
-        price_history = self.krx.get_stock_price_history(stock_code, start_date=start_date, end_date=end_date)
+        if price_history is None:
+            end_date = datetime.now().strftime("%Y%m%d")
+            start_date = calendar_start_for_bars(self.required_history_bars(), end_date)
+            price_history = self.krx.get_stock_price_history(stock_code, start_date=start_date, end_date=end_date)
 
         if not price_history or len(price_history) < 20:
             self.logger.warning(f"가격 데이터 부족: {stock_code}")
             return self._create_default_result(stock_code, stock_name, analysis_date)
 
-        # 3. 시장 리스크 분석
-        market_risk = self._analyze_market_risk(price_history)
+        # 3. 시장 리스크 분석 (소속 시장 지수 대비 Beta)
+        benchmark = self._get_benchmark(stock_code, price_history)
+        market_risk = self._analyze_market_risk(price_history, benchmark)
 
         # 4. 신용 리스크 분석
         credit_risk = self._analyze_credit_risk(stock_code, financial_data)
@@ -231,7 +293,8 @@ class RiskAgent:
             stock_code,
             price_history,
             market_risk.get("beta", 1.0),
-            credit_risk
+            credit_risk,
+            market_risk.get("annual_volatility")
         )
 
         # 8. 종합 리스크 점수 계산
@@ -263,11 +326,14 @@ class RiskAgent:
             concentration_risk_score=round(concentration_risk["score"], 1),
             beta=market_risk.get("beta"),
             beta_adjusted=market_risk.get("beta_adjusted"),
+            beta_r_squared=market_risk.get("beta_r_squared"),
+            beta_benchmark=market_risk.get("beta_benchmark"),
             annual_volatility=market_risk.get("annual_volatility"),
             var_95=market_risk.get("var_95"),
             cvar_95=market_risk.get("cvar_95"),
             max_drawdown=market_risk.get("max_drawdown"),
             mdd_recovery_days=market_risk.get("recovery_days"),
+            var_by_confidence=market_risk.get("var_by_confidence", {}),
             z_score=credit_risk.get("z_score"),
             z_score_zone=credit_risk.get("zone", "unknown"),
             debt_to_equity=credit_risk.get("debt_to_equity"),
@@ -278,21 +344,36 @@ class RiskAgent:
             avg_daily_trading_value=liquidity_risk.get("avg_daily_trading_value"),
             liquidity_grade=liquidity_risk.get("liquidity_grade", "C"),
             turnover_ratio=liquidity_risk.get("turnover_ratio"),
+            adtv_by_window=liquidity_risk.get("adtv", {}),
+            amihud_illiquidity=liquidity_risk.get("amihud_illiquidity", {}),
             free_float_ratio=liquidity_risk.get("free_float_ratio"),
             bid_ask_spread=liquidity_risk.get("bid_ask_spread"),
             largest_shareholder_pct=concentration_risk.get("largest_shareholder"),
             foreign_ownership_pct=concentration_risk.get("foreign_ownership"),
             concentration_risks=concentration_risk.get("risks", []),
+            cluster_exposure=concentration_risk.get("cluster_exposure", {}),
             stress_test_results=stress_test,
             key_risks=key_risks
         )
 
-    def _analyze_market_risk(self, price_history: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """시장 리스크 분석"""
+    def _analyze_market_risk(
+        self,
+        price_history: List[Dict[str, Any]],
+        benchmark: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        시장 리스크 분석
+
+        Args:
+            price_history: 일별 시세
+            benchmark: {"name": 지수명, "closes": {거래일: 종가}} (None이면 Beta 미산출)
+        """
         result = {
             "score": 50,
             "beta": None,
             "beta_adjusted": None,
+            "beta_r_squared": None,
+            "beta_benchmark": None,
             "annual_volatility": None,
             "var_95": None,
             "cvar_95": None,
@@ -303,69 +384,40 @@ class RiskAgent:
         if len(price_history) < 20:
             return result
 
-        prices = [p["close_price"] for p in price_history]
-
-        # 1. Volatility 계산
-        if len(prices) >= 252:
-            returns = [(prices[i] / prices[i-1] - 1) for i in range(1, min(253, len(prices)))]
-            daily_vol = np.std(returns)
-            annual_vol = daily_vol * math.sqrt(252)
-            result["annual_volatility"] = round(annual_vol, 4)
-
-            # VaR 95% (Parametric)
-            mean_return = np.mean(returns)
-            z_95 = norm_ppf(0.05)  # -1.645
-            var_95 = -(mean_return + z_95 * daily_vol)
-            result["var_95"] = round(var_95, 4)
-
-            # CVaR 95% (Historical)
-            returns_array = np.array(returns)
-            var_threshold = np.percentile(returns_array, 5)
-            tail_losses = returns_array[returns_array <= var_threshold]
-            if len(tail_losses) > 0:
-                cvar_95 = -np.mean(tail_losses)
-                result["cvar_95"] = round(cvar_95, 4)
-
-        # 2. Beta 계산 (시장지수 대비)
-        # 간단한 추정: KOSPI와의 상관관계 (실제로는 시장 데이터 필요)
-        # 여기서는 변동성 기반 추정치 사용
-        if result["annual_volatility"]:
-            market_vol = 0.20  # KOSPI 평균 변동성 가정
-            estimated_beta = result["annual_volatility"] / market_vol
-            result["beta"] = round(estimated_beta, 2)
+        # 1. Volatility / VaR / CVaR / MDD (배치 엔진에 단일 종목 열로 전달)
+        close = np.array([[p["close_price"]] for p in price_history], dtype=float)
+        metrics = self._compute_risk_metrics(close, ["-"])
+
+        if not np.isnan(metrics.annual_volatility[0]):
+            result["annual_volatility"] = round(float(metrics.annual_volatility[0]), 4)
+            # VaR 95% (Parametric), CVaR 95% (Historical)
+            result["var_95"] = _round_or_none(metrics.parametric_var.get(0.95), 4)
+            result["cvar_95"] = _round_or_none(metrics.historical_cvar.get(0.95), 4)
+            result["var_by_confidence"] = {
+                str(level): {
+                    "parametric_var": _round_or_none(metrics.parametric_var[level], 4),
+                    "parametric_cvar": _round_or_none(metrics.parametric_cvar[level], 4),
+                    "historical_var": _round_or_none(metrics.historical_var[level], 4),
+                    "historical_cvar": _round_or_none(metrics.historical_cvar[level], 4),
+                }
+                for level in self.config.var_confidence_levels
+            }
 
-            # Blume Adjustment
-            adjusted_beta = 0.67 * estimated_beta + 0.33 * 1.0
-            result["beta_adjusted"] = round(adjusted_beta, 2)
+        # 2. Beta 계산 (시장지수 대비 주간 수익률 회귀, Blume 조정)
+        if benchmark and benchmark.get("closes"):
+            dates = [p["trade_date"] for p in price_history]
+            betas = self._compute_betas(dates, close, self._align_index(dates, benchmark["closes"]), ["-"])
+            if not np.isnan(betas.beta[0]):
+                result["beta"] = round(float(betas.beta[0]), 2)
+                result["beta_adjusted"] = round(float(betas.beta_adjusted[0]), 2)
+                result["beta_r_squared"] = _round_or_none(betas.r_squared, 4)
+                result["beta_benchmark"] = benchmark.get("name")
 
         # 3. Maximum Drawdown
-        if len(prices) >= 100:
-            peak = prices[0]
-            max_dd = 0
-            dd_start_idx = 0
-            dd_end_idx = 0
-            current_dd_start = 0
-
-            for i, price in enumerate(prices):
-                if price > peak:
-                    peak = price
-                    current_dd_start = i
-
-                drawdown = (peak - price) / peak
-                if drawdown > max_dd:
-                    max_dd = drawdown
-                    dd_start_idx = current_dd_start
-                    dd_end_idx = i
-
-            result["max_drawdown"] = round(max_dd, 4)
-
-            # 회복 기간 계산
-            if dd_end_idx < len(prices) - 1:
-                peak_price = prices[dd_start_idx]
-                for i in range(dd_end_idx + 1, len(prices)):
-                    if prices[i] >= peak_price:
-                        result["recovery_days"] = i - dd_end_idx
-                        break
+        if not np.isnan(metrics.max_drawdown[0]):
+            result["max_drawdown"] = round(float(metrics.max_drawdown[0]), 4)
+            if not np.isnan(metrics.recovery_days[0]):
+                result["recovery_days"] = int(metrics.recovery_days[0])
 
         # 점수 계산 (낮을수록 좋음)
         score = 50
@@ -400,6 +452,160 @@ class RiskAgent:
         result["score"] = max(0, min(100, score))
         return result
 
+    def scan_market_risk(self, panel: PricePanel) -> RiskMetrics:
+        """
+        유니버스 시장 리스크 일괄 계산
+
+        Args:
+            panel: 시세 패널 (required_history_bars() 이상 권장)
+
+        Returns:
+            RiskMetrics (종목별 변동성, 신뢰수준별 VaR/CVaR, MDD, 회복기간)
+
+        Example:
+            metrics = agent.scan_market_risk(krx.get_ohlcv_panel(n_bars=756))
+            riskiest = metrics.ranked(metrics.historical_cvar[0.99])[:20]
+        """
+        return self._compute_risk_metrics(panel.close, panel.codes)
+
+    def scan_betas(
+        self,
+        panel: PricePanel,
+        benchmark: str = "KOSPI",
+        index_closes: Optional[Dict[str, float]] = None
+    ) -> BetaResult:
+        """
+        유니버스 Beta 일괄 계산 (주간 수익률 OLS, 행렬곱 1회)
+
+        Args:
+            panel: 시세 패널 (required_history_bars() 이상 권장)
+            benchmark: 기준 지수 ("KOSPI", "KOSDAQ")
+            index_closes: {거래일: 지수 종가} (None이면 KrxClient로 조회)
+
+        Returns:
+            BetaResult (종목별 Beta, Blume 조정 Beta, 결정계수, 표본 주 수)
+
+        Example:
+            panel = krx.get_ohlcv_panel(n_bars=agent.required_history_bars(), market="KOSDAQ")
+            betas = agent.scan_betas(panel, benchmark="KOSDAQ")
+        """
+        if index_closes is None:
+            index_closes = self.krx.get_index_close_series(benchmark, panel.dates[0], panel.dates[-1])
+        market_close = self._align_index(panel.dates, index_closes)
+        return self._compute_betas(panel.dates, panel.close, market_close, panel.codes)
+
+    def rolling_beta(
+        self,
+        panel: PricePanel,
+        benchmark: str = "KOSPI",
+        index_closes: Optional[Dict[str, float]] = None
+    ) -> RollingBeta:
+        """
+        주 단위 증분 갱신용 롤링 Beta (패널 구간으로 초기화)
+
+        매주 RollingBeta.update(종목 주간 수익률, 지수 주간 수익률)로
+        빠지는 주/추가되는 주만 반영해 갱신한다.
+        """
+        if index_closes is None:
+            index_closes = self.krx.get_index_close_series(benchmark, panel.dates[0], panel.dates[-1])
+        market_close = self._align_index(panel.dates, index_closes)
+        _, stock_returns, market_returns = weekly_returns(panel.dates, panel.close, market_close)
+
+        rolling = RollingBeta(panel.codes, self.config.beta_period_weeks, self.config.beta_min_weeks)
+        rolling.extend(stock_returns, market_returns)
+        return rolling
+
+    def _compute_betas(
+        self,
+        dates: Sequence[str],
+        close: np.ndarray,
+        market_close: np.ndarray,
+        codes: List[str]
+    ) -> BetaResult:
+        """설정 기간(최근 beta_period_weeks주)으로 Beta 계산"""
+        _, stock_returns, market_returns = weekly_returns(dates, close, market_close)
+        window = self.config.beta_period_weeks
+        return ols_beta(
+            stock_returns[-window:],
+            market_returns[-window:],
+            codes,
+            min_observations=self.config.beta_min_weeks
+        )
+
+    def _get_benchmark(
+        self,
+        stock_code: str,
+        price_history: Sequence[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """종목 소속 시장 지수 종가 (KOSPI/KOSDAQ, 조회 실패 시 None)"""
+        try:
+            name = self.krx.get_stock_market(stock_code)
+            closes = self.krx.get_index_close_series(
+                name, price_history[0]["trade_date"], price_history[-1]["trade_date"]
+            )
+        except Exception as e:
+            self.logger.warning(f"{stock_code} 기준 지수 조회 실패, Beta 미산출: {e}")
+            return None
+        if not closes:
+            return None
+        return {"name": name, "closes": closes}
+
+    @staticmethod
+    def _align_index(dates: Sequence[str], index_closes: Dict[str, float]) -> np.ndarray:
+        """지수 종가를 종목 거래일에 정렬 (없는 날짜 NaN, 이후 직전값으로 채움)"""
+        return np.array([index_closes.get(d, np.nan) for d in dates], dtype=float)
+
+    def analyze_portfolio(
+        self,
+        panel: PricePanel,
+        stock_codes: Optional[List[str]] = None,
+        weights: Optional[Dict[str, float]] = None
+    ) -> PortfolioRisk:
+        """
+        바스켓 포트폴리오 리스크 (스크리닝 결과 조합 평가)
+
+        Args:
+            panel: 시세 패널 (var_period_days + 1봉 이상 권장)
+            stock_codes: 대상 종목 (None이면 패널 전체)
+            weights: {종목코드: 비중} (None이면 동일가중)
+
+        Returns:
+            PortfolioRisk (VaR/CVaR, 한계/구성 VaR, 분산투자비율)
+
+        Example:
+            panel = krx.get_ohlcv_panel(codes, n_bars=253)
+            portfolio = agent.analyze_portfolio(panel)
+            top_contributors = portfolio.contributions(0.99)[:5]
+        """
+        if stock_codes is not None:
+            panel = panel.select(stock_codes)
+        weight_values = None if weights is None else [weights.get(code, 0.0) for code in panel.codes]
+
+        portfolio = compute_portfolio_risk(
+            panel.close,
+            panel.codes,
+            weights=weight_values,
+            confidence_levels=self.config.var_confidence_levels,
+            window=self.config.var_period_days,
+            min_observations=self.config.portfolio_min_observations,
+            block_size=self.config.portfolio_block_size
+        )
+        if portfolio.excluded:
+            self.logger.warning(f"표본 부족으로 포트폴리오에서 제외: {portfolio.excluded}")
+        return portfolio
+
+    def _compute_risk_metrics(self, close: np.ndarray, codes: List[str]) -> RiskMetrics:
+        """설정값으로 리스크 엔진 호출"""
+        return compute_risk_metrics(
+            close,
+            codes,
+            confidence_levels=self.config.var_confidence_levels,
+            var_window=self.config.var_period_days,
+            min_var_observations=self.config.var_period_days - 1,
+            mdd_window=self.config.mdd_period_days,
+            min_mdd_observations=100
+        )
+
     def _analyze_credit_risk(
         self,
         stock_code: str,
@@ -422,104 +628,41 @@ class RiskAgent:
             return result
 
         try:
-            # 1. Altman Z-Score 계산
-            total_assets = financial_data.get("total_assets", 0)
-            if total_assets > 0:
-                x1 = financial_data.get("working_capital", 0) / total_assets
-                x2 = financial_data.get("retained_earnings", 0) / total_assets
-                x3 = financial_data.get("ebit", 0) / total_assets
-
-                market_cap = financial_data.get("market_cap", 0)
-                total_liabilities = financial_data.get("total_liabilities", 1)
-                x4 = market_cap / total_liabilities if total_liabilities > 0 else 0
-
-                x5 = financial_data.get("revenue", 0) / total_assets
-
-                z_score = 1.2*x1 + 1.4*x2 + 3.3*x3 + 0.6*x4 + 1.0*x5
-                result["z_score"] = round(z_score, 2)
-
-                if z_score > self.config.z_score_safe:
-                    result["zone"] = "safe"
-                elif z_score > self.config.z_score_grey:
-                    result["zone"] = "grey"
-                else:
-                    result["zone"] = "distress"
-                    result["red_flags"].append(f"Z-Score {z_score:.2f} - 파산 위험 높음")
-
-            # 2. 부채 관련 지표
-            equity = financial_data.get("equity", 1)
-            total_debt = financial_data.get("total_debt", 0)
-
-            if equity > 0:
-                debt_to_equity = total_debt / equity
-                result["debt_to_equity"] = round(debt_to_equity, 2)
-
-                if debt_to_equity > self.config.debt_to_equity_high:
-                    result["red_flags"].append(f"부채비율 {debt_to_equity:.1f} - 200% 초과")
-
-                # 순차입금비율
-                cash = financial_data.get("cash", 0)
-                net_debt_ratio = (total_debt - cash) / equity
-                result["net_debt_ratio"] = round(net_debt_ratio, 2)
-
-            # 3. 이자보상배율
-            ebit = financial_data.get("ebit", 0)
-            interest_expense = financial_data.get("interest_expense", 0)
-
-            if interest_expense > 0:
-                icr = ebit / interest_expense
-                result["interest_coverage"] = round(icr, 1)
-
-                if icr < self.config.interest_coverage_low:
-                    result["red_flags"].append(f"이자보상배율 {icr:.1f} - 2배 미만")
-            else:
-                result["interest_coverage"] = float('inf')
-
-            # 4. Debt/EBITDA
-            ebitda = financial_data.get("ebitda", 0)
-            if ebitda > 0:
-                debt_to_ebitda = total_debt / ebitda
-                result["debt_to_ebitda"] = round(debt_to_ebitda, 2)
+            # 배치 신용 지표 계산에 단일 종목 행으로 전달
+            table = FundamentalsTable.from_records({stock_code: financial_data}, CREDIT_FIELDS)
+            result = self.scan_credit_risk(table).to_dict(0)
 
-                if debt_to_ebitda > 4.0:
-                    result["red_flags"].append(f"Debt/EBITDA {debt_to_ebitda:.1f} - 4배 초과")
+        except Exception as e:
+            self.logger.error(f"신용 리스크 분석 실패: {e}")
 
-            # 점수 계산
-            score = 50
+        return result
 
-            # Z-Score 점수
-            if result["zone"] == "distress":
-                score += 30
-            elif result["zone"] == "grey":
-                score += 15
-            elif result["zone"] == "safe":
-                score -= 15
-
-            # 부채비율 점수
-            if result["debt_to_equity"]:
-                if result["debt_to_equity"] > 2.0:
-                    score += 25
-                elif result["debt_to_equity"] > 1.5:
-                    score += 15
-                elif result["debt_to_equity"] < 0.5:
-                    score -= 10
-
-            # 이자보상배율 점수
-            if result["interest_coverage"]:
-                if result["interest_coverage"] != float('inf'):
-                    if result["interest_coverage"] < 2:
-                        score += 25
-                    elif result["interest_coverage"] < 3:
-                        score += 10
-                    elif result["interest_coverage"] > 10:
-                        score -= 15
+    def scan_credit_risk(self, fundamentals: FundamentalsTable) -> CreditMetrics:
+        """
+        유니버스 신용 리스크 일괄 계산
 
-            result["score"] = max(0, min(100, score))
+        Args:
+            fundamentals: 재무 테이블 (CREDIT_FIELDS 항목, 원 단위)
 
-        except Exception as e:
-            self.logger.error(f"신용 리스크 분석 실패: {e}")
+        Returns:
+            CreditMetrics (Z-Score, 부채비율, 이자보상배율, Debt/EBITDA, 위험 신호, 점수)
 
-        return result
+        Example:
+            credit = agent.scan_credit_risk(FundamentalsTable.from_records(records))
+            distressed = credit.flagged("distress_zone", "low_interest_coverage")
+        """
+        return compute_credit_metrics(fundamentals, self._credit_thresholds())
+
+    def _credit_thresholds(self) -> CreditThresholds:
+        """설정값 → 신용 임계값"""
+        return CreditThresholds(
+            z_score_safe=self.config.z_score_safe,
+            z_score_grey=self.config.z_score_grey,
+            debt_to_equity_high=self.config.debt_to_equity_high,
+            debt_to_equity_moderate=self.config.debt_to_equity_moderate,
+            interest_coverage_low=self.config.interest_coverage_low,
+            interest_coverage_moderate=self.config.interest_coverage_moderate
+        )
 
     def _analyze_liquidity_risk(
         self,
@@ -536,142 +679,296 @@ class RiskAgent:
             "bid_ask_spread": None
         }
 
+        # 같은 거래일 유니버스 유동성이 계산되어 있으면 그대로 사용 (히스토리 재계산 없음)
+        trade_date = price_history[-1].get("trade_date") if price_history else None
+        universe = self.liquidity_provider.lookup(trade_date, stock_code) if trade_date else None
+        if universe is not None:
+            return universe.to_dict(stock_code)
+
         if len(price_history) < 20:
             return result
 
         try:
-            # 1. 일평균 거래대금 (최근 20일)
-            recent_data = price_history[-20:]
-            trading_values = []
-
-            for day in recent_data:
-                volume = day.get("volume", 0)
-                price = day.get("close_price", 0)
-                trading_value = volume * price
-                trading_values.append(trading_value)
-
-            avg_daily_value = sum(trading_values) / len(trading_values) if trading_values else 0
-            result["avg_daily_trading_value"] = int(avg_daily_value)
-
-            # 유동성 등급
-            if avg_daily_value >= self.config.liquidity_excellent:
-                result["liquidity_grade"] = "A"
-                score = 20
-            elif avg_daily_value >= self.config.liquidity_good:
-                result["liquidity_grade"] = "B"
-                score = 30
-            elif avg_daily_value >= self.config.liquidity_moderate:
-                result["liquidity_grade"] = "C"
-                score = 50
-            elif avg_daily_value >= self.config.liquidity_poor:
-                result["liquidity_grade"] = "D"
-                score = 70
-            else:
-                result["liquidity_grade"] = "F"
-                score = 90
-
-            # 2. 회전율 추정 (간략 버전)
-            history_to_use = price_history[-252:] if len(price_history) >= 252 else price_history
-            total_volume = sum(d.get("volume", 0) for d in history_to_use)
-            # 유통주식수는 실제로는 별도 조회 필요, 여기서는 추정
-            # turnover_ratio = 연간 거래량 / 유통주식수
-
-            # 3. 호가 스프레드 (실시간 데이터 필요, 여기서는 생략)
-            # result["bid_ask_spread"] = ...
-
-            result["score"] = score
+            # 배치 유동성 계산에 단일 종목 열로 전달 (거래대금 없는 날은 종가 × 거래량)
+            close = np.array([[p["close_price"]] for p in price_history], dtype=float)
+            volume = np.array([[p.get("volume", 0)] for p in price_history], dtype=float)
+            trading_value = np.array(
+                [[p.get("trading_value", p["close_price"] * p.get("volume", 0))] for p in price_history],
+                dtype=float
+            )
+            panel = PricePanel(
+                dates=[p.get("trade_date", "") for p in price_history],
+                codes=[stock_code],
+                close=close,
+                volume=volume,
+                trading_value=trading_value
+            )
+
+            # 회전율은 상장주식수가 필요하므로 scan_liquidity()에서만 산출
+            metrics = compute_liquidity_metrics(panel, thresholds=self._liquidity_thresholds())
+            result = metrics.to_dict(stock_code)
 
         except Exception as e:
             self.logger.error(f"유동성 리스크 분석 실패: {e}")
 
         return result
 
+    def scan_liquidity(
+        self,
+        panel: PricePanel,
+        shares_outstanding: Optional[Dict[str, float]] = None,
+        free_float: Optional[Dict[str, float]] = None
+    ) -> LiquidityMetrics:
+        """
+        유니버스 유동성 일괄 계산 (공용 유동성 조회 캐시, 이후 analyze()의 유동성 리스크에 사용)
+
+        Args:
+            panel: 시세 패널 (거래량/거래대금 포함, 253봉 권장)
+            shares_outstanding: {종목코드: 상장주식수}
+            free_float: {종목코드: 유통주식 비율 (0~1)} (없으면 공용 유동성 조회의 유통비율)
+
+        Returns:
+            LiquidityMetrics (20/60/252일 ADTV, 회전율, Amihud, 등급)
+        """
+        self.liquidity = self.liquidity_provider.compute(panel, shares_outstanding, free_float)
+        return self.liquidity
+
+    def _liquidity_thresholds(self) -> LiquidityThresholds:
+        """설정값 → 유동성 등급 기준"""
+        return LiquidityThresholds(
+            excellent=self.config.liquidity_excellent,
+            good=self.config.liquidity_good,
+            moderate=self.config.liquidity_moderate,
+            poor=self.config.liquidity_poor
+        )
+
     def _analyze_concentration_risk(self, stock_code: str) -> Dict[str, Any]:
-        """집중 리스크 분석"""
+        """
+        집중 리스크 분석 (수익률 상관 군집 노출)
+
+        scan_concentration()으로 계산한 군집이 없거나 종목이 없으면 중립 점수 유지
+        """
         result = {
             "score": 50,
             "largest_shareholder": None,
             "foreign_ownership": None,
-            "risks": []
+            "risks": [],
+            "cluster_exposure": {}
         }
 
         try:
-            # 실제로는 지분 구조 데이터를 KRX나 DART에서 조회해야 함
-            # 여기서는 기본값으로 처리
+            # 지분 구조 데이터는 미연동 → 상관 군집 노출로 평가
+            exposure = self.concentration.exposure(stock_code) if self.concentration else None
+            if exposure is None:
+                return result
 
-            # 지분 데이터가 없으면 중립 점수 유지
-            result["score"] = 50
+            result["cluster_exposure"] = exposure
+            size = exposure["cluster_size"]
+            weight = exposure["cluster_weight"]
+            mean_corr = exposure["mean_correlation"]
+
+            score = 50
+            if size == 1:
+                score -= 15  # 독립적 움직임 (분산 효과)
+            else:
+                if mean_corr is not None and mean_corr >= 0.75:
+                    score += 20
+                elif mean_corr is not None and mean_corr >= self.config.concentration_min_correlation:
+                    score += 10
+
+                if weight >= 0.20:
+                    score += 20
+                elif weight >= 0.10:
+                    score += 10
+
+            if size >= self.config.concentration_crowded_size:
+                result["risks"].append({
+                    "type": "correlation_cluster",
+                    "description": f"동조화 종목군 {size}종목 (평균 상관 {mean_corr:.2f}, 비중 {weight:.0%})"
+                })
+
+            result["score"] = max(0, min(100, score))
 
         except Exception as e:
             self.logger.error(f"집중 리스크 분석 실패: {e}")
 
         return result
 
+    def scan_concentration(
+        self,
+        panel: PricePanel,
+        weights: Optional[Dict[str, float]] = None
+    ) -> ConcentrationResult:
+        """
+        유니버스 상관 군집 계산 (이후 analyze()의 집중 리스크에 사용)
+
+        Args:
+            panel: 시세 패널 (concentration_window_days + 1봉 권장)
+            weights: {종목코드: 비중} (시가총액 등, None이면 동일가중)
+
+        Returns:
+            ConcentrationResult
+
+        Example:
+            clusters = agent.scan_concentration(panel, weights=market_caps)
+            crowded = clusters.crowded_clusters(min_size=5)
+        """
+        returns = simple_returns(panel.close)[-self.config.concentration_window_days:]
+        return self._cluster(correlation_matrix(returns), panel.codes, weights)
+
+    def rolling_correlation(self, panel: PricePanel) -> RollingCorrelation:
+        """
+        일 단위 증분 갱신용 롤링 상관행렬 (패널 구간으로 초기화)
+
+        매일 RollingCorrelation.update(당일 수익률) 후
+        update_concentration()으로 전체 행렬 재계산 없이 군집을 갱신한다.
+        """
+        rolling = RollingCorrelation(panel.codes, self.config.concentration_window_days)
+        rolling.extend(simple_returns(panel.close))
+        return rolling
+
+    def update_concentration(
+        self,
+        rolling: RollingCorrelation,
+        weights: Optional[Dict[str, float]] = None
+    ) -> ConcentrationResult:
+        """롤링 상관행렬로 상관 군집 갱신"""
+        return self._cluster(rolling.correlation(), rolling.codes, weights)
+
+    def _cluster(
+        self,
+        corr: np.ndarray,
+        codes: List[str],
+        weights: Optional[Dict[str, float]]
+    ) -> ConcentrationResult:
+        weight_values = None if weights is None else [weights.get(code, 0.0) for code in codes]
+        self.concentration = cluster_concentration(
+            corr, codes, weight_values, self.config.concentration_min_correlation
+        )
+        crowded = self.concentration.crowded_clusters(self.config.concentration_crowded_size)
+        self.logger.info(f"상관 군집: {len(codes)}종목 → 동조화 군집 {len(crowded)}개")
+        return self.concentration
+
     def _perform_stress_test(
         self,
         stock_code: str,
         price_history: List[Dict[str, Any]],
         beta: float,
-        credit_risk: Dict[str, Any]
+        credit_risk: Dict[str, Any],
+        annual_volatility: Optional[float] = None
     ) -> Dict[str, Dict[str, Any]]:
-        """스트레스 테스트"""
+        """
+        스트레스 테스트 (요인 시나리오 + 과거 구간 재현 + Monte Carlo)
+
+        Beta/부채비율이 없으면 기본 노출(Beta 1.0, 부채비율 1.0)로 계산한다.
+        """
         results = {}
 
         if not price_history:
             return results
 
-        current_price = price_history[-1]["close_price"]
-
         try:
-            # 1. 시장 급락 시나리오 (-20%)
-            if beta is not None:
-                market_crash_loss = beta * (-0.20) * 100
-                results["market_crash"] = {
-                    "description": "시장 급락 (-20%)",
-                    "estimated_loss_pct": round(market_crash_loss, 2),
-                    "severity": "high" if market_crash_loss < -25 else "moderate" if market_crash_loss < -15 else "low"
+            stress = self.stress_test_universe(
+                [stock_code],
+                betas=[beta],
+                debt_to_equity=[credit_risk.get("debt_to_equity")]
+            )
+            for col, scenario in enumerate(stress.scenarios):
+                loss_pct = round(float(stress.stock_returns[0, col]) * 100, 2)
+                results[scenario.name] = {
+                    "description": scenario.description,
+                    "estimated_loss_pct": loss_pct,
+                    "severity": severity(loss_pct, scenario.severity_thresholds)
                 }
-            else:
-                results["market_crash"] = {
-                    "description": "시장 급락 (-20%)",
-                    "estimated_loss_pct": -20.0,
-                    "severity": "moderate"
-                }
-
-            # 2. 금리 충격 (200bp 인상)
-            debt_ratio = credit_risk.get("debt_to_equity")
-            if debt_ratio is not None:
-                rate_shock_loss = -0.02 * debt_ratio * 5 * 100  # 단순 추정
-            else:
-                rate_shock_loss = -10.0  # 기본값
-            results["interest_rate_shock"] = {
-                "description": "금리 200bp 인상",
-                "estimated_loss_pct": round(rate_shock_loss, 2),
-                "severity": "high" if rate_shock_loss < -25 else "moderate" if rate_shock_loss < -10 else "low"
-            }
-
-            # 3. 원화 약세 시나리오
-            # 수출/수입 데이터가 필요하므로 여기서는 중립 가정
-            results["currency_depreciation"] = {
-                "description": "원화 15% 약세",
-                "estimated_loss_pct": 0.0,
-                "severity": "neutral"
-            }
 
-            # 4. 섹터 침체
-            sector_beta = 0.8  # 섹터 베타 가정
-            sector_loss = sector_beta * (-0.15) * 100
-            results["sector_downturn"] = {
-                "description": "섹터 언더퍼폼 (-15%)",
-                "estimated_loss_pct": round(sector_loss, 2),
-                "severity": "moderate"
-            }
+            # Monte Carlo (개별 변동성 = 총 변동성 중 Beta로 설명되지 않는 부분)
+            if annual_volatility:
+                mc = self.monte_carlo_universe(
+                    [stock_code], [beta], [credit_risk.get("debt_to_equity")], [annual_volatility]
+                )
+                results["monte_carlo"] = {
+                    "description": f"Monte Carlo {mc.n_paths:,}경로 ({mc.horizon_days}거래일)",
+                    "var_pct": {str(level): round(-float(v[0]) * 100, 2) for level, v in mc.var.items()},
+                    "cvar_pct": {str(level): round(-float(v[0]) * 100, 2) for level, v in mc.cvar.items()},
+                }
 
         except Exception as e:
             self.logger.error(f"스트레스 테스트 실패: {e}")
 
         return results
 
+    def stress_test_universe(
+        self,
+        stock_codes: List[str],
+        betas: Sequence[Optional[float]],
+        debt_to_equity: Optional[Sequence[Optional[float]]] = None,
+        krw_sensitivity: Optional[Sequence[Optional[float]]] = None,
+        sectors: Optional[Sequence[Optional[str]]] = None,
+        portfolio_weights: Optional[np.ndarray] = None,
+        scenarios: Optional[List[Scenario]] = None
+    ) -> StressResult:
+        """
+        전 종목/포트폴리오 시나리오 손익 일괄 계산
+
+        Args:
+            stock_codes: 종목코드
+            betas: 시장 Beta (None → 1.0)
+            debt_to_equity: 부채비율 (None → 1.0)
+            krw_sensitivity: 환율 민감도 (None → 0)
+            sectors: 섹터명 (sector:<섹터명> 시나리오 적용)
+            portfolio_weights: (포트폴리오 × 종목) 비중 행렬
+            scenarios: 시나리오 (None이면 설정 시나리오 + 과거 구간 재현)
+
+        Returns:
+            StressResult (종목 × 시나리오 수익률)
+        """
+        if scenarios is None:
+            scenarios = list(self.config.stress_scenarios) + self._historical_scenarios()
+        exposures = build_exposures(stock_codes, betas, debt_to_equity, krw_sensitivity, sectors)
+        return apply_scenarios(exposures, scenarios, portfolio_weights)
+
+    def monte_carlo_universe(
+        self,
+        stock_codes: List[str],
+        betas: Sequence[Optional[float]],
+        debt_to_equity: Optional[Sequence[Optional[float]]],
+        annual_volatility: Sequence[Optional[float]],
+        sectors: Optional[Sequence[Optional[str]]] = None,
+        portfolio_weights: Optional[np.ndarray] = None
+    ) -> MonteCarloResult:
+        """
+        요인 모형 Monte Carlo (설정: config.stress_monte_carlo)
+
+        개별 변동성 = √max(총 분산 - diag(B Σ_f Bᵀ), 0) (시장/금리/섹터 등 시뮬레이션 요인 분산 전체 차감)
+        연변동성 결측 종목은 요인 변동성만 사용 (개별 변동성 0)
+        """
+        mc_config = self.config.stress_monte_carlo
+        exposures = build_exposures(stock_codes, betas, debt_to_equity, sectors=sectors)
+
+        systematic = systematic_daily_vol(exposures, mc_config)
+        daily_vol = np.array([
+            systematic[i] if v is None else v / math.sqrt(252) for i, v in enumerate(annual_volatility)
+        ])
+        idio = np.sqrt(np.maximum(daily_vol ** 2 - systematic ** 2, 0.0))
+
+        return monte_carlo_stress(exposures, idio, mc_config, portfolio_weights)
+
+    def _historical_scenarios(self) -> List[Scenario]:
+        """과거 구간 재현 시나리오 (지수 조회 1회 후 캐시, 실패 시 기본 수익률)"""
+        if self._replay_returns is None:
+            self._replay_returns = {}
+            for window in HISTORICAL_SCENARIOS:
+                try:
+                    closes = self.krx.get_index_close_series(window.index, window.start_date, window.end_date)
+                except Exception as e:
+                    self.logger.warning(f"{window.name} 지수 조회 실패, 기본 수익률 사용: {e}")
+                    continue
+                if len(closes) >= 2:
+                    values = list(closes.values())
+                    self._replay_returns[window.name] = values[-1] / values[0] - 1
+
+        return [window.as_scenario(self._replay_returns.get(window.name)) for window in HISTORICAL_SCENARIOS]
+
     def _calculate_total_risk_score(
         self,
         market_risk: Dict[str, Any],
@@ -728,6 +1025,10 @@ class RiskAgent:
         if liquidity_risk.get("liquidity_grade") in ["D", "F"]:
             key_risks.append("낮은 유동성")
 
+        # 집중 리스크
+        if concentration_risk.get("score", 50) >= 70:
+            key_risks.append("동조화 종목군 집중 (상관 군집)")
+
         # 스트레스 테스트
         for scenario, data in stress_test.items():
             if data.get("severity") == "high":
@@ -752,6 +1053,13 @@ class RiskAgent:
         )
 
 
+def _round_or_none(values: Optional[np.ndarray], digits: int) -> Optional[float]:
+    """단일 종목 배열 값 반올림 (NaN이면 None)"""
+    if values is None or np.isnan(values[0]):
+        return None
+    return round(float(values[0]), digits)
+
+
 def normalize_score(value: float, min_val: float, max_val: float) -> float:
     """값을 0-100 점수로 정규화"""
     if value <= min_val:
@@ -8,6 +8,8 @@ from dataclasses import dataclass
 from datetime import datetime
 import logging
 
+from ..analytics.liquidity import LiquidityMetrics
+from ..utils.liquidity_provider import LiquidityProvider
 from ..api.krx_client import KrxClient, KrxApiError
 from ..models.stock import Stock, StockPrice, StockValuation, ScreeningResult, Market
 
@@ -21,6 +23,7 @@ class ScreeningCriteria:
 
     # 거래대금
     min_trading_value: int = 1_000_000_000  # 일평균 10억 이상
+    min_liquidity_grade: Optional[str] = None  # 유동성 등급 하한 ("A"~"F", 20일 ADTV 기준)
 
     # 밸류에이션
     max_per: float = 30.0  # PER 30 이하
@@ -57,15 +60,21 @@ class ScreeningAgent:
         )
     """
 
-    def __init__(self, krx_client: Optional[KrxClient] = None):
+    def __init__(
+        self,
+        krx_client: Optional[KrxClient] = None,
+        liquidity_provider: Optional[LiquidityProvider] = None
+    ):
         """
         스크리닝 에이전트 초기화
 
         Args:
             krx_client: KRX 클라이언트. 미입력시 새로 생성
+            liquidity_provider: 유니버스 유동성 공용 조회 (RiskAgent와 공유, 미입력시 기본 등급 기준으로 생성)
         """
         self.krx = krx_client or KrxClient()
         self.logger = logging.getLogger(__name__)
+        self.liquidity_provider = liquidity_provider or LiquidityProvider(self.krx)
 
     def run_screening(
         self,
@@ -97,6 +106,11 @@ class ScreeningAgent:
         filtered = self._apply_basic_filters(all_stocks, criteria)
         self.logger.info(f"기본 필터 통과: {len(filtered)}")
 
+        # 2-1. 유동성 등급 필터 (유니버스 일괄 계산, 거래일별 캐시)
+        if criteria.min_liquidity_grade:
+            filtered = self._apply_liquidity_filter(filtered, market, criteria.min_liquidity_grade)
+            self.logger.info(f"유동성 필터 통과: {len(filtered)}")
+
         # 3. 밸류에이션 데이터 조회
         valuations = self._get_valuations(market)
 
@@ -164,6 +178,42 @@ class ScreeningAgent:
 
         return filtered
 
+    def _apply_liquidity_filter(
+        self,
+        stocks: List[Dict[str, Any]],
+        market: str,
+        min_grade: str
+    ) -> List[Dict[str, Any]]:
+        """유동성 등급 필터 (유동성 계산 실패 시 필터 생략)"""
+        liquidity = self.get_liquidity(market=market)
+        if liquidity is None:
+            return stocks
+
+        passing = set(liquidity.passing(min_grade))
+        return [stock for stock in stocks if stock.get("stock_code") in passing]
+
+    def get_liquidity(
+        self,
+        trade_date: Optional[str] = None,
+        market: str = "ALL",
+        n_bars: int = 253
+    ) -> Optional[LiquidityMetrics]:
+        """
+        유니버스 유동성 지표 (20/60/252일 ADTV, 회전율, Amihud, 등급)
+
+        공용 유동성 조회(LiquidityProvider)로 (거래일, 시장)별 한 번 계산하며,
+        RiskAgent와 같은 등급 기준/유통비율/캐시를 사용한다.
+
+        Args:
+            trade_date: 기준 거래일 (기본: 최근 거래일)
+            market: 시장 구분 ("ALL", "KOSPI", "KOSDAQ")
+            n_bars: 패널 거래일 수 (252일 수익률 + 1)
+
+        Returns:
+            LiquidityMetrics (조회 실패 시 None)
+        """
+        return self.liquidity_provider.get(trade_date, market=market, n_bars=n_bars)
+
     def _get_valuations(self, market: str) -> Dict[str, Dict[str, Any]]:
         """밸류에이션 데이터 조회"""
         valuations = {}
@@ -3,17 +3,31 @@ Sentiment Agent - 센티먼트 분석 에이전트
 뉴스, 공시, 애널리스트 의견, 소셜 미디어 등 비정형 데이터를 분석하여 시장 센티먼트를 파악
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable
 from dataclasses import dataclass, field
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
+import hashlib
+import json
 import logging
 import re
+import threading
 import time
 from urllib.parse import quote
 
+import numpy as np
+
 from ..api.krx_client import KrxClient
 from ..api.dart_client import DartClient
 from ..api.ebest_client import EbestClient
+from ..api.http_pool import HttpPool, get_http_pool
+from ..api.crawl_scheduler import CrawlScheduler, get_crawl_scheduler
+from ..utils.keyword_automaton import KeywordAutomaton, KeywordMatrix
+from ..utils.html_parser import parse_html
+from ..storage.news_store import NewsStore
+from ..storage.consensus_store import ConsensusStore
+from ..storage.earnings_store import EarningsStore, latest_periodic_filing
+from ..storage.sentiment_store import HALF_LIVES, SentimentSeriesMetrics, SentimentSeriesStore
 
 # 외부 라이브러리 (선택적 import)
 try:
@@ -24,7 +38,6 @@ except ImportError:
 
 try:
     import requests
-    from bs4 import BeautifulSoup
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
@@ -42,18 +55,35 @@ class SentimentAnalysisConfig:
     # 뉴스 설정
     news_lookback_days: int = 30
     news_volume_threshold: float = 1.5  # 평균 대비 배수
+    news_dedup: bool = True  # 소스/실행 간 중복 기사 제거 + 헤드라인 점수 캐시 (data/news_store)
+    sentiment_series: bool = True  # 일별 센티먼트 집계 누적 + 감쇠 센티먼트/볼륨 z-score (data/sentiment_series)
+    news_sentiment_half_life_days: float = 3.0  # 감쇠 센티먼트 반감기
+    news_volume_baseline_half_life_days: float = 30.0  # 뉴스 볼륨 기준선 반감기
+    news_volume_surge_z: float = 3.0  # 당일 기사 수 z-score "surge" 기준
+    news_volume_above_z: float = 1.5  # "above_normal" 기준
+    news_volume_min_history_days: int = 14  # z-score 계산 최소 이력 (미만이면 기사 수 배수 기준)
 
     # 애널리스트 설정
     analyst_lookback_days: int = 90
     target_price_significant_upside: float = 30.0  # 목표가 업사이드 %
     eps_revision_threshold: float = 5.0  # EPS 수정률 임계값 %
+    consensus_history: bool = True  # 일별 컨센서스 스냅샷 기록 + 이력 기반 의견/목표가/EPS 변화 (data/consensus_history)
 
     # 공시 설정
     disclosure_lookback_days: int = 90
+    disclosure_cache_seconds: float = 600.0  # 공시 목록 재사용 시간 (공시/실적 분석 공용)
 
     # 실적 서프라이즈
     earnings_quarters: int = 8
     consecutive_beats_threshold: int = 3
+    earnings_cache: bool = True  # 보고 분기별 실적 캐시, 새 정기보고서 공시 시에만 재수집 (data/earnings_store)
+
+    # 소스 동시 수집 (뉴스/애널리스트/공시/실적)
+    parallel_sources: bool = True
+    source_deadline_seconds: float = 20.0  # 분석 1회 제한 시간, 초과 소스는 중립(50) 처리
+
+    # 종목 전체 수집 (analyze_universe, 호스트별 제한은 크롤링 스케줄러가 적용)
+    universe_workers: int = 8  # 동시 분석 종목 수
 
 
 @dataclass
@@ -116,6 +146,7 @@ class SentimentAnalysisResult:
     news_weighted_sentiment: Optional[float] = None  # -1.0 ~ 1.0
     news_volume: int = 0
     news_volume_signal: str = "normal"  # "surge", "above_normal", "normal"
+    news_volume_zscore: Optional[float] = None  # 당일 기사 수 z-score (일별 시계열 기준)
     positive_news_count: int = 0
     negative_news_count: int = 0
     recent_headlines: List[Dict[str, Any]] = field(default_factory=list)
@@ -134,7 +165,9 @@ class SentimentAnalysisResult:
     avg_target_price: Optional[int] = None
     median_target_price: Optional[int] = None
     upside_to_avg: Optional[float] = None
+    target_price_change_1m: Optional[float] = None
     target_price_change_3m: Optional[float] = None
+    target_price_change_6m: Optional[float] = None
 
     # 이익 추정치 수정
     current_year_eps_revision: Optional[float] = None
@@ -161,6 +194,9 @@ class SentimentAnalysisResult:
     # 주요 동인
     key_drivers: List[str] = field(default_factory=list)
 
+    # 제한 시간 초과/오류로 중립 처리된 소스
+    timed_out_sources: List[str] = field(default_factory=list)
+
     # 투자 시그널
     investment_signal: str = "neutral"  # "strong_buy", "buy", "hold", "sell", "strong_sell"
 
@@ -185,7 +221,13 @@ class SentimentAgent:
         krx_client: Optional[KrxClient] = None,
         dart_client: Optional[DartClient] = None,
         ebest_client: Optional[EbestClient] = None,
-        config: Optional[SentimentAnalysisConfig] = None
+        config: Optional[SentimentAnalysisConfig] = None,
+        http_pool: Optional[HttpPool] = None,
+        news_store: Optional[NewsStore] = None,
+        crawl_scheduler: Optional[CrawlScheduler] = None,
+        consensus_store: Optional[ConsensusStore] = None,
+        earnings_store: Optional[EarningsStore] = None,
+        sentiment_store: Optional[SentimentSeriesStore] = None
     ):
         """
         센티먼트 분석 에이전트 초기화
@@ -195,11 +237,52 @@ class SentimentAgent:
             dart_client: DART API 클라이언트 (선택)
             ebest_client: eBest xingAPI 클라이언트 (선택)
             config: 분석 설정
+            http_pool: 웹 크롤링 HTTP 풀 (미입력시 프로세스 공용 풀)
+            news_store: 뉴스 중복 제거 저장소 (미입력시 news_dedup 설정에 따라 생성)
+            crawl_scheduler: 크롤링 스케줄러 (미입력시 공용 스케줄러, http_pool 지정 시 해당 풀 전용)
+            consensus_store: 컨센서스 이력 저장소 (미입력시 consensus_history 설정에 따라 생성)
+            earnings_store: 보고 분기별 실적 저장소 (미입력시 earnings_cache 설정에 따라 생성)
+            sentiment_store: 일별 뉴스 센티먼트 저장소 (미입력시 sentiment_series 설정에 따라 생성)
         """
         self.krx = krx_client or KrxClient()
         self.config = config or SentimentAnalysisConfig()
         self.logger = logging.getLogger(__name__)
 
+        # 네이버/RSS 크롤링 공용 세션 (keep-alive, 조건부 요청)
+        self.http = http_pool
+        if self.http is None and REQUESTS_AVAILABLE:
+            self.http = get_http_pool()
+
+        # 호스트별 동시 요청/요청 간격 제한 + 재시도 + 파싱 작업자 풀
+        self.crawler = crawl_scheduler
+        if self.crawler is None and self.http is not None:
+            self.crawler = get_crawl_scheduler() if http_pool is None else CrawlScheduler(http_pool=self.http)
+
+        self.news_store = news_store
+        if self.news_store is None and self.config.news_dedup:
+            self.news_store = NewsStore()
+
+        self.consensus_store = consensus_store
+        if self.consensus_store is None and self.config.consensus_history:
+            self.consensus_store = ConsensusStore()
+
+        self.earnings_store = earnings_store
+        if self.earnings_store is None and self.config.earnings_cache:
+            self.earnings_store = EarningsStore()
+
+        self.sentiment_store = sentiment_store
+        if self.sentiment_store is None and self.config.sentiment_series:
+            self.sentiment_store = SentimentSeriesStore(half_lives=HALF_LIVES + (
+                self.config.news_sentiment_half_life_days, self.config.news_volume_baseline_half_life_days
+            ))
+
+        # 소스 분석 스레드별 제한 시각 (넘기면 대기 중인 크롤링 요청 취소)
+        self._source_deadline = threading.local()
+
+        # 종목별 DART 공시 목록 (공시/실적 분석이 동시에 요청해도 1회 조회)
+        self._disclosure_lock = threading.Lock()
+        self._disclosure_feeds: Dict[str, tuple] = {}  # 종목코드 -> (조회 시각, Future)
+
         # DART 클라이언트 초기화 (환경 변수에서 API 키 자동 로드)
         self.dart = dart_client
         if self.dart is None:
@@ -293,6 +376,83 @@ class SentimentAgent:
             "배임": -0.8,
         }
 
+        self._compile_keyword_automata()
+
+    def _compile_keyword_automata(self):
+        """키워드 사전 → 오토마톤 (사전을 수정한 경우 다시 호출)"""
+        self._headline_automaton = KeywordAutomaton.from_dicts(self.positive_keywords, self.negative_keywords)
+        self._disclosure_automaton = KeywordAutomaton.from_dicts(
+            self.positive_disclosure_keywords, self.negative_disclosure_keywords
+        )
+        # 헤드라인 점수 캐시 버전 (사전이 바뀌면 캐시 무효화)
+        self._lexicon_version = hashlib.sha1(json.dumps(
+            [self.positive_keywords, self.negative_keywords], ensure_ascii=False, sort_keys=True
+        ).encode("utf-8")).hexdigest()[:12]
+
+    def score_headlines(self, headlines: List[str]) -> List[float]:
+        """
+        헤드라인 일괄 센티먼트 (-1.0 ~ 1.0)
+
+        Args:
+            headlines: 헤드라인 목록 (시장 전체 뉴스 등)
+
+        Returns:
+            헤드라인 순서 점수 목록
+        """
+        return self._headline_automaton.score_many(headlines)
+
+    def score_disclosures(self, titles: List[str]) -> List[float]:
+        """공시 제목 일괄 센티먼트 (-1.0 ~ 1.0)"""
+        return self._disclosure_automaton.score_many(titles)
+
+    def _keyword_automaton(self, kind: str) -> KeywordAutomaton:
+        if kind == "headline":
+            return self._headline_automaton
+        if kind == "disclosure":
+            return self._disclosure_automaton
+        raise ValueError(f"지원하지 않는 텍스트 종류: {kind}")
+
+    def keyword_matrix(self, texts: List[str], kind: str = "headline") -> KeywordMatrix:
+        """
+        텍스트 × 키워드 희소 행렬 (텍스트당 1회 탐색, 가중치 보정/백테스트용)
+
+        Args:
+            texts: 헤드라인 또는 공시 제목 목록
+            kind: "headline" (뉴스 사전) 또는 "disclosure" (공시 사전)
+
+        Returns:
+            KeywordMatrix (열 순서 = keyword_weights(kind)의 키워드 순서)
+        """
+        return self._keyword_automaton(kind).matrix(texts)
+
+    def keyword_weights(self, kind: str = "headline") -> Dict[str, float]:
+        """행렬 열 순서의 키워드 → 가중치 (긍정/부정 중복 키워드는 합산)"""
+        automaton = self._keyword_automaton(kind)
+        return dict(zip(automaton.keywords, automaton.weights))
+
+    def score_texts(
+        self,
+        texts: Any,
+        kind: str = "headline",
+        weights: Optional[Any] = None,
+        clip: float = 1.0
+    ) -> np.ndarray:
+        """
+        대량 텍스트 일괄 센티먼트 (희소 행렬-벡터 곱 1회)
+
+        Args:
+            texts: 텍스트 목록 또는 keyword_matrix() 결과 (가중치만 바꿔 재계산할 때)
+            kind: "headline" 또는 "disclosure"
+            weights: 키워드 가중치 벡터 (None이면 사전 가중치, 보정 후보 평가용)
+            clip: 점수 범위 [-clip, clip]
+
+        Returns:
+            텍스트 순서 점수 배열 (score_headlines/score_disclosures와 동일 값)
+        """
+        automaton = self._keyword_automaton(kind)
+        matrix = texts if isinstance(texts, KeywordMatrix) else automaton.matrix(texts)
+        return automaton.score_matrix(matrix, weights, clip)
+
     def analyze(
         self,
         stock_code: str,
@@ -327,21 +487,17 @@ class SentimentAgent:
             if price_data and "close_price" in price_data:
                 current_price = price_data["close_price"]
 
-        # 2. 뉴스 센티먼트 분석
-        news_result = self._analyze_news_sentiment(stock_code, stock_name)
-
-        # 3. 애널리스트 센티먼트 분석
-        analyst_result = self._analyze_analyst_sentiment(
-            stock_code,
-            stock_name,
-            current_price
-        )
-
-        # 4. 공시 센티먼트 분석
-        disclosure_result = self._analyze_disclosure_sentiment(stock_code, stock_name)
-
-        # 5. 실적 서프라이즈 분석
-        earnings_result = self._analyze_earnings_surprise(stock_code, financial_data)
+        # 2-5. 뉴스 / 애널리스트 / 공시 / 실적 서프라이즈 (소스별 독립, 동시 수집)
+        source_results, timed_out_sources = self._run_sources({
+            "news": lambda: self._analyze_news_sentiment(stock_code, stock_name),
+            "analyst": lambda: self._analyze_analyst_sentiment(stock_code, stock_name, current_price),
+            "disclosure": lambda: self._analyze_disclosure_sentiment(stock_code, stock_name),
+            "earnings": lambda: self._analyze_earnings_surprise(stock_code, financial_data),
+        }, stock_code)
+        news_result = source_results["news"]
+        analyst_result = source_results["analyst"]
+        disclosure_result = source_results["disclosure"]
+        earnings_result = source_results["earnings"]
 
         # 6. 종합 센티먼트 점수 계산
         total_score, sentiment_grade = self._calculate_total_sentiment_score(
@@ -376,6 +532,7 @@ class SentimentAgent:
             news_weighted_sentiment=news_result.get("weighted_sentiment"),
             news_volume=news_result.get("volume", 0),
             news_volume_signal=news_result.get("volume_signal", "normal"),
+            news_volume_zscore=news_result.get("volume_zscore"),
             positive_news_count=news_result.get("positive_count", 0),
             negative_news_count=news_result.get("negative_count", 0),
             recent_headlines=news_result.get("recent_headlines", []),
@@ -391,7 +548,9 @@ class SentimentAgent:
             avg_target_price=analyst_result.get("avg_target"),
             median_target_price=analyst_result.get("median_target"),
             upside_to_avg=analyst_result.get("upside_to_avg"),
+            target_price_change_1m=analyst_result.get("tp_change_1m"),
             target_price_change_3m=analyst_result.get("tp_change_3m"),
+            target_price_change_6m=analyst_result.get("tp_change_6m"),
             current_year_eps_revision=analyst_result.get("current_year_revision"),
             next_year_eps_revision=analyst_result.get("next_year_revision"),
             eps_up_revisions=analyst_result.get("up_revisions", 0),
@@ -412,9 +571,119 @@ class SentimentAgent:
             earnings_surprises=earnings_result.get("surprises", []),
             # 종합
             key_drivers=key_drivers,
-            investment_signal=investment_signal
+            investment_signal=investment_signal,
+            timed_out_sources=timed_out_sources
         )
 
+    def analyze_universe(
+        self,
+        stock_codes: List[str],
+        current_prices: Optional[Dict[str, int]] = None
+    ) -> Dict[str, SentimentAnalysisResult]:
+        """
+        여러 종목 센티먼트 동시 분석
+
+        종목 분석은 universe_workers개씩 동시에 실행되고, 네이버/구글 요청은 모두 크롤링 스케줄러
+        호스트 대기열을 거치므로 동시 분석 종목 수와 무관하게 호스트별 동시 요청/요청 간격이 유지된다.
+
+        Args:
+            stock_codes: 종목코드 목록
+            current_prices: {종목코드: 현재주가} (옵션)
+
+        Returns:
+            {종목코드: 센티먼트 분석 결과} (분석 실패 종목 제외, 입력 순서)
+        """
+        current_prices = current_prices or {}
+        results: Dict[str, SentimentAnalysisResult] = {}
+
+        with ThreadPoolExecutor(max_workers=max(1, self.config.universe_workers),
+                                thread_name_prefix="sentiment-universe") as executor:
+            futures = {
+                code: executor.submit(self.analyze, code, current_prices.get(code))
+                for code in stock_codes
+            }
+            for code, future in futures.items():
+                try:
+                    results[code] = future.result()
+                except Exception as e:
+                    self.logger.error(f"센티먼트 분석 실패 ({code}): {e}")
+
+        if self.news_store is not None:
+            self.news_store.flush()
+        self.logger.info(f"종목 전체 센티먼트 분석 완료: {len(results)}/{len(stock_codes)}개")
+        return results
+
+    def _run_sources(
+        self,
+        branches: Dict[str, Callable[[], Dict[str, Any]]],
+        stock_code: str
+    ) -> tuple[Dict[str, Dict[str, Any]], List[str]]:
+        """
+        소스별 분석 동시 실행 (분석 1회 제한 시간)
+
+        제한 시간 안에 끝나지 않거나 예외가 난 소스는 중립({"score": 50})으로 대체하므로
+        센티먼트 지연은 소스 합계가 아니라 가장 느린 소스(최대 제한 시간)로 제한된다.
+        늦은 소스의 크롤링 요청은 제한 시각에 취소되어 대기열에서 빠진다 (진행 중인 요청만 HTTP 타임아웃까지).
+
+        Args:
+            branches: {소스명: 분석 함수}
+            stock_code: 종목코드 (로그용)
+
+        Returns:
+            ({소스명: 결과}, 중립 처리된 소스명 목록)
+        """
+        if not self.config.parallel_sources:
+            return {name: branch() for name, branch in branches.items()}, []
+
+        # DART 고유번호 매핑은 지연 로딩이므로 스레드 분기 전에 미리 로드
+        if self.dart:
+            try:
+                self.dart.get_corp_code_by_stock_code(stock_code)
+            except Exception as e:
+                self.logger.warning(f"DART 고유번호 매핑 로드 실패: {e}")
+
+        results: Dict[str, Dict[str, Any]] = {}
+        failed: List[str] = []
+        deadline = time.monotonic() + self.config.source_deadline_seconds
+        executor = ThreadPoolExecutor(max_workers=len(branches), thread_name_prefix="sentiment")
+        try:
+            futures = {executor.submit(self._run_branch, branch, deadline): name for name, branch in branches.items()}
+            done, pending = wait(futures, timeout=self.config.source_deadline_seconds)
+
+            for future in done:
+                name = futures[future]
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    self.logger.error(f"{name} 센티먼트 분석 오류 ({stock_code}): {e}")
+                    results[name] = {"score": 50}
+                    failed.append(name)
+
+            for future in pending:
+                name = futures[future]
+                self.logger.warning(
+                    f"{name} 센티먼트 제한 시간 초과 ({stock_code}, "
+                    f"{self.config.source_deadline_seconds:g}초) - 중립 처리"
+                )
+                results[name] = {"score": 50}
+                failed.append(name)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return results, [name for name in branches if name in failed]
+
+    def _run_branch(self, branch: Callable[[], Dict[str, Any]], deadline: float) -> Dict[str, Any]:
+        """소스 분석 실행 (스레드 제한 시각 설정 → _crawl이 사용)"""
+        self._source_deadline.value = deadline
+        try:
+            return branch()
+        finally:
+            self._source_deadline.value = None
+
+    def _crawl(self, url: str, parser: Callable[[str], Any]) -> tuple:
+        """크롤링 스케줄러 요청 (소스 분석 제한 시각이 있으면 그때까지만 대기)"""
+        return self.crawler.fetch(url, parser, deadline=getattr(self._source_deadline, "value", None))
+
     def _analyze_news_sentiment(
         self,
         stock_code: str,
@@ -428,7 +697,10 @@ class SentimentAgent:
             "volume_signal": "normal",
             "positive_count": 0,
             "negative_count": 0,
-            "recent_headlines": []
+            "recent_headlines": [],
+            "duplicates_removed": 0,
+            "volume_zscore": None,
+            "decayed_sentiment": {}
         }
 
         try:
@@ -447,12 +719,22 @@ class SentimentAgent:
                 self.logger.warning(f"뉴스 데이터 없음: {stock_code}")
                 return result
 
+            # 소스/실행 간 중복 기사 제거 (같은 스토리는 1건으로 집계)
+            if self.news_store is not None:
+                batch = self.news_store.add_articles(stock_code, news_articles)
+                result["duplicates_removed"] = batch.duplicates
+                news_articles = batch.stories
+
             result["volume"] = len(news_articles)
 
-            # 각 기사 센티먼트 분석
+            # 각 기사 센티먼트 분석 (헤드라인 일괄 점수, 이전에 본 헤드라인은 캐시)
             sentiments = []
-            for article in news_articles:
-                sentiment = self._analyze_headline(article["headline"])
+            headlines = [article["headline"] for article in news_articles]
+            if self.news_store is not None:
+                scores = self.news_store.score_headlines(headlines, self.score_headlines, self._lexicon_version)
+            else:
+                scores = self.score_headlines(headlines)
+            for article, sentiment in zip(news_articles, scores):
                 sentiments.append({
                     "date": article["date"],
                     "source": article["source"],
@@ -468,8 +750,18 @@ class SentimentAgent:
             # 최근 헤드라인 저장 (최대 5개)
             result["recent_headlines"] = sentiments[:5]
 
-            # 시간 가중 평균 센티먼트 계산
-            if sentiments:
+            # 일별 시계열 누적 (중복 제거 시 새 스토리만, 아니면 이번 수집으로 그날 집계 교체)
+            series = self._record_sentiment_series(stock_code, news_articles, sentiments)
+            decayed = None
+            if series is not None:
+                result["decayed_sentiment"] = series["decayed_sentiment"]
+                result["volume_zscore"] = series["volume_zscore"]
+                decayed = series["decayed_sentiment"].get(self.config.news_sentiment_half_life_days)
+
+            # 시간 가중 평균 센티먼트 계산 (일별 시계열이 있으면 반감기 감쇠 평균)
+            if decayed is not None:
+                result["weighted_sentiment"] = round(decayed, 3)
+            elif sentiments:
                 # 최근 뉴스에 더 높은 가중치 (지수 감소)
                 total_weight = 0
                 weighted_sum = 0
@@ -481,9 +773,11 @@ class SentimentAgent:
                 weighted_sentiment = weighted_sum / total_weight if total_weight > 0 else 0
                 result["weighted_sentiment"] = round(weighted_sentiment, 3)
 
-            # 뉴스 볼륨 시그널
+            # 뉴스 볼륨 시그널 (이력이 충분하면 당일 기사 수 z-score)
             avg_volume = 20  # 평균 뉴스 개수 가정
-            if result["volume"] > avg_volume * 2:
+            if result["volume_zscore"] is not None:
+                result["volume_signal"] = series["volume_signal"]
+            elif result["volume"] > avg_volume * 2:
                 result["volume_signal"] = "surge"
             elif result["volume"] > avg_volume * self.config.news_volume_threshold:
                 result["volume_signal"] = "above_normal"
@@ -505,27 +799,55 @@ class SentimentAgent:
 
         return result
 
-    def _analyze_headline(self, headline: str) -> float:
-        """헤드라인 센티먼트 분석"""
-        score = 0
-        matched_keywords = []
+    def _record_sentiment_series(
+        self,
+        stock_code: str,
+        news_articles: List[Dict[str, Any]],
+        sentiments: List[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """기사 센티먼트 → 일별 시계열 누적 후 종목 지표 (저장소 미사용/실패 시 None)"""
+        if self.sentiment_store is None:
+            return None
+        try:
+            items = [
+                (s["date"], s["sentiment"]) for article, s in zip(news_articles, sentiments)
+                if s["date"] and article.get("is_new", True)
+            ]
+            self.sentiment_store.add(stock_code, items, replace=self.news_store is None)
+            return self.news_volume_signals([stock_code]).to_dict(stock_code)
+        except Exception as e:
+            self.logger.warning(f"센티먼트 시계열 기록 실패 ({stock_code}): {e}")
+            return None
 
-        # 긍정 키워드 체크
-        for keyword, weight in self.positive_keywords.items():
-            if keyword in headline:
-                score += weight
-                matched_keywords.append((keyword, weight))
+    def news_volume_signals(
+        self,
+        stock_codes: Optional[List[str]] = None,
+        as_of: Optional[str] = None
+    ) -> SentimentSeriesMetrics:
+        """
+        전 종목 뉴스 볼륨 급증/감쇠 센티먼트 (저장된 일별 시계열만 사용, 원격 조회 없음)
 
-        # 부정 키워드 체크
-        for keyword, weight in self.negative_keywords.items():
-            if keyword in headline:
-                score += weight
-                matched_keywords.append((keyword, weight))
+        Args:
+            stock_codes: 종목코드 (None이면 시계열 있는 전 종목)
+            as_of: 기준일 (None이면 오늘)
 
-        # -1 ~ 1 범위로 정규화
-        normalized_score = max(-1, min(1, score))
+        Returns:
+            SentimentSeriesMetrics (volume_signal: "surge" / "above_normal" / "normal")
+        """
+        if self.sentiment_store is None:
+            raise RuntimeError("sentiment_series 설정이 꺼져 있습니다.")
+        return self.sentiment_store.metrics(
+            stock_codes,
+            as_of=as_of,
+            baseline_half_life=self.config.news_volume_baseline_half_life_days,
+            surge_z=self.config.news_volume_surge_z,
+            above_normal_z=self.config.news_volume_above_z,
+            min_history_days=self.config.news_volume_min_history_days
+        )
 
-        return normalized_score
+    def _analyze_headline(self, headline: str) -> float:
+        """헤드라인 센티먼트 분석 (긍정/부정 키워드 가중치 합, -1 ~ 1)"""
+        return self._headline_automaton.score(headline)
 
     def _analyze_analyst_sentiment(
         self,
@@ -552,7 +874,9 @@ class SentimentAgent:
             "avg_target": None,
             "median_target": None,
             "upside_to_avg": None,
+            "tp_change_1m": None,
             "tp_change_3m": None,
+            "tp_change_6m": None,
             "current_year_revision": None,
             "next_year_revision": None,
             "up_revisions": 0,
@@ -575,6 +899,9 @@ class SentimentAgent:
                 self.logger.warning(f"애널리스트 데이터 없음: {stock_code}")
                 return result
 
+            # 오늘 스냅샷 기록 + 이력 지표 (이력 2일 이상이면 의견 변화/목표주가 변화/EPS 수정에 사용)
+            history = self._record_consensus(stock_code, analyst_data)
+
             # 1. 투자의견 분포
             result["rating_distribution"] = analyst_data.get("rating_distribution", result["rating_distribution"])
             result["total_analysts"] = sum(result["rating_distribution"].values())
@@ -595,12 +922,17 @@ class SentimentAgent:
                 result["consensus"] = self._get_consensus_label(consensus_score)
 
             # 2. 의견 변화 모멘텀
-            result["upgrades"] = analyst_data.get("upgrades_3m", 0)
-            result["downgrades"] = analyst_data.get("downgrades_3m", 0)
+            if history:
+                result["upgrades"] = history["upgrades_3m"]
+                result["downgrades"] = history["downgrades_3m"]
+                result["rating_momentum"] = history["rating_momentum"] or 0.0
+            else:
+                result["upgrades"] = analyst_data.get("upgrades_3m", 0)
+                result["downgrades"] = analyst_data.get("downgrades_3m", 0)
 
-            total_changes = result["upgrades"] + result["downgrades"]
-            if total_changes > 0:
-                result["rating_momentum"] = (result["upgrades"] - result["downgrades"]) / total_changes
+                total_changes = result["upgrades"] + result["downgrades"]
+                if total_changes > 0:
+                    result["rating_momentum"] = (result["upgrades"] - result["downgrades"]) / total_changes
 
             # 3. 목표주가 분석
             target_prices = analyst_data.get("target_prices", [])
@@ -609,12 +941,25 @@ class SentimentAgent:
                 result["median_target"] = int(sorted(target_prices)[len(target_prices) // 2])
                 result["upside_to_avg"] = round((result["avg_target"] / current_price - 1) * 100, 2)
                 result["tp_change_3m"] = analyst_data.get("tp_change_3m", 0.0)
+                if history:
+                    # 해당 기간 이전 스냅샷이 없으면 None (3개월은 수집값 유지)
+                    changes = history["target_price_change"]
+                    result["tp_change_1m"] = changes[1]
+                    result["tp_change_6m"] = changes[6]
+                    if changes[3] is not None:
+                        result["tp_change_3m"] = changes[3]
 
             # 4. 이익 추정치 수정
             result["current_year_revision"] = analyst_data.get("eps_revision_current", 0.0)
             result["next_year_revision"] = analyst_data.get("eps_revision_next", 0.0)
             result["up_revisions"] = analyst_data.get("eps_up_count", 0)
             result["down_revisions"] = analyst_data.get("eps_down_count", 0)
+            if history and history["eps_revision_current"] is not None:
+                result["current_year_revision"] = history["eps_revision_current"]
+                result["up_revisions"] = history["eps_up_3m"]
+                result["down_revisions"] = history["eps_down_3m"]
+            if history and history["eps_revision_next"] is not None:
+                result["next_year_revision"] = history["eps_revision_next"]
 
             total_revisions = result["up_revisions"] + result["down_revisions"]
             if total_revisions > 0:
@@ -658,6 +1003,20 @@ class SentimentAgent:
 
         return result
 
+    def _record_consensus(self, stock_code: str, analyst_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """컨센서스 스냅샷 기록 후 종목 이력 지표 반환 (이력 1일 이하/비활성/오류 시 None)"""
+        if self.consensus_store is None:
+            return None
+        try:
+            self.consensus_store.record(stock_code, analyst_data)
+            history = self.consensus_store.metrics([stock_code]).to_dict(stock_code)
+        except Exception as e:
+            self.logger.warning(f"컨센서스 이력 처리 실패 ({stock_code}): {e}")
+            return None
+        if not history or history["snapshots"] < 2:
+            return None
+        return history
+
     def _analyze_disclosure_sentiment(
         self,
         stock_code: str,
@@ -674,8 +1033,8 @@ class SentimentAgent:
         }
 
         try:
-            # DART API를 통해 공시 데이터 수집
-            disclosures = self._fetch_disclosures_dart(stock_code, days=self.config.disclosure_lookback_days)
+            # DART API를 통해 공시 데이터 수집 (실적 분석과 공용)
+            disclosures = self._disclosure_feed(stock_code)
 
             if not disclosures:
                 self.logger.warning(f"공시 데이터 없음: {stock_code}")
@@ -686,8 +1045,8 @@ class SentimentAgent:
             positive_events = []
             negative_events = []
 
-            for disclosure in disclosures:
-                sentiment = self._calculate_disclosure_sentiment(disclosure["title"])
+            scores = self.score_disclosures([disclosure["title"] for disclosure in disclosures])
+            for disclosure, sentiment in zip(disclosures, scores):
                 disclosure["sentiment"] = sentiment
 
                 if sentiment > 0.3:
@@ -710,20 +1069,8 @@ class SentimentAgent:
         return result
 
     def _calculate_disclosure_sentiment(self, title: str) -> float:
-        """공시 센티먼트 계산"""
-        sentiment = 0
-
-        # 긍정 공시 키워드
-        for keyword, weight in self.positive_disclosure_keywords.items():
-            if keyword in title:
-                sentiment += weight
-
-        # 부정 공시 키워드
-        for keyword, weight in self.negative_disclosure_keywords.items():
-            if keyword in title:
-                sentiment += weight
-
-        return max(-1, min(1, sentiment))
+        """공시 센티먼트 계산 (공시 키워드 가중치 합, -1 ~ 1)"""
+        return self._disclosure_automaton.score(title)
 
     def _analyze_earnings_surprise(
         self,
@@ -737,49 +1084,23 @@ class SentimentAgent:
             "consecutive_beats": 0,
             "consecutive_misses": 0,
             "beat_rate": None,
-            "surprises": []
+            "surprises": [],
+            "source": None,
+            "from_cache": False
         }
 
         try:
-            # 하이브리드 접근: DART 최우선, 하지만 최신 분기 없으면 Naver 보충
-            earnings_data = []
-            has_recent_quarter = False
-
-            # 1차: DART에서 실적 데이터 수집
-            if self.dart:
-                earnings_data, has_recent_quarter = self._fetch_earnings_data_dart(stock_code)
-
-            # 2차: DART에 최신 분기가 없으면 Naver로 보충 시도
-            if earnings_data and not has_recent_quarter:
-                self.logger.info(f"DART에 최신 분기 없음. Naver 금융에서 최신 실적 확인 중...")
-                naver_data = self._fetch_earnings_data_naver(stock_code)
-
-                if naver_data:
-                    # Naver에서 가장 최신 데이터를 가져와서 사용
-                    # Naver 데이터가 더 신선하므로 우선 사용
-                    self.logger.info(f"Naver 금융에서 최신 실적 수집 성공. Naver 데이터 우선 사용.")
-                    earnings_data = naver_data
-                else:
-                    self.logger.info(f"Naver 금융에서도 최신 실적 없음. DART의 최신 데이터 사용.")
-                    # earnings_data는 DART 데이터 그대로 사용
-
-            # 3차: DART에 데이터가 아예 없으면 eBest 시도
-            if not earnings_data and self.ebest:
-                self.logger.info(f"DART 실적 없음. eBest API 시도 중...")
-                earnings_data = self._fetch_earnings_data_ebest(stock_code)
-
-            # 4차: 모두 실패하면 Naver 최종 시도
-            if not earnings_data:
-                self.logger.info(f"DART/eBest 실적 없음. Naver 금융 최종 시도 중...")
-                earnings_data = self._fetch_earnings_data_naver(stock_code)
+            # 보고 분기 캐시 (새 정기보고서가 없으면 저장값) → 없으면 DART/eBest/Naver 수집
+            earnings_data, data_source, from_cache = self._load_earnings_data(stock_code)
 
             if not earnings_data:
                 self.logger.warning(f"실적 데이터 없음: {stock_code}")
                 return result
 
             # 데이터 소스 로깅
-            data_source = earnings_data[0].get("source", "Unknown") if earnings_data else "Unknown"
-            self.logger.info(f"실적 데이터 소스: {data_source}")
+            result["source"] = data_source
+            result["from_cache"] = from_cache
+            self.logger.info(f"실적 데이터 소스: {data_source}{' (보고 분기 캐시)' if from_cache else ''}")
 
             surprises = []
             consecutive_beats = 0
@@ -836,6 +1157,116 @@ class SentimentAgent:
 
         return result
 
+    def _load_earnings_data(self, stock_code: str) -> tuple[List[Dict[str, Any]], Optional[str], bool]:
+        """
+        실적 데이터 (보고 분기 캐시 우선)
+
+        공시 목록에 저장 기준보다 새로운 정기보고서가 없으면 저장값을 그대로 사용하고,
+        있으면(또는 저장값이 없으면) DART/eBest/Naver에서 다시 수집해 보고 분기 키로 저장한다.
+
+        Returns:
+            (실적 데이터, 사용 소스, 캐시 사용 여부)
+        """
+        if self.earnings_store is None:
+            earnings_data, _ = self._collect_earnings_data(stock_code)
+            return earnings_data, self._earnings_source(earnings_data), False
+
+        filing = latest_periodic_filing(self._disclosure_feed(stock_code)) if self.dart else None
+        record = self.earnings_store.get(stock_code, filing, feed_available=self.dart is not None)
+        if record is not None and record.rows:
+            return [dict(row) for row in record.rows], record.source, True
+
+        earnings_data, sources = self._collect_earnings_data(stock_code)
+        if earnings_data:
+            self.earnings_store.put(
+                stock_code, earnings_data, self._earnings_source(earnings_data), sources=sources, filing=filing
+            )
+        return earnings_data, self._earnings_source(earnings_data), False
+
+    @staticmethod
+    def _earnings_source(earnings_data: List[Dict[str, Any]]) -> Optional[str]:
+        return earnings_data[0].get("source", "Unknown") if earnings_data else None
+
+    def _collect_earnings_data(self, stock_code: str) -> tuple[List[Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+        """
+        DART/eBest/Naver 실적 수집 (하이브리드)
+
+        Returns:
+            (분석에 사용할 실적 데이터, 조회한 소스별 결과)
+        """
+        # 하이브리드 접근: DART 최우선, 하지만 최신 분기 없으면 Naver 보충
+        earnings_data = []
+        has_recent_quarter = False
+        sources: Dict[str, List[Dict[str, Any]]] = {}
+
+        # 1차: DART에서 실적 데이터 수집
+        if self.dart:
+            earnings_data, has_recent_quarter = self._fetch_earnings_data_dart(stock_code)
+            sources["DART"] = earnings_data
+
+        # 2차: DART에 최신 분기가 없으면 Naver로 보충 시도
+        if earnings_data and not has_recent_quarter:
+            self.logger.info(f"DART에 최신 분기 없음. Naver 금융에서 최신 실적 확인 중...")
+            naver_data = self._fetch_earnings_data_naver(stock_code)
+            sources["Naver"] = naver_data
+
+            if naver_data:
+                # Naver에서 가장 최신 데이터를 가져와서 사용
+                # Naver 데이터가 더 신선하므로 우선 사용
+                self.logger.info(f"Naver 금융에서 최신 실적 수집 성공. Naver 데이터 우선 사용.")
+                earnings_data = naver_data
+            else:
+                self.logger.info(f"Naver 금융에서도 최신 실적 없음. DART의 최신 데이터 사용.")
+                # earnings_data는 DART 데이터 그대로 사용
+
+        # 3차: DART에 데이터가 아예 없으면 eBest 시도
+        if not earnings_data and self.ebest:
+            self.logger.info(f"DART 실적 없음. eBest API 시도 중...")
+            earnings_data = self._fetch_earnings_data_ebest(stock_code)
+            sources["eBest"] = earnings_data
+
+        # 4차: 모두 실패하면 Naver 최종 시도
+        if not earnings_data:
+            self.logger.info(f"DART/eBest 실적 없음. Naver 금융 최종 시도 중...")
+            earnings_data = self._fetch_earnings_data_naver(stock_code)
+            sources["Naver"] = earnings_data
+
+        return earnings_data, sources
+
+    def _disclosure_feed(self, stock_code: str) -> List[Dict[str, Any]]:
+        """
+        DART 공시 목록 (disclosure_lookback_days, disclosure_cache_seconds 동안 재사용)
+
+        공시/실적 분석이 동시에 요청하면 먼저 요청한 쪽만 조회하고 나머지는 결과를 기다린다.
+        조회 실패는 빈 목록으로 처리하되 재사용하지 않아 다음 요청에서 다시 조회한다.
+        """
+        now = time.monotonic()
+        with self._disclosure_lock:
+            cached = self._disclosure_feeds.get(stock_code)
+            owner = cached is None or (
+                cached[1].done() and now - cached[0] > self.config.disclosure_cache_seconds
+            )
+            if owner:
+                future: Future = Future()
+                self._disclosure_feeds[stock_code] = (now, future)
+            else:
+                future = cached[1]
+
+        if owner:
+            try:
+                disclosures = self._fetch_disclosures_dart(stock_code, days=self.config.disclosure_lookback_days)
+            except Exception as e:
+                self.logger.error(f"DART 공시 수집 실패: {e}")
+                disclosures = None
+            if disclosures is None:
+                with self._disclosure_lock:
+                    if self._disclosure_feeds.get(stock_code, (None, None))[1] is future:
+                        del self._disclosure_feeds[stock_code]
+            future.set_result(disclosures or [])
+
+        # 공시 분석이 항목에 점수를 기록하므로 복사본 반환
+        return [dict(item) for item in future.result()]
+
     def _calculate_total_sentiment_score(
         self,
         news_result: Dict[str, Any],
@@ -947,26 +1378,13 @@ class SentimentAgent:
 
         news_list = []
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-
             # 네이버 금융 종목 뉴스 페이지
             url = f"https://finance.naver.com/item/news_news.naver?code={stock_code}&page=1&sm=title_entity_id.basic&clusterId="
 
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # 뉴스 리스트 파싱
-            news_items = soup.select('.newsList .articleSubject a')
-            date_items = soup.select('.newsList .date')
-
-            for i, (news_link, date_elem) in enumerate(zip(news_items[:20], date_items[:20])):
-                headline = news_link.get('title', news_link.text.strip())
-                date_str = date_elem.text.strip()
+            # 뉴스 리스트 파싱 (같은 페이지는 캐시)
+            rows, _ = self._crawl(url, self._parse_naver_news_rows)
 
+            for headline, date_str, href in rows:
                 # 날짜 파싱 (예: "2026.02.02" 형식)
                 try:
                     if '.' in date_str:
@@ -982,7 +1400,7 @@ class SentimentAgent:
                         "date": date_obj.strftime("%Y-%m-%d"),
                         "source": "네이버금융",
                         "headline": headline,
-                        "url": "https://finance.naver.com" + news_link.get('href', '')
+                        "url": "https://finance.naver.com" + href
                     })
                 except Exception as e:
                     self.logger.debug(f"날짜 파싱 오류: {e}")
@@ -1010,7 +1428,11 @@ class SentimentAgent:
             encoded_query = quote(query)
             rss_url = f"https://news.google.com/rss/search?q={encoded_query}&hl=ko&gl=KR&ceid=KR:ko"
 
-            feed = feedparser.parse(rss_url)
+            if self.crawler is not None:
+                # 공용 세션 조건부 요청 (변경 없으면 304 + 이전 파싱 결과 재사용)
+                feed, _ = self._crawl(rss_url, feedparser.parse)
+            else:
+                feed = feedparser.parse(rss_url)
 
             for entry in feed.entries[:10]:  # 최대 10개
                 try:
@@ -1066,59 +1488,39 @@ class SentimentAgent:
         }
 
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-
             # 네이버 금융 투자의견 페이지
             url = f"https://finance.naver.com/item/main.naver?code={stock_code}"
 
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # 투자의견 표: [(투자의견, 목표주가)] (같은 페이지는 캐시)
+            opinion_rows, _ = self._crawl(url, self._parse_naver_opinion_rows)
 
             # 투자의견 파싱
             try:
-                consensus_area = soup.select_one('.cop_analysis')
-                if consensus_area:
-                    # 컨센서스 의견 (매수/보유/매도)
-                    opinion_items = consensus_area.select('.tb_type1 tr')
-                    for item in opinion_items:
-                        cells = item.select('td')
-                        if len(cells) >= 4:
-                            # 증권사명, 투자의견, 목표주가, 날짜
-                            opinion_text = cells[1].text.strip() if len(cells) > 1 else ""
-                            target_price_text = cells[2].text.strip() if len(cells) > 2 else ""
-
-                            # 투자의견 매핑
-                            if "매수" in opinion_text or "BUY" in opinion_text.upper():
-                                if "적극" in opinion_text or "STRONG" in opinion_text.upper():
-                                    result["rating_distribution"]["strong_buy"] += 1
-                                else:
-                                    result["rating_distribution"]["buy"] += 1
-                            elif "보유" in opinion_text or "HOLD" in opinion_text.upper():
-                                result["rating_distribution"]["hold"] += 1
-                            elif "매도" in opinion_text or "SELL" in opinion_text.upper():
-                                result["rating_distribution"]["sell"] += 1
-
-                            # 목표주가 파싱
-                            if target_price_text:
-                                try:
-                                    tp = int(target_price_text.replace(",", "").replace("원", ""))
-                                    if tp > 0:
-                                        result["target_prices"].append(tp)
-                                except:
-                                    pass
+                # 컨센서스 의견 (매수/보유/매도)
+                for opinion_text, target_price_text in opinion_rows:
+                    # 투자의견 매핑
+                    if "매수" in opinion_text or "BUY" in opinion_text.upper():
+                        if "적극" in opinion_text or "STRONG" in opinion_text.upper():
+                            result["rating_distribution"]["strong_buy"] += 1
+                        else:
+                            result["rating_distribution"]["buy"] += 1
+                    elif "보유" in opinion_text or "HOLD" in opinion_text.upper():
+                        result["rating_distribution"]["hold"] += 1
+                    elif "매도" in opinion_text or "SELL" in opinion_text.upper():
+                        result["rating_distribution"]["sell"] += 1
+
+                    # 목표주가 파싱
+                    if target_price_text:
+                        try:
+                            tp = int(target_price_text.replace(",", "").replace("원", ""))
+                            if tp > 0:
+                                result["target_prices"].append(tp)
+                        except:
+                            pass
             except Exception as e:
                 self.logger.debug(f"투자의견 파싱 오류: {e}")
 
-            # EPS 컨센서스 파싱 (간략 버전)
-            try:
-                eps_area = soup.select('.gray .tbody')
-                # 실제 구현 시 상세 파싱 필요
-            except Exception as e:
-                self.logger.debug(f"EPS 파싱 오류: {e}")
+            # EPS 컨센서스 파싱: 미구현 (실제 구현 시 상세 파싱 필요)
 
             self.logger.info(f"애널리스트 데이터 수집 완료: {sum(result['rating_distribution'].values())}명")
 
@@ -1132,8 +1534,8 @@ class SentimentAgent:
 
         return result
 
-    def _fetch_disclosures_dart(self, stock_code: str, days: int = 90) -> List[Dict[str, Any]]:
-        """DART API로 공시 수집"""
+    def _fetch_disclosures_dart(self, stock_code: str, days: int = 90) -> Optional[List[Dict[str, Any]]]:
+        """DART API로 공시 수집 (조회 실패 시 None, 조회된 공시 없음은 빈 리스트)"""
         if not self.dart:
             self.logger.warning("DART 클라이언트가 없습니다.")
             return []
@@ -1171,7 +1573,7 @@ class SentimentAgent:
 
         except Exception as e:
             self.logger.error(f"DART 공시 수집 실패: {e}")
-            return []
+            return None
 
         return disclosures
 
@@ -1183,76 +1585,54 @@ class SentimentAgent:
 
         earnings_data = []
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-
             # 네이버 금융 투자정보 페이지
             url = f"https://finance.naver.com/item/main.naver?code={stock_code}"
 
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # 네이버 금융의 "투자정보" 섹션 첫 번째 EPS 테이블 행 (같은 페이지는 캐시)
+            rows, _ = self._crawl(url, self._parse_naver_eps_rows)
 
             # 실적 분석 탭에서 분기별 EPS 데이터 파싱
             try:
-                # 컨센서스 실적 테이블 (tb_type1 클래스)
-                # 네이버 금융의 "투자정보" 섹션에서 실적 데이터 추출
-                finance_table = soup.select('.sub_section.cop_analysis')
-
-                if finance_table:
-                    # EPS 관련 테이블 찾기
-                    tables = soup.select('.gray')
-
-                    for table in tables:
-                        # EPS 또는 실적 관련 테이블 찾기
-                        header = table.select_one('th')
-                        if header and ('EPS' in header.text or '주당순이익' in header.text):
-                            rows = table.select('tr')
-
-                            # 연도/분기 정보 파싱
-                            quarters = []
-                            actual_values = []
-                            estimate_values = []
-
-                            for row in rows:
-                                cells = row.select('td')
-                                if len(cells) >= 2:
-                                    # 분기 정보
-                                    quarter_text = cells[0].text.strip()
-                                    if quarter_text and ('Q' in quarter_text or '/' in quarter_text):
-                                        quarters.append(quarter_text)
-
-                                        # 실제 값
-                                        actual_text = cells[1].text.strip() if len(cells) > 1 else ""
-                                        try:
-                                            actual = float(actual_text.replace(',', '')) if actual_text and actual_text != '-' else 0
-                                            actual_values.append(actual)
-                                        except:
-                                            actual_values.append(0)
-
-                                        # 추정치 (있는 경우)
-                                        estimate_text = cells[2].text.strip() if len(cells) > 2 else ""
-                                        try:
-                                            estimate = float(estimate_text.replace(',', '')) if estimate_text and estimate_text != '-' else 0
-                                            estimate_values.append(estimate)
-                                        except:
-                                            estimate_values.append(0)
-
-                            # 데이터 조합
-                            for i, quarter in enumerate(quarters[:8]):  # 최대 8분기
-                                actual = actual_values[i] if i < len(actual_values) else 0
-                                estimate = estimate_values[i] if i < len(estimate_values) else actual * 0.95  # 추정치가 없으면 실제값의 95%로 가정
-
-                                earnings_data.append({
-                                    "quarter": quarter,
-                                    "actual_eps": actual,
-                                    "estimate_eps": estimate,
-                                    "source": "Naver"
-                                })
-
-                            break  # 첫 번째 EPS 테이블만 사용
+                if rows:
+                    # 연도/분기 정보 파싱
+                    quarters = []
+                    actual_values = []
+                    estimate_values = []
+
+                    for cells in rows:
+                        if len(cells) >= 2:
+                            # 분기 정보
+                            quarter_text = cells[0]
+                            if quarter_text and ('Q' in quarter_text or '/' in quarter_text):
+                                quarters.append(quarter_text)
+
+                                # 실제 값
+                                actual_text = cells[1] if len(cells) > 1 else ""
+                                try:
+                                    actual = float(actual_text.replace(',', '')) if actual_text and actual_text != '-' else 0
+                                    actual_values.append(actual)
+                                except:
+                                    actual_values.append(0)
+
+                                # 추정치 (있는 경우)
+                                estimate_text = cells[2] if len(cells) > 2 else ""
+                                try:
+                                    estimate = float(estimate_text.replace(',', '')) if estimate_text and estimate_text != '-' else 0
+                                    estimate_values.append(estimate)
+                                except:
+                                    estimate_values.append(0)
+
+                    # 데이터 조합
+                    for i, quarter in enumerate(quarters[:8]):  # 최대 8분기
+                        actual = actual_values[i] if i < len(actual_values) else 0
+                        estimate = estimate_values[i] if i < len(estimate_values) else actual * 0.95  # 추정치가 없으면 실제값의 95%로 가정
+
+                        earnings_data.append({
+                            "quarter": quarter,
+                            "actual_eps": actual,
+                            "estimate_eps": estimate,
+                            "source": "Naver"
+                        })
 
                 # 간단한 방식: API 방식으로 시도 (네이버 금융 AJAX)
                 if not earnings_data:
@@ -1273,6 +1653,51 @@ class SentimentAgent:
 
         return earnings_data
 
+    # ========================================================================
+    # 네이버 금융 페이지 파서 (대상 영역만 파싱, 결과는 페이지 해시로 캐시)
+    # ========================================================================
+
+    @staticmethod
+    def _parse_naver_news_rows(html: str) -> List[tuple]:
+        """종목 뉴스 페이지 → [(헤드라인, 날짜 문자열, 링크)] (최대 20개)"""
+        soup = parse_html(html, ("newsList",))
+        news_items = soup.select('.newsList .articleSubject a')
+        date_items = soup.select('.newsList .date')
+        return [
+            (news_link.get('title', news_link.text.strip()), date_elem.text.strip(), news_link.get('href', ''))
+            for news_link, date_elem in zip(news_items[:20], date_items[:20])
+        ]
+
+    @staticmethod
+    def _parse_naver_opinion_rows(html: str) -> List[tuple]:
+        """종목 메인 페이지 → 투자의견 표 [(투자의견, 목표주가)]"""
+        soup = parse_html(html, ("cop_analysis",))
+        consensus_area = soup.select_one('.cop_analysis')
+        if not consensus_area:
+            return []
+
+        rows = []
+        for item in consensus_area.select('.tb_type1 tr'):
+            cells = item.select('td')
+            if len(cells) >= 4:
+                # 증권사명, 투자의견, 목표주가, 날짜
+                rows.append((cells[1].text.strip(), cells[2].text.strip()))
+        return rows
+
+    @staticmethod
+    def _parse_naver_eps_rows(html: str) -> List[List[str]]:
+        """종목 메인 페이지 → 첫 번째 EPS 테이블 행별 셀 텍스트 (투자정보 섹션 없으면 빈 목록)"""
+        soup = parse_html(html, ("cop_analysis", "gray"))
+        if not soup.select('.sub_section.cop_analysis'):
+            return []
+
+        for table in soup.select('.gray'):
+            # EPS 또는 실적 관련 테이블 찾기
+            header = table.select_one('th')
+            if header and ('EPS' in header.text or '주당순이익' in header.text):
+                return [[cell.text.strip() for cell in row.select('td')] for row in table.select('tr')]
+        return []
+
     # ========================================================================
     # eBest xingAPI 데이터 수집 함수들
     # ========================================================================
@@ -3,13 +3,31 @@ Technical Agent - 기술적 분석 에이전트
 이동평균, RSI, MACD, 거래량, 수급 분석
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Sequence
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
 import math
 
+import numpy as np
+
 from ..api.krx_client import KrxClient
+from ..models.panel import PricePanel
+from ..utils.history_planner import calendar_start_for_bars
+from ..analytics.indicators import (
+    forward_fill,
+    history_lengths,
+    sma_last,
+    wilder_rsi_last,
+    macd_last
+)
+from ..analytics.indicator_registry import (
+    INDICATOR_REGISTRY,
+    evaluate_indicators,
+    indicator_lookback,
+    indicator_values_at,
+    indicator_signals_at
+)
 
 
 @dataclass
@@ -32,6 +50,9 @@ class TechnicalAnalysisConfig:
     # 분석 기간
     lookback_days: int = 120
 
+    # 보조지표 (analytics.indicator_registry 등록 이름)
+    indicators: List[str] = field(default_factory=lambda: ["bollinger", "atr", "obv", "stochastic", "adx"])
+
 
 @dataclass
 class TechnicalSignal:
@@ -80,6 +101,9 @@ class TechnicalAnalysisResult:
     foreign_net_20d: Optional[int] = None
     institutional_net_20d: Optional[int] = None
 
+    # 보조지표 ({지표명: {출력명: 값}})
+    indicators: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
     # 시그널
     signals: List[TechnicalSignal] = field(default_factory=list)
 
@@ -88,6 +112,51 @@ class TechnicalAnalysisResult:
     recommendation: str = ""
 
 
+@dataclass
+class TechnicalScan:
+    """
+    유니버스 기술적 스캔 결과
+
+    모든 배열은 codes와 같은 순서의 종목 축 배열이며,
+    계산 불가(데이터 부족) 값은 NaN이다.
+    """
+    codes: List[str]
+    trade_date: str
+    bars: np.ndarray  # 종목별 유효 봉 수
+    close: np.ndarray
+
+    # 추세
+    ma: Dict[int, np.ndarray]
+    prev_ma20: np.ndarray
+    prev_ma60: np.ndarray
+    arrangement: np.ndarray  # 1: 정배열, -1: 역배열, 0: 혼조
+    golden_cross: np.ndarray
+    death_cross: np.ndarray
+
+    # 모멘텀
+    rsi: np.ndarray
+    macd: np.ndarray
+    macd_signal: np.ndarray
+    macd_histogram: np.ndarray
+    macd_bullish_cross: np.ndarray
+    macd_bearish_cross: np.ndarray
+
+    # 거래량
+    volume_ratio: np.ndarray
+
+    # 점수 (0-100)
+    trend_score: np.ndarray
+    momentum_score: np.ndarray
+    volume_score: np.ndarray
+
+    # 보조지표 ({지표명: {출력명: 종목 축 배열}})
+    indicators: Dict[str, Dict[str, np.ndarray]] = field(default_factory=dict)
+
+    def codes_where(self, mask: np.ndarray) -> List[str]:
+        """조건을 만족하는 종목코드 목록"""
+        return [code for code, hit in zip(self.codes, mask) if hit]
+
+
 class TechnicalAgent:
     """
     기술적 분석 에이전트
@@ -121,12 +190,33 @@ class TechnicalAgent:
         self.config = config or TechnicalAnalysisConfig()
         self.logger = logging.getLogger(__name__)
 
-    def analyze(self, stock_code: str) -> TechnicalAnalysisResult:
+        for name in self.config.indicators:
+            if name not in INDICATOR_REGISTRY:
+                self.logger.warning(f"등록되지 않은 보조지표 무시: {name}")
+
+    def required_history_bars(self) -> int:
+        """분석에 필요한 가격 히스토리 봉 수 (최장 이동평균 + 전일 비교 1봉, 보조지표)"""
+        return max(
+            self.config.lookback_days,
+            max(self.config.ma_periods, default=0) + 1,
+            indicator_lookback(self._enabled_indicators())
+        )
+
+    def _enabled_indicators(self) -> List[str]:
+        """설정된 보조지표 중 등록된 것만"""
+        return [name for name in self.config.indicators if name in INDICATOR_REGISTRY]
+
+    def analyze(
+        self,
+        stock_code: str,
+        price_history: Optional[Sequence[Dict[str, Any]]] = None
+    ) -> TechnicalAnalysisResult:
         """
         종목 기술적 분석 실행
 
         Args:
             stock_code: 종목코드 (6자리)
+            price_history: 일별 시세 (None이면 required_history_bars()만큼 조회)
 
         Returns:
             기술적 분석 결과
@@ -134,7 +224,13 @@ class TechnicalAgent:
         self.logger.info(f"기술적 분석 시작: {stock_code}")
 
         # 1. 가격 히스토리 조회
-        price_history = self.krx.get_stock_price_history(stock_code)
+        if price_history is None:
+            end_date = self.krx._get_latest_trade_date()
+            price_history = self.krx.get_stock_price_history(
+                stock_code,
+                start_date=calendar_start_for_bars(self.required_history_bars(), end_date),
+                end_date=end_date
+            )
         if not price_history or len(price_history) < 20:
             self.logger.warning(f"가격 데이터 부족: {stock_code}")
             return self._create_default_result(stock_code)
@@ -142,9 +238,6 @@ class TechnicalAgent:
         # 데이터 추출
         prices = [p["close_price"] for p in price_history]
         volumes = [p.get("volume", 0) for p in price_history]
-        stock_name = self.krx._get_stock_name(stock_code)
-        current_price = prices[-1]
-        analysis_date = datetime.now().strftime("%Y-%m-%d")
 
         # 2. 추세 분석
         trend_result = self._analyze_trend(prices)
@@ -158,10 +251,296 @@ class TechnicalAgent:
         # 5. 수급 분석
         supply_demand_result = self._analyze_supply_demand(stock_code)
 
-        # 6. 시그널 수집
-        signals = self._collect_signals(trend_result, momentum_result, volume_result, supply_demand_result)
+        # 6. 보조지표 (단일 종목 패널로 레지스트리 커널 평가)
+        indicator_result = self._analyze_indicators(
+            PricePanel.from_histories({stock_code: list(price_history)})
+        )
+
+        return self._build_result(
+            stock_code, prices[-1],
+            trend_result, momentum_result, volume_result, supply_demand_result,
+            indicator_result
+        )
+
+    # =========================================================================
+    # 유니버스 일괄 분석
+    # =========================================================================
 
-        # 7. 종합 점수 계산
+    def scan(
+        self,
+        panel: Optional[PricePanel] = None,
+        stock_codes: Optional[List[str]] = None,
+        market: str = "ALL"
+    ) -> TechnicalScan:
+        """
+        유니버스 기술적 스캔 (배열 연산)
+
+        정렬된 날짜 × 종목 패널 하나로 전 종목의 이동평균, 골든/데드크로스,
+        RSI, MACD, 거래량비율 및 추세/모멘텀/거래량 점수를 한 번에 계산한다.
+        점수 규칙은 analyze()의 단일 종목 계산과 동일하다.
+
+        Args:
+            panel: 시세 패널 (None이면 KRX에서 조회)
+            stock_codes: 패널 조회 시 대상 종목 (None이면 시장 전체)
+            market: 패널 조회 시 시장 구분
+
+        Returns:
+            TechnicalScan
+
+        Example:
+            scan = agent.scan()
+            oversold = scan.codes_where(scan.rsi < 30)
+            golden = scan.codes_where(scan.golden_cross)
+        """
+        if panel is None:
+            panel = self.krx.get_ohlcv_panel(stock_codes, n_bars=self.required_history_bars(), market=market)
+
+        close = forward_fill(panel.close)
+        n_codes = close.shape[1]
+        bars = history_lengths(close)
+        current = close[-1] if close.shape[0] else np.full(n_codes, np.nan)
+        nan = np.full(n_codes, np.nan)
+
+        with np.errstate(invalid="ignore"):
+            # 1. 추세 (이동평균)
+            ma = {
+                period: np.where(bars >= period, sma_last(close, period), np.nan)
+                for period in self.config.ma_periods
+            }
+            ma_count = sum((~np.isnan(values)).astype(int) for values in ma.values()) if ma else np.zeros(n_codes, dtype=int)
+            ma20 = np.nan_to_num(ma.get(20, nan), nan=0.0)
+            ma60 = np.nan_to_num(ma.get(60, nan), nan=0.0)
+            ma120 = np.where(np.isnan(ma.get(120, nan)), ma60, ma.get(120, nan))
+
+            trend_ready = bars >= 60
+            aligned = trend_ready & (ma_count >= 3)
+            arrangement = np.where(
+                aligned & (ma20 > ma60) & (ma60 > ma120), 1,
+                np.where(aligned & (ma20 < ma60) & (ma60 < ma120), -1, 0)
+            )
+
+            has_cross_ma = ~np.isnan(ma.get(20, nan)) & ~np.isnan(ma.get(60, nan))
+            cross_ready = trend_ready & (bars >= 61) & has_cross_ma
+            prev_ma20 = np.where(cross_ready, sma_last(close, 20, offset=1), np.nan)
+            prev_ma60 = np.where(cross_ready, sma_last(close, 60, offset=1), np.nan)
+            golden_cross = cross_ready & (ma20 > ma60) & (prev_ma20 <= prev_ma60)
+            death_cross = cross_ready & (ma20 < ma60) & (prev_ma20 >= prev_ma60)
+
+            trend_score = 50 + 25 * arrangement
+            if 20 in ma:
+                trend_score = trend_score + np.where(~np.isnan(ma[20]), np.where(current > ma20, 10, -10), 0)
+            trend_score = trend_score + 15 * golden_cross - 15 * death_cross
+            trend_score = np.where(trend_ready, np.clip(trend_score, 0, 100), 50).astype(float)
+
+            # 2. 모멘텀 (RSI, MACD)
+            momentum_ready = bars >= self.config.rsi_period + 1
+            rsi = np.where(momentum_ready, wilder_rsi_last(close, self.config.rsi_period), np.nan)
+            macd = macd_last(close)
+            has_macd = momentum_ready & ~np.isnan(macd["histogram"])
+
+            momentum_score = 50 + np.select(
+                [rsi < 30, rsi < 40, rsi > 70, rsi > 60], [20, 10, -15, -5], 0
+            )
+            momentum_score = momentum_score + np.where(
+                has_macd,
+                np.select(
+                    [macd["bullish_cross"], macd["bearish_cross"], macd["histogram"] > 0],
+                    [15, -15, 5], -5
+                ),
+                0
+            )
+            momentum_score = np.where(momentum_ready, np.clip(momentum_score, 0, 100), 50).astype(float)
+
+            # 3. 거래량
+            if panel.volume is not None:
+                volume = np.where(np.isnan(panel.volume) & ~np.isnan(close), 0.0, panel.volume)
+                avg_volume = sma_last(volume, 20)
+                volume_ratio = np.where(
+                    (bars >= 20) & (avg_volume > 0), volume[-1] / avg_volume, np.nan
+                )
+            else:
+                volume_ratio = nan.copy()
+
+            rounded_ratio = np.round(volume_ratio, 2)
+            volume_score = 50 + np.select(
+                [rounded_ratio > 1.5, rounded_ratio > 1.2, (rounded_ratio < 0.5) & (rounded_ratio != 0)],
+                [15, 5, -10], 0
+            )
+            volume_score = np.clip(volume_score, 0, 100).astype(float)
+
+        return TechnicalScan(
+            codes=list(panel.codes),
+            trade_date=panel.dates[-1] if panel.dates else "",
+            bars=bars,
+            close=current,
+            ma=ma,
+            prev_ma20=prev_ma20,
+            prev_ma60=prev_ma60,
+            arrangement=arrangement,
+            golden_cross=golden_cross,
+            death_cross=death_cross,
+            rsi=rsi,
+            macd=np.where(has_macd, macd["macd"], np.nan),
+            macd_signal=np.where(has_macd, macd["signal"], np.nan),
+            macd_histogram=np.where(has_macd, macd["histogram"], np.nan),
+            macd_bullish_cross=has_macd & macd["bullish_cross"],
+            macd_bearish_cross=has_macd & macd["bearish_cross"],
+            volume_ratio=volume_ratio,
+            trend_score=trend_score,
+            momentum_score=momentum_score,
+            volume_score=volume_score,
+            indicators=evaluate_indicators(self._enabled_indicators(), panel)
+        )
+
+    def analyze_many(
+        self,
+        stock_codes: List[str],
+        panel: Optional[PricePanel] = None,
+        include_supply_demand: bool = True
+    ) -> Dict[str, TechnicalAnalysisResult]:
+        """
+        다종목 기술적 분석 (일괄)
+
+        시세 패널 하나로 지표를 한 번에 계산하고, 요청 종목에 대해서만
+        TechnicalAnalysisResult를 생성한다. 수급은 시장 전체 투자자별
+        순매수를 한 번씩만 조회하여 종목별로 나눈다.
+
+        Args:
+            stock_codes: 종목코드 목록
+            panel: 시세 패널 (None이면 KRX에서 조회, 요청 종목 외 종목이 있어도 무방)
+            include_supply_demand: 수급 분석 포함 여부
+
+        Returns:
+            {종목코드: 기술적 분석 결과}
+        """
+        self.logger.info(f"기술적 일괄 분석 시작: {len(stock_codes)}종목")
+
+        if panel is None:
+            panel = self.krx.get_ohlcv_panel(stock_codes, n_bars=self.required_history_bars())
+
+        scan = self.scan(panel)
+        supply_demand = self._fetch_supply_demand_batch(panel) if include_supply_demand else {}
+
+        results = {}
+        for stock_code in stock_codes:
+            col = panel.index_of(stock_code)
+            if col is None or scan.bars[col] < 20:
+                self.logger.warning(f"가격 데이터 부족: {stock_code}")
+                results[stock_code] = self._create_default_result(stock_code)
+                continue
+
+            foreign_net, inst_net = supply_demand.get(stock_code, (None, None))
+            if foreign_net is None and inst_net is None:
+                supply_demand_result = self._evaluate_supply_demand(None, None)
+            else:
+                supply_demand_result = self._evaluate_supply_demand(foreign_net or 0, inst_net or 0)
+
+            results[stock_code] = self._build_result(
+                stock_code,
+                int(scan.close[col]),  # 단일 종목 분석과 같이 정수 원 단위 (패널은 float 배열)
+                self._trend_from_scan(scan, col),
+                self._momentum_from_scan(scan, col),
+                self._evaluate_volume(None if np.isnan(scan.volume_ratio[col]) else scan.volume_ratio[col].item()),
+                supply_demand_result,
+                self._indicators_from_scan(scan.indicators, col)
+            )
+
+        return results
+
+    def _trend_from_scan(self, scan: TechnicalScan, col: int) -> Dict[str, Any]:
+        """스캔 결과에서 단일 종목 추세 분석 결과 생성"""
+        if scan.bars[col] < 60:
+            return self._evaluate_trend(None, {})
+
+        ma_values = {
+            period: values[col].item()
+            for period, values in scan.ma.items()
+            if not np.isnan(values[col])
+        }
+        prev_ma20 = None if np.isnan(scan.prev_ma20[col]) else scan.prev_ma20[col].item()
+        prev_ma60 = None if np.isnan(scan.prev_ma60[col]) else scan.prev_ma60[col].item()
+        return self._evaluate_trend(scan.close[col].item(), ma_values, prev_ma20, prev_ma60)
+
+    def _momentum_from_scan(self, scan: TechnicalScan, col: int) -> Dict[str, Any]:
+        """스캔 결과에서 단일 종목 모멘텀 분석 결과 생성"""
+        if scan.bars[col] < self.config.rsi_period + 1:
+            return self._evaluate_momentum(None, None)
+
+        rsi = None if np.isnan(scan.rsi[col]) else scan.rsi[col].item()
+        macd_result = None
+        if not np.isnan(scan.macd_histogram[col]):
+            macd_result = {
+                "macd": scan.macd[col].item(),
+                "signal": scan.macd_signal[col].item(),
+                "histogram": scan.macd_histogram[col].item(),
+                "bullish_cross": bool(scan.macd_bullish_cross[col]),
+                "bearish_cross": bool(scan.macd_bearish_cross[col])
+            }
+        return self._evaluate_momentum(rsi, macd_result)
+
+    def _analyze_indicators(self, panel: PricePanel) -> Dict[str, Any]:
+        """단일 종목 패널 보조지표 분석"""
+        try:
+            outputs = evaluate_indicators(self._enabled_indicators(), panel)
+            return self._indicators_from_scan(outputs, 0)
+        except Exception as e:
+            self.logger.warning(f"보조지표 분석 실패: {e}")
+            return {"values": {}, "signals": []}
+
+    def _indicators_from_scan(
+        self,
+        indicators: Dict[str, Dict[str, np.ndarray]],
+        col: int
+    ) -> Dict[str, Any]:
+        """보조지표 출력에서 단일 종목 값과 시그널 추출"""
+        result = {"values": {}, "signals": []}
+        for name, outputs in indicators.items():
+            result["values"][name] = indicator_values_at(outputs, col)
+            result["signals"].extend(indicator_signals_at(name, outputs, col))
+        return result
+
+    def _fetch_supply_demand_batch(self, panel: PricePanel) -> Dict[str, tuple]:
+        """
+        시장 전체 20일 누적 순매수 일괄 조회
+
+        Returns:
+            {종목코드: (외국인 순매수, 기관 순매수)}
+        """
+        if not panel.dates:
+            return {}
+
+        end_date = panel.dates[-1]
+        start_date = (datetime.strptime(end_date, "%Y%m%d") - timedelta(days=20)).strftime("%Y%m%d")
+
+        foreign = self.krx.get_investor_net_buy_by_ticker(start_date, end_date, "외국인")
+        institution = self.krx.get_investor_net_buy_by_ticker(start_date, end_date, "기관합계")
+
+        return {
+            code: (foreign.get(code), institution.get(code))
+            for code in set(foreign) | set(institution)
+        }
+
+    def _build_result(
+        self,
+        stock_code: str,
+        current_price: int,
+        trend_result: Dict[str, Any],
+        momentum_result: Dict[str, Any],
+        volume_result: Dict[str, Any],
+        supply_demand_result: Dict[str, Any],
+        indicator_result: Optional[Dict[str, Any]] = None
+    ) -> TechnicalAnalysisResult:
+        """세부 분석 결과로부터 종합 결과 생성"""
+        stock_name = self.krx._get_stock_name(stock_code)
+        analysis_date = datetime.now().strftime("%Y-%m-%d")
+        indicator_result = indicator_result or {"values": {}, "signals": []}
+
+        # 시그널 수집
+        signals = self._collect_signals(
+            trend_result, momentum_result, volume_result, supply_demand_result, indicator_result
+        )
+
+        # 종합 점수 계산
         total_score = (
             trend_result["score"] * self.config.trend_weight +
             momentum_result["score"] * self.config.momentum_weight +
@@ -169,7 +548,7 @@ class TechnicalAgent:
             supply_demand_result["score"] * self.config.supply_demand_weight
         )
 
-        # 8. 종합 판단
+        # 종합 판단
         if total_score >= 65:
             overall_signal = "bullish"
             recommendation = "매수 타이밍 양호, 분할 매수 고려"
@@ -205,13 +584,43 @@ class TechnicalAgent:
             institutional_trend=supply_demand_result.get("institutional_trend", "neutral"),
             foreign_net_20d=supply_demand_result.get("foreign_net"),
             institutional_net_20d=supply_demand_result.get("institutional_net"),
+            indicators=indicator_result["values"],
             signals=signals,
             overall_signal=overall_signal,
             recommendation=recommendation
         )
 
+    # =========================================================================
+    # 세부 분석
+    # =========================================================================
+
     def _analyze_trend(self, prices: List[float]) -> Dict[str, Any]:
         """추세 분석 (이동평균)"""
+        if len(prices) < 60:
+            return self._evaluate_trend(None, {})
+
+        # 이동평균 계산
+        ma_values = {}
+        for period in self.config.ma_periods:
+            if len(prices) >= period:
+                ma_values[period] = sum(prices[-period:]) / period
+
+        # 전일 MA (골든크로스/데드크로스 체크용)
+        prev_ma20 = prev_ma60 = None
+        if len(prices) >= 61 and 20 in ma_values and 60 in ma_values:
+            prev_ma20 = sum(prices[-21:-1]) / 20
+            prev_ma60 = sum(prices[-61:-1]) / 60
+
+        return self._evaluate_trend(prices[-1], ma_values, prev_ma20, prev_ma60)
+
+    def _evaluate_trend(
+        self,
+        current_price: Optional[float],
+        ma_values: Dict[int, float],
+        prev_ma20: Optional[float] = None,
+        prev_ma60: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """이동평균 값으로 추세 판단 및 점수 계산"""
         result = {
             "score": 50,
             "arrangement": "mixed",
@@ -219,24 +628,16 @@ class TechnicalAgent:
             "signals": []
         }
 
-        if len(prices) < 60:
+        if current_price is None:
             return result
 
-        current_price = prices[-1]
-
-        # 이동평균 계산
-        ma_values = {}
-        for period in self.config.ma_periods:
-            if len(prices) >= period:
-                ma = sum(prices[-period:]) / period
-                ma_values[period] = ma
-
-                pct_diff = ((current_price / ma) - 1) * 100
-                result["ma_positions"][f"ma{period}"] = {
-                    "value": round(ma, 0),
-                    "vs_price": round(pct_diff, 2),
-                    "position": "above" if current_price > ma else "below"
-                }
+        for period, ma in ma_values.items():
+            pct_diff = ((current_price / ma) - 1) * 100
+            result["ma_positions"][f"ma{period}"] = {
+                "value": round(ma, 0),
+                "vs_price": round(pct_diff, 2),
+                "position": "above" if current_price > ma else "below"
+            }
 
         # 가격 vs MA20, MA60 기록
         if 20 in ma_values:
@@ -258,11 +659,7 @@ class TechnicalAgent:
                 result["arrangement"] = "mixed"
 
         # 골든크로스/데드크로스 체크 (MA20/MA60)
-        if len(prices) >= 61 and 20 in ma_values and 60 in ma_values:
-            # 전일 MA 계산
-            prev_ma20 = sum(prices[-21:-1]) / 20
-            prev_ma60 = sum(prices[-61:-1]) / 60
-
+        if prev_ma20 is not None and prev_ma60 is not None:
             ma20 = ma_values[20]
             ma60 = ma_values[60]
 
@@ -307,6 +704,19 @@ class TechnicalAgent:
 
     def _analyze_momentum(self, prices: List[float]) -> Dict[str, Any]:
         """모멘텀 분석 (RSI, MACD)"""
+        if len(prices) < self.config.rsi_period + 1:
+            return self._evaluate_momentum(None, None)
+
+        rsi = self._calculate_rsi(prices, self.config.rsi_period)
+        macd_result = self._calculate_macd(prices)
+        return self._evaluate_momentum(rsi, macd_result)
+
+    def _evaluate_momentum(
+        self,
+        rsi: Optional[float],
+        macd_result: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """RSI/MACD 값으로 모멘텀 판단 및 점수 계산"""
         result = {
             "score": 50,
             "rsi": None,
@@ -317,11 +727,7 @@ class TechnicalAgent:
             "signals": []
         }
 
-        if len(prices) < self.config.rsi_period + 1:
-            return result
-
-        # RSI 계산
-        rsi = self._calculate_rsi(prices, self.config.rsi_period)
+        # RSI
         if rsi is not None:
             result["rsi"] = round(rsi, 1)
 
@@ -340,8 +746,7 @@ class TechnicalAgent:
                     "strength": "moderate"
                 })
 
-        # MACD 계산
-        macd_result = self._calculate_macd(prices)
+        # MACD
         if macd_result:
             result["macd"] = round(macd_result["macd"], 2)
             result["macd_signal"] = round(macd_result["signal"], 2)
@@ -391,6 +796,16 @@ class TechnicalAgent:
 
     def _analyze_volume(self, volumes: List[int]) -> Dict[str, Any]:
         """거래량 분석"""
+        ratio = None
+        if len(volumes) >= 20:
+            avg_vol = sum(volumes[-20:]) / 20
+            if avg_vol > 0:
+                ratio = volumes[-1] / avg_vol
+
+        return self._evaluate_volume(ratio)
+
+    def _evaluate_volume(self, ratio: Optional[float]) -> Dict[str, Any]:
+        """거래량비율(당일/20일 평균)로 거래량 판단 및 점수 계산"""
         result = {
             "score": 50,
             "ratio": None,
@@ -398,14 +813,7 @@ class TechnicalAgent:
             "signals": []
         }
 
-        if len(volumes) < 20:
-            return result
-
-        current_vol = volumes[-1]
-        avg_vol = sum(volumes[-20:]) / 20
-
-        if avg_vol > 0:
-            ratio = current_vol / avg_vol
+        if ratio is not None:
             result["ratio"] = round(ratio, 2)
 
             if ratio > 2.0:
@@ -442,69 +850,80 @@ class TechnicalAgent:
 
     def _analyze_supply_demand(self, stock_code: str) -> Dict[str, Any]:
         """수급 분석 (외국인, 기관)"""
-        result = {
-            "score": 50,
-            "foreign_trend": "neutral",
-            "institutional_trend": "neutral",
-            "foreign_net": None,
-            "institutional_net": None,
-            "signals": []
-        }
-
         try:
             investor_data = self.krx.get_investor_trading(stock_code)
             if not investor_data:
-                return result
+                return self._evaluate_supply_demand(None, None)
 
             # 20일 누적 순매수
             foreign_net = sum(d.get("foreign_net_buy", 0) for d in investor_data)
             inst_net = sum(d.get("institution_net_buy", 0) for d in investor_data)
 
-            result["foreign_net"] = foreign_net
-            result["institutional_net"] = inst_net
+            return self._evaluate_supply_demand(foreign_net, inst_net)
 
-            # 추세 판단
-            if foreign_net > 10_000_000_000:  # 100억 이상 순매수
-                result["foreign_trend"] = "buying"
-            elif foreign_net < -10_000_000_000:
-                result["foreign_trend"] = "selling"
-
-            if inst_net > 10_000_000_000:
-                result["institutional_trend"] = "buying"
-            elif inst_net < -10_000_000_000:
-                result["institutional_trend"] = "selling"
+        except Exception as e:
+            self.logger.warning(f"수급 분석 실패: {e}")
+            return self._evaluate_supply_demand(None, None)
 
-            # 시그널
-            if result["foreign_trend"] == "buying" and result["institutional_trend"] == "buying":
-                result["signals"].append({
-                    "type": "smart_money_buying",
-                    "description": "외국인+기관 동반 순매수",
-                    "strength": "strong"
-                })
-            elif result["foreign_trend"] == "selling" and result["institutional_trend"] == "selling":
-                result["signals"].append({
-                    "type": "smart_money_selling",
-                    "description": "외국인+기관 동반 순매도",
-                    "strength": "strong"
-                })
+    def _evaluate_supply_demand(
+        self,
+        foreign_net: Optional[int],
+        inst_net: Optional[int]
+    ) -> Dict[str, Any]:
+        """20일 누적 순매수 금액으로 수급 판단 및 점수 계산"""
+        result = {
+            "score": 50,
+            "foreign_trend": "neutral",
+            "institutional_trend": "neutral",
+            "foreign_net": None,
+            "institutional_net": None,
+            "signals": []
+        }
 
-            # 점수 계산
-            score = 50
-            if result["foreign_trend"] == "buying":
-                score += 15
-            elif result["foreign_trend"] == "selling":
-                score -= 15
+        if foreign_net is None or inst_net is None:
+            return result
 
-            if result["institutional_trend"] == "buying":
-                score += 10
-            elif result["institutional_trend"] == "selling":
-                score -= 10
+        result["foreign_net"] = foreign_net
+        result["institutional_net"] = inst_net
+
+        # 추세 판단
+        if foreign_net > 10_000_000_000:  # 100억 이상 순매수
+            result["foreign_trend"] = "buying"
+        elif foreign_net < -10_000_000_000:
+            result["foreign_trend"] = "selling"
+
+        if inst_net > 10_000_000_000:
+            result["institutional_trend"] = "buying"
+        elif inst_net < -10_000_000_000:
+            result["institutional_trend"] = "selling"
+
+        # 시그널
+        if result["foreign_trend"] == "buying" and result["institutional_trend"] == "buying":
+            result["signals"].append({
+                "type": "smart_money_buying",
+                "description": "외국인+기관 동반 순매수",
+                "strength": "strong"
+            })
+        elif result["foreign_trend"] == "selling" and result["institutional_trend"] == "selling":
+            result["signals"].append({
+                "type": "smart_money_selling",
+                "description": "외국인+기관 동반 순매도",
+                "strength": "strong"
+            })
 
-            result["score"] = max(0, min(100, score))
+        # 점수 계산
+        score = 50
+        if result["foreign_trend"] == "buying":
+            score += 15
+        elif result["foreign_trend"] == "selling":
+            score -= 15
 
-        except Exception as e:
-            self.logger.warning(f"수급 분석 실패: {e}")
+        if result["institutional_trend"] == "buying":
+            score += 10
+        elif result["institutional_trend"] == "selling":
+            score -= 10
 
+        result["score"] = max(0, min(100, score))
         return result
 
     def _calculate_rsi(self, prices: List[float], period: int = 14) -> Optional[float]:
@@ -607,16 +1026,19 @@ class TechnicalAgent:
         trend: Dict[str, Any],
         momentum: Dict[str, Any],
         volume: Dict[str, Any],
-        supply_demand: Dict[str, Any]
+        supply_demand: Dict[str, Any],
+        indicators: Optional[Dict[str, Any]] = None
     ) -> List[TechnicalSignal]:
-        """모든 시그널 수집"""
+        """모든 시그널 수집 (시그널에 action이 지정되어 있으면 그대로 사용)"""
         signals = []
 
-        for result in [trend, momentum, volume, supply_demand]:
+        for result in [trend, momentum, volume, supply_demand, indicators or {}]:
             for s in result.get("signals", []):
-                action = "bullish" if "bullish" in s["type"] or "golden" in s["type"] or s["type"] == "rsi_oversold" or s["type"] == "smart_money_buying" else \
-                         "bearish" if "bearish" in s["type"] or "death" in s["type"] or s["type"] == "rsi_overbought" or s["type"] == "smart_money_selling" else \
-                         "neutral"
+                action = s.get("action") or (
+                    "bullish" if "bullish" in s["type"] or "golden" in s["type"] or s["type"] == "rsi_oversold" or s["type"] == "smart_money_buying" else
+                    "bearish" if "bearish" in s["type"] or "death" in s["type"] or s["type"] == "rsi_overbought" or s["type"] == "smart_money_selling" else
+                    "neutral"
+                )
 
                 signals.append(TechnicalSignal(
                     signal_type=s["type"],
@@ -0,0 +1,164 @@
+"""
+Stock Selection Agent - Analytics
+유니버스 단위 배열 연산 모듈 (지표, 리스크 등)
+"""
+
+from .indicators import (
+    forward_fill,
+    history_lengths,
+    sma_last,
+    ema_series,
+    wilder_smooth_series,
+    wilder_rsi_series,
+    wilder_rsi_last,
+    macd_last
+)
+from .indicator_registry import (
+    IndicatorSignalRule,
+    IndicatorDefinition,
+    INDICATOR_REGISTRY,
+    register_indicator,
+    get_indicator,
+    available_indicators,
+    indicator_lookback,
+    evaluate_indicators
+)
+from .alerts import AlertRule, AlertEvent, AlertEngine
+from .risk_engine import RiskMetrics, simple_returns, max_drawdown, compute_risk_metrics
+from .beta import BetaResult, RollingBeta, blume_adjust, week_end_rows, weekly_returns, ols_beta
+from .portfolio_risk import ShrunkCovariance, PortfolioRisk, ledoit_wolf_covariance, compute_portfolio_risk
+from .concentration import (
+    RollingCorrelation,
+    ConcentrationResult,
+    correlation_matrix,
+    cluster_labels,
+    cluster_concentration
+)
+from .credit import CREDIT_FIELDS, RED_FLAGS, CreditThresholds, CreditMetrics, compute_credit_metrics
+from .liquidity import (
+    ADTV_WINDOWS,
+    LiquidityThresholds,
+    LiquidityMetrics,
+    liquidity_grades,
+    compute_liquidity_metrics
+)
+from .sector import (
+    RS_WINDOWS,
+    SectorMomentum,
+    percentile_rank,
+    compute_sector_momentum,
+    blend_outlook
+)
+from .sector_valuation import (
+    ValuationStats,
+    GroupValuation,
+    SectorValuations,
+    compute_sector_valuations,
+    peer_comparison
+)
+from .market_cap_rank import MarketCapRanks, rank_within, build_market_cap_ranks
+from .stress import (
+    Scenario,
+    HistoricalScenario,
+    DEFAULT_SCENARIOS,
+    HISTORICAL_SCENARIOS,
+    FactorExposures,
+    StressResult,
+    MonteCarloConfig,
+    MonteCarloResult,
+    build_exposures,
+    apply_scenarios,
+    factor_loadings,
+    systematic_daily_vol,
+    monte_carlo_stress
+)
+
+__all__ = [
+    # Indicators
+    "forward_fill",
+    "history_lengths",
+    "sma_last",
+    "ema_series",
+    "wilder_smooth_series",
+    "wilder_rsi_series",
+    "wilder_rsi_last",
+    "macd_last",
+    # Indicator Registry
+    "IndicatorSignalRule",
+    "IndicatorDefinition",
+    "INDICATOR_REGISTRY",
+    "register_indicator",
+    "get_indicator",
+    "available_indicators",
+    "indicator_lookback",
+    "evaluate_indicators",
+    # Alerts
+    "AlertRule",
+    "AlertEvent",
+    "AlertEngine",
+    # Risk Engine
+    "RiskMetrics",
+    "simple_returns",
+    "max_drawdown",
+    "compute_risk_metrics",
+    # Beta
+    "BetaResult",
+    "RollingBeta",
+    "blume_adjust",
+    "week_end_rows",
+    "weekly_returns",
+    "ols_beta",
+    # Portfolio Risk
+    "ShrunkCovariance",
+    "PortfolioRisk",
+    "ledoit_wolf_covariance",
+    "compute_portfolio_risk",
+    # Concentration
+    "RollingCorrelation",
+    "ConcentrationResult",
+    "correlation_matrix",
+    "cluster_labels",
+    "cluster_concentration",
+    # Credit
+    "CREDIT_FIELDS",
+    "RED_FLAGS",
+    "CreditThresholds",
+    "CreditMetrics",
+    "compute_credit_metrics",
+    # Liquidity
+    "ADTV_WINDOWS",
+    "LiquidityThresholds",
+    "LiquidityMetrics",
+    "liquidity_grades",
+    "compute_liquidity_metrics",
+    # Sector
+    "RS_WINDOWS",
+    "SectorMomentum",
+    "percentile_rank",
+    "compute_sector_momentum",
+    "blend_outlook",
+    # Sector Valuation
+    "ValuationStats",
+    "GroupValuation",
+    "SectorValuations",
+    "compute_sector_valuations",
+    "peer_comparison",
+    # Market Cap Rank
+    "MarketCapRanks",
+    "rank_within",
+    "build_market_cap_ranks",
+    # Stress
+    "Scenario",
+    "HistoricalScenario",
+    "DEFAULT_SCENARIOS",
+    "HISTORICAL_SCENARIOS",
+    "FactorExposures",
+    "StressResult",
+    "MonteCarloConfig",
+    "MonteCarloResult",
+    "build_exposures",
+    "apply_scenarios",
+    "factor_loadings",
+    "systematic_daily_vol",
+    "monte_carlo_stress"
+]
@@ -0,0 +1,413 @@
+"""
+Alert Engine - 지표 조건 알림 엔진 (증분 평가)
+"RSI14 crosses below 30", "MA5 crosses MA20", "volume_ratio > 3" 같은 조건을
+새 봉이 들어올 때마다 전 종목에 대해 증분 평가하고, 상태가 바뀐 종목만 알림으로 반환
+
+규칙 문법:
+    <피연산자> <연산자> <피연산자>
+    피연산자: close, volume, volume_ratio, MA<n>, RSI<n>, 숫자
+    연산자: >, >=, <, <=, crosses above, crosses below, crosses
+
+사용법:
+    engine = AlertEngine(codes, AlertEngine.default_rules())
+    engine.warm_up(panel)                       # 과거 구간으로 상태 구성 (알림 없음)
+    events = engine.update("20240621", close, volume)   # 새 봉: 바뀐 상태만 반환
+"""
+
+from typing import Dict, List, Any, Optional, Sequence, Tuple, Union
+from dataclasses import dataclass
+import re
+
+import numpy as np
+
+from ..models.panel import PricePanel
+
+
+# 거래량비율 기준 기간 (TechnicalAgent._analyze_volume과 동일)
+VOLUME_RATIO_PERIOD = 20
+
+_OPERAND_PATTERN = re.compile(r"^(close|volume|volume_ratio|ma(\d+)|rsi(\d+)|-?\d+(?:\.\d+)?)$", re.IGNORECASE)
+_RULE_PATTERN = re.compile(
+    r"^\s*(\S+)\s+(crosses\s+above|crosses\s+below|crosses|>=|<=|>|<)\s+(\S+)\s*$",
+    re.IGNORECASE
+)
+
+# 연산자별 감시 상태 및 알림 종류
+#   크로스: 조건이 거짓 → 참으로 바뀐 봉에서만 알림
+#   비교: 참이 되면 triggered, 다시 거짓이 되면 cleared
+_CONDITIONS = {
+    "crosses_above": [("crossed_above", ">")],
+    "crosses_below": [("crossed_below", "<")],
+    "crosses": [("crossed_above", ">"), ("crossed_below", "<")],
+    ">": [("triggered", ">")],
+    ">=": [("triggered", ">=")],
+    "<": [("triggered", "<")],
+    "<=": [("triggered", "<=")],
+}
+
+
+@dataclass
+class AlertRule:
+    """알림 규칙"""
+    left: str
+    op: str  # ">", ">=", "<", "<=", "crosses_above", "crosses_below", "crosses"
+    right: str
+    name: str = ""
+
+    def __post_init__(self):
+        self.left = _normalize_operand(self.left)
+        self.right = _normalize_operand(self.right)
+        if self.op not in _CONDITIONS:
+            raise ValueError(f"지원하지 않는 연산자: {self.op}")
+        if not self.name:
+            self.name = f"{self.left} {self.op.replace('_', ' ')} {self.right}"
+
+    @classmethod
+    def parse(cls, text: str, name: str = "") -> "AlertRule":
+        """
+        문자열 규칙 파싱
+
+        Example:
+            AlertRule.parse("RSI14 crosses below 30")
+            AlertRule.parse("MA5 crosses MA20", name="단기 크로스")
+        """
+        match = _RULE_PATTERN.match(text)
+        if not match:
+            raise ValueError(f"규칙 형식 오류: {text}")
+        left, op, right = match.groups()
+        op = re.sub(r"\s+", "_", op.lower())
+        return cls(left=left, op=op, right=right, name=name or text.strip())
+
+    @property
+    def is_cross(self) -> bool:
+        return self.op.startswith("crosses")
+
+    def operands(self) -> List[str]:
+        return [self.left, self.right]
+
+
+@dataclass
+class AlertEvent:
+    """알림 (상태 변화)"""
+    trade_date: str
+    stock_code: str
+    rule: str
+    kind: str  # "crossed_above", "crossed_below", "triggered", "cleared"
+    left_value: Optional[float] = None
+    right_value: Optional[float] = None
+
+
+def _normalize_operand(operand: Union[str, float, int]) -> str:
+    text = str(operand).strip()
+    if not _OPERAND_PATTERN.match(text):
+        raise ValueError(f"지원하지 않는 피연산자: {operand}")
+    return text.lower() if not _is_number(text) else text
+
+
+def _is_number(text: str) -> bool:
+    try:
+        float(text)
+        return True
+    except ValueError:
+        return False
+
+
+class AlertEngine:
+    """
+    지표 조건 알림 엔진
+
+    종목별 상태(이동평균용 최근 종가 버퍼, Wilder RSI 평균, 거래량 버퍼)를
+    배열로 보관하여 새 봉 하나당 전 종목을 O(최장 이동평균 기간) 연산으로 갱신한다.
+    과거 전체를 다시 스캔하지 않는다.
+
+    지표 계산식은 TechnicalAgent와 동일하다 (SMA, Wilder RSI, 당일/20일 평균 거래량).
+    """
+
+    def __init__(self, codes: Sequence[str], rules: Sequence[Union[AlertRule, str]]):
+        """
+        Args:
+            codes: 감시 종목코드 (update()에 전달하는 배열의 순서)
+            rules: 알림 규칙 (AlertRule 또는 문자열)
+        """
+        self.codes = list(codes)
+        self.rules = [r if isinstance(r, AlertRule) else AlertRule.parse(r) for r in rules]
+        self.trade_date: Optional[str] = None
+
+        n = len(self.codes)
+        operands = {op for rule in self.rules for op in rule.operands()}
+        self._ma_periods = sorted({int(op[2:]) for op in operands if op.startswith("ma")})
+        self._rsi_periods = sorted({int(op[3:]) for op in operands if op.startswith("rsi")})
+        self._buffer_len = max(self._ma_periods + [VOLUME_RATIO_PERIOD, 1])
+
+        # 최근 종가/거래량 링버퍼 (행 = 시점)
+        self._close_buf = np.full((self._buffer_len, n), np.nan)
+        self._volume_buf = np.full((self._buffer_len, n), np.nan)
+        self._pos = -1  # 마지막 기록 행
+        self._bars = np.zeros(n, dtype=np.int64)  # 종목별 누적 봉 수
+        self._last_close = np.full(n, np.nan)
+        self._undo: Optional[Dict[str, Any]] = None  # 마지막 확정 봉 이전 상태 (같은 날 재확정 시 복원)
+
+        # Wilder RSI 상태 {기간: (avg_gain, avg_loss, 변화량 수)}
+        self._rsi_state = {p: (np.zeros(n), np.zeros(n), np.zeros(n, dtype=np.int64)) for p in self._rsi_periods}
+
+        # 규칙별 감시 상태 (-1: 미정, 0: 거짓, 1: 참)
+        self._states = {
+            (i, kind): np.full(n, -1, dtype=np.int8)
+            for i, rule in enumerate(self.rules)
+            for kind, _ in _CONDITIONS[rule.op]
+        }
+
+    @staticmethod
+    def default_rules() -> List[AlertRule]:
+        """TechnicalAgent 시그널과 같은 기준의 기본 규칙"""
+        return [
+            AlertRule.parse("MA20 crosses above MA60", name="golden_cross"),
+            AlertRule.parse("MA20 crosses below MA60", name="death_cross"),
+            AlertRule.parse("RSI14 crosses below 30", name="rsi_oversold"),
+            AlertRule.parse("RSI14 crosses above 70", name="rsi_overbought"),
+            AlertRule.parse("volume_ratio > 2", name="volume_surge"),
+        ]
+
+    # =========================================================================
+    # 입력
+    # =========================================================================
+
+    def warm_up(self, panel: PricePanel) -> None:
+        """과거 패널로 상태 구성 (알림은 반환하지 않음)"""
+        aligned = panel.select(self.codes) if list(panel.codes) != self.codes else panel
+        cols = np.array([aligned.index_of(code) if code in aligned else -1 for code in self.codes])
+        has = cols >= 0
+
+        for row, trade_date in enumerate(aligned.dates):
+            close = np.full(len(self.codes), np.nan)
+            close[has] = aligned.close[row, cols[has]]
+            volume = None
+            if aligned.volume is not None:
+                volume = np.full(len(self.codes), np.nan)
+                volume[has] = aligned.volume[row, cols[has]]
+            self.update(trade_date, close, volume)
+
+    def update(
+        self,
+        trade_date: str,
+        close: np.ndarray,
+        volume: Optional[np.ndarray] = None,
+        commit: bool = True
+    ) -> List[AlertEvent]:
+        """
+        새 봉 반영 및 상태 변화 알림
+
+        Args:
+            trade_date: 봉 기준일 (YYYYMMDD)
+            close: 종목별 종가 (codes 순서, 결측 NaN → 직전 종가 사용)
+            volume: 종목별 거래량
+            commit: False면 장중 잠정 봉으로 평가만 하고 지표 상태는 확정하지 않음
+                    (같은 날 여러 번 호출해도 상태가 바뀐 경우에만 알림)
+                    마지막 확정일과 같은 날을 다시 확정하면 그 봉을 교체한다
+
+        Returns:
+            상태가 바뀐 (종목, 규칙) 알림 목록
+
+        Raises:
+            ValueError: 마지막 확정일 이전 봉, 또는 이미 확정된 날의 잠정 봉
+        """
+        replace = False
+        if self.trade_date is not None and trade_date <= self.trade_date:
+            if not commit or trade_date < self.trade_date:
+                raise ValueError(f"이미 확정된 봉 이후만 반영 가능: {trade_date} (마지막 확정 {self.trade_date})")
+            replace = True
+
+        close = np.asarray(close, dtype=float)
+        volume = np.full(len(self.codes), np.nan) if volume is None else np.asarray(volume, dtype=float)
+
+        if replace:
+            # 재실행: 마지막 확정 봉을 되돌린 뒤 새 값으로 다시 확정 (링버퍼/RSI 이중 전진 방지)
+            self._restore(self._undo)
+        if commit:
+            self._undo = self._snapshot()
+        values, new_state = self._advance(close, volume, in_place=commit)
+        if commit:
+            self._commit(new_state)
+            self.trade_date = trade_date
+
+        return self._evaluate(trade_date, values)
+
+    def update_mapping(
+        self,
+        trade_date: str,
+        close: Dict[str, float],
+        volume: Optional[Dict[str, float]] = None,
+        commit: bool = True
+    ) -> List[AlertEvent]:
+        """종목코드 → 값 dict 입력 (예: KRX 일별 스냅샷)"""
+        close_arr = np.array([close.get(code, np.nan) for code in self.codes], dtype=float)
+        volume_arr = None
+        if volume is not None:
+            volume_arr = np.array([volume.get(code, np.nan) for code in self.codes], dtype=float)
+        return self.update(trade_date, close_arr, volume_arr, commit)
+
+    def current_values(self) -> Dict[str, np.ndarray]:
+        """마지막 확정 봉 기준 지표 값 (codes 순서 배열)"""
+        return self._indicators(
+            self._close_buf, self._volume_buf, self._pos, self._bars,
+            {p: s for p, s in self._rsi_state.items()}, self._last_close
+        )
+
+    # =========================================================================
+    # 내부 계산
+    # =========================================================================
+
+    def _advance(
+        self,
+        close: np.ndarray,
+        volume: np.ndarray,
+        in_place: bool = True
+    ) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+        """새 봉 반영 후 지표 값과 상태 계산 (in_place=False면 버퍼를 복사하여 잠정 계산)"""
+        started = ~np.isnan(self._last_close)
+        fresh = ~np.isnan(close)
+        # 거래정지 등 결측은 직전 종가 유지, 상장 전 종목은 NaN 유지
+        filled = np.where(fresh, close, self._last_close)
+        active = fresh | started
+        volume = np.where(np.isnan(volume) & active, 0.0, volume)
+
+        pos = (self._pos + 1) % self._buffer_len
+        close_buf = self._close_buf if in_place else self._close_buf.copy()
+        volume_buf = self._volume_buf if in_place else self._volume_buf.copy()
+        close_buf[pos] = filled
+        volume_buf[pos] = np.where(active, volume, np.nan)
+        bars = self._bars + active
+
+        rsi_state = {}
+        change = np.where(started & active, filled - self._last_close, np.nan)
+        valid = ~np.isnan(change)
+        gain = np.where(change > 0, change, 0.0)
+        loss = np.where(change > 0, 0.0, -change)
+        for period, (avg_gain, avg_loss, count) in self._rsi_state.items():
+            warming = valid & (count < period)
+            running = valid & (count >= period)
+            avg_gain = np.where(warming, avg_gain + gain / period,
+                                np.where(running, (avg_gain * (period - 1) + gain) / period, avg_gain))
+            avg_loss = np.where(warming, avg_loss + loss / period,
+                                np.where(running, (avg_loss * (period - 1) + loss) / period, avg_loss))
+            rsi_state[period] = (avg_gain, avg_loss, count + valid)
+
+        last_close = np.where(active, filled, self._last_close)
+        state = {
+            "close_buf": close_buf, "volume_buf": volume_buf, "pos": pos,
+            "bars": bars, "rsi": rsi_state, "last_close": last_close,
+        }
+        values = self._indicators(close_buf, volume_buf, pos, bars, rsi_state, last_close)
+        return values, state
+
+    def _snapshot(self) -> Dict[str, Any]:
+        """다음 봉 확정 전 상태 (덮어쓸 버퍼 행만 복사, 나머지는 확정 시 새 배열로 교체됨)"""
+        row = (self._pos + 1) % self._buffer_len
+        return {
+            "pos": self._pos, "row": row,
+            "close_row": self._close_buf[row].copy(), "volume_row": self._volume_buf[row].copy(),
+            "bars": self._bars, "rsi": self._rsi_state, "last_close": self._last_close,
+        }
+
+    def _restore(self, snapshot: Dict[str, Any]) -> None:
+        row = snapshot["row"]
+        self._close_buf[row] = snapshot["close_row"]
+        self._volume_buf[row] = snapshot["volume_row"]
+        self._pos = snapshot["pos"]
+        self._bars = snapshot["bars"]
+        self._rsi_state = snapshot["rsi"]
+        self._last_close = snapshot["last_close"]
+
+    def _commit(self, state: Dict[str, Any]) -> None:
+        self._close_buf = state["close_buf"]
+        self._volume_buf = state["volume_buf"]
+        self._pos = state["pos"]
+        self._bars = state["bars"]
+        self._rsi_state = state["rsi"]
+        self._last_close = state["last_close"]
+
+    def _indicators(
+        self,
+        close_buf: np.ndarray,
+        volume_buf: np.ndarray,
+        pos: int,
+        bars: np.ndarray,
+        rsi_state: Dict[int, Tuple[np.ndarray, np.ndarray, np.ndarray]],
+        last_close: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """버퍼 상태로부터 규칙에 필요한 지표 값 계산"""
+        values = {"close": last_close}
+        if pos < 0:
+            nan = np.full(len(self.codes), np.nan)
+            values.update({"volume": nan, "volume_ratio": nan})
+            values.update({f"ma{p}": nan for p in self._ma_periods})
+            values.update({f"rsi{p}": nan for p in self._rsi_periods})
+            return values
+
+        values["volume"] = volume_buf[pos]
+
+        def last_rows(n: int) -> np.ndarray:
+            return np.array([(pos - k) % self._buffer_len for k in range(n)])
+
+        for period in self._ma_periods:
+            window = close_buf[last_rows(period)]
+            values[f"ma{period}"] = np.where(bars >= period, window.mean(axis=0), np.nan)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            avg_volume = volume_buf[last_rows(VOLUME_RATIO_PERIOD)].mean(axis=0)
+            values["volume_ratio"] = np.where(
+                (bars >= VOLUME_RATIO_PERIOD) & (avg_volume > 0), volume_buf[pos] / avg_volume, np.nan
+            )
+
+            for period, (avg_gain, avg_loss, count) in rsi_state.items():
+                rsi = np.where(avg_loss == 0, 100.0, 100 - (100 / (1 + avg_gain / avg_loss)))
+                values[f"rsi{period}"] = np.where(count >= period, rsi, np.nan)
+
+        return values
+
+    def _operand(self, operand: str, values: Dict[str, np.ndarray]) -> np.ndarray:
+        if _is_number(operand):
+            return np.full(len(self.codes), float(operand))
+        return values[operand]
+
+    def _evaluate(self, trade_date: str, values: Dict[str, np.ndarray]) -> List[AlertEvent]:
+        """규칙별 상태 갱신 및 변화 알림 생성"""
+        events = []
+
+        for i, rule in enumerate(self.rules):
+            left = self._operand(rule.left, values)
+            right = self._operand(rule.right, values)
+            known = ~np.isnan(left) & ~np.isnan(right)
+
+            for kind, comparison in _CONDITIONS[rule.op]:
+                with np.errstate(invalid="ignore"):
+                    if comparison == ">":
+                        now = left > right
+                    elif comparison == ">=":
+                        now = left >= right
+                    elif comparison == "<":
+                        now = left < right
+                    else:
+                        now = left <= right
+
+                prev = self._states[(i, kind)]
+                current = np.where(known, now.astype(np.int8), prev)
+
+                if rule.is_cross:
+                    # 크로스: 직전 상태가 확정(거짓)이어야 함
+                    fired = known & (prev == 0) & now
+                    cleared = np.zeros_like(fired)
+                else:
+                    fired = known & (prev != 1) & now
+                    cleared = known & (prev == 1) & ~now
+
+                for col in np.flatnonzero(fired):
+                    events.append(AlertEvent(trade_date, self.codes[col], rule.name, kind,
+                                             round(float(left[col]), 2), round(float(right[col]), 2)))
+                for col in np.flatnonzero(cleared):
+                    events.append(AlertEvent(trade_date, self.codes[col], rule.name, "cleared",
+                                             round(float(left[col]), 2), round(float(right[col]), 2)))
+
+                self._states[(i, kind)] = current
+
+        return events
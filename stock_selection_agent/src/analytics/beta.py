@@ -0,0 +1,229 @@
+"""
+Beta - 시장지수 대비 회귀 베타 일괄 계산
+주간 수익률 OLS 베타를 전 종목에 대해 행렬곱으로 한 번에 계산하고,
+롤링 윈도우 베타는 주 단위로 증분 갱신
+
+계산식:
+    beta = Cov(r_stock, r_market) / Var(r_market)   (종목별 유효 주간 수익률만 사용)
+    Blume 조정 베타 = 0.67 × beta + 0.33
+"""
+
+from typing import List, Optional, Sequence, Tuple
+from dataclasses import dataclass
+
+import numpy as np
+
+from .indicators import forward_fill
+
+
+BLUME_WEIGHT = 0.67
+
+
+def blume_adjust(beta: np.ndarray) -> np.ndarray:
+    """Blume 조정 베타 (1로 회귀)"""
+    return BLUME_WEIGHT * beta + (1 - BLUME_WEIGHT) * 1.0
+
+
+def week_end_rows(dates: Sequence[str]) -> np.ndarray:
+    """
+    주(월~일)별 마지막 거래일 행 인덱스
+
+    Args:
+        dates: 거래일 목록 (YYYYMMDD, 오름차순)
+
+    Returns:
+        주 마지막 거래일 행 인덱스 배열
+    """
+    if len(dates) == 0:
+        return np.array([], dtype=np.intp)
+    days = np.array([f"{d[:4]}-{d[4:6]}-{d[6:8]}" for d in dates], dtype="datetime64[D]").astype(np.int64)
+    # 1970-01-01은 목요일 → +3 하면 월요일 시작 주 번호
+    weeks = (days + 3) // 7
+    last = np.flatnonzero(np.diff(weeks) != 0)
+    return np.append(last, len(dates) - 1).astype(np.intp)
+
+
+def weekly_returns(
+    dates: Sequence[str],
+    close: np.ndarray,
+    market_close: np.ndarray
+) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    일별 종가 → 주간 수익률 (주 마지막 거래일 종가 기준)
+
+    Args:
+        dates: 거래일 목록 (YYYYMMDD)
+        close: (날짜 × 종목) 종목 종가
+        market_close: (날짜,) 지수 종가 (같은 거래일 정렬)
+
+    Returns:
+        (주 종료일 목록, (주-1) × 종목 수익률, (주-1,) 지수 수익률)
+    """
+    rows = week_end_rows(dates)
+    stock_weekly = forward_fill(close)[rows]
+    market_weekly = forward_fill(market_close.reshape(-1, 1))[rows, 0]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        stock_returns = stock_weekly[1:] / stock_weekly[:-1] - 1
+        market_returns = market_weekly[1:] / market_weekly[:-1] - 1
+
+    week_dates = [dates[i] for i in rows[1:]]
+    return week_dates, stock_returns, market_returns
+
+
+@dataclass
+class BetaResult:
+    """종목별 회귀 베타 (codes 순서 배열, 계산 불가 NaN)"""
+    codes: List[str]
+    beta: np.ndarray
+    beta_adjusted: np.ndarray
+    alpha: np.ndarray  # 주간 절편
+    r_squared: np.ndarray
+    observations: np.ndarray
+
+    def index_of(self, stock_code: str) -> Optional[int]:
+        try:
+            return self.codes.index(stock_code)
+        except ValueError:
+            return None
+
+
+def _beta_from_sums(n, sx, sy, sxx, syy, sxy, min_observations):
+    """누적합으로부터 OLS 베타/절편/결정계수"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = sxy / n - (sx / n) * (sy / n)
+        var_x = sxx / n - (sx / n) ** 2
+        var_y = syy / n - (sy / n) ** 2
+        beta = cov / var_x
+        alpha = sy / n - beta * sx / n
+        r_squared = np.where(var_y > 0, cov ** 2 / (var_x * var_y), np.nan)
+
+    ok = (n >= min_observations) & (var_x > 0)
+    return (
+        np.where(ok, beta, np.nan),
+        np.where(ok, alpha, np.nan),
+        np.where(ok, r_squared, np.nan),
+    )
+
+
+def ols_beta(
+    stock_returns: np.ndarray,
+    market_returns: np.ndarray,
+    codes: Sequence[str],
+    min_observations: int = 26
+) -> BetaResult:
+    """
+    전 종목 OLS 베타 (행렬곱 일괄 계산)
+
+    종목마다 결측 구간이 달라도 유효 표본 마스크 M으로
+    Σx = Mᵀm, Σxy = Yᵀm 형태의 행렬곱 몇 번으로 모든 종목을 계산한다.
+
+    Args:
+        stock_returns: (기간 × 종목) 수익률
+        market_returns: (기간,) 지수 수익률
+        codes: 종목코드
+        min_observations: 최소 유효 표본 수
+
+    Returns:
+        BetaResult
+    """
+    market = np.asarray(market_returns, dtype=float)
+    mask = ~np.isnan(stock_returns) & ~np.isnan(market)[:, None]
+    m = np.nan_to_num(market)
+    y = np.where(mask, stock_returns, 0.0)
+    w = mask.astype(float)
+
+    n = w.sum(axis=0)
+    sx = w.T @ m
+    sxx = w.T @ (m * m)
+    sy = y.sum(axis=0)
+    syy = (y * y).sum(axis=0)
+    sxy = y.T @ m
+
+    beta, alpha, r_squared = _beta_from_sums(n, sx, sy, sxx, syy, sxy, min_observations)
+    return BetaResult(
+        codes=list(codes),
+        beta=beta,
+        beta_adjusted=blume_adjust(beta),
+        alpha=alpha,
+        r_squared=r_squared,
+        observations=n.astype(np.int64)
+    )
+
+
+class RollingBeta:
+    """
+    롤링 윈도우 베타 (주 단위 증분 갱신)
+
+    종목별 최근 window주 (지수, 종목) 수익률 누적합을 보관하고
+    새 주가 들어오면 빠지는 주를 빼고 새 주를 더해 O(종목 수)로 갱신한다.
+
+    사용법:
+        rolling = RollingBeta(codes, window=156)
+        rolling.extend(stock_returns, market_returns)   # 과거 주간 수익률
+        result = rolling.update(new_stock_returns, new_market_return)  # 매주
+    """
+
+    def __init__(self, codes: Sequence[str], window: int = 156, min_observations: int = 26):
+        self.codes = list(codes)
+        self.window = window
+        self.min_observations = min_observations
+
+        n = len(self.codes)
+        self._x = np.full((window, n), np.nan)  # 종목별 유효 표본의 지수 수익률
+        self._y = np.full((window, n), np.nan)
+        self._pos = -1
+        self._sums = {key: np.zeros(n) for key in ("n", "sx", "sy", "sxx", "syy", "sxy")}
+
+    def extend(self, stock_returns: np.ndarray, market_returns: np.ndarray) -> BetaResult:
+        """과거 주간 수익률 일괄 반영 (오래된 주부터)"""
+        for row in range(stock_returns.shape[0]):
+            self._push(stock_returns[row], market_returns[row])
+        return self.result()
+
+    def update(self, stock_returns: np.ndarray, market_return: float) -> BetaResult:
+        """새 주간 수익률 1주 반영"""
+        self._push(stock_returns, market_return)
+        return self.result()
+
+    def result(self) -> BetaResult:
+        s = self._sums
+        beta, alpha, r_squared = _beta_from_sums(
+            s["n"], s["sx"], s["sy"], s["sxx"], s["syy"], s["sxy"], self.min_observations
+        )
+        return BetaResult(
+            codes=self.codes,
+            beta=beta,
+            beta_adjusted=blume_adjust(beta),
+            alpha=alpha,
+            r_squared=r_squared,
+            observations=s["n"].astype(np.int64)
+        )
+
+    def _push(self, stock_returns: np.ndarray, market_return: float) -> None:
+        self._pos = (self._pos + 1) % self.window
+
+        # 윈도우에서 빠지는 주
+        old_x, old_y = self._x[self._pos], self._y[self._pos]
+        self._accumulate(old_x, old_y, sign=-1.0)
+
+        y = np.asarray(stock_returns, dtype=float)
+        valid = ~np.isnan(y) & (not np.isnan(market_return))
+        new_x = np.where(valid, market_return, np.nan)
+        new_y = np.where(valid, y, np.nan)
+        self._accumulate(new_x, new_y, sign=1.0)
+
+        self._x[self._pos] = new_x
+        self._y[self._pos] = new_y
+
+    def _accumulate(self, x: np.ndarray, y: np.ndarray, sign: float) -> None:
+        valid = ~np.isnan(x)
+        x0 = np.where(valid, x, 0.0)
+        y0 = np.where(valid, y, 0.0)
+        s = self._sums
+        s["n"] += sign * valid
+        s["sx"] += sign * x0
+        s["sy"] += sign * y0
+        s["sxx"] += sign * x0 * x0
+        s["syy"] += sign * y0 * y0
+        s["sxy"] += sign * x0 * y0
@@ -0,0 +1,311 @@
+"""
+Concentration - 수익률 상관 군집 기반 집중 리스크
+유니버스 상관행렬을 블록 단위 float32로 계산하고 평균 연결(average linkage)
+계층적 군집으로 같이 움직이는 종목군을 찾아 종목별 군집 노출을 계산
+
+- 결측 수익률(상장 전, 거래정지)은 0으로 간주하여 전 종목이 같은 기간으로 계산된다
+- 상관 거리 d = 1 - ρ, 군집 절단 높이 = 1 - 최소 평균 상관
+- scipy가 있으면 scipy.cluster.hierarchy, 없으면 NN-chain 알고리즘(O(N²))으로 계산
+- RollingCorrelation은 교차곱 누적합을 보관하여 하루 수익률 추가/제거를
+  O(N²) 랭크-1 갱신으로 처리 (전체 O(T·N²) 재계산 불필요)
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+
+import numpy as np
+
+try:
+    from scipy.cluster.hierarchy import linkage as _scipy_linkage, fcluster as _scipy_fcluster
+    from scipy.spatial.distance import squareform as _squareform
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+
+def correlation_matrix(returns: np.ndarray, block_size: int = 512) -> np.ndarray:
+    """
+    상관행렬 (종목 × 종목, float32, 블록 단위 계산)
+
+    Args:
+        returns: (기간 × 종목) 수익률 (결측 0 처리)
+        block_size: 한 번에 계산할 종목 수
+
+    Returns:
+        상관행렬 (변동 없는 종목은 자기 자신 1, 타 종목 0)
+    """
+    x = np.nan_to_num(np.asarray(returns, dtype=np.float32))
+    x = x - x.mean(axis=0, dtype=np.float64).astype(np.float32)
+    norms = np.sqrt(np.einsum("ij,ij->j", x, x, dtype=np.float64)).astype(np.float32)
+    z = np.divide(x, norms, out=np.zeros_like(x), where=norms > 0)
+
+    n = z.shape[1]
+    corr = np.empty((n, n), dtype=np.float32)
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        corr[start:stop] = z[:, start:stop].T @ z
+    np.clip(corr, -1.0, 1.0, out=corr)
+    np.fill_diagonal(corr, 1.0)
+    return corr
+
+
+class RollingCorrelation:
+    """
+    롤링 윈도우 상관행렬 (일 단위 증분 갱신)
+
+    교차곱 합 Σxxᵀ, 합 Σx, 관측 수를 float64로 누적하고
+    새 수익률 행은 더하고 윈도우를 벗어난 행은 빼서 갱신한다.
+
+    사용법:
+        rolling = RollingCorrelation(codes, window=252)
+        rolling.extend(returns)            # 과거 수익률 (기간 × 종목)
+        rolling.update(today_returns)      # 매일 1행
+        corr = rolling.correlation()
+    """
+
+    def __init__(self, codes: Sequence[str], window: int = 252):
+        self.codes = list(codes)
+        self.window = window
+        n = len(self.codes)
+        self._rows = np.zeros((window, n), dtype=np.float32)
+        self._count = 0
+        self._pos = -1
+        self._sum = np.zeros(n)
+        self._cross = np.zeros((n, n))
+
+    @property
+    def observations(self) -> int:
+        return min(self._count, self.window)
+
+    def extend(self, returns: np.ndarray) -> None:
+        """과거 수익률 일괄 반영 (오래된 행부터)"""
+        returns = np.nan_to_num(np.asarray(returns, dtype=np.float32))
+        if returns.shape[0] >= self.window:
+            # 윈도우 전체 교체: 누적합을 새로 계산
+            recent = returns[-self.window:]
+            self._rows[:] = recent
+            self._pos = self.window - 1
+            self._count = self._count + returns.shape[0]
+            self._sum = recent.sum(axis=0, dtype=np.float64)
+            self._cross = recent.T.astype(np.float64) @ recent.astype(np.float64)
+            return
+        for row in returns:
+            self.update(row)
+
+    def update(self, returns: np.ndarray) -> None:
+        """하루 수익률 반영 (종목 순서 = codes)"""
+        row = np.nan_to_num(np.asarray(returns, dtype=np.float32))
+        self._pos = (self._pos + 1) % self.window
+
+        if self._count >= self.window:
+            old = self._rows[self._pos].astype(np.float64)
+            self._sum -= old
+            self._cross -= np.outer(old, old)
+
+        new = row.astype(np.float64)
+        self._sum += new
+        self._cross += np.outer(new, new)
+        self._rows[self._pos] = row
+        self._count += 1
+
+    def correlation(self) -> np.ndarray:
+        """현재 윈도우 상관행렬 (float32)"""
+        n_obs = max(self.observations, 1)
+        mean = self._sum / n_obs
+        cov = self._cross / n_obs - np.outer(mean, mean)
+        std = np.sqrt(np.clip(np.diag(cov), 0, None))
+        denom = np.outer(std, std)
+        corr = np.divide(cov, denom, out=np.zeros_like(cov), where=denom > 0)
+        np.clip(corr, -1.0, 1.0, out=corr)
+        np.fill_diagonal(corr, 1.0)
+        return corr.astype(np.float32)
+
+
+def _average_linkage_nn_chain(distance: np.ndarray) -> List[Tuple[int, int, float]]:
+    """
+    평균 연결 계층적 군집 (NN-chain, O(N²) 메모리/시간)
+
+    Returns:
+        병합 목록 [(군집 대표 i, 군집 대표 j, 병합 거리)] (순서는 거리 오름차순 아님)
+    """
+    n = distance.shape[0]
+    d = distance.astype(np.float64, copy=True)
+    np.fill_diagonal(d, np.inf)
+    size = np.ones(n)
+    active = np.ones(n, dtype=bool)
+    merges = []
+    chain: List[int] = []
+
+    for _ in range(n - 1):
+        if not chain:
+            chain.append(int(np.flatnonzero(active)[0]))
+
+        while True:
+            a = chain[-1]
+            row = np.where(active, d[a], np.inf)
+            b = int(np.argmin(row))
+            # 동률이면 체인의 직전 원소 우선 (무한 루프 방지)
+            if len(chain) > 1 and row[chain[-2]] <= row[b]:
+                b = chain[-2]
+            if len(chain) > 1 and b == chain[-2]:
+                break
+            chain.append(b)
+
+        b = chain.pop()
+        a = chain.pop()
+        height = d[a, b]
+        merges.append((a, b, float(height)))
+
+        # Lance-Williams 평균 연결 갱신: a 자리에 병합 군집 저장
+        merged = (size[a] * d[a] + size[b] * d[b]) / (size[a] + size[b])
+        d[a, :] = merged
+        d[:, a] = merged
+        d[a, a] = np.inf
+        size[a] += size[b]
+        active[b] = False
+
+    return merges
+
+
+def cluster_labels(corr: np.ndarray, min_correlation: float = 0.6) -> np.ndarray:
+    """
+    평균 연결 계층적 군집 라벨
+
+    Args:
+        corr: 상관행렬
+        min_correlation: 같은 군집으로 묶을 최소 평균 상관 (절단 거리 = 1 - 값)
+
+    Returns:
+        종목별 군집 번호 (0부터, 큰 군집 순)
+    """
+    n = corr.shape[0]
+    if n == 0:
+        return np.array([], dtype=np.intp)
+    distance = 1.0 - np.asarray(corr, dtype=np.float64)
+    np.fill_diagonal(distance, 0.0)
+    threshold = 1.0 - min_correlation
+
+    if SCIPY_AVAILABLE and n > 1:
+        condensed = _squareform(np.clip(distance, 0, None), checks=False)
+        raw = _scipy_fcluster(_scipy_linkage(condensed, method="average"), t=threshold, criterion="distance")
+    else:
+        # 절단 높이 이하 병합만 적용 (평균 연결은 단조이므로 절단 결과와 동일)
+        parent = np.arange(n)
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for a, b, height in _average_linkage_nn_chain(distance) if n > 1 else []:
+            if height <= threshold:
+                parent[find(b)] = find(a)
+        raw = np.array([find(i) for i in range(n)])
+
+    # 큰 군집부터 0, 1, 2... 로 재번호
+    uniques, inverse, counts = np.unique(raw, return_inverse=True, return_counts=True)
+    order = np.argsort(-counts, kind="stable")
+    rank = np.empty(len(uniques), dtype=np.intp)
+    rank[order] = np.arange(len(uniques))
+    return rank[inverse]
+
+
+@dataclass
+class ConcentrationResult:
+    """
+    상관 군집 결과
+
+    exposure는 종목이 속한 군집의 비중 합 (weights 기준, 기본 동일가중)
+    """
+    codes: List[str]
+    labels: np.ndarray  # 종목별 군집 번호
+    cluster_sizes: np.ndarray  # 군집별 종목 수
+    cluster_weights: np.ndarray  # 군집별 비중 합
+    mean_correlation: np.ndarray  # 종목별 같은 군집 내 평균 상관 (단독 군집 NaN)
+    min_correlation: float
+    _index: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self):
+        self._index = {code: i for i, code in enumerate(self.codes)}
+
+    def index_of(self, stock_code: str) -> Optional[int]:
+        return self._index.get(stock_code)
+
+    def members(self, cluster: int) -> List[str]:
+        return [self.codes[i] for i in np.flatnonzero(self.labels == cluster)]
+
+    def crowded_clusters(self, min_size: int = 3) -> List[Dict[str, object]]:
+        """종목 수 min_size 이상 군집 (비중 큰 순)"""
+        clusters = [c for c in range(len(self.cluster_sizes)) if self.cluster_sizes[c] >= min_size]
+        clusters.sort(key=lambda c: -self.cluster_weights[c])
+        return [
+            {
+                "cluster": c,
+                "size": int(self.cluster_sizes[c]),
+                "weight": float(self.cluster_weights[c]),
+                "mean_correlation": float(np.nanmean(self.mean_correlation[self.labels == c])),
+                "members": self.members(c),
+            }
+            for c in clusters
+        ]
+
+    def exposure(self, stock_code: str) -> Optional[Dict[str, object]]:
+        """종목의 군집 노출 (없으면 None)"""
+        row = self.index_of(stock_code)
+        if row is None:
+            return None
+        cluster = int(self.labels[row])
+        mean_corr = self.mean_correlation[row]
+        return {
+            "cluster": cluster,
+            "cluster_size": int(self.cluster_sizes[cluster]),
+            "cluster_weight": float(self.cluster_weights[cluster]),
+            "mean_correlation": None if np.isnan(mean_corr) else float(mean_corr),
+            "peers": [code for code in self.members(cluster) if code != stock_code],
+        }
+
+
+def cluster_concentration(
+    corr: np.ndarray,
+    codes: Sequence[str],
+    weights: Optional[Sequence[float]] = None,
+    min_correlation: float = 0.6
+) -> ConcentrationResult:
+    """
+    상관행렬 → 군집 및 군집 노출
+
+    Args:
+        corr: 상관행렬
+        codes: 종목코드
+        weights: 종목 비중 (시가총액 등, None이면 동일가중)
+        min_correlation: 군집 최소 평균 상관
+
+    Returns:
+        ConcentrationResult
+    """
+    n = len(codes)
+    labels = cluster_labels(corr, min_correlation)
+    w = np.ones(n) if weights is None else np.nan_to_num(np.asarray(weights, dtype=float))
+    w = w / w.sum() if w.sum() > 0 else np.full(n, 1 / max(n, 1))
+
+    n_clusters = int(labels.max()) + 1 if n else 0
+    sizes = np.bincount(labels, minlength=n_clusters)
+    cluster_weights = np.bincount(labels, weights=w, minlength=n_clusters)
+
+    # 같은 군집 내 평균 상관: 군집 소속 행렬 M (N × K)로 (C @ M)[i, label_i]
+    membership = np.zeros((n, n_clusters), dtype=np.float32)
+    membership[np.arange(n), labels] = 1.0
+    same_cluster_sum = (np.asarray(corr, dtype=np.float32) @ membership)[np.arange(n), labels]
+    peers = sizes[labels] - 1
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_corr = np.where(peers > 0, (same_cluster_sum - 1.0) / peers, np.nan)
+
+    return ConcentrationResult(
+        codes=list(codes),
+        labels=labels,
+        cluster_sizes=sizes,
+        cluster_weights=cluster_weights,
+        mean_correlation=mean_corr.astype(float),
+        min_correlation=min_correlation
+    )
@@ -0,0 +1,208 @@
+"""
+Credit - 유니버스 신용 리스크 일괄 계산
+재무 테이블(종목 × 항목)로 Altman Z-Score, 부채비율, 순차입금비율, 이자보상배율,
+Debt/EBITDA 및 위험 신호를 배열 연산으로 계산
+
+계산식과 결측 처리는 RiskAgent의 단일 종목 계산과 동일:
+- 결측 항목은 0 (총부채/자기자본은 1)으로 대체
+- Z = 1.2·운전자본/자산 + 1.4·이익잉여금/자산 + 3.3·EBIT/자산 + 0.6·시총/부채 + 1.0·매출/자산
+- 위험 신호는 원값, 부채비율/이자보상배율 점수 구간은 표시값(반올림 값) 기준
+"""
+
+from typing import Dict, List, Any, Optional
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from ..models.fundamentals import FundamentalsTable
+
+
+# 신용 지표 계산에 사용하는 재무 항목
+CREDIT_FIELDS = (
+    "total_assets",
+    "working_capital",
+    "retained_earnings",
+    "ebit",
+    "ebitda",
+    "total_liabilities",
+    "total_debt",
+    "equity",
+    "cash",
+    "interest_expense",
+    "revenue",
+    "market_cap",
+)
+
+# 위험 신호 이름 (CreditMetrics.red_flags 키)
+RED_FLAGS = ("distress_zone", "high_debt_to_equity", "low_interest_coverage", "high_debt_to_ebitda")
+
+
+@dataclass
+class CreditThresholds:
+    """신용 리스크 임계값 (RiskAnalysisConfig와 같은 기본값)"""
+    z_score_safe: float = 2.99
+    z_score_grey: float = 1.81
+    debt_to_equity_high: float = 2.0
+    debt_to_equity_moderate: float = 1.5
+    interest_coverage_low: float = 2.0
+    interest_coverage_moderate: float = 3.0
+    debt_to_ebitda_high: float = 4.0
+
+
+@dataclass
+class CreditMetrics:
+    """
+    유니버스 신용 지표
+
+    배열은 codes 순서이며 계산 불가 값은 NaN (이자비용 없는 이자보상배율은 inf).
+    """
+    codes: List[str]
+    z_score: np.ndarray
+    zone: np.ndarray  # "safe", "grey", "distress", "unknown"
+    debt_to_equity: np.ndarray
+    net_debt_ratio: np.ndarray
+    interest_coverage: np.ndarray
+    debt_to_ebitda: np.ndarray
+    score: np.ndarray  # 0-100, 높을수록 위험
+    red_flags: Dict[str, np.ndarray] = field(default_factory=dict)  # {신호명: bool 배열}
+
+    def index_of(self, stock_code: str) -> Optional[int]:
+        try:
+            return self.codes.index(stock_code)
+        except ValueError:
+            return None
+
+    def flagged(self, *flags: str) -> List[str]:
+        """지정 위험 신호 중 하나라도 해당하는 종목 (없으면 모든 신호)"""
+        names = flags or RED_FLAGS
+        mask = np.zeros(len(self.codes), dtype=bool)
+        for name in names:
+            mask |= self.red_flags[name]
+        return [self.codes[i] for i in np.flatnonzero(mask)]
+
+    def flag_messages(self, row: int) -> List[str]:
+        """종목의 위험 신호 메시지"""
+        messages = []
+        if self.red_flags["distress_zone"][row]:
+            messages.append(f"Z-Score {self.z_score[row]:.2f} - 파산 위험 높음")
+        if self.red_flags["high_debt_to_equity"][row]:
+            messages.append(f"부채비율 {self.debt_to_equity[row]:.1f} - 200% 초과")
+        if self.red_flags["low_interest_coverage"][row]:
+            messages.append(f"이자보상배율 {self.interest_coverage[row]:.1f} - 2배 미만")
+        if self.red_flags["high_debt_to_ebitda"][row]:
+            messages.append(f"Debt/EBITDA {self.debt_to_ebitda[row]:.1f} - 4배 초과")
+        return messages
+
+    def to_dict(self, row: int) -> Dict[str, Any]:
+        """종목 1개 결과 (RiskAgent 신용 리스크 dict 형식)"""
+        def rounded(values, digits):
+            value = values[row]
+            if np.isnan(value):
+                return None
+            return float("inf") if np.isinf(value) else round(float(value), digits)
+
+        return {
+            "score": float(self.score[row]),
+            "z_score": rounded(self.z_score, 2),
+            "zone": str(self.zone[row]),
+            "debt_to_equity": rounded(self.debt_to_equity, 2),
+            "net_debt_ratio": rounded(self.net_debt_ratio, 2),
+            "interest_coverage": rounded(self.interest_coverage, 1),
+            "debt_to_ebitda": rounded(self.debt_to_ebitda, 2),
+            "red_flags": self.flag_messages(row),
+        }
+
+
+def compute_credit_metrics(
+    table: FundamentalsTable,
+    thresholds: Optional[CreditThresholds] = None
+) -> CreditMetrics:
+    """
+    유니버스 신용 지표 일괄 계산
+
+    Args:
+        table: 재무 테이블 (CREDIT_FIELDS 항목)
+        thresholds: 임계값
+
+    Returns:
+        CreditMetrics
+    """
+    t = thresholds or CreditThresholds()
+    n = len(table)
+    nan = np.full(n, np.nan)
+
+    total_assets = table.column("total_assets", 0.0)
+    total_liabilities = table.column("total_liabilities", 1.0)
+    equity = table.column("equity", 1.0)
+    total_debt = table.column("total_debt", 0.0)
+    ebit = table.column("ebit", 0.0)
+    ebitda = table.column("ebitda", 0.0)
+    interest_expense = table.column("interest_expense", 0.0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # 1. Altman Z-Score
+        has_assets = total_assets > 0
+        x4 = np.where(total_liabilities > 0, table.column("market_cap", 0.0) / total_liabilities, 0.0)
+        z_score = np.where(
+            has_assets,
+            1.2 * (table.column("working_capital", 0.0) / total_assets)
+            + 1.4 * (table.column("retained_earnings", 0.0) / total_assets)
+            + 3.3 * (ebit / total_assets)
+            + 0.6 * x4
+            + 1.0 * (table.column("revenue", 0.0) / total_assets),
+            nan
+        )
+
+        # 2. 부채비율, 순차입금비율
+        has_equity = equity > 0
+        debt_to_equity = np.where(has_equity, total_debt / equity, nan)
+        net_debt_ratio = np.where(has_equity, (total_debt - table.column("cash", 0.0)) / equity, nan)
+
+        # 3. 이자보상배율 (이자비용 없으면 inf)
+        interest_coverage = np.where(interest_expense > 0, ebit / interest_expense, np.inf)
+
+        # 4. Debt/EBITDA
+        debt_to_ebitda = np.where(ebitda > 0, total_debt / ebitda, nan)
+
+    zone = np.full(n, "unknown", dtype=object)
+    zone[has_assets] = "distress"
+    zone[has_assets & (z_score > t.z_score_grey)] = "grey"
+    zone[has_assets & (z_score > t.z_score_safe)] = "safe"
+
+    red_flags = {
+        "distress_zone": zone == "distress",
+        "high_debt_to_equity": has_equity & (debt_to_equity > t.debt_to_equity_high),
+        "low_interest_coverage": np.isfinite(interest_coverage) & (interest_coverage < t.interest_coverage_low),
+        "high_debt_to_ebitda": (ebitda > 0) & (debt_to_ebitda > t.debt_to_ebitda_high),
+    }
+
+    # 점수 (표시값 기준, 0으로 표시되는 값은 점수 미반영)
+    score = np.full(n, 50.0)
+    score += np.select([zone == "distress", zone == "grey", zone == "safe"], [30, 15, -15], 0)
+
+    de = np.nan_to_num(np.round(debt_to_equity, 2))
+    score += np.where(
+        de != 0,
+        np.select([de > t.debt_to_equity_high, de > t.debt_to_equity_moderate, de < 0.5], [25, 15, -10], 0),
+        0
+    )
+
+    icr = np.round(interest_coverage, 1)
+    scored_icr = np.isfinite(icr) & (icr != 0)
+    score += np.where(
+        scored_icr,
+        np.select([icr < t.interest_coverage_low, icr < t.interest_coverage_moderate, icr > 10], [25, 10, -15], 0),
+        0
+    )
+
+    return CreditMetrics(
+        codes=list(table.codes),
+        z_score=z_score,
+        zone=zone,
+        debt_to_equity=debt_to_equity,
+        net_debt_ratio=net_debt_ratio,
+        interest_coverage=interest_coverage,
+        debt_to_ebitda=debt_to_ebitda,
+        score=np.clip(score, 0, 100),
+        red_flags=red_flags
+    )
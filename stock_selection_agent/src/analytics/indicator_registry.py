@@ -0,0 +1,397 @@
+"""
+Indicator Registry - 배열 기반 보조지표 등록부
+지표를 (날짜 × 종목) OHLCV 배열에 대한 커널로 선언하고,
+TechnicalAnalysisConfig.indicators에 이름으로 선택하여 한 번에 평가
+
+새 지표 추가:
+    register_indicator(IndicatorDefinition(
+        name="my_indicator",
+        lookback=lambda p: p["period"] + 1,  # 파라미터 → 필요 봉 수 (고정값이면 정수)
+        kernel=my_kernel,          # (ohlcv, **params) -> {출력명: (종목,) 배열}
+        signals=[IndicatorSignalRule(...)]
+    ))
+"""
+
+from typing import Dict, List, Any, Callable, Sequence, Union
+from dataclasses import dataclass, field
+import inspect
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from ..models.panel import PricePanel
+from .indicators import forward_fill, sma_last, wilder_smooth_series
+
+
+@dataclass
+class IndicatorSignalRule:
+    """
+    지표 시그널 규칙
+
+    when은 커널이 반환하는 불리언 출력명이며, description은
+    해당 종목의 출력값으로 포맷된다 (예: "%K {k:.1f}").
+    """
+    signal_type: str
+    when: str
+    description: str
+    strength: str  # "strong", "moderate", "weak"
+    action: str  # "bullish", "bearish", "neutral"
+
+
+@dataclass
+class IndicatorDefinition:
+    """보조지표 정의"""
+    name: str
+    # 최근 값 계산에 필요한 봉 수 (정수 또는 파라미터 → 봉 수 함수)
+    lookback: Union[int, Callable[[Dict[str, Any]], int]]
+    kernel: Callable[..., Dict[str, np.ndarray]]
+    params: Dict[str, Any] = field(default_factory=dict)
+    signals: List[IndicatorSignalRule] = field(default_factory=list)
+
+    def resolved_params(self) -> Dict[str, Any]:
+        """커널 기본값에 params를 덮어쓴 실제 파라미터"""
+        defaults = {
+            name: parameter.default
+            for name, parameter in list(inspect.signature(self.kernel).parameters.items())[1:]
+            if parameter.default is not inspect.Parameter.empty
+        }
+        return {**defaults, **self.params}
+
+    def required_bars(self) -> int:
+        """현재 파라미터 기준 필요 봉 수"""
+        if callable(self.lookback):
+            return int(self.lookback(self.resolved_params()))
+        return self.lookback
+
+
+INDICATOR_REGISTRY: Dict[str, IndicatorDefinition] = {}
+
+
+def register_indicator(definition: IndicatorDefinition) -> IndicatorDefinition:
+    """지표 등록 (같은 이름은 덮어씀)"""
+    INDICATOR_REGISTRY[definition.name] = definition
+    return definition
+
+
+def get_indicator(name: str) -> IndicatorDefinition:
+    """이름으로 지표 조회"""
+    if name not in INDICATOR_REGISTRY:
+        raise ValueError(f"등록되지 않은 지표: {name} (사용 가능: {', '.join(available_indicators())})")
+    return INDICATOR_REGISTRY[name]
+
+
+def available_indicators() -> List[str]:
+    """등록된 지표 이름 목록"""
+    return sorted(INDICATOR_REGISTRY)
+
+
+def indicator_lookback(names: Sequence[str]) -> int:
+    """선택된 지표들의 최대 필요 봉 수"""
+    return max((get_indicator(name).required_bars() for name in names), default=0)
+
+
+def prepare_ohlcv(panel: PricePanel) -> Dict[str, np.ndarray]:
+    """
+    커널 입력용 OHLCV 배열 준비
+
+    - 종가는 전일값으로 채움 (거래정지 구간)
+    - 고가/저가/시가가 없으면 종가로 대체
+    - 종가가 있는 날의 거래량 결측은 0
+    """
+    close = forward_fill(panel.close)
+    arrays = {"close": close}
+
+    for name in ("open", "high", "low"):
+        values = getattr(panel, name)
+        arrays[name] = close.copy() if values is None else np.where(np.isnan(values), close, values)
+
+    if panel.volume is None:
+        arrays["volume"] = np.where(np.isnan(close), np.nan, 0.0)
+    else:
+        arrays["volume"] = np.where(np.isnan(panel.volume) & ~np.isnan(close), 0.0, panel.volume)
+
+    return arrays
+
+
+def evaluate_indicators(
+    names: Sequence[str],
+    panel: PricePanel
+) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    선택된 지표를 패널 전체에 대해 한 번에 평가
+
+    Args:
+        names: 지표 이름 목록
+        panel: 시세 패널
+
+    Returns:
+        {지표명: {출력명: (종목,) 배열}}
+    """
+    if not names:
+        return {}
+
+    ohlcv = prepare_ohlcv(panel)
+    results = {}
+    for name in names:
+        definition = get_indicator(name)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            results[name] = definition.kernel(ohlcv, **definition.params)
+    return results
+
+
+def indicator_values_at(outputs: Dict[str, np.ndarray], col: int) -> Dict[str, Any]:
+    """단일 종목의 지표 출력값 (NaN은 None, 실수는 소수 둘째 자리 반올림)"""
+    values = {}
+    for key, arr in outputs.items():
+        value = arr[col]
+        if arr.dtype == bool:
+            values[key] = bool(value)
+        elif np.isnan(value):
+            values[key] = None
+        else:
+            values[key] = round(float(value), 2)
+    return values
+
+
+def indicator_signals_at(
+    name: str,
+    outputs: Dict[str, np.ndarray],
+    col: int
+) -> List[Dict[str, Any]]:
+    """
+    단일 종목의 지표 시그널 (TechnicalAgent 시그널 dict 형식)
+
+    Returns:
+        [{"type", "description", "strength", "action"}]
+    """
+    definition = get_indicator(name)
+    values = None
+    signals = []
+
+    for rule in definition.signals:
+        if not outputs[rule.when][col]:
+            continue
+        if values is None:
+            values = {k: (v if v is not None else float("nan")) for k, v in indicator_values_at(outputs, col).items()}
+        signals.append({
+            "type": rule.signal_type,
+            "description": rule.description.format(**values),
+            "strength": rule.strength,
+            "action": rule.action
+        })
+
+    return signals
+
+
+# =============================================================================
+# 기본 지표 커널
+# =============================================================================
+
+def _rolling_last(values: np.ndarray, window: int, n_last: int, func) -> np.ndarray:
+    """최근 n_last 시점의 이동 집계 ((n_last × 종목), 부족하면 NaN 행)"""
+    n_rows, n_cols = values.shape
+    out = np.full((n_last, n_cols), np.nan)
+    span = min(n_rows, window + n_last - 1)
+    if span < window:
+        return out
+    windows = sliding_window_view(values[-span:], window, axis=0)
+    aggregated = func(windows, axis=-1)
+    out[n_last - aggregated.shape[0]:] = aggregated
+    return out
+
+
+def bollinger_kernel(ohlcv: Dict[str, np.ndarray], period: int = 20, width: float = 2.0) -> Dict[str, np.ndarray]:
+    """볼린저 밴드 (중심선 ± width × 표준편차)"""
+    close = ohlcv["close"]
+    middle = sma_last(close, period)
+    if close.shape[0] >= period:
+        std = close[-period:].std(axis=0)
+    else:
+        std = np.full(close.shape[1], np.nan)
+
+    upper = middle + width * std
+    lower = middle - width * std
+    current = close[-1]
+    band = upper - lower
+
+    return {
+        "middle": middle,
+        "upper": upper,
+        "lower": lower,
+        "pct_b": np.where(band > 0, (current - lower) / band, np.nan),
+        "bandwidth": np.where(middle > 0, band / middle * 100, np.nan),
+        "below_lower": current < lower,
+        "above_upper": current > upper,
+    }
+
+
+def atr_kernel(ohlcv: Dict[str, np.ndarray], period: int = 14) -> Dict[str, np.ndarray]:
+    """ATR (Wilder 평균 True Range)"""
+    high, low, close = ohlcv["high"], ohlcv["low"], ohlcv["close"]
+    n_cols = close.shape[1]
+    if close.shape[0] < 2:
+        nan = np.full(n_cols, np.nan)
+        return {"atr": nan, "atr_pct": nan.copy()}
+
+    prev_close = close[:-1]
+    true_range = np.fmax(
+        high[1:] - low[1:],
+        np.fmax(np.abs(high[1:] - prev_close), np.abs(low[1:] - prev_close))
+    )
+    true_range[np.isnan(prev_close)] = np.nan
+
+    atr = wilder_smooth_series(true_range, period)[-1]
+    return {
+        "atr": atr,
+        "atr_pct": np.where(close[-1] > 0, atr / close[-1] * 100, np.nan),
+    }
+
+
+def obv_kernel(ohlcv: Dict[str, np.ndarray], period: int = 20) -> Dict[str, np.ndarray]:
+    """OBV (On-Balance Volume) 및 가격 대비 다이버전스"""
+    close, volume = ohlcv["close"], ohlcv["volume"]
+    n_rows, n_cols = close.shape
+    if n_rows < period + 1:
+        nan = np.full(n_cols, np.nan)
+        false = np.zeros(n_cols, dtype=bool)
+        return {"obv": nan, "obv_change": nan.copy(), "price_change_pct": nan.copy(),
+                "bullish_divergence": false, "bearish_divergence": false.copy()}
+
+    direction = np.sign(np.diff(close, axis=0))
+    flow = np.where(np.isnan(direction), 0.0, direction * np.nan_to_num(volume[1:]))
+    obv = np.vstack([np.zeros((1, n_cols)), np.cumsum(flow, axis=0)])  # 행 = 종가 행
+
+    # 기간 내 OBV 변화 / 가격 변화
+    obv_change = obv[-1] - obv[-1 - period]
+    start_price = close[-1 - period]
+    price_change = np.where(start_price > 0, (close[-1] / start_price - 1) * 100, np.nan)
+
+    return {
+        "obv": obv[-1],
+        "obv_change": np.where(np.isnan(start_price), np.nan, obv_change),
+        "price_change_pct": price_change,
+        "bullish_divergence": (price_change < 0) & (obv_change > 0),
+        "bearish_divergence": (price_change > 0) & (obv_change < 0),
+    }
+
+
+def stochastic_kernel(
+    ohlcv: Dict[str, np.ndarray],
+    k_period: int = 14,
+    d_period: int = 3,
+    oversold: float = 20.0,
+    overbought: float = 80.0
+) -> Dict[str, np.ndarray]:
+    """스토캐스틱 (Fast %K, %D = %K의 d_period 단순평균)"""
+    high, low, close = ohlcv["high"], ohlcv["low"], ohlcv["close"]
+
+    # %D 전일값까지 필요: 최근 d_period + 1개의 %K
+    n_last = d_period + 1
+    highest = _rolling_last(high, k_period, n_last, np.max)
+    lowest = _rolling_last(low, k_period, n_last, np.min)
+    span = highest - lowest
+    recent_close = np.full_like(highest, np.nan)
+    take = min(n_last, close.shape[0])
+    if take:
+        recent_close[-take:] = close[-take:]
+    k = np.where(span > 0, (recent_close - lowest) / span * 100, 50.0)
+    k[np.isnan(span)] = np.nan
+
+    d = k[1:].mean(axis=0)
+    prev_d = k[:-1].mean(axis=0)
+    k_now, k_prev = k[-1], k[-2]
+
+    return {
+        "k": k_now,
+        "d": d,
+        "oversold_cross": (k_now > d) & (k_prev <= prev_d) & (k_now < oversold),
+        "overbought_cross": (k_now < d) & (k_prev >= prev_d) & (k_now > overbought),
+    }
+
+
+def adx_kernel(ohlcv: Dict[str, np.ndarray], period: int = 14, threshold: float = 25.0) -> Dict[str, np.ndarray]:
+    """ADX / +DI / -DI (Wilder)"""
+    high, low, close = ohlcv["high"], ohlcv["low"], ohlcv["close"]
+    n_cols = close.shape[1]
+    if close.shape[0] < 2:
+        nan = np.full(n_cols, np.nan)
+        false = np.zeros(n_cols, dtype=bool)
+        return {"adx": nan, "plus_di": nan.copy(), "minus_di": nan.copy(),
+                "strong_uptrend": false, "strong_downtrend": false.copy()}
+
+    up_move = high[1:] - high[:-1]
+    down_move = low[:-1] - low[1:]
+    plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+    minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+
+    prev_close = close[:-1]
+    true_range = np.fmax(
+        high[1:] - low[1:],
+        np.fmax(np.abs(high[1:] - prev_close), np.abs(low[1:] - prev_close))
+    )
+    missing = np.isnan(prev_close)
+    for arr in (plus_dm, minus_dm, true_range):
+        arr[missing] = np.nan
+
+    smoothed_tr = wilder_smooth_series(true_range, period)
+    plus_di = np.where(smoothed_tr > 0, wilder_smooth_series(plus_dm, period) / smoothed_tr * 100, np.nan)
+    minus_di = np.where(smoothed_tr > 0, wilder_smooth_series(minus_dm, period) / smoothed_tr * 100, np.nan)
+
+    di_sum = plus_di + minus_di
+    dx = np.where(di_sum > 0, np.abs(plus_di - minus_di) / di_sum * 100, np.where(np.isnan(di_sum), np.nan, 0.0))
+    adx = wilder_smooth_series(dx, period)[-1]
+
+    return {
+        "adx": adx,
+        "plus_di": plus_di[-1],
+        "minus_di": minus_di[-1],
+        "strong_uptrend": (adx > threshold) & (plus_di[-1] > minus_di[-1]),
+        "strong_downtrend": (adx > threshold) & (minus_di[-1] > plus_di[-1]),
+    }
+
+
+register_indicator(IndicatorDefinition(
+    name="bollinger",
+    lookback=lambda p: p["period"],
+    kernel=bollinger_kernel,
+    signals=[
+        IndicatorSignalRule("bollinger_lower_break", "below_lower", "볼린저 하단 이탈 (%B {pct_b:.2f})", "moderate", "bullish"),
+        IndicatorSignalRule("bollinger_upper_break", "above_upper", "볼린저 상단 돌파 (%B {pct_b:.2f})", "moderate", "bearish"),
+    ]
+))
+
+register_indicator(IndicatorDefinition(
+    name="atr",
+    lookback=lambda p: p["period"] + 1,  # 전일 종가 포함
+    kernel=atr_kernel
+))
+
+register_indicator(IndicatorDefinition(
+    name="obv",
+    lookback=lambda p: p["period"] + 1,
+    kernel=obv_kernel,
+    signals=[
+        IndicatorSignalRule("obv_bullish_divergence", "bullish_divergence", "주가 하락 중 OBV 상승 (매집 가능성)", "moderate", "bullish"),
+        IndicatorSignalRule("obv_bearish_divergence", "bearish_divergence", "주가 상승 중 OBV 하락 (분산 가능성)", "moderate", "bearish"),
+    ]
+))
+
+register_indicator(IndicatorDefinition(
+    name="stochastic",
+    lookback=lambda p: p["k_period"] + p["d_period"],  # 전일 %D까지 %K d_period + 1개
+    kernel=stochastic_kernel,
+    signals=[
+        IndicatorSignalRule("stochastic_oversold_cross", "oversold_cross", "스토캐스틱 과매도권 상향 교차 (%K {k:.1f})", "moderate", "bullish"),
+        IndicatorSignalRule("stochastic_overbought_cross", "overbought_cross", "스토캐스틱 과매수권 하향 교차 (%K {k:.1f})", "moderate", "bearish"),
+    ]
+))
+
+register_indicator(IndicatorDefinition(
+    name="adx",
+    lookback=lambda p: 2 * p["period"],  # DI 평활(전일 종가 포함 period + 1봉) 후 DX period개 평활
+    kernel=adx_kernel,
+    signals=[
+        IndicatorSignalRule("adx_strong_uptrend", "strong_uptrend", "ADX {adx:.1f} - 강한 상승 추세", "moderate", "bullish"),
+        IndicatorSignalRule("adx_strong_downtrend", "strong_downtrend", "ADX {adx:.1f} - 강한 하락 추세", "moderate", "bearish"),
+    ]
+))
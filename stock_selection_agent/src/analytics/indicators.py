@@ -0,0 +1,228 @@
+"""
+Vectorized Indicators - 배열 기반 기술적 지표 계산
+(날짜 × 종목) 배열을 입력받아 모든 종목의 지표를 한 번에 계산
+
+규칙:
+- 0번 축은 시간(과거 → 최근), 1번 축은 종목
+- 결측값은 NaN (상장 전 구간 등)
+- 계산식은 TechnicalAgent의 단일 종목 계산과 동일하게 유지
+"""
+
+from typing import Dict
+
+import numpy as np
+
+
+def forward_fill(values: np.ndarray) -> np.ndarray:
+    """
+    시간 축 방향 결측값 전일값 채우기 (상장 전 구간은 NaN 유지)
+
+    Args:
+        values: (날짜 × 종목) 배열
+
+    Returns:
+        결측값이 직전 유효값으로 채워진 배열
+    """
+    valid = ~np.isnan(values)
+    rows = np.where(valid, np.arange(values.shape[0])[:, None], 0)
+    np.maximum.accumulate(rows, axis=0, out=rows)
+    filled = values[rows, np.arange(values.shape[1])]
+    # 첫 유효값 이전 구간은 여전히 NaN
+    started = np.maximum.accumulate(valid, axis=0)
+    filled[~started] = np.nan
+    return filled
+
+
+def history_lengths(values: np.ndarray) -> np.ndarray:
+    """
+    종목별 히스토리 길이 (첫 유효값부터 마지막 행까지의 봉 수)
+
+    Args:
+        values: (날짜 × 종목) 배열
+
+    Returns:
+        (종목,) 정수 배열
+    """
+    valid = ~np.isnan(values)
+    has_any = valid.any(axis=0)
+    first = np.argmax(valid, axis=0)
+    return np.where(has_any, values.shape[0] - first, 0)
+
+
+def sma_last(values: np.ndarray, period: int, offset: int = 0) -> np.ndarray:
+    """
+    최근 시점 단순이동평균
+
+    Args:
+        values: (날짜 × 종목) 배열
+        period: 이동평균 기간
+        offset: 뒤에서 제외할 봉 수 (1이면 전일 기준 이동평균)
+
+    Returns:
+        (종목,) 배열 (기간 내 결측이 있으면 NaN)
+    """
+    end = values.shape[0] - offset
+    if period <= 0 or end - period < 0:
+        return np.full(values.shape[1], np.nan)
+    return values[end - period:end].mean(axis=0)
+
+
+def ema_series(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    지수이동평균 시계열 (첫 period개 단순평균으로 시작)
+
+    종목마다 첫 유효값 시점이 달라도 각자의 첫 period개 값으로 시작한다.
+
+    Args:
+        values: (날짜 × 종목) 배열
+        period: EMA 기간
+
+    Returns:
+        (날짜 × 종목) 배열 (시작 전 구간은 NaN)
+    """
+    n_rows, n_cols = values.shape
+    k = 2 / (period + 1)
+    out = np.full((n_rows, n_cols), np.nan)
+    count = np.zeros(n_cols, dtype=np.int64)
+    total = np.zeros(n_cols)
+    ema = np.full(n_cols, np.nan)
+
+    for t in range(n_rows):
+        x = values[t]
+        valid = ~np.isnan(x)
+        warming = valid & (count < period)
+        total[warming] += x[warming]
+        count[valid] += 1
+
+        seeded = warming & (count == period)
+        ema[seeded] = total[seeded] / period
+
+        running = valid & (count > period)
+        ema[running] = x[running] * k + ema[running] * (1 - k)
+
+        out[t] = np.where(count >= period, ema, np.nan)
+
+    return out
+
+
+def wilder_smooth_series(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Wilder 평활 시계열
+
+    종목마다 첫 period개 유효값의 단순평균으로 시작하여
+    avg = (avg * (period - 1) + x) / period 로 갱신한다.
+
+    Args:
+        values: (날짜 × 종목) 배열
+        period: 평활 기간
+
+    Returns:
+        (날짜 × 종목) 배열 (시작 전 구간은 NaN)
+    """
+    n_rows, n_cols = values.shape
+    out = np.full((n_rows, n_cols), np.nan)
+    count = np.zeros(n_cols, dtype=np.int64)
+    avg = np.zeros(n_cols)
+
+    for t in range(n_rows):
+        x = values[t]
+        valid = ~np.isnan(x)
+        warming = valid & (count < period)
+        avg[warming] += x[warming] / period
+
+        running = valid & (count >= period)
+        avg[running] = (avg[running] * (period - 1) + x[running]) / period
+        count[valid] += 1
+
+        out[t] = np.where(count >= period, avg, np.nan)
+
+    return out
+
+
+def wilder_rsi_series(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """
+    RSI 시계열 (Wilder 평활)
+
+    첫 period개 변화량의 단순평균으로 시작하여 이후 Wilder 방식으로 갱신한다.
+
+    Args:
+        close: (날짜 × 종목) 종가 배열
+        period: RSI 기간
+
+    Returns:
+        (날짜 × 종목) RSI 배열 (계산 불가 구간은 NaN)
+    """
+    filled = forward_fill(close)
+    n_rows, n_cols = filled.shape
+    out = np.full((n_rows, n_cols), np.nan)
+    if n_rows < 2:
+        return out
+
+    change = np.diff(filled, axis=0)
+    missing = np.isnan(change)
+    gains = np.where(missing, np.nan, np.where(change > 0, change, 0.0))
+    losses = np.where(missing, np.nan, np.where(change > 0, 0.0, -change))
+
+    avg_gain = wilder_smooth_series(gains, period)
+    avg_loss = wilder_smooth_series(losses, period)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = avg_gain / avg_loss
+        rsi = np.where(avg_loss == 0, 100.0, 100 - (100 / (1 + rs)))
+    out[1:] = np.where(np.isnan(avg_loss), np.nan, rsi)
+    return out
+
+
+def wilder_rsi_last(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """최근 시점 RSI (종목,)"""
+    return wilder_rsi_series(close, period)[-1]
+
+
+def macd_last(close: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    최근 시점 MACD (12, 26, 9) 및 시그널선 크로스
+
+    Args:
+        close: (날짜 × 종목) 종가 배열
+
+    Returns:
+        {"macd", "signal", "histogram", "bullish_cross", "bearish_cross"} 종목 축 배열
+    """
+    filled = forward_fill(close)
+    n_rows, n_cols = filled.shape
+    nan = np.full(n_cols, np.nan)
+    if n_rows < 26:
+        false = np.zeros(n_cols, dtype=bool)
+        return {"macd": nan, "signal": nan.copy(), "histogram": nan.copy(),
+                "bullish_cross": false, "bearish_cross": false.copy()}
+
+    macd_line = ema_series(filled, 12)[-1] - ema_series(filled, 26)[-1]
+
+    # 최근 26봉 MACD 히스토리 (26번째 전 종가에서 시작)
+    window = filled[-26:]
+    k12 = 2 / (12 + 1)
+    k26 = 2 / (26 + 1)
+    ema12 = window[0].copy()
+    ema26 = window[0].copy()
+    history = np.empty_like(window)
+    for t in range(window.shape[0]):
+        ema12 = window[t] * k12 + ema12 * (1 - k12)
+        ema26 = window[t] * k26 + ema26 * (1 - k26)
+        history[t] = ema12 - ema26
+
+    signal = ema_series(history, 9)[-1]
+    prev_signal = ema_series(history[:-1], 9)[-1]
+    prev_macd = history[-2]
+
+    with np.errstate(invalid="ignore"):
+        has_prev = ~np.isnan(prev_signal) & (prev_signal != 0)
+        bullish = (macd_line > signal) & has_prev & (prev_macd <= prev_signal)
+        bearish = (macd_line < signal) & has_prev & (prev_macd >= prev_signal)
+
+    return {
+        "macd": macd_line,
+        "signal": signal,
+        "histogram": macd_line - signal,
+        "bullish_cross": bullish,
+        "bearish_cross": bearish,
+    }
@@ -0,0 +1,174 @@
+"""
+Liquidity - 유니버스 유동성 지표 일괄 계산
+시세 패널의 실제 거래대금과 상장주식수로 기간별 일평균 거래대금(ADTV),
+회전율(유통주식 조정), Amihud 비유동성을 전 종목 한 번에 계산
+
+- ADTV: 최근 N거래일 거래대금 평균 (거래정지일 제외)
+- 회전율: 일평균 거래량 × 252 / 유통주식수 (유통비율 미제공 시 상장주식수)
+- Amihud: 일평균 |수익률| / 거래대금(억원) - 1억원 거래당 가격 변동
+"""
+
+from typing import Dict, List, Optional, Sequence
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from .risk_engine import TRADING_DAYS_PER_YEAR, simple_returns
+from ..models.panel import PricePanel
+
+
+ADTV_WINDOWS = (20, 60, 252)
+AMIHUD_SCALE = 100_000_000  # 거래대금 1억원 단위
+
+# 등급별 유동성 리스크 점수 (RiskAgent와 동일)
+GRADE_SCORES = {"A": 20, "B": 30, "C": 50, "D": 70, "F": 90}
+
+
+@dataclass
+class LiquidityThresholds:
+    """ADTV 등급 기준 (원, RiskAnalysisConfig와 같은 기본값)"""
+    excellent: int = 10_000_000_000  # 100억 → A
+    good: int = 5_000_000_000  # 50억 → B
+    moderate: int = 1_000_000_000  # 10억 → C
+    poor: int = 500_000_000  # 5억 → D, 미만 F
+
+
+@dataclass
+class LiquidityMetrics:
+    """
+    유니버스 유동성 지표 (codes 순서 배열, 계산 불가 NaN)
+
+    등급은 가장 짧은 기간(기본 20일) ADTV 기준이며, 거래 데이터가 없는 종목은 "F"이다.
+    """
+    codes: List[str]
+    trade_date: str
+    adtv: Dict[int, np.ndarray] = field(default_factory=dict)  # {기간: 일평균 거래대금}
+    turnover_ratio: Dict[int, np.ndarray] = field(default_factory=dict)  # {기간: 연환산 회전율}
+    amihud: Dict[int, np.ndarray] = field(default_factory=dict)  # {기간: Amihud 비유동성}
+    free_float_ratio: Optional[np.ndarray] = None
+    grade: Optional[np.ndarray] = None  # "A" ~ "F"
+    score: Optional[np.ndarray] = None  # 20 ~ 90, 높을수록 위험
+    _index: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self):
+        self._index = {code: i for i, code in enumerate(self.codes)}
+
+    def index_of(self, stock_code: str) -> Optional[int]:
+        return self._index.get(stock_code)
+
+    def __contains__(self, stock_code: str) -> bool:
+        return stock_code in self._index
+
+    def passing(self, min_grade: str = "C") -> List[str]:
+        """등급 min_grade 이상 종목 (A가 가장 높음)"""
+        return [code for code, g in zip(self.codes, self.grade) if g <= min_grade]
+
+    def to_dict(self, stock_code: str) -> Optional[Dict[str, object]]:
+        """종목 1개 결과 (RiskAgent 유동성 리스크 dict 형식, 없으면 None)"""
+        row = self.index_of(stock_code)
+        if row is None:
+            return None
+
+        def value(values, digits=None):
+            v = values[row]
+            if np.isnan(v):
+                return None
+            return int(v) if digits is None else round(float(v), digits)
+
+        base = min(self.adtv) if self.adtv else None
+        turnover_period = max(self.turnover_ratio) if self.turnover_ratio else None
+        free_float = None if self.free_float_ratio is None else value(self.free_float_ratio, 4)
+        return {
+            "score": int(self.score[row]),
+            "avg_daily_trading_value": value(self.adtv[base]) if base else None,
+            "adtv": {str(n): value(v) for n, v in self.adtv.items()},
+            "liquidity_grade": str(self.grade[row]),
+            "turnover_ratio": value(self.turnover_ratio[turnover_period], 4) if turnover_period else None,
+            "amihud_illiquidity": {str(n): value(v, 6) for n, v in self.amihud.items()},
+            "free_float_ratio": free_float,
+            "bid_ask_spread": None
+        }
+
+
+def liquidity_grades(adtv: np.ndarray, thresholds: Optional[LiquidityThresholds] = None) -> np.ndarray:
+    """ADTV → 유동성 등급 배열 (NaN은 F)"""
+    t = thresholds or LiquidityThresholds()
+    values = np.nan_to_num(adtv, nan=-1.0)
+    return np.select(
+        [values >= t.excellent, values >= t.good, values >= t.moderate, values >= t.poor],
+        ["A", "B", "C", "D"],
+        "F"
+    )
+
+
+def compute_liquidity_metrics(
+    panel: PricePanel,
+    shares_outstanding: Optional[Sequence[float]] = None,
+    free_float_ratio: Optional[Sequence[float]] = None,
+    windows: Sequence[int] = ADTV_WINDOWS,
+    thresholds: Optional[LiquidityThresholds] = None
+) -> LiquidityMetrics:
+    """
+    유니버스 유동성 지표 일괄 계산
+
+    Args:
+        panel: 시세 패널 (거래량/거래대금 포함, 최대 기간 + 1봉 권장)
+        shares_outstanding: 종목별 상장주식수 (None이면 회전율 미산출)
+        free_float_ratio: 종목별 유통주식 비율 (0~1, 결측은 1로 간주)
+        windows: ADTV/회전율/Amihud 계산 기간
+        thresholds: 등급 기준
+
+    Returns:
+        LiquidityMetrics
+    """
+    close = panel.close
+    volume = panel.volume if panel.volume is not None else np.full(close.shape, np.nan)
+    if panel.trading_value is not None:
+        trading_value = panel.trading_value
+    else:
+        # 거래대금이 없는 패널은 종가 × 거래량으로 근사
+        trading_value = close * volume
+
+    traded = ~np.isnan(close) & (np.nan_to_num(trading_value) > 0)
+    value = np.where(traded, trading_value, np.nan)
+    vol = np.where(traded, volume, np.nan)
+    returns = np.vstack([np.full((1, close.shape[1]), np.nan), simple_returns(close)])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        impact = np.abs(returns) / (value / AMIHUD_SCALE)
+    impact = np.where(np.isfinite(impact), impact, np.nan)
+
+    shares = None
+    ratio = None
+    if shares_outstanding is not None:
+        shares = np.asarray(shares_outstanding, dtype=float)
+        shares = np.where(shares > 0, shares, np.nan)
+        if free_float_ratio is not None:
+            ratio = np.asarray(free_float_ratio, dtype=float)
+            ratio = np.where((ratio > 0) & (ratio <= 1), ratio, np.nan)
+            shares = shares * np.nan_to_num(ratio, nan=1.0)
+
+    metrics = LiquidityMetrics(
+        codes=list(panel.codes),
+        trade_date=panel.dates[-1] if panel.dates else "",
+        free_float_ratio=ratio
+    )
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for n in windows:
+            counts = traded[-n:].sum(axis=0)
+            has = counts > 0
+            safe = np.where(has, counts, 1)
+            metrics.adtv[n] = np.where(has, np.nansum(value[-n:], axis=0) / safe, np.nan)
+            impact_counts = (~np.isnan(impact[-n:])).sum(axis=0)
+            metrics.amihud[n] = np.where(
+                impact_counts > 0,
+                np.nansum(impact[-n:], axis=0) / np.where(impact_counts > 0, impact_counts, 1),
+                np.nan
+            )
+            if shares is not None:
+                mean_volume = np.where(has, np.nansum(vol[-n:], axis=0) / safe, np.nan)
+                metrics.turnover_ratio[n] = mean_volume * TRADING_DAYS_PER_YEAR / shares
+
+    metrics.grade = liquidity_grades(metrics.adtv[min(windows)], thresholds)
+    metrics.score = np.array([GRADE_SCORES[g] for g in metrics.grade], dtype=float)
+    return metrics
@@ -0,0 +1,132 @@
+"""
+Market Cap Rank - 거래일 시가총액 순위 인덱스
+시가총액 스냅샷 전 종목의 전체/시장 내/업종 내 순위를 정렬 한 번으로 계산하고
+종목코드 → 행 dict로 O(1) 조회
+
+- 순위는 시가총액 내림차순 1부터 (동률은 종목코드 순)
+- 시가총액이 없는 종목은 순위 None
+"""
+
+from typing import Dict, List, Optional, Sequence
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+def rank_within(values: np.ndarray, groups: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    그룹 내 내림차순 순위 (1부터, NaN 행은 0)
+
+    Args:
+        values: 순위 기준 값
+        groups: 그룹 라벨 (None이면 전체 한 그룹)
+
+    Returns:
+        순위 배열 (int)
+    """
+    n = len(values)
+    valid = ~np.isnan(values)
+    group_ids = np.zeros(n, dtype=np.intp) if groups is None else np.unique(groups, return_inverse=True)[1]
+
+    # (그룹, 결측 여부, -값) 순 정렬 후 그룹 시작 위치를 빼서 그룹 내 순위
+    order = np.lexsort((np.arange(n), -np.nan_to_num(values, nan=0.0), ~valid, group_ids))
+    sorted_groups = group_ids[order]
+    starts = np.r_[0, np.flatnonzero(np.diff(sorted_groups)) + 1]
+    group_start = np.repeat(starts, np.diff(np.r_[starts, n]))
+
+    ranks = np.empty(n, dtype=np.intp)
+    ranks[order] = np.arange(n) - group_start + 1
+    ranks[~valid] = 0
+    return ranks
+
+
+@dataclass
+class MarketCapRanks:
+    """거래일 시가총액 순위 인덱스 (codes 순서 배열)"""
+    trade_date: str
+    codes: List[str]
+    market_cap: np.ndarray
+    markets: np.ndarray  # "KOSPI", "KOSDAQ"
+    sectors: np.ndarray  # 섹터명 (없으면 "")
+    rank: np.ndarray  # 전체 순위 (0 = 순위 없음)
+    market_rank: np.ndarray
+    sector_rank: np.ndarray
+    market_totals: Dict[str, int] = field(default_factory=dict)
+    sector_totals: Dict[str, int] = field(default_factory=dict)
+    total: int = 0
+    _index: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self):
+        self._index = {code: i for i, code in enumerate(self.codes)}
+
+    def __contains__(self, stock_code: str) -> bool:
+        return stock_code in self._index
+
+    def index_of(self, stock_code: str) -> Optional[int]:
+        return self._index.get(stock_code)
+
+    def lookup(self, stock_code: str) -> Optional[Dict[str, object]]:
+        """종목 순위 정보 (없거나 시가총액 결측이면 None)"""
+        row = self._index.get(stock_code)
+        if row is None or self.rank[row] == 0:
+            return None
+        market = str(self.markets[row])
+        sector = str(self.sectors[row])
+        return {
+            "market_cap": int(self.market_cap[row]),
+            "rank": int(self.rank[row]),
+            "total": self.total,
+            "market": market,
+            "market_rank": int(self.market_rank[row]),
+            "market_total": self.market_totals.get(market, 0),
+            "sector": sector or None,
+            "sector_rank": int(self.sector_rank[row]) if sector else None,
+            "sector_total": self.sector_totals.get(sector) if sector else None,
+        }
+
+
+def build_market_cap_ranks(
+    codes: Sequence[str],
+    market_caps: Sequence[float],
+    markets: Sequence[str],
+    sectors: Optional[Sequence[Optional[str]]] = None,
+    trade_date: str = ""
+) -> MarketCapRanks:
+    """
+    시가총액 순위 인덱스 생성
+
+    Args:
+        codes: 종목코드
+        market_caps: 시가총액 (원)
+        markets: 소속 시장
+        sectors: 섹터명 (None/빈 문자열은 업종 순위 제외)
+        trade_date: 기준 거래일
+
+    Returns:
+        MarketCapRanks
+    """
+    caps = np.asarray(market_caps, dtype=float)
+    caps = np.where(caps > 0, caps, np.nan)
+    market_labels = np.asarray([str(m) for m in markets], dtype=object)
+    sector_labels = np.asarray(
+        [s or "" for s in (sectors if sectors is not None else [""] * len(codes))], dtype=object
+    )
+    valid = ~np.isnan(caps)
+
+    def totals(labels):
+        names, counts = np.unique(labels[valid], return_counts=True)
+        return {str(name): int(count) for name, count in zip(names, counts) if name}
+
+    return MarketCapRanks(
+        trade_date=trade_date,
+        codes=list(codes),
+        market_cap=caps,
+        markets=market_labels,
+        sectors=sector_labels,
+        rank=rank_within(caps),
+        market_rank=rank_within(caps, market_labels.astype(str)),
+        sector_rank=rank_within(caps, sector_labels.astype(str)),
+        market_totals=totals(market_labels.astype(str)),
+        sector_totals=totals(sector_labels.astype(str)),
+        total=int(valid.sum())
+    )
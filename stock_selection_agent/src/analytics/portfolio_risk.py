@@ -0,0 +1,219 @@
+"""
+Portfolio Risk - 바스켓 포트폴리오 리스크
+Ledoit-Wolf 축소 공분산으로 포트폴리오 VaR/CVaR, 한계/구성 VaR, 분산투자비율 계산
+
+공분산 행렬(N × N)을 만들지 않고 중심화 수익률 X (T × N, float32)와
+축소 계수로 Σw = (1-δ)·Xᵀ(Xw)/T + δ·μ·w 를 계산하므로
+500종목 바스켓도 메모리 O(T × N)로 처리된다.
+Ledoit-Wolf 계수 계산에 필요한 ||XᵀX||² 는 T × T 그램 행렬을 종목 블록 단위로 누적해 구한다.
+"""
+
+from typing import Dict, List, Optional, Sequence
+from dataclasses import dataclass, field
+from statistics import NormalDist
+
+import numpy as np
+
+from .risk_engine import simple_returns
+
+
+@dataclass
+class ShrunkCovariance:
+    """
+    Ledoit-Wolf 축소 공분산 (항등행렬 배수 타깃)
+
+    Σ = (1 - shrinkage) × S + shrinkage × mu × I,  S = XᵀX / T
+    """
+    centered: np.ndarray  # (T × N) float32 중심화 수익률
+    shrinkage: float
+    mu: float  # 표본 분산 평균 (타깃 스케일)
+
+    @property
+    def n_observations(self) -> int:
+        return self.centered.shape[0]
+
+    def variances(self) -> np.ndarray:
+        """종목별 축소 분산 (대각 원소)"""
+        x = self.centered
+        sample = np.einsum("ij,ij->j", x, x, dtype=np.float64) / self.n_observations
+        return (1 - self.shrinkage) * sample + self.shrinkage * self.mu
+
+    def matvec(self, weights: np.ndarray) -> np.ndarray:
+        """Σw (공분산 행렬 구성 없이 계산)"""
+        x = self.centered
+        w = np.asarray(weights, dtype=np.float32)
+        sample = (x.T @ (x @ w)).astype(np.float64) / self.n_observations
+        return (1 - self.shrinkage) * sample + self.shrinkage * self.mu * np.asarray(weights, dtype=np.float64)
+
+    def to_dense(self, block_size: int = 256) -> np.ndarray:
+        """공분산 행렬 (N × N, float32) - 필요할 때만 블록 단위로 구성"""
+        x = self.centered
+        n = x.shape[1]
+        dense = np.empty((n, n), dtype=np.float32)
+        for start in range(0, n, block_size):
+            stop = min(start + block_size, n)
+            dense[start:stop] = (x[:, start:stop].T @ x) / self.n_observations
+        dense *= (1 - self.shrinkage)
+        dense[np.diag_indices(n)] += self.shrinkage * self.mu
+        return dense
+
+
+def ledoit_wolf_covariance(returns: np.ndarray, block_size: int = 256) -> ShrunkCovariance:
+    """
+    Ledoit-Wolf 축소 공분산 추정
+
+    Args:
+        returns: (기간 × 종목) 수익률 (결측은 종목 평균으로 대체 = 편차 0)
+        block_size: 그램 행렬 누적 종목 블록 크기
+
+    Returns:
+        ShrunkCovariance
+    """
+    data = np.asarray(returns, dtype=np.float32)
+    with np.errstate(invalid="ignore"):
+        means = np.nanmean(data, axis=0)
+    x = np.nan_to_num(data - means[None, :]).astype(np.float32)
+    n_obs, n_assets = x.shape
+
+    x2 = x * x
+    sample_var = x2.sum(axis=0, dtype=np.float64) / n_obs
+    mu = float(sample_var.sum() / n_assets)
+
+    # Σ_ij Σ_t x_ti² x_tj² = Σ_t (Σ_i x_ti²)²
+    row_energy = x2.sum(axis=1, dtype=np.float64)
+    beta_sum = float((row_energy ** 2).sum())
+
+    # ||XᵀX||_F² = ||XXᵀ||_F²  (T × T 그램 행렬을 블록 누적)
+    gram = np.zeros((n_obs, n_obs), dtype=np.float64)
+    for start in range(0, n_assets, block_size):
+        block = x[:, start:start + block_size]
+        gram += (block @ block.T).astype(np.float64)
+    delta_sum = float((gram ** 2).sum()) / n_obs ** 2
+
+    beta = (beta_sum / n_obs - delta_sum) / (n_assets * n_obs)
+    delta = (delta_sum - 2 * mu * sample_var.sum() + n_assets * mu ** 2) / n_assets
+    beta = min(beta, delta)
+    shrinkage = 0.0 if beta <= 0 or delta <= 0 else beta / delta
+
+    return ShrunkCovariance(centered=x, shrinkage=float(shrinkage), mu=mu)
+
+
+@dataclass
+class PortfolioRisk:
+    """
+    포트폴리오 리스크 (일간, 손실 양수)
+
+    종목 축 배열은 codes 순서이며 component_var 합계 = parametric_var[level] 이다.
+    """
+    codes: List[str]
+    weights: np.ndarray
+    observations: int
+    shrinkage: float
+    volatility: float  # 일간 포트폴리오 표준편차
+    annual_volatility: float
+    diversification_ratio: float  # 가중 개별 변동성 합 / 포트폴리오 변동성
+    parametric_var: Dict[float, float] = field(default_factory=dict)
+    parametric_cvar: Dict[float, float] = field(default_factory=dict)
+    historical_var: Dict[float, float] = field(default_factory=dict)
+    historical_cvar: Dict[float, float] = field(default_factory=dict)
+    marginal_var: Dict[float, np.ndarray] = field(default_factory=dict)
+    component_var: Dict[float, np.ndarray] = field(default_factory=dict)
+    excluded: List[str] = field(default_factory=list)  # 표본 부족 제외 종목
+
+    def contributions(self, level: float = 0.95) -> List[Dict[str, float]]:
+        """종목별 VaR 기여도 (구성 VaR 큰 순)"""
+        component = self.component_var[level]
+        total = self.parametric_var[level]
+        order = np.argsort(-component, kind="stable")
+        return [
+            {
+                "stock_code": self.codes[i],
+                "weight": float(self.weights[i]),
+                "marginal_var": float(self.marginal_var[level][i]),
+                "component_var": float(component[i]),
+                "contribution_pct": float(component[i] / total * 100) if total else 0.0,
+            }
+            for i in order
+        ]
+
+
+def compute_portfolio_risk(
+    close: np.ndarray,
+    codes: Sequence[str],
+    weights: Optional[Sequence[float]] = None,
+    confidence_levels: Sequence[float] = (0.95, 0.99),
+    window: int = 252,
+    min_observations: int = 60,
+    block_size: int = 256,
+    trading_days: int = 252
+) -> PortfolioRisk:
+    """
+    바스켓 포트폴리오 리스크 계산
+
+    Args:
+        close: (날짜 × 종목) 종가 배열 (오름차순)
+        codes: 종목코드 (열 순서)
+        weights: 종목 비중 (None이면 동일가중, 합 1로 정규화)
+        confidence_levels: VaR/CVaR 신뢰수준
+        window: 최근 수익률 개수
+        min_observations: 종목 최소 유효 수익률 개수 (미만 종목 제외 후 비중 재정규화)
+        block_size: 공분산 블록 크기
+        trading_days: 연율화 거래일 수
+
+    Returns:
+        PortfolioRisk
+    """
+    codes = list(codes)
+    returns = simple_returns(close)[-window:]
+    w = np.ones(len(codes)) if weights is None else np.asarray(weights, dtype=float)
+
+    keep = (~np.isnan(returns)).sum(axis=0) >= min_observations
+    excluded = [code for code, ok in zip(codes, keep) if not ok]
+    returns, w = returns[:, keep], w[keep]
+    codes = [code for code, ok in zip(codes, keep) if ok]
+    if not codes or w.sum() == 0:
+        raise ValueError("포트폴리오 리스크 계산 가능한 종목이 없습니다")
+    w = w / w.sum()
+
+    cov = ledoit_wolf_covariance(returns, block_size)
+    with np.errstate(invalid="ignore"):
+        mean = np.nan_to_num(np.nanmean(returns, axis=0))
+
+    sigma_w = cov.matvec(w)
+    variance = float(w @ sigma_w)
+    vol = float(np.sqrt(max(variance, 0.0)))
+    asset_vol = np.sqrt(cov.variances())
+    port_mean = float(w @ mean)
+
+    result = PortfolioRisk(
+        codes=codes,
+        weights=w,
+        observations=cov.n_observations,
+        shrinkage=cov.shrinkage,
+        volatility=vol,
+        annual_volatility=vol * float(np.sqrt(trading_days)),
+        diversification_ratio=float(w @ asset_vol / vol) if vol > 0 else float("nan"),
+        excluded=excluded
+    )
+
+    # 역사적 시뮬레이션용 포트폴리오 수익률 (결측 수익률 0 처리)
+    port_returns = np.nan_to_num(returns).astype(np.float32) @ w.astype(np.float32)
+
+    normal = NormalDist()
+    for level in confidence_levels:
+        tail = 1 - level
+        z = -normal.inv_cdf(tail)  # 양수
+
+        result.parametric_var[level] = -port_mean + z * vol
+        result.parametric_cvar[level] = -port_mean + vol * normal.pdf(z) / tail
+
+        # 한계 VaR = ∂VaR/∂w_i, 구성 VaR = w_i × 한계 VaR (합 = 포트폴리오 VaR)
+        marginal = -mean + (z * sigma_w / vol if vol > 0 else 0.0)
+        result.marginal_var[level] = marginal
+        result.component_var[level] = w * marginal
+
+        threshold = float(np.percentile(port_returns, tail * 100))
+        result.historical_var[level] = -threshold
+        result.historical_cvar[level] = -float(port_returns[port_returns <= threshold].mean())
+
+    return result
@@ -0,0 +1,185 @@
+"""
+Risk Engine - 유니버스 시장 리스크 일괄 계산
+(날짜 × 종목) 종가 배열로 변동성, VaR/CVaR(모수/역사적), MDD, 회복기간을 한 번에 계산
+
+계산식은 RiskAgent의 단일 종목 계산과 동일하게 유지:
+- 일간 수익률 표준편차(ddof=0) × √252
+- 모수적 VaR = -(평균 + z × 표준편차), 역사적 CVaR = 하위 분위수 이하 평균 손실
+- MDD = 누적 최고가 대비 최대 하락률, 회복기간 = MDD 저점 이후 직전 고점 회복까지 봉 수
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+from statistics import NormalDist
+
+import numpy as np
+
+from .indicators import forward_fill
+
+
+TRADING_DAYS_PER_YEAR = 252
+
+
+@dataclass
+class RiskMetrics:
+    """
+    유니버스 시장 리스크 지표
+
+    모든 배열은 codes 순서의 종목 축 배열이며, 계산 불가 값은 NaN이다.
+    VaR/CVaR은 손실을 양수로 표시한 일간 수익률이다.
+    """
+    codes: List[str]
+    observations: np.ndarray  # VaR 구간 유효 수익률 개수
+    annual_volatility: np.ndarray
+    mean_return: np.ndarray
+    parametric_var: Dict[float, np.ndarray] = field(default_factory=dict)
+    parametric_cvar: Dict[float, np.ndarray] = field(default_factory=dict)
+    historical_var: Dict[float, np.ndarray] = field(default_factory=dict)
+    historical_cvar: Dict[float, np.ndarray] = field(default_factory=dict)
+    max_drawdown: Optional[np.ndarray] = None
+    recovery_days: Optional[np.ndarray] = None  # 미회복 NaN
+
+    def index_of(self, stock_code: str) -> Optional[int]:
+        try:
+            return self.codes.index(stock_code)
+        except ValueError:
+            return None
+
+    def ranked(self, values: np.ndarray, descending: bool = True) -> List[Tuple[str, float]]:
+        """
+        지표 기준 종목 정렬 (NaN 제외)
+
+        Example:
+            metrics.ranked(metrics.annual_volatility)      # 변동성 높은 순
+            metrics.ranked(metrics.historical_cvar[0.99])  # 꼬리 손실 큰 순
+        """
+        valid = np.flatnonzero(~np.isnan(values))
+        order = valid[np.argsort(values[valid], kind="stable")]
+        if descending:
+            order = order[::-1]
+        return [(self.codes[i], float(values[i])) for i in order]
+
+
+def simple_returns(close: np.ndarray) -> np.ndarray:
+    """
+    일간 단순 수익률 ((날짜-1) × 종목, 상장 전 구간 NaN)
+
+    거래정지 등 결측 종가는 직전 종가로 채워 수익률 0으로 처리한다.
+    """
+    filled = forward_fill(close)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return filled[1:] / filled[:-1] - 1
+
+
+def max_drawdown(close: np.ndarray, min_observations: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    최대 낙폭(MDD) 및 회복기간
+
+    Args:
+        close: (날짜 × 종목) 종가 배열
+        min_observations: 최소 유효 종가 수 (미만이면 NaN)
+
+    Returns:
+        (MDD 비율, 회복 봉 수) 종목 축 배열 (미회복 NaN)
+    """
+    prices = forward_fill(close)
+    n_rows, n_cols = prices.shape
+    nan = np.full(n_cols, np.nan)
+    if n_rows == 0:
+        return nan, nan.copy()
+
+    peaks = np.fmax.accumulate(prices, axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drawdowns = (peaks - prices) / peaks
+
+    has_data = ~np.isnan(drawdowns).all(axis=0)
+    filled_dd = np.where(np.isnan(drawdowns), -np.inf, drawdowns)
+    trough = np.argmax(filled_dd, axis=0)  # 첫 최대값 위치
+    cols = np.arange(n_cols)
+    mdd = np.where(has_data, filled_dd[trough, cols], np.nan)
+
+    # 회복: 저점 이후 저점 시점의 누적 최고가 이상으로 처음 복귀한 시점
+    peak_at_trough = peaks[trough, cols]
+    rows = np.arange(n_rows)[:, None]
+    with np.errstate(invalid="ignore"):
+        recovered = (rows > trough[None, :]) & (prices >= peak_at_trough[None, :])
+    has_recovery = recovered.any(axis=0)
+    first = np.argmax(recovered, axis=0)
+    recovery = np.where(has_data & has_recovery, first - trough, np.nan)
+
+    enough = (~np.isnan(prices)).sum(axis=0) >= min_observations
+    return np.where(enough, mdd, np.nan), np.where(enough, recovery, np.nan)
+
+
+def compute_risk_metrics(
+    close: np.ndarray,
+    codes: Sequence[str],
+    confidence_levels: Sequence[float] = (0.95, 0.99),
+    var_window: int = TRADING_DAYS_PER_YEAR,
+    min_var_observations: int = TRADING_DAYS_PER_YEAR - 1,
+    mdd_window: Optional[int] = None,
+    min_mdd_observations: int = 100
+) -> RiskMetrics:
+    """
+    유니버스 시장 리스크 일괄 계산
+
+    Args:
+        close: (날짜 × 종목) 종가 배열 (오름차순)
+        codes: 종목코드 (열 순서)
+        confidence_levels: VaR/CVaR 신뢰수준 목록
+        var_window: 변동성/VaR 계산 최근 수익률 개수
+        min_var_observations: 변동성/VaR 계산 최소 수익률 개수
+        mdd_window: MDD 계산 최근 봉 수 (None이면 전체)
+        min_mdd_observations: MDD 계산 최소 종가 수
+
+    Returns:
+        RiskMetrics
+    """
+    returns = simple_returns(close)[-var_window:]
+    n_cols = close.shape[1]
+    observations = (~np.isnan(returns)).sum(axis=0)
+    enough = observations >= max(min_var_observations, 2)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # 표본이 부족한 종목은 NaN으로 가려서 경고 없이 계산
+        masked = np.where(enough[None, :], returns, np.nan)
+        counts = np.where(enough, observations, 1)
+        mean = np.where(enough, np.nansum(masked, axis=0) / counts, np.nan)
+        std = np.sqrt(np.nansum((masked - mean[None, :]) ** 2, axis=0) / counts)
+        std = np.where(enough, std, np.nan)
+
+    metrics = RiskMetrics(
+        codes=list(codes),
+        observations=observations,
+        annual_volatility=std * np.sqrt(TRADING_DAYS_PER_YEAR),
+        mean_return=mean
+    )
+
+    normal = NormalDist()
+    for level in confidence_levels:
+        tail = 1 - level
+        z = normal.inv_cdf(tail)
+
+        # 모수적 (정규분포 가정)
+        metrics.parametric_var[level] = -(mean + z * std)
+        metrics.parametric_cvar[level] = -(mean - std * normal.pdf(z) / tail)
+
+        # 역사적 (np.percentile 선형 보간과 동일)
+        if masked.shape[0] and enough.any():
+            threshold = np.full(n_cols, np.nan)
+            threshold[enough] = np.nanpercentile(masked[:, enough], tail * 100, axis=0)
+            with np.errstate(invalid="ignore"):
+                in_tail = masked <= threshold[None, :]
+            tail_count = in_tail.sum(axis=0)
+            tail_sum = np.where(in_tail, masked, 0.0).sum(axis=0)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                metrics.historical_var[level] = -threshold
+                metrics.historical_cvar[level] = np.where(tail_count > 0, -tail_sum / tail_count, np.nan)
+        else:
+            metrics.historical_var[level] = np.full(n_cols, np.nan)
+            metrics.historical_cvar[level] = np.full(n_cols, np.nan)
+
+    mdd_close = close if mdd_window is None else close[-mdd_window:]
+    metrics.max_drawdown, metrics.recovery_days = max_drawdown(mdd_close, min_mdd_observations)
+
+    return metrics
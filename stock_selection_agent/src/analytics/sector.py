@@ -0,0 +1,181 @@
+"""
+Sector - 업종지수 모멘텀 일괄 계산
+업종지수 패널(거래일 × 업종)로 시장 대비 상대강도, 추세, 변동성을 한 번에 계산하고
+업종 간 백분위 순위를 합성해 업종 모멘텀 점수(0-100)를 산출
+
+- 상대강도: 기간 N일 업종 수익률 - 시장지수 수익률
+- 추세: 종가 / N일 이동평균 - 1
+- 변동성: 최근 N일 일간 수익률 표준편차 (연환산)
+- 모멘텀 점수: 0.5 × 상대강도 순위(기간 평균) + 0.3 × 추세 순위 + 0.2 × 저변동성 순위
+"""
+
+from typing import Dict, List, Optional, Sequence
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from .indicators import forward_fill, sma_last
+from .risk_engine import TRADING_DAYS_PER_YEAR, simple_returns
+from ..models.panel import PricePanel
+
+
+RS_WINDOWS = (20, 60, 120)
+
+# 모멘텀 점수 구성 비중
+MOMENTUM_WEIGHTS = {"relative_strength": 0.5, "trend": 0.3, "low_volatility": 0.2}
+
+
+@dataclass
+class SectorMomentum:
+    """
+    업종 모멘텀 (sectors 순서 배열, 계산 불가 NaN)
+
+    점수는 업종 간 상대 순위이므로 같은 패널로 계산한 업종끼리만 비교한다.
+    """
+    sectors: List[str]
+    trade_date: str
+    benchmark: str
+    relative_strength: Dict[int, np.ndarray] = field(default_factory=dict)  # {기간: 초과수익률}
+    trend: Optional[np.ndarray] = None
+    volatility: Optional[np.ndarray] = None
+    score: Optional[np.ndarray] = None  # 0-100, 높을수록 강세
+    _index: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self):
+        self._index = {sector: i for i, sector in enumerate(self.sectors)}
+
+    def index_of(self, sector: str) -> Optional[int]:
+        return self._index.get(sector)
+
+    def __contains__(self, sector: str) -> bool:
+        return sector in self._index
+
+    def ranking(self) -> List[str]:
+        """모멘텀 점수 높은 순 업종 (점수 없는 업종 제외)"""
+        rows = [i for i in np.argsort(-np.nan_to_num(self.score, nan=-1.0), kind="stable")
+                if not np.isnan(self.score[i])]
+        return [self.sectors[i] for i in rows]
+
+    def to_dict(self, sector: str) -> Optional[Dict[str, object]]:
+        """업종 1개 결과 (없으면 None)"""
+        row = self.index_of(sector)
+        if row is None:
+            return None
+
+        def value(values, digits):
+            v = values[row]
+            return None if np.isnan(v) else round(float(v), digits)
+
+        return {
+            "momentum_score": value(self.score, 1),
+            "relative_strength": {str(n): value(v, 4) for n, v in self.relative_strength.items()},
+            "trend": value(self.trend, 4),
+            "volatility": value(self.volatility, 4),
+            "benchmark": self.benchmark,
+            "trade_date": self.trade_date,
+        }
+
+
+def percentile_rank(values: np.ndarray) -> np.ndarray:
+    """
+    단면 백분위 순위 (0 = 최저, 100 = 최고, NaN 유지, 동률은 평균 순위)
+
+    유효값이 1개면 50
+    """
+    ranks = np.full(len(values), np.nan)
+    valid = ~np.isnan(values)
+    n = int(valid.sum())
+    if n == 0:
+        return ranks
+    if n == 1:
+        ranks[valid] = 50.0
+        return ranks
+
+    v = values[valid]
+    order = np.argsort(v, kind="stable")
+    position = np.empty(n)
+    position[order] = np.arange(n)
+    # 동률 평균 순위
+    _, inverse = np.unique(v, return_inverse=True)
+    position = np.bincount(inverse, weights=position) / np.bincount(inverse)
+    ranks[valid] = position[inverse] / (n - 1) * 100
+    return ranks
+
+
+def compute_sector_momentum(
+    panel: PricePanel,
+    benchmark_close: np.ndarray,
+    benchmark: str = "KOSPI",
+    windows: Sequence[int] = RS_WINDOWS,
+    trend_window: int = 60,
+    volatility_window: int = 60
+) -> SectorMomentum:
+    """
+    업종 모멘텀 일괄 계산
+
+    Args:
+        panel: 업종지수 패널 (codes = 업종명, close = 지수 종가)
+        benchmark_close: 시장지수 종가 (panel.dates와 같은 길이)
+        benchmark: 시장지수명
+        windows: 상대강도 기간
+        trend_window: 추세 이동평균 기간
+        volatility_window: 변동성 기간
+
+    Returns:
+        SectorMomentum
+    """
+    close = forward_fill(panel.close)
+    market = forward_fill(np.asarray(benchmark_close, dtype=float)[:, None])[:, 0]
+    n_rows, n_sectors = close.shape
+
+    result = SectorMomentum(
+        sectors=list(panel.codes),
+        trade_date=panel.dates[-1] if panel.dates else "",
+        benchmark=benchmark
+    )
+    if n_rows == 0:
+        empty = np.full(n_sectors, np.nan)
+        result.relative_strength = {n: empty for n in windows}
+        result.trend, result.volatility, result.score = empty, empty, empty
+        return result
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for n in windows:
+            if n_rows <= n:
+                result.relative_strength[n] = np.full(n_sectors, np.nan)
+                continue
+            sector_return = close[-1] / close[-1 - n] - 1
+            market_return = market[-1] / market[-1 - n] - 1
+            result.relative_strength[n] = sector_return - market_return
+
+        result.trend = close[-1] / sma_last(close, trend_window) - 1
+
+        returns = simple_returns(close)[-volatility_window:]
+        valid = ~np.isnan(returns)
+        counts = valid.sum(axis=0)
+        mean = np.where(valid, returns, 0).sum(axis=0) / counts
+        variance = np.where(valid, (returns - mean) ** 2, 0).sum(axis=0) / (counts - 1)
+        result.volatility = np.where(counts > 1, np.sqrt(variance) * np.sqrt(TRADING_DAYS_PER_YEAR), np.nan)
+
+        # 상대강도 순위는 계산 가능한 기간만 평균
+        rs_ranks = np.vstack([percentile_rank(v) for v in result.relative_strength.values()])
+        rs_counts = (~np.isnan(rs_ranks)).sum(axis=0)
+        rs_score = np.where(rs_counts > 0, np.nansum(rs_ranks, axis=0) / rs_counts, np.nan)
+
+    components = {
+        "relative_strength": rs_score,
+        "trend": percentile_rank(result.trend),
+        "low_volatility": 100 - percentile_rank(result.volatility),
+    }
+
+    # 계산 불가 구성요소는 중립(50)으로, 지수 데이터가 없는 업종은 NaN
+    score = sum(MOMENTUM_WEIGHTS[name] * np.nan_to_num(values, nan=50.0) for name, values in components.items())
+    result.score = np.where(np.isnan(close[-1]), np.nan, score)
+    return result
+
+
+def blend_outlook(static_score: float, momentum_score: Optional[float], momentum_weight: float = 0.5) -> float:
+    """기본 업종 전망 점수와 모멘텀 점수 가중 합성 (모멘텀 없으면 기본 점수)"""
+    if momentum_score is None or np.isnan(momentum_score):
+        return static_score
+    return round((1 - momentum_weight) * static_score + momentum_weight * momentum_score, 1)
@@ -0,0 +1,219 @@
+"""
+Sector Valuation - 업종별 PER/PBR 집계
+거래일 전 종목 PER/PBR 스냅샷을 DART 업종코드(KSIC) 접두어 단위로 묶어
+평균, 중앙값, 절사평균을 한 번에 계산 (종목 분석 시에는 dict 조회만 수행)
+
+- 유효 범위: 0 < PER < 100, 0 < PBR < 10 (적자/자본잠식/극단값 제외)
+- 업종 단계: 업종코드 앞 3자리(소분류 수준) → 앞 2자리(대분류) → 시장 전체 순으로,
+  유효 종목이 min_peers 이상인 가장 세분화된 단계를 동종업계로 사용
+"""
+
+from typing import Dict, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+MARKET_GROUP = "ALL"
+PER_RANGE = (0.0, 100.0)
+PBR_RANGE = (0.0, 10.0)
+
+
+@dataclass
+class ValuationStats:
+    """업종 1개 밸류에이션 통계 (유효 종목 없음 None)"""
+    count: int = 0
+    mean: Optional[float] = None
+    median: Optional[float] = None
+    trimmed_mean: Optional[float] = None
+
+    def get(self, statistic: str) -> Optional[float]:
+        """"mean", "median", "trimmed_mean" 중 하나"""
+        return getattr(self, statistic)
+
+
+@dataclass
+class GroupValuation:
+    """업종 그룹 밸류에이션"""
+    group: str  # 업종코드 접두어 또는 "ALL"
+    members: int  # 그룹 종목 수
+    per: ValuationStats = field(default_factory=ValuationStats)
+    pbr: ValuationStats = field(default_factory=ValuationStats)
+
+
+@dataclass
+class SectorValuations:
+    """
+    거래일 업종별 밸류에이션 집계
+
+    groups 키는 업종코드 접두어(예: "264", "26")와 시장 전체 "ALL"이다.
+    """
+    trade_date: str
+    groups: Dict[str, GroupValuation] = field(default_factory=dict)
+    stock_per: Dict[str, float] = field(default_factory=dict)
+    stock_pbr: Dict[str, float] = field(default_factory=dict)
+    industry_codes: Dict[str, str] = field(default_factory=dict)  # 종목코드 -> 업종코드
+    prefix_lengths: Tuple[int, ...] = (3, 2)
+    min_peers: int = 5
+
+    def peer_group(self, stock_code: str, industry_code: Optional[str] = None) -> Optional[GroupValuation]:
+        """
+        종목의 동종업계 그룹 (유효 PER 종목이 min_peers 이상인 가장 세분화된 그룹)
+
+        Args:
+            stock_code: 종목코드
+            industry_code: 업종코드 (없으면 집계 시 사용한 업종코드)
+        """
+        code = industry_code or self.industry_codes.get(stock_code) or ""
+        for length in self.prefix_lengths:
+            if len(code) < length:
+                continue
+            group = self.groups.get(code[:length])
+            if group is not None and group.per.count >= self.min_peers:
+                return group
+        return self.groups.get(MARKET_GROUP)
+
+
+def _stats(values: np.ndarray, trim: float) -> ValuationStats:
+    """유효값 배열 → 통계 (절사평균은 양쪽 trim 비율 제외)"""
+    n = len(values)
+    if n == 0:
+        return ValuationStats()
+    ordered = np.sort(values)
+    cut = int(n * trim)
+    trimmed = ordered[cut:n - cut] if n - 2 * cut > 0 else ordered
+    return ValuationStats(
+        count=n,
+        mean=float(ordered.mean()),
+        median=float(np.median(ordered)),
+        trimmed_mean=float(trimmed.mean())
+    )
+
+
+def compute_sector_valuations(
+    codes: Sequence[str],
+    per: np.ndarray,
+    pbr: np.ndarray,
+    industry_codes: Dict[str, str],
+    trade_date: str = "",
+    prefix_lengths: Sequence[int] = (3, 2),
+    min_peers: int = 5,
+    trim: float = 0.1
+) -> SectorValuations:
+    """
+    업종별 PER/PBR 집계
+
+    Args:
+        codes: 종목코드
+        per: 종목별 PER
+        pbr: 종목별 PBR
+        industry_codes: {종목코드: 업종코드} (없는 종목은 시장 전체 집계에만 포함)
+        trade_date: 기준 거래일
+        prefix_lengths: 업종코드 접두어 길이 (세분화된 순)
+        min_peers: 동종업계로 인정할 최소 유효 종목 수
+        trim: 절사평균 양쪽 제외 비율
+
+    Returns:
+        SectorValuations
+    """
+    per = np.asarray(per, dtype=float)
+    pbr = np.asarray(pbr, dtype=float)
+    valid_per = (per > PER_RANGE[0]) & (per < PER_RANGE[1])
+    valid_pbr = (pbr > PBR_RANGE[0]) & (pbr < PBR_RANGE[1])
+
+    result = SectorValuations(
+        trade_date=trade_date,
+        stock_per={code: float(v) for code, v in zip(codes, per) if not np.isnan(v)},
+        stock_pbr={code: float(v) for code, v in zip(codes, pbr) if not np.isnan(v)},
+        industry_codes={code: industry_codes[code] for code in codes if code in industry_codes},
+        prefix_lengths=tuple(prefix_lengths),
+        min_peers=min_peers
+    )
+
+    def add_group(name: str, rows: np.ndarray):
+        result.groups[name] = GroupValuation(
+            group=name,
+            members=len(rows),
+            per=_stats(per[rows][valid_per[rows]], trim),
+            pbr=_stats(pbr[rows][valid_pbr[rows]], trim)
+        )
+
+    add_group(MARKET_GROUP, np.arange(len(codes)))
+
+    # 접두어 길이별로 np.unique 역인덱스로 그룹 행 분할
+    known = [i for i, code in enumerate(codes) if industry_codes.get(code)]
+    for length in prefix_lengths:
+        rows = np.array([i for i in known if len(industry_codes[codes[i]]) >= length], dtype=np.intp)
+        if len(rows) == 0:
+            continue
+        keys = np.array([industry_codes[codes[i]][:length] for i in rows])
+        names, inverse = np.unique(keys, return_inverse=True)
+        order = np.argsort(inverse, kind="stable")
+        splits = np.cumsum(np.bincount(inverse))[:-1]
+        for name, members in zip(names, np.split(rows[order], splits)):
+            add_group(str(name), members)
+
+    return result
+
+
+def peer_comparison(
+    stock_per: Optional[float],
+    stock_pbr: Optional[float],
+    group: Optional[GroupValuation],
+    statistic: str = "trimmed_mean"
+) -> Dict[str, object]:
+    """
+    종목 PER/PBR vs 동종업계 비교 점수 (저평가일수록 높음, 기존 IndustryAgent 산식)
+
+    Args:
+        stock_per: 종목 PER
+        stock_pbr: 종목 PBR
+        group: 동종업계 그룹
+        statistic: 비교 기준 ("mean", "median", "trimmed_mean")
+
+    Returns:
+        {"score", "sector_avg_per", "sector_avg_pbr", "per_vs_sector", "pbr_vs_sector", ...}
+    """
+    result = {
+        "score": 50,
+        "sector_avg_per": None,
+        "sector_avg_pbr": None,
+        "sector_median_per": None,
+        "sector_median_pbr": None,
+        "per_vs_sector": None,
+        "pbr_vs_sector": None,
+        "peer_group": None,
+        "peer_count": None
+    }
+    if group is None or not stock_per or stock_per <= 0:
+        return result
+
+    result["peer_group"] = group.group
+    result["peer_count"] = group.per.count
+
+    sector_avg_per = group.per.get(statistic)
+    sector_avg_pbr = group.pbr.get(statistic)
+
+    if sector_avg_per is not None:
+        result["sector_avg_per"] = round(sector_avg_per, 2)
+        result["sector_median_per"] = round(group.per.median, 2)
+        result["per_vs_sector"] = round(stock_per - sector_avg_per, 2)
+
+    if sector_avg_pbr is not None and stock_pbr is not None and stock_pbr > 0:
+        result["sector_avg_pbr"] = round(sector_avg_pbr, 2)
+        result["sector_median_pbr"] = round(group.pbr.median, 2)
+        result["pbr_vs_sector"] = round(stock_pbr - sector_avg_pbr, 2)
+
+    score = 50
+    if result["per_vs_sector"] is not None:
+        # PER이 업종 평균보다 낮으면 가점
+        per_diff_pct = (result["per_vs_sector"] / sector_avg_per) * 100 if sector_avg_per else 0
+        score += min(25, max(-25, -per_diff_pct))
+
+    if result["pbr_vs_sector"] is not None:
+        # PBR이 업종 평균보다 낮으면 가점
+        pbr_diff_pct = (result["pbr_vs_sector"] / sector_avg_pbr) * 100 if sector_avg_pbr else 0
+        score += min(15, max(-15, -pbr_diff_pct * 0.5))
+
+    result["score"] = max(0, min(100, round(score, 1)))
+    return result
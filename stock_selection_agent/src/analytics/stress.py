@@ -0,0 +1,306 @@
+"""
+Stress - 시나리오 스트레스 테스트 엔진
+요인 노출 행렬(종목 × 요인)과 시나리오 충격 행렬(요인 × 시나리오)의 곱으로
+전 종목/포트폴리오 시나리오 손익을 한 번에 계산
+
+요인:
+- market: 시장지수 수익률 (노출 = Beta)
+- rates: 금리 변화 (소수, 0.02 = 200bp, 노출 = -5 × 부채비율)
+- krw: 원/달러 환율 변화율 (양수 = 원화 약세, 노출 = 환율 민감도)
+- sector: 소속 섹터 초과수익률 (노출 = 섹터 베타)
+- sector:<섹터명>: 특정 섹터 초과수익률 (소속 종목만 섹터 베타로 노출)
+
+Monte Carlo는 요인 공분산 + 개별 변동성으로 경로를 청크 단위로 생성하고,
+종목별 하위 꼬리만 유지해 메모리를 O((청크 + 꼬리) × 종목)으로 제한한다.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+BASE_FACTORS = ["market", "rates", "krw", "sector"]
+
+# 요인별 일간 변동성 (Monte Carlo 기본값)
+DEFAULT_FACTOR_DAILY_VOL = {
+    "market": 0.012,
+    "rates": 0.0005,
+    "krw": 0.006,
+    "sector": 0.008,
+}
+
+RATE_SENSITIVITY_PER_DEBT_RATIO = -5.0  # 금리 1.00 상승당 수익률 / 부채비율
+DEFAULT_SECTOR_BETA = 0.8
+
+
+@dataclass
+class Scenario:
+    """요인 충격 시나리오"""
+    name: str
+    description: str
+    shocks: Dict[str, float]  # {요인명: 충격}
+    severity_thresholds: Tuple[float, float] = (-25.0, -15.0)  # (high, moderate) 손실률(%) 기준
+
+
+@dataclass
+class HistoricalScenario:
+    """과거 구간 재현 시나리오 (구간 지수 수익률 × Beta)"""
+    name: str
+    description: str
+    start_date: str
+    end_date: str
+    index: str = "KOSPI"
+    market_return: float = 0.0  # 지수 조회 실패 시 사용하는 구간 수익률 (근사치)
+    severity_thresholds: Tuple[float, float] = (-25.0, -15.0)
+
+    def as_scenario(self, market_return: Optional[float] = None) -> Scenario:
+        shock = self.market_return if market_return is None else market_return
+        return Scenario(self.name, self.description, {"market": shock}, self.severity_thresholds)
+
+
+DEFAULT_SCENARIOS = [
+    Scenario("market_crash", "시장 급락 (-20%)", {"market": -0.20}),
+    Scenario("interest_rate_shock", "금리 200bp 인상", {"rates": 0.02}, (-25.0, -10.0)),
+    Scenario("currency_depreciation", "원화 15% 약세", {"krw": 0.15}, (-25.0, -10.0)),
+    Scenario("sector_downturn", "섹터 언더퍼폼 (-15%)", {"sector": -0.15}, (-25.0, -10.0)),
+]
+
+HISTORICAL_SCENARIOS = [
+    HistoricalScenario("gfc_2008", "2008 글로벌 금융위기 (2008.09~10)", "20080901", "20081024",
+                       market_return=-0.336),
+    HistoricalScenario("covid_2020", "2020 코로나19 급락 (2020.02~03)", "20200219", "20200319",
+                       market_return=-0.341),
+]
+
+
+@dataclass
+class FactorExposures:
+    """종목 × 요인 노출 행렬"""
+    codes: List[str]
+    factors: List[str]
+    values: np.ndarray  # (종목 × 요인)
+
+    def shock_matrix(self, scenarios: Sequence[Scenario]) -> np.ndarray:
+        """(요인 × 시나리오) 충격 행렬 (노출 없는 요인 충격은 무시)"""
+        position = {factor: i for i, factor in enumerate(self.factors)}
+        shocks = np.zeros((len(self.factors), len(scenarios)))
+        for col, scenario in enumerate(scenarios):
+            for factor, shock in scenario.shocks.items():
+                if factor in position:
+                    shocks[position[factor], col] = shock
+        return shocks
+
+
+def build_exposures(
+    codes: Sequence[str],
+    betas: Sequence[Optional[float]],
+    debt_to_equity: Optional[Sequence[Optional[float]]] = None,
+    krw_sensitivity: Optional[Sequence[Optional[float]]] = None,
+    sectors: Optional[Sequence[Optional[str]]] = None,
+    sector_beta: float = DEFAULT_SECTOR_BETA
+) -> FactorExposures:
+    """
+    종목 정보 → 요인 노출 행렬
+
+    결측값 기본: Beta 1.0, 부채비율 1.0, 환율 민감도 0 (중립)
+
+    Args:
+        codes: 종목코드
+        betas: 시장 Beta
+        debt_to_equity: 부채비율
+        krw_sensitivity: 원화 1% 약세당 수익률(%) (수출 비중 등)
+        sectors: 섹터명
+        sector_beta: 섹터 초과수익률 노출
+    """
+    n = len(codes)
+
+    def column(values, default):
+        if values is None:
+            return np.full(n, default)
+        return np.array([default if v is None else float(v) for v in values])
+
+    sector_names = sorted({s for s in (sectors or []) if s})
+    factors = BASE_FACTORS + [f"sector:{name}" for name in sector_names]
+    values = np.zeros((n, len(factors)))
+    values[:, 0] = column(betas, 1.0)
+    values[:, 1] = RATE_SENSITIVITY_PER_DEBT_RATIO * column(debt_to_equity, 1.0)
+    values[:, 2] = column(krw_sensitivity, 0.0)
+    values[:, 3] = sector_beta
+
+    for row, sector in enumerate(sectors or []):
+        if sector:
+            values[row, len(BASE_FACTORS) + sector_names.index(sector)] = sector_beta
+
+    return FactorExposures(codes=list(codes), factors=factors, values=values)
+
+
+@dataclass
+class StressResult:
+    """시나리오 손익 (수익률, 손실 음수)"""
+    scenarios: List[Scenario]
+    stock_returns: np.ndarray  # (종목 × 시나리오)
+    portfolio_returns: Optional[np.ndarray] = None  # (포트폴리오 × 시나리오)
+
+    def worst(self) -> Tuple[np.ndarray, List[str]]:
+        """종목별 최악 시나리오 손익과 시나리오명"""
+        idx = np.argmin(self.stock_returns, axis=1)
+        return self.stock_returns[np.arange(len(idx)), idx], [self.scenarios[i].name for i in idx]
+
+
+def apply_scenarios(
+    exposures: FactorExposures,
+    scenarios: Sequence[Scenario],
+    portfolio_weights: Optional[np.ndarray] = None
+) -> StressResult:
+    """
+    시나리오 일괄 적용
+
+    Args:
+        exposures: 종목 × 요인 노출
+        scenarios: 시나리오 목록
+        portfolio_weights: (포트폴리오 × 종목) 비중 행렬
+
+    Returns:
+        StressResult (종목 × 시나리오 = 노출 @ 충격)
+    """
+    scenarios = list(scenarios)
+    stock_returns = exposures.values @ exposures.shock_matrix(scenarios)
+    portfolio_returns = None
+    if portfolio_weights is not None:
+        portfolio_returns = np.atleast_2d(portfolio_weights) @ stock_returns
+    return StressResult(scenarios, stock_returns, portfolio_returns)
+
+
+def severity(loss_pct: float, thresholds: Tuple[float, float]) -> str:
+    """손실률(%) → 심각도"""
+    if loss_pct == 0:
+        return "neutral"
+    high, moderate = thresholds
+    if loss_pct < high:
+        return "high"
+    if loss_pct < moderate:
+        return "moderate"
+    return "low"
+
+
+@dataclass
+class MonteCarloConfig:
+    """Monte Carlo 설정"""
+    n_paths: int = 10_000
+    horizon_days: int = 20
+    chunk_size: int = 2_000
+    seed: int = 42
+    confidence_levels: List[float] = field(default_factory=lambda: [0.95, 0.99])
+    factor_daily_vol: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_FACTOR_DAILY_VOL))
+    factor_correlation: Optional[np.ndarray] = None  # (요인 × 요인), None이면 독립
+
+
+@dataclass
+class MonteCarloResult:
+    """Monte Carlo 기간 수익률 꼬리 지표 (손실 양수)"""
+    codes: List[str]
+    n_paths: int
+    horizon_days: int
+    var: Dict[float, np.ndarray] = field(default_factory=dict)  # 종목별
+    cvar: Dict[float, np.ndarray] = field(default_factory=dict)
+    portfolio_var: Dict[float, np.ndarray] = field(default_factory=dict)  # 포트폴리오별
+    portfolio_cvar: Dict[float, np.ndarray] = field(default_factory=dict)
+
+
+def _factor_vols(factors: Sequence[str], daily_vol: Dict[str, float]) -> np.ndarray:
+    """요인별 일간 변동성 (sector:<이름> 요인은 sector 값 사용)"""
+    return np.array([
+        daily_vol.get(f, daily_vol.get(f.split(":")[0], 0.0)) for f in factors
+    ])
+
+
+def factor_loadings(exposures: FactorExposures, config: Optional[MonteCarloConfig] = None) -> np.ndarray:
+    """
+    독립 요인 충격 → 종목 일간 수익률 적재 행렬 (독립 충격 × 종목)
+
+    요인 공분산 Σ_f = L Lᵀ (L = 요인 변동성 × 상관계수 촐레스키)일 때 (노출 @ L)ᵀ
+    """
+    config = config or MonteCarloConfig()
+    vols = _factor_vols(exposures.factors, config.factor_daily_vol)
+    corr = config.factor_correlation
+    if corr is None:
+        corr = np.eye(len(vols))
+    factor_chol = np.linalg.cholesky(corr) * vols[None, :].T  # 행 = 요인, 요인 변동성 반영
+    return factor_chol.T @ exposures.values.T
+
+
+def systematic_daily_vol(exposures: FactorExposures, config: Optional[MonteCarloConfig] = None) -> np.ndarray:
+    """종목별 요인(체계적) 일간 변동성 √diag(B Σ_f Bᵀ) (Monte Carlo와 같은 요인 모형)"""
+    loadings = factor_loadings(exposures, config)
+    return np.sqrt((loadings ** 2).sum(axis=0))
+
+
+def _merge_tail(tail: Optional[np.ndarray], chunk: np.ndarray, k: int) -> np.ndarray:
+    """기존 하위 꼬리 + 청크 → 하위 k개 (열별)"""
+    merged = chunk if tail is None else np.concatenate([tail, chunk], axis=0)
+    if merged.shape[0] <= k:
+        return merged
+    return np.partition(merged, k - 1, axis=0)[:k]
+
+
+def monte_carlo_stress(
+    exposures: FactorExposures,
+    idiosyncratic_daily_vol: np.ndarray,
+    config: Optional[MonteCarloConfig] = None,
+    portfolio_weights: Optional[np.ndarray] = None
+) -> MonteCarloResult:
+    """
+    요인 모형 Monte Carlo (청크 생성, 시드 고정)
+
+    기간 수익률 = 요인 충격 @ 노출ᵀ + 개별 충격,
+    요인/개별 충격 ~ 정규분포 × √horizon_days
+
+    Args:
+        exposures: 종목 × 요인 노출
+        idiosyncratic_daily_vol: 종목별 개별(비체계적) 일간 변동성
+        config: Monte Carlo 설정
+        portfolio_weights: (포트폴리오 × 종목) 비중 행렬
+
+    Returns:
+        MonteCarloResult
+    """
+    config = config or MonteCarloConfig()
+    rng = np.random.default_rng(config.seed)
+    horizon = np.sqrt(config.horizon_days)
+
+    loadings = factor_loadings(exposures, config).astype(np.float32)  # (독립 충격 × 종목)
+    idio = (np.asarray(idiosyncratic_daily_vol, dtype=float) * horizon).astype(np.float32)
+    weights = None if portfolio_weights is None else np.atleast_2d(portfolio_weights).astype(np.float32)
+
+    # 가장 높은 신뢰수준 꼬리 개수만큼 유지
+    tail_k = max(1, int(np.ceil(config.n_paths * (1 - min(config.confidence_levels)))))
+    stock_tail, portfolio_tail = None, None
+
+    remaining = config.n_paths
+    while remaining > 0:
+        size = min(config.chunk_size, remaining)
+        remaining -= size
+
+        factor_draws = rng.standard_normal((size, loadings.shape[0]), dtype=np.float32) * horizon
+        returns = factor_draws @ loadings
+        returns += rng.standard_normal((size, len(idio)), dtype=np.float32) * idio[None, :]
+
+        stock_tail = _merge_tail(stock_tail, returns, tail_k)
+        if weights is not None:
+            portfolio_tail = _merge_tail(portfolio_tail, returns @ weights.T, tail_k)
+
+    result = MonteCarloResult(exposures.codes, config.n_paths, config.horizon_days)
+    for level in config.confidence_levels:
+        k = max(1, int(np.ceil(config.n_paths * (1 - level))))
+        for tail, var_out, cvar_out in (
+            (stock_tail, result.var, result.cvar),
+            (portfolio_tail, result.portfolio_var, result.portfolio_cvar),
+        ):
+            if tail is None:
+                continue
+            worst = np.sort(tail, axis=0)[:k].astype(np.float64)
+            var_out[level] = -worst[-1]
+            cvar_out[level] = -worst.mean(axis=0)
+
+    return result
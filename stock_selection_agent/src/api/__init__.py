@@ -3,15 +3,27 @@ Stock Selection Agent - API Clients
 DART, KRX, eBest API 클라이언트
 """
 
-from .dart_client import DartClient, DartApiError, SubsidiaryInfo
+from .dart_client import DartClient, DartApiError, DartQuotaError, SubsidiaryInfo
 from .krx_client import KrxClient, KrxApiError
 from .ebest_client import EbestClient
+from .http_pool import HttpPool, HttpPoolConfig, PageResponse, get_http_pool
+from .crawl_scheduler import CrawlScheduler, CrawlSchedulerConfig, CrawlJob, CrawlResult, get_crawl_scheduler
 
 __all__ = [
     "DartClient",
     "DartApiError",
+    "DartQuotaError",
     "SubsidiaryInfo",
     "KrxClient",
     "KrxApiError",
-    "EbestClient"
+    "EbestClient",
+    "HttpPool",
+    "HttpPoolConfig",
+    "PageResponse",
+    "get_http_pool",
+    "CrawlScheduler",
+    "CrawlSchedulerConfig",
+    "CrawlJob",
+    "CrawlResult",
+    "get_crawl_scheduler"
 ]
@@ -0,0 +1,432 @@
+"""
+Crawl Scheduler - 종목 전체 웹 크롤링 작업 스케줄러
+여러 종목의 스크래핑 요청을 호스트별 대기열에 모아 호스트 단위 동시 연결 수와 요청 간격을 지키며 실행
+
+- 호스트별 제한: 동시 요청 수 상한 + 최소 요청 간격 (간격은 ±jitter 비율로 무작위화)
+- 재시도: 연결 오류/타임아웃/429·5xx는 지수 백오프(+jitter) 후 재시도, Retry-After 헤더 우선
+  (429/503은 해당 호스트 전체 요청을 백오프 시간만큼 보류)
+- 중복 요청 병합: 대기/진행 중인 같은 URL 요청은 한 번만 가져옴 (추출기는 요청별 실행)
+- 취소: 대기 제한 시간을 넘긴 요청은 Future를 취소하고, 대기자가 모두 취소된 작업은
+  요청 전에 대기열/재시도 목록에서 제거 (버려진 작업이 호스트 요청 한도를 쓰지 않음)
+- 파싱: 페이지 수집 스레드와 분리된 파싱 작업자 풀에서 HtmlParseCache로 실행
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from collections import deque
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor, TimeoutError
+from urllib.parse import urlsplit
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+
+from .http_pool import HttpPool, PageResponse, get_http_pool
+from ..utils.html_parser import HtmlParseCache
+
+# 외부 라이브러리 (선택적 import)
+try:
+    import requests
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+
+@dataclass
+class CrawlSchedulerConfig:
+    """크롤링 스케줄러 설정"""
+    max_concurrency_per_host: int = 2  # 호스트별 동시 요청 상한
+    request_interval_seconds: float = 0.5  # 호스트별 요청 시작 간격 (초)
+    host_intervals: Dict[str, float] = field(default_factory=dict)  # 호스트별 간격 재정의
+    jitter_ratio: float = 0.3  # 간격/백오프 무작위 폭 (±비율)
+
+    # 재시도 (일시적 오류만)
+    max_retries: int = 3
+    backoff_base_seconds: float = 1.0  # 재시도 n회차 대기 = base × 2^(n-1)
+    backoff_max_seconds: float = 30.0
+    retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504)
+    host_penalty_statuses: Tuple[int, ...] = (429, 503)  # 호스트 전체 보류 상태 코드
+
+    # 작업자 수
+    fetch_workers: int = 8  # 호스트 수 × 호스트별 동시 요청 이상 권장
+    parse_workers: int = 4
+
+    random_seed: Optional[int] = None
+
+
+@dataclass
+class CrawlJob:
+    """크롤링 작업 (URL + 선택적 추출기)"""
+    url: str
+    parser: Optional[Callable[[str], Any]] = None  # 본문 텍스트 → 추출 결과
+    params: Optional[Dict[str, Any]] = None
+    timeout: Optional[float] = None
+    tag: Any = None  # 호출자 식별값 (예: 종목코드)
+
+
+@dataclass
+class CrawlResult:
+    """크롤링 결과 (실패 시 error)"""
+    job: CrawlJob
+    page: Optional[PageResponse] = None
+    parsed: Any = None
+    error: Optional[Exception] = None
+    attempts: int = 0
+    elapsed_seconds: float = 0.0  # 대기열 대기 포함
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class _FetchTask:
+    """같은 URL 요청을 묶은 내부 수집 작업"""
+    key: str
+    host: str
+    url: str
+    params: Optional[Dict[str, Any]]
+    timeout: Optional[float]
+    waiters: List[Tuple[CrawlJob, Future, float]] = field(default_factory=list)
+    attempts: int = 0
+
+    @property
+    def abandoned(self) -> bool:
+        """대기자가 모두 취소됨 (요청할 필요 없음)"""
+        return all(future.cancelled() for _, future, _ in self.waiters)
+
+
+class CrawlScheduler:
+    """
+    호스트별 예절(politeness)을 지키는 크롤링 스케줄러 (스레드 안전)
+
+    사용법:
+        scheduler = get_crawl_scheduler()
+
+        # 단건 (호출 스레드에서 대기)
+        rows, page = scheduler.fetch(url, parser=parse_news_rows)
+
+        # 여러 종목 일괄
+        results = scheduler.run([CrawlJob(url, parse_news_rows, tag=code) for code, url in urls])
+    """
+
+    def __init__(
+        self,
+        http_pool: Optional[HttpPool] = None,
+        html_cache: Optional[HtmlParseCache] = None,
+        config: Optional[CrawlSchedulerConfig] = None
+    ):
+        """
+        크롤링 스케줄러 초기화
+
+        Args:
+            http_pool: HTTP 풀 (미입력시 프로세스 공용 풀)
+            html_cache: 추출 결과 캐시 (미입력시 새로 생성)
+            config: 스케줄러 설정
+        """
+        self.config = config or CrawlSchedulerConfig()
+        self.logger = logging.getLogger(__name__)
+        self.http = http_pool if http_pool is not None else get_http_pool()
+        self.html_cache = html_cache if html_cache is not None else HtmlParseCache()
+
+        self._fetch_executor = ThreadPoolExecutor(
+            max_workers=self.config.fetch_workers, thread_name_prefix="crawl-fetch"
+        )
+        self._parse_executor = ThreadPoolExecutor(
+            max_workers=self.config.parse_workers, thread_name_prefix="crawl-parse"
+        )
+        self._rng = random.Random(self.config.random_seed)
+
+        self._cond = threading.Condition()
+        self._queues: Dict[str, deque] = {}  # 호스트 -> 대기 작업
+        self._delayed: List[Tuple[float, int, _FetchTask]] = []  # (재시도 시각, 순번, 작업) 힙
+        self._inflight: Dict[str, _FetchTask] = {}  # 캐시 키 -> 대기/진행 중 작업
+        self._active: Dict[str, int] = {}  # 호스트 -> 진행 중 요청 수
+        self._next_slot: Dict[str, float] = {}  # 호스트 -> 다음 요청 가능 시각 (monotonic)
+        self._seq = itertools.count()
+        self._dispatcher: Optional[threading.Thread] = None
+        self._closed = False
+        self.stats = {"requests": 0, "retries": 0, "failures": 0, "coalesced": 0, "cancelled": 0}
+
+    # =========================================================================
+    # 작업 제출
+    # =========================================================================
+
+    def submit(self, job: CrawlJob) -> "Future[CrawlResult]":
+        """
+        작업 제출 (호스트 대기열에 추가)
+
+        Args:
+            job: 크롤링 작업
+
+        Returns:
+            CrawlResult Future (예외 대신 error 필드로 실패 전달, cancel()로 대기 포기)
+        """
+        future: Future = Future()
+        key = HttpPool.cache_key(job.url, job.params)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("종료된 크롤링 스케줄러입니다.")
+
+            task = self._inflight.get(key)
+            if task is not None:
+                task.waiters.append((job, future, time.monotonic()))
+                self.stats["coalesced"] += 1
+                return future
+
+            task = _FetchTask(
+                key=key,
+                host=urlsplit(job.url).netloc,
+                url=job.url,
+                params=job.params,
+                timeout=job.timeout,
+                waiters=[(job, future, time.monotonic())]
+            )
+            self._inflight[key] = task
+            self._queues.setdefault(task.host, deque()).append(task)
+            self._ensure_dispatcher()
+            self._cond.notify_all()
+        return future
+
+    def run(self, jobs: List[CrawlJob]) -> List[CrawlResult]:
+        """여러 작업 실행 후 결과 반환 (입력 순서)"""
+        futures = [self.submit(job) for job in jobs]
+        return [future.result() for future in futures]
+
+    def fetch(
+        self,
+        url: str,
+        parser: Optional[Callable[[str], Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None
+    ) -> Tuple[Any, PageResponse]:
+        """
+        단건 요청 (호스트 제한/재시도 적용, 완료 또는 제한 시각까지 대기)
+
+        Args:
+            url: 요청 URL
+            parser: 본문 텍스트 → 추출 결과 (None이면 추출 생략)
+            params: 쿼리 파라미터
+            timeout: HTTP 타임아웃 (초, 미입력시 HTTP 풀 설정값)
+            deadline: 대기 제한 시각 (time.monotonic() 기준, None이면 무제한)
+                      넘기면 요청을 취소하고 TimeoutError (대기열에 남은 작업은 요청하지 않음)
+
+        Returns:
+            (추출 결과, PageResponse) - 재시도 후에도 실패하면 마지막 예외 발생
+        """
+        future = self.submit(CrawlJob(url, parser=parser, params=params, timeout=timeout))
+        wait_seconds = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+        try:
+            result = future.result(timeout=wait_seconds)
+        except TimeoutError:
+            if future.cancel():
+                raise TimeoutError(f"크롤링 대기 제한 시간 초과: {url}")
+            result = future.result()  # 취소 직전 완료
+        if result.error is not None:
+            raise result.error
+        return result.parsed, result.page
+
+    # =========================================================================
+    # 호스트 대기열 배분
+    # =========================================================================
+
+    def _ensure_dispatcher(self):
+        """배분 스레드 시작 (잠금 보유 상태에서 호출)"""
+        if self._dispatcher is None or not self._dispatcher.is_alive():
+            self._dispatcher = threading.Thread(target=self._dispatch_loop, name="crawl-dispatch", daemon=True)
+            self._dispatcher.start()
+
+    def _jittered(self, seconds: float) -> float:
+        ratio = self.config.jitter_ratio
+        return seconds * self._rng.uniform(1.0 - ratio, 1.0 + ratio)
+
+    def _dispatch_loop(self):
+        """요청 가능한 호스트의 작업을 수집 작업자에 배분"""
+        with self._cond:
+            while not self._closed:
+                now = time.monotonic()
+
+                # 백오프가 끝난 재시도 작업을 대기열 앞으로 복귀
+                while self._delayed and self._delayed[0][0] <= now:
+                    _, _, task = heapq.heappop(self._delayed)
+                    self._queues.setdefault(task.host, deque()).appendleft(task)
+
+                wake_at = self._delayed[0][0] if self._delayed else None
+                for host, queue in self._queues.items():
+                    # 대기자가 모두 취소된 작업은 요청하지 않고 제거
+                    while queue and queue[0].abandoned:
+                        self._drop(queue.popleft())
+                    if not queue or self._active.get(host, 0) >= self.config.max_concurrency_per_host:
+                        continue
+                    slot = self._next_slot.get(host, 0.0)
+                    if slot > now:
+                        wake_at = slot if wake_at is None else min(wake_at, slot)
+                        continue
+
+                    task = queue.popleft()
+                    self._active[host] = self._active.get(host, 0) + 1
+                    interval = self.config.host_intervals.get(host, self.config.request_interval_seconds)
+                    self._next_slot[host] = now + self._jittered(interval)
+                    self._fetch_executor.submit(self._fetch, task)
+
+                    if queue:
+                        next_slot = self._next_slot[host]
+                        wake_at = next_slot if wake_at is None else min(wake_at, next_slot)
+
+                self._cond.wait(timeout=None if wake_at is None else max(wake_at - now, 0.0))
+
+    def _drop(self, task: _FetchTask):
+        """버려진 작업 제거 (잠금 보유 상태에서 호출)"""
+        if self._inflight.get(task.key) is task:
+            del self._inflight[task.key]
+        self.stats["cancelled"] += 1
+
+    # =========================================================================
+    # 수집 / 재시도 / 파싱
+    # =========================================================================
+
+    def _fetch(self, task: _FetchTask):
+        """수집 작업자: 페이지 요청 (실패 시 재시도 예약 또는 실패 처리)"""
+        task.attempts += 1
+        try:
+            page = self.http.get(task.url, params=task.params, timeout=task.timeout)
+        except Exception as e:
+            self._handle_failure(task, e)
+            return
+
+        with self._cond:
+            self.stats["requests"] += 1
+            self._active[task.host] -= 1
+            self._inflight.pop(task.key, None)
+            waiters = list(task.waiters)
+            self._cond.notify_all()
+
+        for job, future, queued_at in waiters:
+            if job.parser is None:
+                self._complete(future, CrawlResult(job, page=page, attempts=task.attempts,
+                                                   elapsed_seconds=time.monotonic() - queued_at))
+            else:
+                self._parse_executor.submit(self._parse, job, future, queued_at, page, task.attempts)
+
+    def _handle_failure(self, task: _FetchTask, error: Exception):
+        """일시적 오류는 백오프 후 재시도, 그 외/재시도 소진 시 대기 요청 모두 실패 처리"""
+        delay = self._retry_delay(task, error)
+        status = self._status_code(error)
+
+        with self._cond:
+            self.stats["requests"] += 1
+            self._active[task.host] -= 1
+            if delay is not None and task.abandoned:
+                self._drop(task)
+                self._cond.notify_all()
+                return
+            if delay is not None:
+                self.stats["retries"] += 1
+                retry_at = time.monotonic() + delay
+                heapq.heappush(self._delayed, (retry_at, next(self._seq), task))
+                if status in self.config.host_penalty_statuses:
+                    self._next_slot[task.host] = max(self._next_slot.get(task.host, 0.0), retry_at)
+                self._cond.notify_all()
+                self.logger.warning(
+                    f"크롤링 재시도 예약 ({task.host}, {task.attempts}회 실패, {delay:.1f}초 후): {error}"
+                )
+                return
+
+            self.stats["failures"] += 1
+            self._inflight.pop(task.key, None)
+            waiters = list(task.waiters)
+            self._cond.notify_all()
+
+        self.logger.warning(f"크롤링 실패 ({task.url}, {task.attempts}회 시도): {error}")
+        for job, future, queued_at in waiters:
+            self._complete(future, CrawlResult(job, error=error, attempts=task.attempts,
+                                               elapsed_seconds=time.monotonic() - queued_at))
+
+    @staticmethod
+    def _status_code(error: Exception) -> Optional[int]:
+        response = getattr(error, "response", None)
+        return getattr(response, "status_code", None)
+
+    def _retry_delay(self, task: _FetchTask, error: Exception) -> Optional[float]:
+        """재시도 대기 시간 (재시도 대상이 아니면 None)"""
+        if task.attempts > self.config.max_retries:
+            return None
+
+        status = self._status_code(error)
+        if status is not None:
+            if status not in self.config.retry_statuses:
+                return None
+        elif not (REQUESTS_AVAILABLE and isinstance(error, (requests.ConnectionError, requests.Timeout))):
+            return None
+
+        backoff = min(
+            self.config.backoff_base_seconds * 2 ** (task.attempts - 1),
+            self.config.backoff_max_seconds
+        )
+        delay = self._jittered(backoff)
+
+        # Retry-After(초) 헤더가 있으면 최소 대기 시간으로 사용
+        response = getattr(error, "response", None)
+        retry_after = getattr(response, "headers", {}).get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                delay = max(delay, min(float(retry_after), self.config.backoff_max_seconds))
+            except ValueError:
+                pass
+        return delay
+
+    def _parse(self, job: CrawlJob, future: Future, queued_at: float, page: PageResponse, attempts: int):
+        """파싱 작업자: 추출기 실행 (같은 본문은 캐시)"""
+        try:
+            parsed = self.html_cache.extract(page.text, job.parser)
+            result = CrawlResult(job, page=page, parsed=parsed, attempts=attempts)
+        except Exception as e:
+            self.logger.warning(f"페이지 파싱 실패 ({job.url}): {e}")
+            result = CrawlResult(job, page=page, error=e, attempts=attempts)
+        result.elapsed_seconds = time.monotonic() - queued_at
+        self._complete(future, result)
+
+    @staticmethod
+    def _complete(future: Future, result: CrawlResult):
+        if not future.done():
+            try:
+                future.set_result(result)
+            except InvalidStateError:  # 완료 직전 취소
+                pass
+
+    # =========================================================================
+    # 종료
+    # =========================================================================
+
+    def close(self):
+        """스케줄러 종료 (대기 중인 작업은 실패 처리)"""
+        with self._cond:
+            self._closed = True
+            pending = list(self._inflight.values())
+            self._inflight.clear()
+            self._queues.clear()
+            self._delayed.clear()
+            self._cond.notify_all()
+
+        error = RuntimeError("크롤링 스케줄러가 종료되었습니다.")
+        for task in pending:
+            for job, future, _ in task.waiters:
+                self._complete(future, CrawlResult(job, error=error, attempts=task.attempts))
+        self._fetch_executor.shutdown(wait=False, cancel_futures=True)
+        self._parse_executor.shutdown(wait=False, cancel_futures=True)
+
+
+_shared_scheduler: Optional[CrawlScheduler] = None
+_shared_scheduler_lock = threading.Lock()
+
+
+def get_crawl_scheduler() -> CrawlScheduler:
+    """프로세스 공용 크롤링 스케줄러 (에이전트 간 호스트 제한 공유)"""
+    global _shared_scheduler
+    with _shared_scheduler_lock:
+        if _shared_scheduler is None:
+            _shared_scheduler = CrawlScheduler()
+        return _shared_scheduler
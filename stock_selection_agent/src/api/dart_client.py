@@ -79,6 +79,7 @@ class DartClient:
             )
 
         self.config = config or DartConfig(api_key=self.api_key)
+        self.industry_code_file = Path(__file__).parent.parent.parent / "data" / "industry_code_mapping.json"
         self.session = requests.Session()
         self.session.headers.update({
             "User-Agent": "StockSelectionAgent/1.0"
@@ -105,6 +106,8 @@ class DartClient:
                     return data
                 elif status == "013":  # 조회된 데이터가 없음
                     return {"status": "013", "message": "조회된 데이터가 없습니다", "list": []}
+                elif status == "020":  # 요청 제한 초과 (일일 호출 한도)
+                    raise DartQuotaError(f"DART API 요청 제한 초과: {data.get('message', '')}")
                 else:
                     raise DartApiError(f"DART API 오류: {data.get('message', '알 수 없는 오류')}")
 
@@ -272,6 +275,104 @@ class DartClient:
             })
         return result
 
+    def _load_industry_codes(self) -> Dict[str, str]:
+        """저장된 업종코드 매핑 (최초 1회 data/industry_code_mapping.json 로드)"""
+        if not hasattr(self, "_industry_codes"):
+            self._industry_codes = {}
+            if self.industry_code_file.exists():
+                try:
+                    with open(self.industry_code_file, "r", encoding="utf-8") as f:
+                        self._industry_codes = json.load(f).get("stock_to_industry", {})
+                except Exception as e:
+                    logging.getLogger(__name__).warning(f"업종코드 캐시 로드 실패: {e}")
+        return self._industry_codes
+
+    def _save_industry_codes(self):
+        try:
+            self.industry_code_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.industry_code_file.with_suffix(".tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"stock_to_industry": self._industry_codes, "updated_at": datetime.now().isoformat()},
+                    f, ensure_ascii=False, indent=2
+                )
+            tmp_file.replace(self.industry_code_file)
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"업종코드 캐시 저장 실패: {e}")
+
+    def get_industry_codes(self, stock_codes: List[str]) -> Dict[str, str]:
+        """
+        종목별 업종코드(induty_code, KSIC) 조회 (저장된 매핑만 사용, API 호출 없음)
+
+        저장되지 않은 종목은 warm_industry_codes()로 미리 채운다.
+
+        Args:
+            stock_codes: 종목코드 리스트
+
+        Returns:
+            {종목코드: 업종코드} (저장되지 않은 종목 제외)
+        """
+        industry_codes = self._load_industry_codes()
+        return {code: industry_codes[code] for code in stock_codes if code in industry_codes}
+
+    def warm_industry_codes(
+        self,
+        stock_codes: List[str],
+        request_interval: float = 0.2,
+        save_every: int = 50,
+        max_requests: Optional[int] = None
+    ) -> int:
+        """
+        저장되지 않은 종목 업종코드를 기업개황 API로 조회해 매핑에 누적 (명시적 사전 작업)
+
+        업종코드는 거의 바뀌지 않으므로 최초 1회만 종목 수만큼 호출한다.
+        save_every건마다 저장해 중단되어도 진행분은 남고, 일일 호출 한도(status 020)에 걸리면 즉시 중단한다.
+
+        Args:
+            stock_codes: 종목코드 리스트
+            request_interval: 요청 간격 (초)
+            save_every: 저장 주기 (신규 조회 건수)
+            max_requests: 최대 API 호출 수 (None이면 제한 없음, 일일 한도 분할용)
+
+        Returns:
+            신규 저장 종목 수
+        """
+        logger = logging.getLogger(__name__)
+        industry_codes = self._load_industry_codes()
+        missing = [code for code in dict.fromkeys(stock_codes) if code not in industry_codes]
+
+        fetched = requests_made = 0
+        try:
+            for stock_code in missing:
+                if max_requests is not None and requests_made >= max_requests:
+                    logger.info(f"업종코드 조회 호출 수 제한 도달: {requests_made}회")
+                    break
+                corp_code = self.get_corp_code_by_stock_code(stock_code)
+                if not corp_code:
+                    continue
+                if requests_made:
+                    time.sleep(request_interval)
+                requests_made += 1
+                try:
+                    induty_code = self.get_company_info(corp_code).get("induty_code")
+                except DartQuotaError as e:
+                    logger.warning(f"DART 일일 호출 한도 도달, 업종코드 조회 중단 ({fetched}개 저장): {e}")
+                    break
+                except Exception as e:
+                    logger.warning(f"{stock_code} 업종코드 조회 실패: {e}")
+                    continue
+                if induty_code:
+                    industry_codes[stock_code] = induty_code
+                    fetched += 1
+                    if fetched % save_every == 0:
+                        self._save_industry_codes()
+        finally:
+            if fetched:
+                self._save_industry_codes()
+                logger.info(f"업종코드 캐시 저장: {len(industry_codes)}개 종목 ({fetched}개 신규)")
+
+        return fetched
+
     def get_company_info(self, corp_code: str) -> Dict[str, Any]:
         """
         기업 개황 조회
@@ -1012,3 +1113,8 @@ class DartClient:
 class DartApiError(Exception):
     """DART API 오류"""
     pass
+
+
+class DartQuotaError(DartApiError):
+    """DART API 요청 제한 초과 (status 020, 재시도해도 당일에는 실패)"""
+    pass
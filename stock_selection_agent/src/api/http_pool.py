@@ -0,0 +1,311 @@
+"""
+HTTP Pool - 웹 크롤링 공용 세션 풀
+네이버 금융/구글 RSS 등 스크래핑 요청을 keep-alive 세션 하나로 모아 연결을 재사용하고,
+ETag/Last-Modified 조건부 요청과 디스크 페이지 캐시로 바뀌지 않은 페이지는 304로 처리
+
+- 호스트별 연결 수 제한: HTTPAdapter(pool_maxsize, pool_block=True)
+- 조건부 요청: 캐시된 검증값(ETag/Last-Modified)을 If-None-Match/If-Modified-Since로 전송
+- 페이지 캐시: data/http_cache/<URL 해시>.json (검증값이 있는 응답만 저장)
+  메모리는 LRU 항목 수 상한, 디스크는 항목 수 상한 + 보관 기간 (파일 수정 시각 = 마지막 사용 시각)
+- 파싱 결과 캐시는 utils.html_parser.HtmlParseCache (크롤링 스케줄러가 본문 해시로 재사용)
+"""
+
+from typing import Any, Dict, Optional
+from dataclasses import dataclass, field
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+# 외부 라이브러리 (선택적 import)
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+
+@dataclass
+class HttpPoolConfig:
+    """HTTP 풀 설정"""
+    timeout: float = 10.0
+    pool_connections: int = 10  # 연결 풀을 유지할 호스트 수
+    max_connections_per_host: int = 4  # 호스트별 동시 연결 상한 (초과 요청은 대기)
+    max_retries: int = 0  # 기존 requests.get과 동일하게 재시도 없음
+    user_agent: str = DEFAULT_USER_AGENT
+    cache_dir: Optional[Path] = None  # None이면 data/http_cache
+    use_disk_cache: bool = True
+    memory_cache_size: int = 512  # 페이지 메모리 캐시 항목 수 (LRU)
+    disk_cache_max_entries: int = 5000  # 디스크 캐시 파일 수 상한 (오래 사용하지 않은 파일부터 삭제)
+    disk_cache_max_age_days: float = 30.0  # 이 기간 동안 사용하지 않은 디스크 캐시 삭제
+
+
+@dataclass
+class PageResponse:
+    """페이지 응답 (304인 경우 캐시된 본문)"""
+    url: str
+    status_code: int
+    text: str
+    not_modified: bool = False  # 304 응답으로 캐시 본문 사용
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def validator(self) -> Optional[str]:
+        """페이지 버전 식별값 (검증값이 없으면 None)"""
+        if self.etag or self.last_modified:
+            return f"{self.etag or ''}|{self.last_modified or ''}"
+        return None
+
+
+class HttpPool:
+    """
+    웹 크롤링 공용 HTTP 풀
+
+    사용법:
+        pool = get_http_pool()
+        page = pool.get("https://finance.naver.com/item/main.naver?code=005930")
+        page.not_modified   # True면 304 (캐시 본문)
+    """
+
+    def __init__(self, config: Optional[HttpPoolConfig] = None):
+        """
+        HTTP 풀 초기화
+
+        Args:
+            config: 풀 설정
+        """
+        if not REQUESTS_AVAILABLE:
+            raise ImportError("requests 라이브러리가 필요합니다.")
+
+        self.config = config or HttpPoolConfig()
+        self.logger = logging.getLogger(__name__)
+        self.cache_dir = self.config.cache_dir or Path(__file__).parent.parent.parent / "data" / "http_cache"
+
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": self.config.user_agent})
+        adapter = HTTPAdapter(
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.max_connections_per_host,
+            max_retries=self.config.max_retries,
+            pool_block=True
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._lock = threading.Lock()
+        self._memory_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()  # 캐시 키 -> 페이지 캐시 항목
+        self._stores_since_prune: Optional[int] = None  # None: 첫 저장 시 기존 디렉토리 정리
+        self.stats = {"requests": 0, "not_modified": 0}
+
+    # =========================================================================
+    # 페이지 캐시
+    # =========================================================================
+
+    @staticmethod
+    def cache_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """URL + 쿼리 파라미터 → 캐시 키"""
+        raw = url if not params else url + "?" + "&".join(f"{k}={params[k]}" for k in sorted(params))
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def _load_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시 항목 조회 (메모리 → 디스크)"""
+        with self._lock:
+            entry = self._memory_cache.get(key)
+            if entry is not None:
+                self._memory_cache.move_to_end(key)
+        if entry is not None or not self.config.use_disk_cache:
+            return entry
+
+        cache_file = self.cache_dir / f"{key}.json"
+        if not cache_file.exists():
+            return None
+        try:
+            if time.time() - cache_file.stat().st_mtime > self.config.disk_cache_max_age_days * 86400:
+                cache_file.unlink(missing_ok=True)
+                return None
+            with open(cache_file, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except Exception as e:
+            self.logger.warning(f"페이지 캐시 로드 실패 ({cache_file.name}): {e}")
+            return None
+
+        self._remember(key, entry)
+        return entry
+
+    def _remember(self, key: str, entry: Dict[str, Any]):
+        """메모리 캐시 저장 (상한 초과 시 가장 오래 사용하지 않은 항목 제거)"""
+        with self._lock:
+            self._memory_cache[key] = entry
+            self._memory_cache.move_to_end(key)
+            while len(self._memory_cache) > self.config.memory_cache_size:
+                self._memory_cache.popitem(last=False)
+
+    def _touch(self, key: str):
+        """304 재사용한 디스크 캐시 파일의 사용 시각 갱신"""
+        if not self.config.use_disk_cache:
+            return
+        try:
+            os.utime(self.cache_dir / f"{key}.json")
+        except OSError:
+            pass
+
+    def prune_disk_cache(self) -> int:
+        """
+        디스크 캐시 정리 (보관 기간 경과 파일 삭제 후 상한 초과분은 오래 사용하지 않은 순으로 삭제)
+
+        Returns:
+            삭제한 파일 수
+        """
+        if not self.cache_dir.exists():
+            return 0
+        files = []
+        for cache_file in self.cache_dir.glob("*.json"):
+            try:
+                files.append((cache_file.stat().st_mtime, cache_file))
+            except OSError:
+                continue
+        files.sort()
+
+        cutoff = time.time() - self.config.disk_cache_max_age_days * 86400
+        expired = sum(1 for mtime, _ in files if mtime < cutoff)
+        excess = len(files) - expired - self.config.disk_cache_max_entries
+        removed = 0
+        for _, cache_file in files[:expired + max(0, excess)]:
+            try:
+                cache_file.unlink()
+                removed += 1
+            except OSError:
+                pass
+        if removed:
+            self.logger.debug(f"페이지 캐시 정리: {removed}개 삭제")
+        return removed
+
+    def _store_entry(self, key: str, entry: Dict[str, Any]):
+        """캐시 항목 저장 (메모리 + 디스크)"""
+        self._remember(key, entry)
+        if not self.config.use_disk_cache:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_dir / f"{key}.{threading.get_ident()}.tmp"
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            tmp_file.replace(self.cache_dir / f"{key}.json")
+        except Exception as e:
+            self.logger.warning(f"페이지 캐시 저장 실패: {e}")
+            return
+
+        # 상한의 1/10만큼 저장할 때마다 디렉토리 정리 (매 저장마다 목록 조회하지 않음)
+        with self._lock:
+            interval = max(1, self.config.disk_cache_max_entries // 10)
+            prune = self._stores_since_prune is None or self._stores_since_prune + 1 >= interval
+            self._stores_since_prune = 0 if prune else self._stores_since_prune + 1
+        if prune:
+            self.prune_disk_cache()
+
+    # =========================================================================
+    # 요청
+    # =========================================================================
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        conditional: bool = True
+    ) -> PageResponse:
+        """
+        GET 요청 (조건부)
+
+        Args:
+            url: 요청 URL
+            params: 쿼리 파라미터
+            headers: 추가 헤더
+            timeout: 타임아웃 (초, 미입력시 설정값)
+            conditional: 캐시 검증값으로 조건부 요청 여부
+
+        Returns:
+            PageResponse (HTTP 오류는 requests 예외 발생)
+        """
+        key = self.cache_key(url, params)
+        entry = self._load_entry(key) if conditional else None
+
+        request_headers = dict(headers or {})
+        if entry:
+            if entry.get("etag"):
+                request_headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                request_headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = self.session.get(
+            url,
+            params=params,
+            headers=request_headers,
+            timeout=timeout or self.config.timeout
+        )
+        with self._lock:
+            self.stats["requests"] += 1
+
+        if response.status_code == 304 and entry:
+            with self._lock:
+                self.stats["not_modified"] += 1
+            self._touch(key)
+            return PageResponse(
+                url=url,
+                status_code=304,
+                text=entry["text"],
+                not_modified=True,
+                etag=entry.get("etag"),
+                last_modified=entry.get("last_modified"),
+                headers=dict(response.headers)
+            )
+
+        response.raise_for_status()
+        page = PageResponse(
+            url=url,
+            status_code=response.status_code,
+            text=response.text,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            headers=dict(response.headers)
+        )
+
+        # 검증값이 없는 동적 페이지는 조건부 요청이 불가하므로 저장하지 않음
+        if page.validator:
+            self._store_entry(key, {
+                "url": url,
+                "etag": page.etag,
+                "last_modified": page.last_modified,
+                "text": page.text,
+                "fetched_at": datetime.now().isoformat()
+            })
+        return page
+
+    def close(self):
+        """세션 종료"""
+        self.session.close()
+
+
+_shared_pool: Optional[HttpPool] = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_http_pool() -> HttpPool:
+    """프로세스 공용 HTTP 풀 (에이전트 간 연결 공유)"""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = HttpPool()
+        return _shared_pool
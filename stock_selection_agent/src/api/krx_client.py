@@ -8,19 +8,25 @@ pykrx 라이브러리 기반
 - PER/PBR/배당수익률
 """
 
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
+from collections import OrderedDict
 import logging
 
+import numpy as np
 from pykrx import stock as krx
 
+from ..models.panel import PricePanel
+
 
 @dataclass
 class KrxConfig:
     """KRX Data 설정"""
     timeout: int = 30
     retry_count: int = 3
+    ohlcv_snapshot_cache_size: int = 300  # OHLCV 스냅샷 보관 거래일 수 (LRU, 253봉 패널 1회분 이상)
+    snapshot_cache_size: int = 32  # 시가총액/PER·PBR 스냅샷 보관 (거래일, 시장) 수 (LRU)
 
 
 class KrxApiError(Exception):
@@ -48,11 +54,20 @@ class KrxClient:
         valuation = client.get_stock_valuation("005930")
     """
 
+    # KRX 지수코드
+    INDEX_TICKERS = {"KOSPI": "1001", "KOSDAQ": "2001"}
+
     def __init__(self, config: Optional[KrxConfig] = None):
         """KRX 클라이언트 초기화"""
         self.config = config or KrxConfig()
         self.logger = logging.getLogger(__name__)
         self._ticker_cache: Dict[str, str] = {}  # 종목코드 -> 종목명 캐시
+        self._ohlcv_snapshot_cache: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()  # (거래일, 시장) -> OHLCV 스냅샷
+        self._cap_snapshot_cache: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()  # (거래일, 시장) -> 시가총액 스냅샷
+        self._fundamental_snapshot_cache: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()  # (거래일, 시장) -> PER/PBR 스냅샷
+        self._index_close_cache: Dict[str, Dict[str, float]] = {}  # 지수코드 -> {거래일: 종가}
+        self._index_coverage: Dict[str, Tuple[str, str]] = {}  # 지수코드 -> 캐시된 조회 구간
+        self._kosdaq_tickers: Optional[set] = None
 
     # =========================================================================
     # 종목 목록
@@ -281,6 +296,8 @@ class KrxClient:
                     "low_price": int(row["저가"]),
                     "volume": int(row["거래량"]),
                 })
+                if "거래대금" in row.index:
+                    result[-1]["trading_value"] = int(row["거래대금"])
 
             return result
 
@@ -288,6 +305,303 @@ class KrxClient:
             self.logger.error(f"종목 {stock_code} 시세 히스토리 조회 실패: {e}")
             return []
 
+    # =========================================================================
+    # 시세 패널 (다종목 일괄 조회)
+    # =========================================================================
+
+    def get_business_days(self, n_bars: int, end_date: Optional[str] = None) -> List[str]:
+        """
+        종료일 이전 최근 n_bars 거래일 목록
+
+        Args:
+            n_bars: 거래일 수
+            end_date: 종료일 (YYYYMMDD, 기본: 최근 거래일)
+
+        Returns:
+            거래일 목록 (YYYYMMDD, 오름차순)
+        """
+        if not end_date:
+            end_date = self._get_latest_trade_date()
+
+        end_dt = datetime.strptime(end_date, "%Y%m%d")
+        # 휴장일 여유분을 포함한 달력일 구간
+        start_dt = end_dt - timedelta(days=int(n_bars * 1.5) + 10)
+
+        try:
+            days = krx.get_previous_business_days(
+                fromdate=start_dt.strftime("%Y%m%d"),
+                todate=end_date
+            )
+            dates = [d.strftime("%Y%m%d") for d in days]
+        except Exception as e:
+            self.logger.warning(f"거래일 조회 실패, 평일 기준으로 대체: {e}")
+            dates = []
+            day = start_dt
+            while day <= end_dt:
+                if day.weekday() < 5:
+                    dates.append(day.strftime("%Y%m%d"))
+                day += timedelta(days=1)
+
+        return dates[-n_bars:]
+
+    @staticmethod
+    def _cached_snapshot(cache: "OrderedDict[Tuple[str, str], Any]", key: Tuple[str, str], max_entries: int, fetch):
+        """스냅샷 LRU 캐시 조회 (없으면 fetch() 결과 저장, 상한 초과 시 가장 오래 사용하지 않은 항목 제거)"""
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        snapshot = fetch()
+        cache[key] = snapshot
+        while len(cache) > max(1, max_entries):
+            cache.popitem(last=False)
+        return snapshot
+
+    def get_market_ohlcv_snapshot(self, trade_date: str, market: str = "ALL"):
+        """
+        특정 거래일 전 종목 OHLCV 스냅샷 (거래일별 LRU 캐시)
+
+        Args:
+            trade_date: 조회일자 (YYYYMMDD)
+            market: 시장 구분 ("ALL", "KOSPI", "KOSDAQ")
+
+        Returns:
+            종목코드 인덱스 DataFrame (시가/고가/저가/종가/거래량/거래대금)
+        """
+        return self._cached_snapshot(
+            self._ohlcv_snapshot_cache, (trade_date, market), self.config.ohlcv_snapshot_cache_size,
+            lambda: krx.get_market_ohlcv_by_ticker(trade_date, market=market)
+        )
+
+    def get_market_cap_snapshot(self, trade_date: str, market: str = "ALL"):
+        """
+        특정 거래일 전 종목 시가총액/상장주식수 스냅샷 (거래일별 LRU 캐시)
+
+        Args:
+            trade_date: 조회일자 (YYYYMMDD)
+            market: 시장 구분 ("ALL", "KOSPI", "KOSDAQ")
+
+        Returns:
+            종목코드 인덱스 DataFrame (종가/시가총액/거래량/거래대금/상장주식수)
+        """
+        return self._cached_snapshot(
+            self._cap_snapshot_cache, (trade_date, market), self.config.snapshot_cache_size,
+            lambda: krx.get_market_cap_by_ticker(trade_date, market=market)
+        )
+
+    def get_market_fundamental_snapshot(self, trade_date: str, market: str = "ALL"):
+        """
+        특정 거래일 전 종목 PER/PBR/배당 스냅샷 (거래일별 LRU 캐시)
+
+        Args:
+            trade_date: 조회일자 (YYYYMMDD)
+            market: 시장 구분 ("ALL", "KOSPI", "KOSDAQ")
+
+        Returns:
+            종목코드 인덱스 DataFrame (BPS/PER/PBR/EPS/DIV/DPS)
+        """
+        return self._cached_snapshot(
+            self._fundamental_snapshot_cache, (trade_date, market), self.config.snapshot_cache_size,
+            lambda: krx.get_market_fundamental_by_ticker(trade_date, market=market)
+        )
+
+    def get_ohlcv_panel(
+        self,
+        stock_codes: Optional[List[str]] = None,
+        n_bars: int = 120,
+        end_date: Optional[str] = None,
+        market: str = "ALL"
+    ) -> PricePanel:
+        """
+        다종목 OHLCV 패널 조회
+
+        종목별 히스토리를 개별 조회하지 않고, 거래일별 전 종목 스냅샷을
+        n_bars회 조회하여 날짜 × 종목 배열로 정렬한다.
+
+        Args:
+            stock_codes: 대상 종목코드 (None이면 시장 전체)
+            n_bars: 거래일 수
+            end_date: 종료일 (YYYYMMDD)
+            market: 시장 구분 ("ALL", "KOSPI", "KOSDAQ")
+
+        Returns:
+            PricePanel (거래정지/미상장 구간은 NaN)
+        """
+        dates = self.get_business_days(n_bars, end_date)
+
+        snapshots = []
+        for trade_date in dates:
+            try:
+                df = self.get_market_ohlcv_snapshot(trade_date, market)
+            except Exception as e:
+                self.logger.warning(f"{trade_date} 시세 스냅샷 조회 실패: {e}")
+                continue
+            if df is not None and not df.empty:
+                snapshots.append((trade_date, df))
+
+        if stock_codes is None:
+            codes = sorted({code for _, df in snapshots for code in df.index})
+        else:
+            codes = list(stock_codes)
+
+        columns = {
+            "open": "시가",
+            "high": "고가",
+            "low": "저가",
+            "close": "종가",
+            "volume": "거래량",
+            "trading_value": "거래대금",
+        }
+        arrays = {name: np.full((len(snapshots), len(codes)), np.nan) for name in columns}
+
+        for row, (_, df) in enumerate(snapshots):
+            aligned = df.reindex(codes)
+            for name, col in columns.items():
+                if col in aligned.columns:
+                    arrays[name][row] = aligned[col].to_numpy(dtype=float)
+
+        # 거래정지 종목은 종가 0으로 내려오므로 결측 처리
+        halted = ~(arrays["close"] > 0)
+        for name in columns:
+            arrays[name][halted] = np.nan
+
+        return PricePanel(dates=[d for d, _ in snapshots], codes=codes, **arrays)
+
+    def get_investor_net_buy_by_ticker(
+        self,
+        start_date: str,
+        end_date: str,
+        investor: str = "외국인",
+        market: str = "ALL"
+    ) -> Dict[str, int]:
+        """
+        기간 내 투자자별 종목 순매수 금액 (시장 전체 일괄)
+
+        Args:
+            start_date: 시작일 (YYYYMMDD)
+            end_date: 종료일 (YYYYMMDD)
+            investor: 투자자 구분 ("외국인", "기관합계", "개인" 등)
+            market: 시장 구분
+
+        Returns:
+            {종목코드: 순매수거래대금(원)}
+        """
+        try:
+            df = krx.get_market_net_purchases_of_equities(start_date, end_date, market, investor)
+            if df.empty or "순매수거래대금" not in df.columns:
+                return {}
+            return {ticker: int(value) for ticker, value in df["순매수거래대금"].items()}
+        except Exception as e:
+            self.logger.error(f"{investor} 순매수 일괄 조회 실패: {e}")
+            return {}
+
+    # =========================================================================
+    # 시장지수
+    # =========================================================================
+
+    def get_index_close_series(
+        self,
+        index: str = "KOSPI",
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> Dict[str, float]:
+        """
+        시장지수 일별 종가 (지수별 캐시, 부족한 구간만 추가 조회)
+
+        Args:
+            index: 지수명 ("KOSPI", "KOSDAQ") 또는 KRX 지수코드
+            start_date: 시작일 (YYYYMMDD, 기본: 종료일 1년 전)
+            end_date: 종료일 (YYYYMMDD, 기본: 최근 거래일)
+
+        Returns:
+            {거래일: 종가} (거래일 오름차순)
+        """
+        ticker = self.INDEX_TICKERS.get(index, index)
+        if not end_date:
+            end_date = self._get_latest_trade_date()
+        if not start_date:
+            start_dt = datetime.strptime(end_date, "%Y%m%d") - timedelta(days=365)
+            start_date = start_dt.strftime("%Y%m%d")
+
+        cache = self._index_close_cache.setdefault(ticker, {})
+        coverage = self._index_coverage.get(ticker)
+
+        if coverage is None:
+            ranges = [(start_date, end_date)]
+        else:
+            ranges = []
+            if start_date < coverage[0]:
+                ranges.append((start_date, self._shift_date(coverage[0], -1)))
+            if end_date > coverage[1]:
+                ranges.append((self._shift_date(coverage[1], 1), end_date))
+
+        for fetch_start, fetch_end in ranges:
+            try:
+                df = krx.get_index_ohlcv_by_date(fetch_start, fetch_end, ticker)
+            except Exception as e:
+                self.logger.error(f"지수 {index} 시세 조회 실패: {e}")
+                return {d: v for d, v in sorted(cache.items()) if start_date <= d <= end_date}
+            for date_idx, row in df.iterrows():
+                cache[date_idx.strftime("%Y%m%d")] = float(row["종가"])
+
+        if coverage is None:
+            self._index_coverage[ticker] = (start_date, end_date)
+        else:
+            self._index_coverage[ticker] = (min(start_date, coverage[0]), max(end_date, coverage[1]))
+
+        return {d: v for d, v in sorted(cache.items()) if start_date <= d <= end_date}
+
+    def get_index_panel(
+        self,
+        indices: Dict[str, str],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> PricePanel:
+        """
+        여러 지수 종가 패널 (지수별 캐시를 그대로 사용하므로 재호출 시 부족한 구간만 조회)
+
+        Args:
+            indices: {이름: 지수명 또는 KRX 지수코드} (예: {"IT/전자": "1013"})
+            start_date: 시작일 (YYYYMMDD)
+            end_date: 종료일 (YYYYMMDD)
+
+        Returns:
+            PricePanel (codes = 이름, 조회 실패/미존재 구간은 NaN)
+        """
+        series = {
+            name: self.get_index_close_series(index, start_date, end_date)
+            for name, index in indices.items()
+        }
+        dates = sorted({d for closes in series.values() for d in closes})
+        names = list(indices)
+
+        close = np.full((len(dates), len(names)), np.nan)
+        row_of = {d: i for i, d in enumerate(dates)}
+        for col, name in enumerate(names):
+            for trade_date, value in series[name].items():
+                close[row_of[trade_date], col] = value
+
+        return PricePanel(dates=dates, codes=names, close=close)
+
+    def get_stock_market(self, stock_code: str) -> str:
+        """
+        종목 소속 시장 ("KOSPI" 또는 "KOSDAQ", 조회 실패 시 "KOSPI")
+
+        KOSDAQ 종목 목록을 1회 조회해 캐시한다.
+        """
+        if self._kosdaq_tickers is None:
+            try:
+                self._kosdaq_tickers = set(
+                    krx.get_market_ticker_list(self._get_latest_trade_date(), market="KOSDAQ")
+                )
+            except Exception as e:
+                self.logger.warning(f"KOSDAQ 종목 목록 조회 실패: {e}")
+                return "KOSPI"
+        return "KOSDAQ" if stock_code in self._kosdaq_tickers else "KOSPI"
+
+    @staticmethod
+    def _shift_date(date: str, days: int) -> str:
+        return (datetime.strptime(date, "%Y%m%d") + timedelta(days=days)).strftime("%Y%m%d")
+
     # =========================================================================
     # 밸류에이션 (PER/PBR/배당수익률)
     # =========================================================================
@@ -355,7 +669,7 @@ class KrxClient:
             trade_date = self._get_latest_trade_date()
 
         try:
-            df = krx.get_market_fundamental_by_ticker(trade_date, market=market)
+            df = self.get_market_fundamental_snapshot(trade_date, market)
 
             result = []
             for ticker, row in df.iterrows():
@@ -16,9 +16,13 @@ from .analysis import (
     ValuationResult,
     AgentScore,
     RiskAssessment,
-    AnalysisResult
+    AnalysisResult,
+    RsiDistribution
 )
 
+from .panel import PricePanel
+from .fundamentals import FundamentalsTable
+
 __all__ = [
     # Stock models
     "Stock",
@@ -31,5 +35,9 @@ __all__ = [
     "ValuationResult",
     "AgentScore",
     "RiskAssessment",
-    "AnalysisResult"
+    "AnalysisResult",
+    "RsiDistribution",
+    # Panel
+    "PricePanel",
+    "FundamentalsTable"
 ]
@@ -227,3 +227,62 @@ class AnalysisResult:
 **작성**: Stock Selection Agent
 """
         return md
+
+
+@dataclass
+class RsiDistribution:
+    """
+    유니버스 RSI 분포 (RSI 스캔 결과)
+
+    한 번 계산한 분포에 임계값을 여러 번 적용할 수 있다.
+    entries는 RSI 오름차순으로 정렬된 종목별 dict이며
+    run_rsi_screening() 결과와 같은 키를 가진다.
+    RSI 값은 기간과 무관하게 "rsi" 키에 있다 (period == 14이면 "rsi_14" 별칭도 포함).
+    """
+    trade_date: str
+    period: int = 14
+    entries: List[Dict[str, Any]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def below(self, threshold: float) -> List[Dict[str, Any]]:
+        """RSI <= threshold 종목 (RSI 낮은 순)"""
+        return [e for e in self.entries if e["rsi"] <= threshold]
+
+    def above(self, threshold: float) -> List[Dict[str, Any]]:
+        """RSI >= threshold 종목 (RSI 높은 순)"""
+        return [e for e in reversed(self.entries) if e["rsi"] >= threshold]
+
+    def percentile(self, q: float) -> Optional[float]:
+        """RSI 백분위수 (q: 0-100, 선형 보간)"""
+        if not self.entries:
+            return None
+        values = [e["rsi"] for e in self.entries]
+        pos = (len(values) - 1) * q / 100
+        lower = int(pos)
+        upper = min(lower + 1, len(values) - 1)
+        return round(values[lower] + (values[upper] - values[lower]) * (pos - lower), 1)
+
+    def histogram(self, bin_width: int = 10) -> Dict[str, int]:
+        """RSI 구간별 종목 수 (예: {"20-30": 5, ...})"""
+        counts = {f"{low}-{low + bin_width}": 0 for low in range(0, 100, bin_width)}
+        for e in self.entries:
+            low = min(int(e["rsi"] // bin_width) * bin_width, 100 - bin_width)
+            counts[f"{low}-{low + bin_width}"] += 1
+        return counts
+
+    def summary(self) -> Dict[str, Any]:
+        """분포 요약 (종목 수, 평균, 사분위수, 과매도/과매수 비율)"""
+        if not self.entries:
+            return {"count": 0}
+        values = [e["rsi"] for e in self.entries]
+        return {
+            "count": len(values),
+            "mean": round(sum(values) / len(values), 1),
+            "p25": self.percentile(25),
+            "median": self.percentile(50),
+            "p75": self.percentile(75),
+            "oversold_pct": round(len(self.below(30)) / len(values) * 100, 1),
+            "overbought_pct": round(len(self.above(70)) / len(values) * 100, 1),
+        }
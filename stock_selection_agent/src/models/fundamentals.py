@@ -0,0 +1,109 @@
+"""
+Fundamentals Table - 종목 × 재무항목 열 기반 테이블
+유니버스 재무 데이터를 항목별 1차원 배열로 보관하여 배열 연산으로 재무 지표를 계산
+"""
+
+from typing import Dict, List, Any, Optional, Sequence
+from dataclasses import dataclass, field
+import numbers
+
+import numpy as np
+
+
+@dataclass
+class FundamentalsTable:
+    """
+    종목 × 재무항목 테이블
+
+    각 열은 codes 순서의 float64 배열이며, 값이 없는 칸은 NaN이다.
+    금액 단위는 원 (재무제표 원 단위 그대로).
+    """
+    codes: List[str]
+    columns: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    # 종목코드 -> 행 인덱스
+    _index: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self):
+        self._index = {code: i for i, code in enumerate(self.codes)}
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __contains__(self, stock_code: str) -> bool:
+        return stock_code in self._index
+
+    def index_of(self, stock_code: str) -> Optional[int]:
+        """종목코드의 행 인덱스 (없으면 None)"""
+        return self._index.get(stock_code)
+
+    def column(self, name: str, default: float = np.nan) -> np.ndarray:
+        """
+        항목 배열 (없는 항목/결측값은 default로 채움)
+
+        Args:
+            name: 항목명 (예: "total_assets")
+            default: 결측 대체값
+        """
+        values = self.columns.get(name)
+        if values is None:
+            return np.full(len(self.codes), default, dtype=float)
+        if np.isnan(default):
+            return values
+        return np.where(np.isnan(values), default, values)
+
+    def select(self, stock_codes: Sequence[str]) -> "FundamentalsTable":
+        """지정 종목만 남긴 테이블 (테이블에 없는 종목은 제외)"""
+        kept = [code for code in stock_codes if code in self._index]
+        rows = np.array([self._index[code] for code in kept], dtype=np.intp)
+        return FundamentalsTable(kept, {name: values[rows] for name, values in self.columns.items()})
+
+    def record(self, stock_code: str) -> Dict[str, Optional[float]]:
+        """종목 1개 행을 dict로 (결측 None)"""
+        row = self._index[stock_code]
+        return {
+            name: None if np.isnan(values[row]) else float(values[row])
+            for name, values in self.columns.items()
+        }
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Dict[str, Dict[str, Any]],
+        fields: Optional[Sequence[str]] = None
+    ) -> "FundamentalsTable":
+        """
+        종목별 재무 dict → 테이블
+
+        Args:
+            records: {종목코드: {항목명: 값}}
+            fields: 보관할 항목 (None이면 모든 항목)
+        """
+        codes = list(records)
+        if fields is None:
+            fields = sorted({name for record in records.values() for name in record})
+
+        columns = {}
+        for name in fields:
+            values = np.full(len(codes), np.nan)
+            for row, code in enumerate(codes):
+                value = records[code].get(name)
+                # numpy 스칼라(np.int64/np.float64 등) 포함, bool 제외
+                if isinstance(value, numbers.Real) and not isinstance(value, (bool, np.bool_)):
+                    values[row] = value
+            columns[name] = values
+        return cls(codes, columns)
+
+    @classmethod
+    def from_dataframe(cls, df, fields: Optional[Sequence[str]] = None) -> "FundamentalsTable":
+        """
+        종목코드 인덱스 DataFrame → 테이블 (숫자 열만)
+
+        Args:
+            df: 인덱스 = 종목코드, 열 = 항목명
+            fields: 보관할 열 (None이면 숫자 열 전체)
+        """
+        if fields is None:
+            fields = [name for name in df.columns if np.issubdtype(df[name].dtype, np.number)]
+        columns = {name: df[name].to_numpy(dtype=float) for name in fields if name in df.columns}
+        return cls([str(code) for code in df.index], columns)
@@ -0,0 +1,158 @@
+"""
+Price Panel - 날짜 × 종목 정렬 시세 패널
+여러 종목의 OHLCV를 하나의 2차원 배열로 보관하여 배열 연산으로 지표를 계산
+"""
+
+from typing import Dict, List, Any, Optional, Sequence
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+# 패널이 보관하는 시세 필드 (history dict 키와 동일)
+PANEL_FIELDS = ("open", "high", "low", "close", "volume", "trading_value")
+
+
+@dataclass
+class PricePanel:
+    """
+    날짜 × 종목 시세 패널
+
+    각 필드는 (len(dates), len(codes)) 형태의 float64 배열이며,
+    데이터가 없는 칸(상장 전, 거래정지 등)은 NaN으로 채운다.
+    날짜는 오름차순(과거 → 최근)으로 정렬되어 있다.
+    """
+    dates: List[str]  # YYYYMMDD
+    codes: List[str]
+    close: np.ndarray
+    open: Optional[np.ndarray] = None
+    high: Optional[np.ndarray] = None
+    low: Optional[np.ndarray] = None
+    volume: Optional[np.ndarray] = None
+    trading_value: Optional[np.ndarray] = None
+
+    # 종목코드 -> 열 인덱스
+    _index: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self):
+        self._index = {code: i for i, code in enumerate(self.codes)}
+
+    @property
+    def n_dates(self) -> int:
+        return len(self.dates)
+
+    @property
+    def n_codes(self) -> int:
+        return len(self.codes)
+
+    def index_of(self, stock_code: str) -> Optional[int]:
+        """종목코드의 열 인덱스 (없으면 None)"""
+        return self._index.get(stock_code)
+
+    def __contains__(self, stock_code: str) -> bool:
+        return stock_code in self._index
+
+    def valid_counts(self) -> np.ndarray:
+        """종목별 유효(NaN이 아닌) 종가 개수"""
+        return np.sum(~np.isnan(self.close), axis=0)
+
+    def tail(self, n_bars: int) -> "PricePanel":
+        """
+        최근 n_bars 구간 패널 (배열 뷰, 복사 없음)
+
+        Args:
+            n_bars: 남길 최근 거래일 수
+        """
+        if n_bars >= self.n_dates:
+            return self
+        start = self.n_dates - n_bars
+        return self._replace_rows(slice(start, None))
+
+    def select(self, stock_codes: Sequence[str]) -> "PricePanel":
+        """
+        지정 종목만 남긴 패널 (패널에 없는 종목은 제외)
+
+        Args:
+            stock_codes: 선택할 종목코드 목록
+        """
+        kept = [code for code in stock_codes if code in self._index]
+        cols = np.array([self._index[code] for code in kept], dtype=np.intp)
+        values = {
+            name: (getattr(self, name)[:, cols] if getattr(self, name) is not None else None)
+            for name in PANEL_FIELDS
+        }
+        return PricePanel(dates=list(self.dates), codes=kept, **values)
+
+    def to_history(self, stock_code: str) -> List[Dict[str, Any]]:
+        """
+        단일 종목을 KrxClient.get_stock_price_history()와 같은 형식으로 변환
+
+        Args:
+            stock_code: 종목코드
+
+        Returns:
+            일별 시세 목록 (데이터가 없는 날짜는 제외)
+        """
+        col = self._index.get(stock_code)
+        if col is None:
+            return []
+
+        history = []
+        for row, trade_date in enumerate(self.dates):
+            close = self.close[row, col]
+            if np.isnan(close):
+                continue
+            item = {"stock_code": stock_code, "trade_date": trade_date, "close_price": int(close)}
+            for name in ("open", "high", "low", "volume", "trading_value"):
+                arr = getattr(self, name)
+                if arr is not None and not np.isnan(arr[row, col]):
+                    key = f"{name}_price" if name in ("open", "high", "low") else name
+                    item[key] = int(arr[row, col])
+            history.append(item)
+        return history
+
+    @classmethod
+    def from_histories(cls, histories: Dict[str, List[Dict[str, Any]]]) -> "PricePanel":
+        """
+        종목별 일별 시세 목록으로부터 패널 생성
+
+        Args:
+            histories: {종목코드: get_stock_price_history() 결과}
+
+        Returns:
+            날짜 합집합 기준으로 정렬된 패널
+        """
+        codes = list(histories.keys())
+        dates = sorted({p["trade_date"] for rows in histories.values() for p in rows})
+        row_of = {d: i for i, d in enumerate(dates)}
+
+        keys = {
+            "open": "open_price",
+            "high": "high_price",
+            "low": "low_price",
+            "close": "close_price",
+            "volume": "volume",
+            "trading_value": "trading_value",
+        }
+        arrays = {name: np.full((len(dates), len(codes)), np.nan) for name in PANEL_FIELDS}
+
+        for col, code in enumerate(codes):
+            for p in histories[code]:
+                row = row_of[p["trade_date"]]
+                for name, key in keys.items():
+                    value = p.get(key)
+                    if value is not None:
+                        arrays[name][row, col] = value
+
+        # 거래대금이 전혀 없으면 필드 자체를 비워둔다
+        if np.all(np.isnan(arrays["trading_value"])):
+            arrays["trading_value"] = None
+
+        return cls(dates=dates, codes=codes, **arrays)
+
+    def _replace_rows(self, rows: slice) -> "PricePanel":
+        values = {
+            name: (getattr(self, name)[rows] if getattr(self, name) is not None else None)
+            for name in PANEL_FIELDS
+        }
+        return PricePanel(dates=self.dates[rows], codes=self.codes, **values)
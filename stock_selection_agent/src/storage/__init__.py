@@ -0,0 +1,32 @@
+"""
+Stock Selection Agent - Storage
+수집 데이터 로컬 저장소 (data/ 하위)
+"""
+
+from .news_store import NewsStore, NewsStory, NewsBatch, normalize_headline, simhash
+from .consensus_store import ConsensusStore, ConsensusMetrics, compute_consensus_metrics
+from .earnings_store import EarningsStore, EarningsRecord, PeriodicFiling, latest_periodic_filing
+from .sentiment_store import SentimentSeriesStore, SentimentSeriesMetrics, DecayState, daily_aggregates
+
+__all__ = [
+    # News
+    "NewsStore",
+    "NewsStory",
+    "NewsBatch",
+    "normalize_headline",
+    "simhash",
+    # Consensus
+    "ConsensusStore",
+    "ConsensusMetrics",
+    "compute_consensus_metrics",
+    # Earnings
+    "EarningsStore",
+    "EarningsRecord",
+    "PeriodicFiling",
+    "latest_periodic_filing",
+    # Sentiment
+    "SentimentSeriesStore",
+    "SentimentSeriesMetrics",
+    "DecayState",
+    "daily_aggregates",
+]
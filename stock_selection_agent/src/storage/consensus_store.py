@@ -0,0 +1,358 @@
+"""
+Consensus Store - 애널리스트 컨센서스 일별 스냅샷 이력
+eBest/네이버에서 받은 그날의 컨센서스(투자의견 분포, 목표주가, EPS 컨센서스)를 종목별로 누적해
+의견 변화/목표주가 변화/EPS 수정을 원격 호출 없이 이력에서 계산
+
+- 저장: data/consensus_history/<종목코드>.bin (고정 길이 30바이트 레코드 추가 기록)
+  같은 날 여러 번 기록하면 마지막 레코드가 그날 스냅샷 (동일 내용 재기록은 생략)
+- 지표: 전 종목 레코드를 (종목, 날짜) 키로 합쳐 searchsorted/bincount로 일괄 계산
+  기준일 이전 마지막 스냅샷 대비 1/3/6개월(30/91/182일) 목표주가 변화율,
+  3개월 내 컨센서스 점수 상향/하향 횟수 → rating_momentum, EPS 컨센서스 수정률/횟수
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Union
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+import logging
+import threading
+
+import numpy as np
+
+
+RECORD_DTYPE = np.dtype([
+    ("day", "<i4"),  # 1970-01-01 이후 일수
+    ("ratings", "<i2", (5,)),  # strong_buy, buy, hold, sell, strong_sell
+    ("avg_target", "<f4"),  # 평균 목표주가 (없으면 NaN)
+    ("median_target", "<f4"),
+    ("eps_current", "<f4"),  # 당해 연도 EPS 컨센서스 (없으면 NaN)
+    ("eps_next", "<f4"),  # 다음 연도 EPS 컨센서스
+])
+
+RATING_KEYS = ("strong_buy", "buy", "hold", "sell", "strong_sell")
+RATING_WEIGHTS = np.array([2, 1, 0, -1, -2], dtype=np.float64)  # 컨센서스 점수 가중치 (-2 ~ +2)
+TARGET_HORIZONS = {1: 30, 3: 91, 6: 182}  # 개월 → 일
+REVISION_WINDOW_DAYS = 91  # 의견 변화/EPS 수정 집계 기간 (3개월)
+
+_EPOCH = date(1970, 1, 1)
+_KEY_SPAN = np.int64(1) << 32  # (종목 순번, 날짜) 결합 키 간격
+
+
+def to_day(value: Union[str, date, datetime, None]) -> int:
+    """날짜(YYYY-MM-DD/YYYYMMDD 문자열, date, datetime, None=오늘) → 1970-01-01 이후 일수"""
+    if value is None:
+        value = date.today()
+    elif isinstance(value, str):
+        text = value.replace("-", "").replace(".", "")
+        value = datetime.strptime(text[:8], "%Y%m%d").date()
+    elif isinstance(value, datetime):
+        value = value.date()
+    return (value - _EPOCH).days
+
+
+def from_day(day: int) -> str:
+    return date.fromordinal(_EPOCH.toordinal() + int(day)).strftime("%Y-%m-%d")
+
+
+def snapshot_record(analyst_data: Dict[str, Any], day: int) -> np.ndarray:
+    """
+    수집 결과 → 스냅샷 레코드 1개
+
+    Args:
+        analyst_data: {"rating_distribution", "target_prices", "eps_consensus_current"(선택),
+                       "eps_consensus_next"(선택)} (eBest/네이버 수집 형식)
+        day: 1970-01-01 이후 일수
+    """
+    record = np.zeros(1, dtype=RECORD_DTYPE)
+    record["day"] = day
+    distribution = analyst_data.get("rating_distribution") or {}
+    record["ratings"][0] = [int(distribution.get(key, 0) or 0) for key in RATING_KEYS]
+
+    targets = sorted(float(tp) for tp in analyst_data.get("target_prices") or [] if tp and tp > 0)
+    record["avg_target"] = sum(targets) / len(targets) if targets else np.nan
+    record["median_target"] = targets[len(targets) // 2] if targets else np.nan  # 에이전트 중앙값 기준과 동일
+
+    for column, key in (("eps_current", "eps_consensus_current"), ("eps_next", "eps_consensus_next")):
+        value = analyst_data.get(key)
+        record[column] = float(value) if value not in (None, 0) else np.nan
+    return record
+
+
+def consensus_scores(records: np.ndarray) -> np.ndarray:
+    """레코드별 컨센서스 점수 (-2 ~ +2, 의견 없으면 NaN)"""
+    ratings = records["ratings"].astype(np.float64)
+    total = ratings.sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(total > 0, ratings @ RATING_WEIGHTS / total, np.nan)
+
+
+@dataclass
+class ConsensusMetrics:
+    """
+    종목별 컨센서스 이력 지표 (codes 순서 배열, 계산 불가 NaN)
+
+    변화율은 기준일 이전 마지막 스냅샷 대비이며, 해당 기간 이전 스냅샷이 없으면 NaN이다.
+    """
+    codes: List[str]
+    as_of: str
+    snapshots: np.ndarray  # 기준일까지 스냅샷 수
+    last_date: List[Optional[str]]
+    consensus_score: np.ndarray
+    consensus_score_change_3m: np.ndarray
+    target_price_change: Dict[int, np.ndarray] = field(default_factory=dict)  # {개월: 평균 목표주가 변화율 %}
+    upgrades_3m: Optional[np.ndarray] = None  # 컨센서스 점수 상승 횟수
+    downgrades_3m: Optional[np.ndarray] = None
+    rating_momentum: Optional[np.ndarray] = None  # (상향 - 하향) / (상향 + 하향), 변화 없으면 0
+    eps_revision_current: Optional[np.ndarray] = None  # 3개월 EPS 컨센서스 수정률 %
+    eps_revision_next: Optional[np.ndarray] = None
+    eps_up_3m: Optional[np.ndarray] = None  # 당해 EPS 컨센서스 상향 횟수
+    eps_down_3m: Optional[np.ndarray] = None
+    _index: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self):
+        self._index = {code: i for i, code in enumerate(self.codes)}
+
+    def index_of(self, stock_code: str) -> Optional[int]:
+        return self._index.get(stock_code)
+
+    def __contains__(self, stock_code: str) -> bool:
+        return stock_code in self._index
+
+    def to_dict(self, stock_code: str) -> Optional[Dict[str, Any]]:
+        """종목 1개 결과 (값 없음은 None, 이력 없는 종목은 None)"""
+        row = self.index_of(stock_code)
+        if row is None or self.snapshots[row] == 0:
+            return None
+
+        def value(values, digits=2):
+            v = values[row]
+            return None if np.isnan(v) else round(float(v), digits)
+
+        return {
+            "snapshots": int(self.snapshots[row]),
+            "last_date": self.last_date[row],
+            "consensus_score": value(self.consensus_score),
+            "consensus_score_change_3m": value(self.consensus_score_change_3m),
+            "target_price_change": {months: value(v) for months, v in self.target_price_change.items()},
+            "upgrades_3m": int(self.upgrades_3m[row]),
+            "downgrades_3m": int(self.downgrades_3m[row]),
+            "rating_momentum": value(self.rating_momentum),
+            "eps_revision_current": value(self.eps_revision_current),
+            "eps_revision_next": value(self.eps_revision_next),
+            "eps_up_3m": int(self.eps_up_3m[row]),
+            "eps_down_3m": int(self.eps_down_3m[row]),
+        }
+
+
+def _pct_change(current: np.ndarray, past: np.ndarray) -> np.ndarray:
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(np.abs(past) > 0, (current / np.abs(past) - np.sign(past)) * 100, np.nan)
+
+
+def compute_consensus_metrics(
+    codes: Sequence[str],
+    histories: Sequence[np.ndarray],
+    as_of: Union[str, date, datetime, None] = None
+) -> ConsensusMetrics:
+    """
+    종목별 스냅샷 이력 → 컨센서스 이력 지표 일괄 계산
+
+    Args:
+        codes: 종목코드
+        histories: 종목별 스냅샷 레코드 (날짜 오름차순, 하루 1개)
+        as_of: 기준일 (None이면 오늘, 이후 스냅샷은 무시)
+
+    Returns:
+        ConsensusMetrics
+    """
+    n = len(codes)
+    as_of_day = to_day(as_of)
+    lengths = np.array([len(h) for h in histories], dtype=np.int64)
+    records = np.concatenate(histories) if n and lengths.sum() else np.zeros(0, dtype=RECORD_DTYPE)
+    stock = np.repeat(np.arange(n, dtype=np.int64), lengths)
+
+    visible = records["day"] <= as_of_day
+    records, stock = records[visible], stock[visible]
+    keys = stock * _KEY_SPAN + records["day"].astype(np.int64)
+    rows = np.arange(n, dtype=np.int64)
+
+    def last_at_or_before(day_offset: int):
+        """종목별 (기준일 - day_offset) 이전 마지막 스냅샷 위치, 존재 여부"""
+        pos = np.searchsorted(keys, rows * _KEY_SPAN + (as_of_day - day_offset), side="right") - 1
+        valid = pos >= 0
+        valid[valid] = stock[pos[valid]] == rows[valid]
+        return np.where(valid, pos, 0), valid
+
+    def at(column: np.ndarray, pos: np.ndarray, valid: np.ndarray) -> np.ndarray:
+        values = column[pos].astype(np.float64) if len(column) else np.full(n, np.nan)
+        return np.where(valid, values, np.nan)
+
+    scores = consensus_scores(records)
+    current, has_current = last_at_or_before(0)
+    past_3m, has_3m = last_at_or_before(REVISION_WINDOW_DAYS)
+
+    target_change = {}
+    for months, days in TARGET_HORIZONS.items():
+        past, has_past = last_at_or_before(days)
+        target_change[months] = _pct_change(
+            at(records["avg_target"], current, has_current), at(records["avg_target"], past, has_past)
+        )
+
+    # 3개월 내 연속 스냅샷 간 변화 횟수 (이전 스냅샷은 기간 밖이어도 비교 기준)
+    window = np.zeros(len(records), dtype=bool)
+    window[1:] = (stock[1:] == stock[:-1]) & (records["day"][1:] > as_of_day - REVISION_WINDOW_DAYS)
+
+    def count_changes(values: np.ndarray):
+        delta = np.zeros(len(values))
+        delta[1:] = np.nan_to_num(values[1:] - values[:-1], nan=0.0)
+        up = np.bincount(stock[window & (delta > 1e-9)], minlength=n)
+        down = np.bincount(stock[window & (delta < -1e-9)], minlength=n)
+        return up, down
+
+    upgrades, downgrades = count_changes(scores)
+    eps_current = records["eps_current"].astype(np.float64)
+    eps_up, eps_down = count_changes(eps_current)
+    changes = upgrades + downgrades
+    with np.errstate(invalid="ignore", divide="ignore"):
+        momentum = np.where(changes > 0, (upgrades - downgrades) / np.maximum(changes, 1), 0.0)
+
+    return ConsensusMetrics(
+        codes=list(codes),
+        as_of=from_day(as_of_day),
+        snapshots=np.bincount(stock, minlength=n),
+        last_date=[from_day(records["day"][p]) if ok else None for p, ok in zip(current, has_current)],
+        consensus_score=at(scores, current, has_current),
+        consensus_score_change_3m=at(scores, current, has_current) - at(scores, past_3m, has_3m),
+        target_price_change=target_change,
+        upgrades_3m=upgrades,
+        downgrades_3m=downgrades,
+        rating_momentum=np.where(has_current, momentum, np.nan),
+        eps_revision_current=_pct_change(at(eps_current, current, has_current), at(eps_current, past_3m, has_3m)),
+        eps_revision_next=_pct_change(
+            at(records["eps_next"], current, has_current), at(records["eps_next"], past_3m, has_3m)
+        ),
+        eps_up_3m=eps_up,
+        eps_down_3m=eps_down,
+    )
+
+
+class ConsensusStore:
+    """
+    종목별 컨센서스 스냅샷 저장소 (추가 기록 전용, 스레드 안전)
+
+    사용법:
+        store = ConsensusStore()
+        store.record("005930", analyst_data)            # 수집 시 그날 스냅샷 기록
+        metrics = store.metrics(["005930", "000660"])   # 원격 호출 없이 이력 지표
+        metrics.to_dict("005930")["target_price_change"][3]
+    """
+
+    def __init__(self, store_dir: Optional[Path] = None, persist: bool = True):
+        """
+        Args:
+            store_dir: 저장 경로 (None이면 data/consensus_history)
+            persist: 디스크 저장 여부
+        """
+        self.store_dir = store_dir or Path(__file__).parent.parent.parent / "data" / "consensus_history"
+        self.persist = persist
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self._histories: Dict[str, np.ndarray] = {}  # 종목코드 -> 하루 1개 스냅샷 (날짜 오름차순)
+
+    def _history_file(self, stock_code: str) -> Path:
+        return self.store_dir / f"{stock_code}.bin"
+
+    @staticmethod
+    def _latest_per_day(records: np.ndarray) -> np.ndarray:
+        """날짜별 마지막 기록만 남기고 날짜순 정렬"""
+        if len(records) < 2:
+            return records
+        order = np.argsort(records["day"], kind="stable")
+        ordered = records[order]
+        last = np.ones(len(ordered), dtype=bool)
+        last[:-1] = ordered["day"][1:] != ordered["day"][:-1]
+        return ordered[last]
+
+    def _load(self, stock_code: str) -> np.ndarray:
+        """종목 이력 로드 (메모리 → 디스크, 잠금 보유 상태에서 호출)"""
+        if stock_code in self._histories:
+            return self._histories[stock_code]
+
+        records = np.zeros(0, dtype=RECORD_DTYPE)
+        history_file = self._history_file(stock_code)
+        if self.persist and history_file.exists():
+            try:
+                raw = history_file.read_bytes()
+                complete = len(raw) - len(raw) % RECORD_DTYPE.itemsize  # 중단된 마지막 기록 무시
+                records = np.frombuffer(raw[:complete], dtype=RECORD_DTYPE).copy()
+            except Exception as e:
+                self.logger.warning(f"컨센서스 이력 로드 실패 ({stock_code}): {e}")
+
+        records = self._latest_per_day(records)
+        self._histories[stock_code] = records
+        return records
+
+    def record(
+        self,
+        stock_code: str,
+        analyst_data: Dict[str, Any],
+        as_of: Union[str, date, datetime, None] = None
+    ) -> bool:
+        """
+        그날 스냅샷 기록
+
+        Args:
+            stock_code: 종목코드
+            analyst_data: eBest/네이버 수집 결과
+            as_of: 스냅샷 날짜 (None이면 오늘)
+
+        Returns:
+            기록 여부 (같은 날 같은 내용이면 False)
+        """
+        record = snapshot_record(analyst_data, to_day(as_of))
+        with self._lock:
+            history = self._load(stock_code)
+            same_day = history[history["day"] == record["day"][0]]
+            if len(same_day) and same_day[-1:].tobytes() == record.tobytes():
+                return False
+
+            if self.persist:
+                try:
+                    self.store_dir.mkdir(parents=True, exist_ok=True)
+                    with open(self._history_file(stock_code), "ab") as f:
+                        f.write(record.tobytes())
+                except Exception as e:
+                    self.logger.warning(f"컨센서스 스냅샷 저장 실패 ({stock_code}): {e}")
+
+            self._histories[stock_code] = self._latest_per_day(np.concatenate([history, record]))
+        return True
+
+    def history(self, stock_code: str) -> np.ndarray:
+        """종목 스냅샷 (하루 1개, 날짜 오름차순 RECORD_DTYPE 배열)"""
+        with self._lock:
+            return self._load(stock_code).copy()
+
+    def covered_stocks(self) -> List[str]:
+        """이력이 있는 종목코드 (디스크 + 메모리)"""
+        codes = set(code for code, records in self._histories.items() if len(records))
+        if self.persist and self.store_dir.exists():
+            codes.update(path.stem for path in self.store_dir.glob("*.bin"))
+        return sorted(codes)
+
+    def metrics(
+        self,
+        stock_codes: Optional[Sequence[str]] = None,
+        as_of: Union[str, date, datetime, None] = None
+    ) -> ConsensusMetrics:
+        """
+        컨센서스 이력 지표 (원격 호출 없음)
+
+        Args:
+            stock_codes: 종목코드 (None이면 이력 있는 전 종목)
+            as_of: 기준일 (None이면 오늘)
+        """
+        codes = list(stock_codes) if stock_codes is not None else self.covered_stocks()
+        with self._lock:
+            histories = [self._load(code) for code in codes]
+        return compute_consensus_metrics(codes, histories, as_of)
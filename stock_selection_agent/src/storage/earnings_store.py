@@ -0,0 +1,222 @@
+"""
+Earnings Store - 보고 분기별 실적 서프라이즈 데이터 캐시
+DART/eBest/네이버에서 모은 실적 데이터를 최근 정기보고서(사업/반기/분기보고서) 기준 보고 분기로 저장하고,
+공시 목록에 더 새로운 정기보고서가 나타날 때만 무효화해 그 외에는 로컬 조회로 처리
+
+- 키: 보고 분기 (정기보고서 제목의 결산월 "(2026.06)" → 2026Q2)
+- 출처: 분석에 사용한 소스 + 조회한 소스별 결과 (예: DART 최신 분기 없음 → 네이버 보충)
+- 무효화: 공시 목록 최근 정기보고서 접수일 > 저장 기준 접수일 (기재정정 포함)
+  공시 목록을 쓸 수 없거나(DART 미설정/조회 실패) 최근 정기보고서가 없으면 max_age_days 경과 시 재수집
+- 저장: data/earnings_store/<종목코드>.json
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timedelta
+from pathlib import Path
+import json
+import logging
+import re
+import threading
+
+
+PERIODIC_REPORT = re.compile(r"(사업|반기|분기)보고서")
+_REPORT_PERIOD = re.compile(r"\((\d{4})\.(\d{1,2})\)")
+
+
+@dataclass
+class PeriodicFiling:
+    """정기보고서 공시"""
+    filing_date: str  # 접수일 (YYYYMMDD)
+    quarter: str  # 보고 분기 (예: 2026Q2, 결산월 미표기 시 "")
+    title: str
+
+
+def report_quarter(title: str) -> str:
+    """정기보고서 제목 결산월 → 보고 분기 ("분기보고서 (2026.03)" → "2026Q1")"""
+    match = _REPORT_PERIOD.search(title or "")
+    if not match:
+        return ""
+    year, month = int(match.group(1)), int(match.group(2))
+    return f"{year}Q{(month - 1) // 3 + 1}"
+
+
+def latest_periodic_filing(disclosures: Sequence[Dict[str, Any]]) -> Optional[PeriodicFiling]:
+    """
+    공시 목록 중 가장 최근 정기보고서
+
+    Args:
+        disclosures: [{"date": "YYYYMMDD", "title": 보고서명}] (DART 공시 목록 형식)
+    """
+    latest = None
+    for disclosure in disclosures:
+        title = str(disclosure.get("title", ""))
+        filing_date = str(disclosure.get("date", "")).replace("-", "")
+        if not filing_date or not PERIODIC_REPORT.search(title):
+            continue
+        if latest is None or filing_date > latest.filing_date:
+            latest = PeriodicFiling(filing_date=filing_date, quarter=report_quarter(title), title=title)
+    return latest
+
+
+@dataclass
+class EarningsRecord:
+    """보고 분기 실적 데이터 (분석 입력 + 소스별 출처)"""
+    quarter: str  # 보고 분기 (정기보고서를 못 찾으면 "")
+    filing_date: str  # 기준 정기보고서 접수일 (YYYYMMDD, 없으면 "")
+    source: str  # 분석에 사용한 소스 ("DART", "Naver", "eBest")
+    rows: List[Dict[str, Any]]  # [{"quarter", "actual_eps", "estimate_eps", "source"}]
+    sources: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)  # 조회한 소스별 결과
+    fetched_at: str = ""  # 수집 시각 (ISO)
+    filing_title: str = ""
+
+
+class EarningsStore:
+    """
+    종목별 보고 분기 실적 저장소 (스레드 안전)
+
+    사용법:
+        store = EarningsStore()
+        filing = latest_periodic_filing(disclosures)
+        record = store.get("005930", filing)     # 새 정기보고서가 없으면 저장값
+        if record is None:
+            store.put("005930", rows, source="DART", sources={...}, filing=filing)
+    """
+
+    def __init__(self, store_dir: Optional[Path] = None, max_age_days: int = 30, persist: bool = True):
+        """
+        Args:
+            store_dir: 저장 경로 (None이면 data/earnings_store)
+            max_age_days: 공시 목록으로 판단할 수 없을 때(목록 없음/정기보고서 없음) 저장값 유효 기간
+            persist: 디스크 저장 여부
+        """
+        self.store_dir = store_dir or Path(__file__).parent.parent.parent / "data" / "earnings_store"
+        self.max_age_days = max_age_days
+        self.persist = persist
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self._records: Dict[str, Dict[str, EarningsRecord]] = {}  # 종목코드 -> {보고 분기: 레코드}
+
+    def _record_file(self, stock_code: str) -> Path:
+        return self.store_dir / f"{stock_code}.json"
+
+    def _load(self, stock_code: str) -> Dict[str, EarningsRecord]:
+        """종목 레코드 로드 (메모리 → 디스크, 잠금 보유 상태에서 호출)"""
+        if stock_code in self._records:
+            return self._records[stock_code]
+
+        records: Dict[str, EarningsRecord] = {}
+        record_file = self._record_file(stock_code)
+        if self.persist and record_file.exists():
+            try:
+                with open(record_file, "r", encoding="utf-8") as f:
+                    for quarter, item in json.load(f).get("quarters", {}).items():
+                        records[quarter] = EarningsRecord(**item)
+            except Exception as e:
+                self.logger.warning(f"실적 저장소 로드 실패 ({stock_code}): {e}")
+                records = {}
+
+        self._records[stock_code] = records
+        return records
+
+    def latest(self, stock_code: str) -> Optional[EarningsRecord]:
+        """가장 최근 수집 레코드"""
+        with self._lock:
+            records = self._load(stock_code)
+            if not records:
+                return None
+            return max(records.values(), key=lambda r: (r.filing_date, r.fetched_at))
+
+    def get(
+        self,
+        stock_code: str,
+        filing: Optional[PeriodicFiling],
+        feed_available: bool = True,
+        now: Optional[datetime] = None
+    ) -> Optional[EarningsRecord]:
+        """
+        유효한 저장 레코드 조회
+
+        Args:
+            stock_code: 종목코드
+            filing: 공시 목록 최근 정기보고서 (없으면 None, max_age_days 기준)
+            feed_available: 공시 목록 조회 가능 여부 (False면 max_age_days 기준)
+            now: 기준 시각
+
+        Returns:
+            EarningsRecord (새 정기보고서 발견/만료/없음이면 None)
+        """
+        record = self.latest(stock_code)
+        if record is None:
+            return None
+
+        # 공시 목록으로 새 정기보고서 여부를 판단할 수 없으면 (조회 실패로 빈 목록인 경우 포함) 유효 기간 적용
+        if not feed_available or filing is None:
+            fetched_at = datetime.fromisoformat(record.fetched_at) if record.fetched_at else datetime.min
+            if (now or datetime.now()) - fetched_at > timedelta(days=self.max_age_days):
+                return None
+            return record
+
+        if filing.filing_date > record.filing_date:
+            self.logger.info(
+                f"새 정기보고서로 실적 재수집: {stock_code} {filing.title} "
+                f"(저장 기준 {record.quarter or '-'} {record.filing_date or '-'})"
+            )
+            return None
+        return record
+
+    def put(
+        self,
+        stock_code: str,
+        rows: List[Dict[str, Any]],
+        source: str,
+        sources: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        filing: Optional[PeriodicFiling] = None,
+        now: Optional[datetime] = None
+    ) -> EarningsRecord:
+        """
+        보고 분기 레코드 저장 (같은 분기는 덮어씀)
+
+        Args:
+            stock_code: 종목코드
+            rows: 분석에 사용한 실적 데이터
+            source: 사용한 소스
+            sources: 조회한 소스별 결과 (출처 기록)
+            filing: 수집 시점 최근 정기보고서
+            now: 수집 시각
+        """
+        record = EarningsRecord(
+            quarter=filing.quarter if filing else "",
+            filing_date=filing.filing_date if filing else "",
+            source=source,
+            rows=[dict(row) for row in rows],
+            sources={name: [dict(row) for row in data] for name, data in (sources or {}).items()},
+            fetched_at=(now or datetime.now()).isoformat(timespec="seconds"),
+            filing_title=filing.title if filing else ""
+        )
+        with self._lock:
+            records = self._load(stock_code)
+            records[record.quarter] = record
+            if self.persist:
+                self._save(stock_code, records)
+        return record
+
+    def _save(self, stock_code: str, records: Dict[str, EarningsRecord]):
+        try:
+            self.store_dir.mkdir(parents=True, exist_ok=True)
+            path = self._record_file(stock_code)
+            tmp_file = path.with_suffix(f".{threading.get_ident()}.tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump({
+                    "stock_code": stock_code,
+                    "quarters": {quarter: asdict(record) for quarter, record in sorted(records.items())}
+                }, f, ensure_ascii=False, indent=1)
+            tmp_file.replace(path)
+        except Exception as e:
+            self.logger.warning(f"실적 저장소 저장 실패 ({stock_code}): {e}")
+
+    def quarters(self, stock_code: str) -> List[str]:
+        """저장된 보고 분기 (오름차순)"""
+        with self._lock:
+            return sorted(self._load(stock_code))
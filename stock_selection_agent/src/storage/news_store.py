@@ -0,0 +1,383 @@
+"""
+News Store - 뉴스 중복 제거 + 헤드라인 점수 캐시
+네이버 금융/구글 RSS 등 여러 소스와 여러 날에 걸쳐 들어오는 같은 기사를 하나의 스토리로 묶고,
+헤드라인 센티먼트 점수를 해시 키로 캐시해 재실행 시 새 헤드라인만 점수 계산
+
+- 정규화: 출처 꼬리표(" - 한국경제"), 말머리([속보], (종합)), 문장부호, 공백 제거
+- 근사 중복: 정규화 헤드라인 문자 2-gram SimHash(64비트) 해밍 거리 ≤ 임계값
+  (4개 16비트 구간 색인: 거리 3 이하면 최소 한 구간이 일치)
+- 저장: data/news_store/<종목코드>.json (스토리), data/news_store/_scores.json (점수 캐시)
+  점수 캐시는 새 점수가 score_flush_every건 쌓일 때, flush() 호출 시, 프로세스 종료 시에만 기록
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+import atexit
+import hashlib
+import json
+import logging
+import re
+import threading
+
+import numpy as np
+
+
+SIMHASH_BITS = 64
+SIMHASH_BANDS = 4  # 구간 수 (임계값 < 구간 수일 때 후보 누락 없음)
+_BAND_BITS = SIMHASH_BITS // SIMHASH_BANDS
+
+_SOURCE_SUFFIX = re.compile(r"\s+[-|]\s+[^-|]{1,30}$")
+_TAG = re.compile(r"[\[\(【<〈][^\]\)】>〉]{1,12}[\]\)】>〉]")
+_PUNCTUATION = re.compile(r"[^\w\s%]")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_headline(headline: str) -> str:
+    """헤드라인 정규화 (출처 꼬리표, 말머리, 문장부호, 대소문자, 공백)"""
+    text = _SOURCE_SUFFIX.sub("", headline or "")
+    text = _TAG.sub(" ", text)
+    text = _PUNCTUATION.sub(" ", text.lower())
+    return _SPACES.sub(" ", text).strip()
+
+
+@lru_cache(maxsize=65536)
+def _feature_hash(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def simhash(normalized: str) -> int:
+    """정규화 헤드라인 → 64비트 SimHash (공백 제외 문자 2-gram)"""
+    compact = normalized.replace(" ", "")
+    if not compact:
+        return 0
+    features = [compact[i:i + 2] for i in range(max(1, len(compact) - 1))]
+    hashes = np.array([_feature_hash(f) for f in features], dtype=np.uint64)
+    bits = (hashes[:, None] >> np.arange(SIMHASH_BITS, dtype=np.uint64)) & np.uint64(1)
+    votes = bits.sum(axis=0).astype(np.int64) * 2 - len(features)
+    return sum(1 << int(bit) for bit in np.flatnonzero(votes > 0))
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def _bands(fingerprint: int) -> List[Tuple[int, int]]:
+    mask = (1 << _BAND_BITS) - 1
+    return [(i, (fingerprint >> (i * _BAND_BITS)) & mask) for i in range(SIMHASH_BANDS)]
+
+
+def headline_key(headline: str) -> str:
+    """헤드라인 점수 캐시 키"""
+    return hashlib.sha1(headline.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class NewsStory:
+    """중복 기사를 묶은 스토리 (대표 기사 = 처음 본 기사)"""
+    story_id: int
+    fingerprint: int
+    headline: str
+    date: str  # 대표 기사 날짜 (YYYY-MM-DD)
+    source: str
+    url: str = ""
+    first_seen: str = ""  # 처음 수집한 날짜
+    sources: List[str] = field(default_factory=list)  # 같은 스토리를 보도한 소스
+
+
+@dataclass
+class NewsBatch:
+    """add_articles 결과"""
+    stories: List[Dict[str, object]]  # 입력 순서 고유 스토리 (대표 기사 + story_id, sources, is_new)
+    duplicates: int = 0  # 이번 입력에서 제거된 중복 기사 수
+    new_stories: int = 0
+
+
+class NewsStore:
+    """
+    종목별 뉴스 스토리 저장소
+
+    사용법:
+        store = NewsStore()
+        batch = store.add_articles("005930", naver_news + google_news)
+        scores = store.score_headlines([s["headline"] for s in batch.stories], agent.score_headlines, version)
+    """
+
+    def __init__(
+        self,
+        store_dir: Optional[Path] = None,
+        hamming_threshold: int = 3,
+        retention_days: int = 90,
+        max_cached_scores: int = 50000,
+        score_flush_every: int = 1000,
+        persist: bool = True
+    ):
+        """
+        Args:
+            store_dir: 저장 경로 (None이면 data/news_store)
+            hamming_threshold: 근사 중복 SimHash 해밍 거리 상한 (구간 수 미만)
+            retention_days: 스토리 보관 기간 (기사 날짜 기준)
+            max_cached_scores: 헤드라인 점수 캐시 최대 항목 수
+            score_flush_every: 점수 캐시 파일을 다시 쓰기까지 모을 새 점수 수
+            persist: 디스크 저장 여부
+        """
+        if hamming_threshold >= SIMHASH_BANDS:
+            raise ValueError(f"hamming_threshold는 {SIMHASH_BANDS} 미만이어야 합니다")
+
+        self.store_dir = store_dir or Path(__file__).parent.parent.parent / "data" / "news_store"
+        self.hamming_threshold = hamming_threshold
+        self.retention_days = retention_days
+        self.max_cached_scores = max_cached_scores
+        self.score_flush_every = max(1, score_flush_every)
+        self.persist = persist
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.RLock()
+        self._stories: Dict[str, Dict[int, NewsStory]] = {}  # 종목코드 -> {스토리 ID: 스토리}
+        self._band_index: Dict[str, Dict[Tuple[int, int], List[int]]] = {}  # 종목코드 -> {구간: 스토리 ID}
+        self._scores: Optional[Dict[str, float]] = None  # 헤드라인 키 -> 점수
+        self._score_version: Optional[str] = None
+        self._unsaved_scores = 0  # 마지막 기록 이후 새 점수 수
+
+        if self.persist:
+            atexit.register(self.flush)
+
+    # =========================================================================
+    # 스토리
+    # =========================================================================
+
+    def _story_file(self, stock_code: str) -> Path:
+        return self.store_dir / f"{stock_code}.json"
+
+    def _load_stories(self, stock_code: str) -> Dict[int, NewsStory]:
+        """종목 스토리 로드 (메모리 → 디스크)"""
+        if stock_code in self._stories:
+            return self._stories[stock_code]
+
+        stories: Dict[int, NewsStory] = {}
+        story_file = self._story_file(stock_code)
+        if self.persist and story_file.exists():
+            try:
+                with open(story_file, "r", encoding="utf-8") as f:
+                    for item in json.load(f).get("stories", []):
+                        story = NewsStory(**item)
+                        stories[story.story_id] = story
+            except Exception as e:
+                self.logger.warning(f"뉴스 스토리 로드 실패 ({stock_code}): {e}")
+                stories = {}
+
+        self._stories[stock_code] = stories
+        self._rebuild_index(stock_code)
+        return stories
+
+    def _rebuild_index(self, stock_code: str):
+        index: Dict[Tuple[int, int], List[int]] = {}
+        for story in self._stories[stock_code].values():
+            for band in _bands(story.fingerprint):
+                index.setdefault(band, []).append(story.story_id)
+        self._band_index[stock_code] = index
+
+    def _find_duplicate(self, stock_code: str, fingerprint: int) -> Optional[NewsStory]:
+        """근사 중복 스토리 (해밍 거리 최소)"""
+        stories = self._stories[stock_code]
+        candidates = set()
+        for band in _bands(fingerprint):
+            candidates.update(self._band_index[stock_code].get(band, ()))
+
+        best, best_distance = None, self.hamming_threshold + 1
+        for story_id in candidates:
+            distance = hamming_distance(fingerprint, stories[story_id].fingerprint)
+            if distance < best_distance:
+                best, best_distance = stories[story_id], distance
+        return best
+
+    def _prune(self, stock_code: str, today: datetime):
+        """보관 기간 지난 스토리 제거"""
+        cutoff = (today - timedelta(days=self.retention_days)).strftime("%Y-%m-%d")
+        stories = self._stories[stock_code]
+        expired = [story_id for story_id, story in stories.items() if story.date < cutoff]
+        if not expired:
+            return
+        for story_id in expired:
+            del stories[story_id]
+        self._rebuild_index(stock_code)
+
+    def add_articles(
+        self,
+        stock_code: str,
+        articles: Sequence[Dict[str, object]],
+        today: Optional[datetime] = None
+    ) -> NewsBatch:
+        """
+        기사 추가 + 중복 제거
+
+        Args:
+            stock_code: 종목코드
+            articles: [{"date", "source", "headline", "url"}] (최근 기사 우선 순서)
+            today: 기준 시각 (보관 기간 계산용)
+
+        Returns:
+            NewsBatch (이전 실행에서 본 스토리도 포함, is_new로 구분)
+        """
+        today = today or datetime.now()
+        with self._lock:
+            stories = self._load_stories(stock_code)
+            self._prune(stock_code, today)
+            index = self._band_index[stock_code]
+
+            batch_order: List[int] = []  # 이번 입력의 고유 스토리 (입력 순서)
+            in_batch = set()
+            created = set()
+            duplicates = 0
+            changed = False
+
+            for article in articles:
+                headline = str(article.get("headline", ""))
+                normalized = normalize_headline(headline)
+                if not normalized:
+                    continue
+                fingerprint = simhash(normalized)
+                source = str(article.get("source", ""))
+
+                story = self._find_duplicate(stock_code, fingerprint)
+                if story is None:
+                    story_id = max(stories, default=0) + 1
+                    story = NewsStory(
+                        story_id=story_id,
+                        fingerprint=fingerprint,
+                        headline=headline,
+                        date=str(article.get("date") or today.strftime("%Y-%m-%d")),
+                        source=source,
+                        url=str(article.get("url", "")),
+                        first_seen=today.strftime("%Y-%m-%d")
+                    )
+                    stories[story_id] = story
+                    for band in _bands(fingerprint):
+                        index.setdefault(band, []).append(story_id)
+                    created.add(story_id)
+
+                if story.story_id in in_batch:
+                    duplicates += 1
+                else:
+                    in_batch.add(story.story_id)
+                    batch_order.append(story.story_id)
+                if source and source not in story.sources:
+                    story.sources.append(source)
+                    changed = True
+
+            result = []
+            for story_id in batch_order:
+                story = stories[story_id]
+                result.append({
+                    "date": story.date,
+                    "source": story.source,
+                    "headline": story.headline,
+                    "url": story.url,
+                    "story_id": story.story_id,
+                    "sources": list(story.sources),
+                    "is_new": story_id in created,
+                })
+
+            if self.persist and changed:
+                self.save(stock_code)
+
+        return NewsBatch(stories=result, duplicates=duplicates, new_stories=len(created))
+
+    # =========================================================================
+    # 헤드라인 점수 캐시
+    # =========================================================================
+
+    def _score_file(self) -> Path:
+        return self.store_dir / "_scores.json"
+
+    def _load_scores(self, version: str) -> Dict[str, float]:
+        """점수 캐시 로드 (키워드 사전 버전이 다르면 초기화)"""
+        if self._scores is None:
+            self._scores, self._score_version = {}, None
+            if self.persist and self._score_file().exists():
+                try:
+                    with open(self._score_file(), "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                    self._scores, self._score_version = data.get("scores", {}), data.get("version")
+                except Exception as e:
+                    self.logger.warning(f"헤드라인 점수 캐시 로드 실패: {e}")
+
+        if self._score_version != version:
+            self._scores, self._score_version = {}, version
+            self._unsaved_scores = 0
+        return self._scores
+
+    def score_headlines(
+        self,
+        headlines: Sequence[str],
+        scorer: Callable[[List[str]], List[float]],
+        version: str = ""
+    ) -> List[float]:
+        """
+        캐시된 헤드라인 점수 (없는 헤드라인만 scorer로 일괄 계산)
+
+        Args:
+            headlines: 헤드라인 목록
+            scorer: 헤드라인 목록 → 점수 목록
+            version: 키워드 사전 버전 (바뀌면 캐시 무효화)
+
+        Returns:
+            헤드라인 순서 점수 목록
+        """
+        keys = [headline_key(h) for h in headlines]
+        with self._lock:
+            scores = self._load_scores(version)
+            missing = list(dict.fromkeys(k for k in keys if k not in scores))
+            if missing:
+                by_key = {k: h for k, h in zip(keys, headlines)}
+                for key, score in zip(missing, scorer([by_key[k] for k in missing])):
+                    scores[key] = score
+                # 오래된 항목부터 제거 (삽입 순서)
+                for key in list(scores)[:max(0, len(scores) - self.max_cached_scores)]:
+                    del scores[key]
+                # 전체 캐시 파일 재기록은 새 점수가 모였을 때만
+                self._unsaved_scores += len(missing)
+                if self._unsaved_scores >= self.score_flush_every:
+                    self.flush()
+            return [scores[k] for k in keys]
+
+    def flush(self):
+        """기록되지 않은 헤드라인 점수를 캐시 파일에 저장"""
+        with self._lock:
+            if self.persist and self._unsaved_scores and self._scores is not None:
+                self._save_scores()
+            self._unsaved_scores = 0
+
+    # =========================================================================
+    # 저장
+    # =========================================================================
+
+    def _write_json(self, path: Path, data: Dict[str, object]):
+        try:
+            self.store_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = path.with_suffix(f".{threading.get_ident()}.tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            tmp_file.replace(path)
+        except Exception as e:
+            self.logger.warning(f"뉴스 저장소 저장 실패 ({path.name}): {e}")
+
+    def _save_scores(self):
+        self._write_json(self._score_file(), {"version": self._score_version, "scores": self._scores})
+
+    def save(self, stock_code: str):
+        """종목 스토리 저장"""
+        with self._lock:
+            stories = self._stories.get(stock_code, {})
+            self._write_json(self._story_file(stock_code), {
+                "stock_code": stock_code,
+                "updated_at": datetime.now().isoformat(),
+                "stories": [asdict(story) for story in stories.values()]
+            })
+
+    def stories(self, stock_code: str) -> List[NewsStory]:
+        """종목 저장 스토리 (ID 순)"""
+        with self._lock:
+            return [story for _, story in sorted(self._load_stories(stock_code).items())]
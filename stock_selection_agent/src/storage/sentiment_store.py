@@ -0,0 +1,424 @@
+"""
+Sentiment Store - 종목별 일별 뉴스 센티먼트 시계열 + 지수 감쇠 상태
+뉴스 분석마다 기사 원문에서 다시 계산하던 시간 가중 센티먼트/뉴스 볼륨을
+일별 집계(기사 수, 긍정/부정 수, 센티먼트 합)로 누적하고, 반감기별 감쇠 합을 증분 갱신해
+전 종목 뉴스 볼륨 급증(z-score)과 감쇠 센티먼트를 기사 재조회 없이 계산
+
+- 저장: data/sentiment_series/<종목코드>.bin (고정 길이 24바이트 일별 레코드 추가 기록)
+  같은 날을 여러 번 기록하면 마지막 레코드가 그날 집계
+- 감쇠 상태 (반감기 h일, λ = 0.5^(1/h), 기준일 t):
+  일수 W = Σλ^(t-d) (기사 없는 날 포함), 기사 수 N = Σλ^(t-d)·n_d, 제곱 Q = Σλ^(t-d)·n_d², 센티먼트 S = Σλ^(t-d)·s_d
+  다음 날로 이동은 λ^g 곱 + 등비합 1회, 지난 날 집계 수정은 λ^(t-d) 가중 차분 1회 (모두 O(1))
+  상태는 디스크에 두지 않고 로드 시 일별 집계로 1회 재구성 (반감기 설정 변경 자유)
+- 지표: 감쇠 센티먼트 S/N, 일평균 기사 수 N/W, 당일을 뺀 감쇠 평균/분산 대비 당일 기사 수 z-score
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+import logging
+import threading
+
+import numpy as np
+
+from .consensus_store import from_day, to_day
+
+
+DAILY_DTYPE = np.dtype([
+    ("day", "<i4"),  # 1970-01-01 이후 일수
+    ("count", "<i4"),  # 기사(스토리) 수
+    ("positive", "<i4"),  # 센티먼트 > 0.3
+    ("negative", "<i4"),  # 센티먼트 < -0.3
+    ("sentiment_sum", "<f8"),  # 기사 센티먼트 합
+])
+
+HALF_LIVES = (3.0, 10.0, 30.0)  # 기본 반감기 (일)
+SENTIMENT_THRESHOLD = 0.3  # 긍정/부정 기사 기준 (뉴스 분석과 동일)
+_WEIGHT, _COUNT, _COUNT_SQ, _SENTIMENT = range(4)  # 감쇠 상태 열
+
+
+def daily_aggregates(items: Sequence[Tuple[Any, float]]) -> np.ndarray:
+    """
+    기사 (날짜, 센티먼트) 목록 → 일별 집계 (날짜 오름차순 DAILY_DTYPE 배열)
+
+    Args:
+        items: [(YYYY-MM-DD 문자열/date, 센티먼트 -1 ~ 1)]
+    """
+    if not items:
+        return np.zeros(0, dtype=DAILY_DTYPE)
+    days = np.array([to_day(day) for day, _ in items], dtype=np.int64)
+    sentiments = np.array([float(sentiment) for _, sentiment in items], dtype=np.float64)
+    unique_days, inverse = np.unique(days, return_inverse=True)
+
+    records = np.zeros(len(unique_days), dtype=DAILY_DTYPE)
+    records["day"] = unique_days
+    records["count"] = np.bincount(inverse, minlength=len(unique_days))
+    records["positive"] = np.bincount(inverse, weights=sentiments > SENTIMENT_THRESHOLD, minlength=len(unique_days))
+    records["negative"] = np.bincount(inverse, weights=sentiments < -SENTIMENT_THRESHOLD, minlength=len(unique_days))
+    records["sentiment_sum"] = np.bincount(inverse, weights=sentiments, minlength=len(unique_days))
+    return records
+
+
+@dataclass
+class DecayState:
+    """
+    종목 1개 반감기별 감쇠 합 (기준일 day 기준)
+
+    sums[k] = [W, N, Q, S] (반감기 half_lives[k])
+    """
+    half_lives: Tuple[float, ...]
+    day: int = -1  # 기준일 (마지막 집계일, 이력 없으면 -1)
+    first_day: int = -1  # 첫 집계일
+    sums: Optional[np.ndarray] = None
+
+    def __post_init__(self):
+        self._lambda = 0.5 ** (1.0 / np.asarray(self.half_lives, dtype=np.float64))
+        if self.sums is None:
+            self.sums = np.zeros((len(self.half_lives), 4), dtype=np.float64)
+
+    @property
+    def empty(self) -> bool:
+        return self.day < 0
+
+    def advanced(self, day: int) -> np.ndarray:
+        """기준일 → day 이동한 감쇠 합 (사이 날짜는 기사 0건, 상태 불변)"""
+        gap = day - self.day
+        if self.empty or gap <= 0:
+            return self.sums.copy()
+        factor = self._lambda ** gap
+        sums = self.sums * factor[:, None]
+        sums[:, _WEIGHT] += (1.0 - factor) / (1.0 - self._lambda)  # day - gap + 1 ~ day 일수 가중치 합
+        return sums
+
+    def apply(self, day: int, old: np.void, new: np.void):
+        """
+        day 집계 old → new 반영 (O(1))
+
+        기준일 이후면 상태를 day로 이동, 이전이면 λ^(기준일 - day) 가중 차분
+        첫 집계일 이전 날짜면 그 사이 기사 없는 날의 일수 가중치도 추가
+        """
+        if self.empty:
+            self.day = self.first_day = day
+            self.sums[:, _WEIGHT] = 1.0
+        elif day > self.day:
+            self.sums = self.advanced(day)
+            self.day = day
+        elif day < self.first_day:
+            # first_day - 1 ~ day 일수 가중치: λ^(t - first_day + 1) + ... + λ^(t - day)
+            span = self.first_day - day
+            head = self._lambda ** (self.day - self.first_day + 1)
+            self.sums[:, _WEIGHT] += head * (1.0 - self._lambda ** span) / (1.0 - self._lambda)
+            self.first_day = day
+
+        weight = self._lambda ** (self.day - day)
+        old_count, new_count = float(old["count"]), float(new["count"])
+        self.sums[:, _COUNT] += weight * (new_count - old_count)
+        self.sums[:, _COUNT_SQ] += weight * (new_count ** 2 - old_count ** 2)
+        self.sums[:, _SENTIMENT] += weight * (float(new["sentiment_sum"]) - float(old["sentiment_sum"]))
+
+
+def fold_series(series: np.ndarray, half_lives: Sequence[float]) -> DecayState:
+    """일별 집계 (날짜 오름차순) → 감쇠 상태 (로드 시 재구성, O(일수))"""
+    state = DecayState(half_lives=tuple(half_lives))
+    if not len(series):
+        return state
+
+    state.day, state.first_day = int(series["day"][-1]), int(series["day"][0])
+    lam = state._lambda[:, None]
+    weights = lam ** (state.day - series["day"].astype(np.float64))[None, :]  # (반감기, 일)
+    counts = series["count"].astype(np.float64)
+    state.sums[:, _WEIGHT] = (1.0 - state._lambda ** (state.day - state.first_day + 1)) / (1.0 - state._lambda)
+    state.sums[:, _COUNT] = weights @ counts
+    state.sums[:, _COUNT_SQ] = weights @ counts ** 2
+    state.sums[:, _SENTIMENT] = weights @ series["sentiment_sum"]
+    return state
+
+
+@dataclass
+class SentimentSeriesMetrics:
+    """
+    뉴스 센티먼트 시계열 지표 (종목 순서 = codes)
+
+    값 없음은 NaN, volume_signal은 z-score 기준 "surge" / "above_normal" / "normal"
+    """
+    codes: List[str]
+    as_of: str
+    half_lives: Tuple[float, ...]
+    baseline_half_life: float
+    days_observed: np.ndarray  # 첫 집계일 ~ 기준일 일수 (이력 없으면 0)
+    last_date: List[Optional[str]]  # 마지막 기사 날짜
+    count_today: np.ndarray  # 기준일 기사 수
+    baseline_mean: np.ndarray  # 기준일 제외 감쇠 일평균 기사 수
+    baseline_std: np.ndarray  # 기준일 제외 감쇠 표준편차 (포아송 하한 √평균)
+    volume_zscore: np.ndarray
+    volume_signal: List[str]
+    decayed_sentiment: Dict[float, np.ndarray] = field(default_factory=dict)  # {반감기: 기사 수 가중 평균 센티먼트}
+    decayed_volume: Dict[float, np.ndarray] = field(default_factory=dict)  # {반감기: 감쇠 일평균 기사 수}
+    _index: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self):
+        self._index = {code: i for i, code in enumerate(self.codes)}
+
+    def index_of(self, stock_code: str) -> Optional[int]:
+        return self._index.get(stock_code)
+
+    def __contains__(self, stock_code: str) -> bool:
+        return stock_code in self._index
+
+    def to_dict(self, stock_code: str) -> Optional[Dict[str, Any]]:
+        """종목 1개 결과 (값 없음은 None, 이력 없는 종목은 None)"""
+        row = self.index_of(stock_code)
+        if row is None or self.days_observed[row] == 0:
+            return None
+
+        def value(values, digits=3):
+            v = values[row]
+            return None if np.isnan(v) else round(float(v), digits)
+
+        return {
+            "days_observed": int(self.days_observed[row]),
+            "last_date": self.last_date[row],
+            "count_today": int(self.count_today[row]),
+            "baseline_mean": value(self.baseline_mean),
+            "baseline_std": value(self.baseline_std),
+            "volume_zscore": value(self.volume_zscore, 2),
+            "volume_signal": self.volume_signal[row],
+            "decayed_sentiment": {h: value(v) for h, v in self.decayed_sentiment.items()},
+            "decayed_volume": {h: value(v) for h, v in self.decayed_volume.items()},
+        }
+
+
+class SentimentSeriesStore:
+    """
+    종목별 일별 뉴스 센티먼트 저장소 (추가 기록 전용, 스레드 안전)
+
+    사용법:
+        store = SentimentSeriesStore()
+        store.add("005930", [("2026-10-18", 0.6), ("2026-10-17", -0.2)])   # 새 기사만 누적
+        metrics = store.metrics(["005930", "000660"])                       # 기사 재조회 없이 전 종목
+        metrics.to_dict("005930")["volume_signal"]
+    """
+
+    def __init__(
+        self,
+        store_dir: Optional[Path] = None,
+        half_lives: Sequence[float] = HALF_LIVES,
+        persist: bool = True
+    ):
+        """
+        Args:
+            store_dir: 저장 경로 (None이면 data/sentiment_series)
+            half_lives: 감쇠 상태를 유지할 반감기 (일)
+            persist: 디스크 저장 여부
+        """
+        self.store_dir = store_dir or Path(__file__).parent.parent.parent / "data" / "sentiment_series"
+        self.half_lives = tuple(sorted(set(float(h) for h in half_lives)))
+        self.persist = persist
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self._series: Dict[str, np.ndarray] = {}  # 종목코드 -> 일별 집계 (날짜 오름차순)
+        self._states: Dict[str, DecayState] = {}  # 종목코드 -> 마지막 집계일 기준 감쇠 상태
+
+    def _series_file(self, stock_code: str) -> Path:
+        return self.store_dir / f"{stock_code}.bin"
+
+    def _load(self, stock_code: str) -> np.ndarray:
+        """종목 일별 집계 + 감쇠 상태 로드 (메모리 → 디스크, 잠금 보유 상태에서 호출)"""
+        if stock_code in self._series:
+            return self._series[stock_code]
+
+        records = np.zeros(0, dtype=DAILY_DTYPE)
+        series_file = self._series_file(stock_code)
+        if self.persist and series_file.exists():
+            try:
+                raw = series_file.read_bytes()
+                complete = len(raw) - len(raw) % DAILY_DTYPE.itemsize  # 중단된 마지막 기록 무시
+                records = np.frombuffer(raw[:complete], dtype=DAILY_DTYPE).copy()
+            except Exception as e:
+                self.logger.warning(f"센티먼트 시계열 로드 실패 ({stock_code}): {e}")
+
+        if len(records) > 1:
+            order = np.argsort(records["day"], kind="stable")
+            records = records[order]
+            last = np.ones(len(records), dtype=bool)
+            last[:-1] = records["day"][1:] != records["day"][:-1]
+            records = records[last]
+
+        self._series[stock_code] = records
+        self._states[stock_code] = fold_series(records, self.half_lives)
+        return records
+
+    def add(
+        self,
+        stock_code: str,
+        items: Sequence[Tuple[Any, float]],
+        replace: bool = False
+    ) -> int:
+        """
+        기사 센티먼트 누적
+
+        Args:
+            stock_code: 종목코드
+            items: [(날짜, 센티먼트)]
+            replace: False면 새 기사로 보고 그날 집계에 더함 (중복 제거된 새 스토리)
+                     True면 이번 수집의 그날 집계로 교체 (중복 제거 없이 매번 전체 기사를 넘길 때,
+                     조회 범위가 잘려 기사 수가 줄어든 날은 유지)
+
+        Returns:
+            변경된 날짜 수
+        """
+        batch = daily_aggregates(items)
+        if not len(batch):
+            return 0
+
+        with self._lock:
+            series = self._load(stock_code)
+            state = self._states[stock_code]
+            positions = np.searchsorted(series["day"], batch["day"])
+            empty = np.zeros(1, dtype=DAILY_DTYPE)[0]
+
+            changed = []
+            for record, position in zip(batch, positions):
+                exists = position < len(series) and series["day"][position] == record["day"]
+                old = series[position] if exists else empty
+                if replace:
+                    if old["count"] > record["count"]:
+                        continue
+                    new = record.copy()
+                else:
+                    new = record.copy()
+                    for name in ("count", "positive", "negative", "sentiment_sum"):
+                        new[name] = old[name] + record[name]
+                if exists and new.tobytes() == old.tobytes():
+                    continue
+                state.apply(int(new["day"]), old, new)
+                changed.append(new)
+
+            if not changed:
+                return 0
+            updates = np.array(changed, dtype=DAILY_DTYPE)
+
+            if self.persist:
+                try:
+                    self.store_dir.mkdir(parents=True, exist_ok=True)
+                    with open(self._series_file(stock_code), "ab") as f:
+                        f.write(updates.tobytes())
+                except Exception as e:
+                    self.logger.warning(f"센티먼트 시계열 저장 실패 ({stock_code}): {e}")
+
+            merged = np.concatenate([series[~np.isin(series["day"], updates["day"])], updates])
+            self._series[stock_code] = merged[np.argsort(merged["day"], kind="stable")]
+        return len(changed)
+
+    def series(self, stock_code: str) -> np.ndarray:
+        """종목 일별 집계 (날짜 오름차순 DAILY_DTYPE 배열)"""
+        with self._lock:
+            return self._load(stock_code).copy()
+
+    def state(self, stock_code: str) -> DecayState:
+        """종목 감쇠 상태 사본 (마지막 집계일 기준)"""
+        with self._lock:
+            self._load(stock_code)
+            state = self._states[stock_code]
+            return DecayState(half_lives=state.half_lives, day=state.day,
+                              first_day=state.first_day, sums=state.sums.copy())
+
+    def covered_stocks(self) -> List[str]:
+        """시계열이 있는 종목코드 (디스크 + 메모리)"""
+        codes = set(code for code, records in self._series.items() if len(records))
+        if self.persist and self.store_dir.exists():
+            codes.update(path.stem for path in self.store_dir.glob("*.bin"))
+        return sorted(codes)
+
+    def metrics(
+        self,
+        stock_codes: Optional[Sequence[str]] = None,
+        as_of: Union[str, date, datetime, None] = None,
+        baseline_half_life: Optional[float] = None,
+        surge_z: float = 3.0,
+        above_normal_z: float = 1.5,
+        min_history_days: int = 14
+    ) -> SentimentSeriesMetrics:
+        """
+        감쇠 센티먼트 + 뉴스 볼륨 z-score (종목당 O(1), 기사 재조회 없음)
+
+        Args:
+            stock_codes: 종목코드 (None이면 시계열 있는 전 종목)
+            as_of: 기준일 (None이면 오늘, 마지막 집계일 이후만 O(1)이며 이전이면 일별 집계로 재구성)
+            baseline_half_life: 볼륨 기준선 반감기 (None이면 가장 긴 반감기)
+            surge_z: "surge" z-score 기준
+            above_normal_z: "above_normal" z-score 기준
+            min_history_days: z-score 계산 최소 이력 일수 (미만이면 NaN, "normal")
+        """
+        codes = list(stock_codes) if stock_codes is not None else self.covered_stocks()
+        as_of_day = to_day(as_of)
+        baseline = self.half_lives[-1] if baseline_half_life is None else float(baseline_half_life)
+        if baseline not in self.half_lives:
+            raise ValueError(f"감쇠 상태가 없는 반감기: {baseline} (설정 {self.half_lives})")
+
+        n = len(codes)
+        sums = np.zeros((n, len(self.half_lives), 4), dtype=np.float64)
+        first_day = np.full(n, -1, dtype=np.int64)
+        count_today = np.zeros(n, dtype=np.float64)
+        last_date: List[Optional[str]] = [None] * n
+
+        with self._lock:
+            for i, code in enumerate(codes):
+                series = self._load(code)
+                state = self._states[code]
+                if state.day > as_of_day:
+                    series = series[series["day"] <= as_of_day]
+                    state = fold_series(series, self.half_lives)
+                if state.empty:
+                    continue
+                sums[i] = state.advanced(as_of_day)
+                first_day[i] = state.first_day
+                last_date[i] = from_day(state.day)
+                if state.day == as_of_day:
+                    count_today[i] = float(series["count"][-1])
+
+        observed = first_day >= 0
+        days_observed = np.where(observed, as_of_day - first_day + 1, 0)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            decayed_sentiment = {
+                h: np.where(sums[:, k, _COUNT] > 1e-12, sums[:, k, _SENTIMENT] / sums[:, k, _COUNT], np.nan)
+                for k, h in enumerate(self.half_lives)
+            }
+            decayed_volume = {
+                h: np.where(observed, sums[:, k, _COUNT] / sums[:, k, _WEIGHT], np.nan)
+                for k, h in enumerate(self.half_lives)
+            }
+
+            # 기준일을 뺀 감쇠 평균/분산 (기준일 가중치 1)
+            base = sums[:, self.half_lives.index(baseline)]
+            weight = base[:, _WEIGHT] - 1.0
+            mean = (base[:, _COUNT] - count_today) / weight
+            variance = (base[:, _COUNT_SQ] - count_today ** 2) / weight - mean ** 2
+            std = np.sqrt(np.maximum(variance, mean))  # 포아송 하한 (기사 적은 종목 z-score 과대 방지)
+            valid = observed & (days_observed >= min_history_days) & (weight > 1e-9) & (std > 1e-9)
+            mean = np.where(valid, mean, np.nan)
+            std = np.where(valid, std, np.nan)
+            zscore = np.where(valid, (count_today - mean) / std, np.nan)
+
+        signal = np.full(n, "normal", dtype=object)
+        signal[np.nan_to_num(zscore, nan=-np.inf) >= above_normal_z] = "above_normal"
+        signal[np.nan_to_num(zscore, nan=-np.inf) >= surge_z] = "surge"
+
+        return SentimentSeriesMetrics(
+            codes=codes,
+            as_of=from_day(as_of_day),
+            half_lives=self.half_lives,
+            baseline_half_life=baseline,
+            days_observed=days_observed,
+            last_date=last_date,
+            count_today=count_today.astype(np.int64),
+            baseline_mean=mean,
+            baseline_std=std,
+            volume_zscore=zscore,
+            volume_signal=signal.tolist(),
+            decayed_sentiment=decayed_sentiment,
+            decayed_volume=decayed_volume
+        )
@@ -4,10 +4,22 @@ Utility modules for stock selection agent
 
 from .serializers import dataclass_to_dict, format_currency, format_percentage
 from .output_writer import DetailedOutputWriter
+from .history_planner import HistoryPlanner, HistoryView, calendar_start_for_bars
+from .keyword_automaton import KeywordAutomaton, KeywordMatrix
+from .html_parser import HtmlParseCache, parse_html
+from .liquidity_provider import LiquidityProvider
 
 __all__ = [
     "dataclass_to_dict",
     "format_currency",
     "format_percentage",
     "DetailedOutputWriter",
+    "HistoryPlanner",
+    "HistoryView",
+    "calendar_start_for_bars",
+    "KeywordAutomaton",
+    "KeywordMatrix",
+    "HtmlParseCache",
+    "parse_html",
+    "LiquidityProvider",
 ]
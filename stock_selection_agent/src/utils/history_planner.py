@@ -0,0 +1,145 @@
+"""
+History Planner - 에이전트 공용 가격 히스토리 조회 계획
+각 에이전트가 필요한 봉 수를 선언하면 최대 구간을 한 번만 조회하고
+에이전트별로 복사 없는 뷰(HistoryView)를 나누어 준다.
+"""
+
+from typing import Dict, List, Any, Optional, Sequence
+from datetime import datetime, timedelta
+import logging
+
+
+def calendar_start_for_bars(n_bars: int, end_date: str) -> str:
+    """
+    n_bars 거래일을 포함하도록 여유를 둔 달력 기준 시작일
+
+    Args:
+        n_bars: 필요한 거래일 수
+        end_date: 종료일 (YYYYMMDD)
+
+    Returns:
+        시작일 (YYYYMMDD)
+    """
+    end_dt = datetime.strptime(end_date, "%Y%m%d")
+    # 연 252거래일 ≒ 365달력일, 연휴 여유분 포함
+    calendar_days = int(n_bars * 365 / 252) + 15
+    return (end_dt - timedelta(days=calendar_days)).strftime("%Y%m%d")
+
+
+class HistoryView(Sequence):
+    """
+    가격 히스토리 리스트의 읽기 전용 뷰 (복사 없음)
+
+    리스트와 같이 인덱싱/슬라이싱/반복이 가능하며,
+    연속 슬라이스는 원본을 공유하는 HistoryView로 반환된다.
+    """
+
+    __slots__ = ("_base", "_start", "_stop")
+
+    def __init__(self, base: List[Dict[str, Any]], start: int = 0, stop: Optional[int] = None):
+        self._base = base
+        self._start = max(0, start)
+        self._stop = len(base) if stop is None else max(self._start, min(stop, len(base)))
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return HistoryView(self._base, self._start + start, self._start + max(start, stop))
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("HistoryView index out of range")
+        return self._base[self._start + index]
+
+    def __iter__(self):
+        for i in range(self._start, self._stop):
+            yield self._base[i]
+
+    def __repr__(self) -> str:
+        return f"HistoryView(len={len(self)})"
+
+
+class HistoryPlanner:
+    """
+    가격 히스토리 조회 계획
+
+    에이전트는 required_history_bars()로 필요한 봉 수를 선언한다.
+    플래너는 등록된 에이전트의 최댓값만큼 한 번 조회하고, slice_for()로
+    에이전트별 최근 구간 뷰를 돌려준다.
+
+    사용법:
+        planner = HistoryPlanner(krx_client, [technical_agent, risk_agent])
+        history = planner.fetch("005930")
+        technical_agent.analyze("005930", price_history=planner.slice_for(history, technical_agent))
+    """
+
+    def __init__(self, krx_client, agents: Optional[Sequence[Any]] = None):
+        """
+        Args:
+            krx_client: KRX 데이터 클라이언트
+            agents: required_history_bars()를 제공하는 에이전트 목록
+        """
+        self.krx = krx_client
+        self.logger = logging.getLogger(__name__)
+        self._requirements: Dict[str, int] = {}
+
+        for agent in agents or []:
+            self.register(agent)
+
+    def register(self, agent: Any, bars: Optional[int] = None) -> None:
+        """
+        에이전트 히스토리 요구량 등록
+
+        Args:
+            agent: 에이전트 (bars 미지정 시 required_history_bars() 사용)
+            bars: 필요한 봉 수 직접 지정
+        """
+        if agent is None:
+            return
+        if bars is None:
+            bars = agent.required_history_bars()
+        self._requirements[type(agent).__name__] = int(bars)
+
+    @property
+    def max_bars(self) -> int:
+        """등록된 요구량 중 최댓값"""
+        return max(self._requirements.values(), default=0)
+
+    def fetch(self, stock_code: str, end_date: Optional[str] = None) -> HistoryView:
+        """
+        최대 요구 구간을 한 번만 조회
+
+        Args:
+            stock_code: 종목코드
+            end_date: 종료일 (YYYYMMDD, 기본: 최근 거래일)
+
+        Returns:
+            전체 조회 구간 뷰
+        """
+        if not end_date:
+            end_date = self.krx._get_latest_trade_date()
+        start_date = calendar_start_for_bars(self.max_bars, end_date)
+
+        history = self.krx.get_stock_price_history(stock_code, start_date=start_date, end_date=end_date)
+        self.logger.debug(f"{stock_code} 히스토리 {len(history)}봉 조회 (요구량 {self.max_bars}봉)")
+        return HistoryView(history or [])
+
+    def slice_for(self, history: Sequence[Dict[str, Any]], agent: Any) -> HistoryView:
+        """
+        에이전트 요구량만큼의 최근 구간 뷰
+
+        Args:
+            history: fetch() 결과
+            agent: 대상 에이전트
+        """
+        bars = self._requirements.get(type(agent).__name__)
+        if bars is None:
+            bars = agent.required_history_bars()
+        view = history if isinstance(history, HistoryView) else HistoryView(history)
+        return view[-bars:] if bars < len(view) else view
@@ -0,0 +1,135 @@
+"""
+HTML Parser - 스크래핑 페이지 부분 파싱 + 결과 캐시
+페이지 전체 BeautifulSoup 트리를 만들지 않고 필요한 영역(클래스 기준)만 BeautifulSoup으로 만들며,
+추출 결과를 페이지 본문 해시로 캐시해 같은 페이지는 다시 파싱하지 않음
+
+- 부분 파싱: lxml(C)로 문서를 파싱해 XPath로 대상 요소만 골라 그 하위 트리만 BeautifulSoup 변환
+  (lxml 미설치/파싱 실패 시 html.parser + SoupStrainer)
+- 결과 캐시: (본문 SHA-1, 추출기 객체 또는 지정 이름) → 추출 결과 (LRU)
+"""
+
+from typing import Any, Callable, Optional, Tuple
+from collections import OrderedDict
+import copy
+import hashlib
+import threading
+
+# 외부 라이브러리 (선택적 import)
+try:
+    from bs4 import BeautifulSoup, SoupStrainer
+    BS4_AVAILABLE = True
+except ImportError:
+    BS4_AVAILABLE = False
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+
+HTML_FEATURES = "lxml" if LXML_AVAILABLE else "html.parser"
+
+
+def class_strainer(*classes: str) -> "SoupStrainer":
+    """지정 클래스 중 하나를 가진 요소만 남기는 SoupStrainer (다중 클래스 속성 포함)"""
+    targets = set(classes)
+
+    def match(value):
+        if not value:
+            return False
+        names = value.split() if isinstance(value, str) else value
+        return not targets.isdisjoint(names)
+
+    return SoupStrainer(class_=match)
+
+
+def _class_fragments(text: str, classes: Tuple[str, ...]) -> str:
+    """lxml로 지정 클래스 요소(중첩 시 가장 바깥 요소)만 HTML 조각으로 추출"""
+    doc = lxml_html.document_fromstring(text)
+    condition = " or ".join(
+        f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')" for name in classes
+    )
+    elements = doc.xpath(f"//*[@class][{condition}]")
+    matched = set(elements)
+    outermost = [el for el in elements if not any(parent in matched for parent in el.iterancestors())]
+    return "".join(etree.tostring(el, encoding="unicode", with_tail=False) for el in outermost)
+
+
+def parse_html(text: str, classes: Optional[Tuple[str, ...]] = None) -> "BeautifulSoup":
+    """
+    HTML 파싱 (classes 지정 시 해당 클래스 요소 하위 트리만)
+
+    Args:
+        text: HTML 본문
+        classes: 남길 요소 클래스 (None이면 전체)
+
+    Returns:
+        BeautifulSoup
+    """
+    if not classes:
+        return BeautifulSoup(text, HTML_FEATURES)
+
+    if LXML_AVAILABLE:
+        try:
+            return BeautifulSoup(_class_fragments(text, classes), "lxml")
+        except (ValueError, etree.ParserError):
+            pass  # 인코딩 선언 포함 문자열, 빈 문서 등은 SoupStrainer로 처리
+
+    return BeautifulSoup(text, HTML_FEATURES, parse_only=class_strainer(*classes))
+
+
+class HtmlParseCache:
+    """
+    페이지 해시 키 추출 결과 캐시 (스레드 안전)
+
+    추출기는 HTML 본문 → 일반 파이썬 값(list/dict) 함수이며 결과는 복사본으로 반환한다.
+
+    사용법:
+        cache = HtmlParseCache()
+        rows = cache.extract(page.text, parse_news_rows)
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, Any], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def page_hash(text: str) -> str:
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    def extract(self, text: str, extractor: Callable[[str], Any], name: Optional[str] = None) -> Any:
+        """
+        추출 결과 조회 (없으면 추출 후 저장)
+
+        Args:
+            text: HTML 본문
+            extractor: 추출 함수
+            name: 캐시 키 이름 (미입력시 추출기 객체 자체, 이름이 같은 람다/클로저도 구분)
+
+        Returns:
+            추출 결과 복사본
+        """
+        # 캐시 항목이 추출기 참조를 유지하므로 id 재사용으로 인한 충돌 없음
+        key = (self.page_hash(text), name if name is not None else extractor)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(self._entries[key])
+            self.misses += 1
+
+        result = extractor(text)
+        with self._lock:
+            self._entries[key] = result
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return copy.deepcopy(result)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
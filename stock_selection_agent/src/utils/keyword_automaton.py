@@ -0,0 +1,198 @@
+"""
+Keyword Automaton - 다중 키워드 동시 검색 (Aho-Corasick)
+키워드 사전을 한 번 오토마톤으로 컴파일하고 텍스트를 한 번만 훑어
+포함된 모든 키워드(겹치거나 다른 키워드에 포함된 키워드 포함)와 가중치를 반환
+
+실패 링크를 미리 펼친 전이표(DFA)를 만들어 문자당 dict 조회 1회로 진행한다.
+대량 텍스트는 키워드-문서 희소 행렬(KeywordMatrix)로 만들어 점수를 행렬-벡터 곱 한 번으로 계산한다.
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from dataclasses import dataclass
+
+import numpy as np
+
+# 외부 라이브러리 (선택적 import)
+try:
+    from scipy import sparse
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+
+@dataclass
+class KeywordMatrix:
+    """
+    문서 × 키워드 포함 여부 희소 행렬 (CSR 형식, 값은 모두 1)
+
+    행 i의 키워드 번호는 indices[indptr[i]:indptr[i + 1]] (사전 순서)이며,
+    가중치를 바꿔 점수를 다시 계산해도 텍스트를 다시 훑지 않는다 (가중치 보정용).
+    """
+    indptr: np.ndarray  # (문서 수 + 1,) int64
+    indices: np.ndarray  # (포함 수,) int32 키워드 번호
+    n_keywords: int
+
+    @property
+    def n_documents(self) -> int:
+        return len(self.indptr) - 1
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.n_documents, self.n_keywords
+
+    @property
+    def row_ids(self) -> np.ndarray:
+        """포함 항목별 문서 번호 (COO 행)"""
+        return np.repeat(np.arange(self.n_documents), np.diff(self.indptr))
+
+    def dot(self, weights: Sequence[float]) -> np.ndarray:
+        """문서별 가중치 합 (X · w)"""
+        values = np.asarray(weights, dtype=np.float64)[self.indices]
+        return np.bincount(self.row_ids, weights=values, minlength=self.n_documents)
+
+    def rdot(self, values: Sequence[float]) -> np.ndarray:
+        """키워드별 문서 값 합 (Xᵀ · v, 예: 잔차 → 키워드 가중치 기울기)"""
+        per_entry = np.asarray(values, dtype=np.float64)[self.row_ids]
+        return np.bincount(self.indices, weights=per_entry, minlength=self.n_keywords)
+
+    def document_frequency(self) -> np.ndarray:
+        """키워드별 포함 문서 수"""
+        return np.bincount(self.indices, minlength=self.n_keywords)
+
+    def to_dense(self) -> np.ndarray:
+        dense = np.zeros(self.shape, dtype=np.int8)
+        dense[self.row_ids, self.indices] = 1
+        return dense
+
+    def to_scipy(self):
+        """scipy.sparse.csr_matrix 변환 (scipy 설치 시)"""
+        if not SCIPY_AVAILABLE:
+            raise ImportError("scipy 라이브러리가 필요합니다.")
+        data = np.ones(len(self.indices), dtype=np.float64)
+        return sparse.csr_matrix((data, self.indices, self.indptr), shape=self.shape)
+
+
+class KeywordAutomaton:
+    """
+    가중치 키워드 오토마톤
+
+    점수는 텍스트에 한 번 이상 등장한 키워드 가중치의 합이며
+    (같은 키워드 반복은 1회), `keyword in text` 순차 검사와 결과가 같다.
+
+    사용법:
+        automaton = KeywordAutomaton.from_dicts(positive_keywords, negative_keywords)
+        automaton.score("흑자 전환 및 사상 최대 실적")     # 0.9 + 0.8 → 1.0 (clip)
+        automaton.score_many(headlines)                   # 헤드라인 일괄
+        automaton.matrix(headlines).dot(automaton.weights) # 대량 텍스트 (희소 행렬, clip 전)
+    """
+
+    def __init__(self, keywords: Dict[str, float]):
+        """
+        Args:
+            keywords: {키워드: 가중치} (빈 키워드 무시)
+        """
+        self.keywords: List[str] = [k for k in keywords if k]
+        self.weights: List[float] = [keywords[k] for k in self.keywords]
+        self._transitions: List[Dict[str, int]] = [{}]
+        self._outputs: List[Tuple[int, ...]] = [()]
+        self._compile()
+
+    @classmethod
+    def from_dicts(cls, *dicts: Dict[str, float]) -> "KeywordAutomaton":
+        """여러 사전 병합 (같은 키워드는 가중치 합산, 먼저 나온 사전 순서 유지)"""
+        merged: Dict[str, float] = {}
+        for d in dicts:
+            for keyword, weight in d.items():
+                merged[keyword] = merged.get(keyword, 0) + weight
+        return cls(merged)
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def _compile(self) -> None:
+        """트라이 → 실패 링크 → 전이표 (너비 우선)"""
+        goto: List[Dict[str, int]] = [{}]
+        own: List[List[int]] = [[]]
+        for pattern_id, keyword in enumerate(self.keywords):
+            state = 0
+            for ch in keyword:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    own.append([])
+                state = nxt
+            own[state].append(pattern_id)
+
+        fail = [0] * len(goto)
+        transitions: List[Dict[str, int]] = [dict(goto[0])] + [{} for _ in range(len(goto) - 1)]
+        outputs: List[Tuple[int, ...]] = [()] * len(goto)
+
+        queue = list(goto[0].values())
+        for state in queue:
+            outputs[state] = tuple(own[state])
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            # 실패 상태의 전이를 물려받고 자기 전이로 덮어씀
+            table = dict(transitions[fail[state]])
+            for ch, child in goto[state].items():
+                table[ch] = child
+                fail[child] = transitions[fail[state]].get(ch, 0)
+                outputs[child] = tuple(own[child]) + outputs[fail[child]]
+                queue.append(child)
+            transitions[state] = table
+
+        self._transitions = transitions
+        self._outputs = outputs
+
+    def match_ids(self, text: str) -> List[int]:
+        """텍스트에 포함된 키워드 번호 (중복 제거, 사전 순서)"""
+        transitions = self._transitions
+        outputs = self._outputs
+        found = set()
+        state = 0
+        for ch in text:
+            state = transitions[state].get(ch, 0)
+            if outputs[state]:
+                found.update(outputs[state])
+        return sorted(found)
+
+    def find(self, text: str) -> List[Tuple[str, float]]:
+        """텍스트에 포함된 (키워드, 가중치) 목록 (사전 순서)"""
+        return [(self.keywords[i], self.weights[i]) for i in self.match_ids(text)]
+
+    def score(self, text: str, clip: float = 1.0) -> float:
+        """포함된 키워드 가중치 합 ([-clip, clip] 범위로 제한)"""
+        total = 0
+        for i in self.match_ids(text):
+            total += self.weights[i]
+        return max(-clip, min(clip, total))
+
+    def score_many(self, texts: Iterable[str], clip: float = 1.0) -> List[float]:
+        """여러 텍스트 일괄 점수"""
+        return [self.score(text, clip) for text in texts]
+
+    def matrix(self, texts: Iterable[str]) -> KeywordMatrix:
+        """텍스트별 포함 키워드 → 문서 × 키워드 희소 행렬 (텍스트당 1회 탐색)"""
+        indptr = [0]
+        indices: List[int] = []
+        for text in texts:
+            indices.extend(self.match_ids(text))
+            indptr.append(len(indices))
+        return KeywordMatrix(
+            indptr=np.asarray(indptr, dtype=np.int64),
+            indices=np.asarray(indices, dtype=np.int32),
+            n_keywords=len(self.keywords)
+        )
+
+    def score_matrix(
+        self,
+        matrix: KeywordMatrix,
+        weights: Optional[Sequence[float]] = None,
+        clip: float = 1.0
+    ) -> np.ndarray:
+        """희소 행렬 점수 (weights 미입력시 사전 가중치, [-clip, clip] 범위로 제한)"""
+        return np.clip(matrix.dot(self.weights if weights is None else weights), -clip, clip)
@@ -0,0 +1,158 @@
+"""
+Liquidity Provider - 에이전트 공용 유니버스 유동성 조회
+스크리닝 유동성 필터와 리스크 분석이 같은 등급 기준/유통비율/캐시로
+유니버스 유동성 지표(LiquidityMetrics)를 거래일별 한 번만 계산하도록 묶는다.
+
+- get(): 거래일 스냅샷 패널 + 시가총액 스냅샷(상장주식수)으로 직접 조회 (시장별)
+- compute(): 호출자가 구성한 패널로 계산 (RiskAgent.scan_liquidity)
+- lookup(): 같은 거래일에 계산된 지표에서 종목 조회 (RiskAgent 단일 종목 분석)
+"""
+
+from typing import Any, Dict, Optional, Sequence, Tuple
+from collections import OrderedDict
+import logging
+
+import numpy as np
+
+from ..analytics.liquidity import LiquidityMetrics, LiquidityThresholds, compute_liquidity_metrics
+from ..models.panel import PricePanel
+
+
+class LiquidityProvider:
+    """
+    유니버스 유동성 공용 조회 (거래일별 LRU 캐시)
+
+    사용법:
+        provider = LiquidityProvider(krx_client, thresholds=risk_agent._liquidity_thresholds())
+        screening_agent = ScreeningAgent(krx_client, liquidity_provider=provider)
+        liquidity = provider.get(market="KOSPI")
+    """
+
+    def __init__(
+        self,
+        krx_client,
+        thresholds: Optional[LiquidityThresholds] = None,
+        free_float: Optional[Dict[str, float]] = None,
+        max_entries: int = 16
+    ):
+        """
+        Args:
+            krx_client: KRX 데이터 클라이언트
+            thresholds: ADTV 등급 기준 (기본: RiskAnalysisConfig와 같은 기본값)
+            free_float: {종목코드: 유통주식 비율 (0~1)} (없으면 상장주식수 기준 회전율)
+            max_entries: 보관할 (거래일, 대상) 결과 수 상한
+        """
+        self.krx = krx_client
+        self.thresholds = thresholds or LiquidityThresholds()
+        self.free_float: Dict[str, float] = dict(free_float or {})
+        self.max_entries = max_entries
+        self.logger = logging.getLogger(__name__)
+        # (거래일, 시장 또는 종목코드 튜플) -> 유동성
+        self._entries: "OrderedDict[Tuple[str, Any], LiquidityMetrics]" = OrderedDict()
+
+    def _cached(self, key: Tuple[str, Any]) -> Optional[LiquidityMetrics]:
+        metrics = self._entries.get(key)
+        if metrics is not None:
+            self._entries.move_to_end(key)
+        return metrics
+
+    def _remember(self, key: Tuple[str, Any], metrics: LiquidityMetrics) -> None:
+        self._entries[key] = metrics
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def set_free_float(self, free_float: Dict[str, float]) -> None:
+        """유통주식 비율 갱신 (회전율이 바뀌므로 캐시 초기화)"""
+        self.free_float = dict(free_float)
+        self._entries.clear()
+
+    def _ratios(self, codes: Sequence[str], free_float: Optional[Dict[str, float]]) -> Optional[list]:
+        ratios = self.free_float if free_float is None else free_float
+        return [ratios.get(code, np.nan) for code in codes] if ratios else None
+
+    def compute(
+        self,
+        panel: PricePanel,
+        shares_outstanding: Optional[Dict[str, float]] = None,
+        free_float: Optional[Dict[str, float]] = None
+    ) -> LiquidityMetrics:
+        """
+        시세 패널로 유동성 계산 (같은 거래일/종목 구성은 캐시)
+
+        Args:
+            panel: 시세 패널 (거래량/거래대금 포함, 253봉 권장)
+            shares_outstanding: {종목코드: 상장주식수}
+            free_float: {종목코드: 유통주식 비율} (없으면 공용 유통비율)
+        """
+        key = (panel.dates[-1] if panel.dates else "", tuple(panel.codes))
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+
+        shares = None if shares_outstanding is None else [shares_outstanding.get(c, np.nan) for c in panel.codes]
+        metrics = compute_liquidity_metrics(
+            panel, shares, self._ratios(panel.codes, free_float), thresholds=self.thresholds
+        )
+        self._remember(key, metrics)
+        return metrics
+
+    def get(
+        self,
+        trade_date: Optional[str] = None,
+        market: str = "ALL",
+        n_bars: int = 253
+    ) -> Optional[LiquidityMetrics]:
+        """
+        시장 전 종목 유동성 (거래일 스냅샷 패널 + 상장주식수, (거래일, 시장)별 캐시)
+
+        Args:
+            trade_date: 기준 거래일 (기본: 최근 거래일)
+            market: 시장 구분 ("ALL", "KOSPI", "KOSDAQ")
+            n_bars: 패널 거래일 수 (252일 수익률 + 1)
+
+        Returns:
+            LiquidityMetrics (조회 실패 시 None)
+        """
+        market = market.upper()
+        trade_date = trade_date or self.krx._get_latest_trade_date()
+        cached = self._cached((trade_date, market))
+        if cached is not None:
+            return cached
+
+        try:
+            panel = self.krx.get_ohlcv_panel(None, n_bars=n_bars, end_date=trade_date, market=market)
+            if not panel.dates:
+                self.logger.warning("유동성 계산용 시세 패널이 비어 있음")
+                return None
+
+            as_of = panel.dates[-1]
+            cached = self._cached((as_of, market))
+            if cached is None:
+                shares = None
+                try:
+                    caps = self.krx.get_market_cap_snapshot(as_of, market)
+                    if caps is not None and "상장주식수" in caps.columns:
+                        shares = caps["상장주식수"].reindex(panel.codes).to_numpy(dtype=float)
+                except Exception as e:
+                    self.logger.warning(f"{as_of} 상장주식수 조회 실패, 회전율 미산출: {e}")
+
+                cached = compute_liquidity_metrics(
+                    panel, shares, self._ratios(panel.codes, None), thresholds=self.thresholds
+                )
+                self._remember((as_of, market), cached)
+
+            # 요청일이 휴장일이면 직전 거래일 결과와 같은 객체로 캐시
+            self._remember((trade_date, market), cached)
+            return cached
+
+        except Exception as e:
+            self.logger.error(f"유니버스 유동성 계산 실패: {e}")
+            return None
+
+    def lookup(self, trade_date: str, stock_code: str) -> Optional[LiquidityMetrics]:
+        """같은 거래일에 계산된 유동성 중 종목을 포함하는 결과 (없으면 None)"""
+        for metrics in reversed(self._entries.values()):
+            if metrics.trade_date == trade_date and stock_code in metrics:
+                return metrics
+        return None
@@ -0,0 +1,140 @@
+"""
+지표 알림 엔진 검증 (합성 패널, 네트워크 불필요)
+증분 평가 결과가 일괄 스캔과 같은지, 바뀐 상태만 알림하는지 확인
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+
+from src.api.krx_client import KrxClient
+from src.agents.technical_agent import TechnicalAgent, TechnicalAnalysisConfig
+from src.analytics.alerts import AlertEngine, AlertRule
+from src.models.panel import PricePanel
+
+
+def _make_panel(n_dates: int = 130, n_codes: int = 40, seed: int = 7) -> PricePanel:
+    """랜덤워크 합성 패널 (일부 종목은 신규상장으로 히스토리가 짧음)"""
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(0.0005, 0.02, size=(n_dates, n_codes))
+    close = np.round(10000 * np.exp(np.cumsum(returns, axis=0)))
+    volume = np.round(rng.lognormal(12, 0.5, size=(n_dates, n_codes)))
+
+    # 신규상장 종목 (앞 구간 NaN)
+    for col, listed_bars in [(1, 10), (2, 30), (3, 61), (4, 100)]:
+        close[:n_dates - listed_bars, col] = np.nan
+        volume[:n_dates - listed_bars, col] = np.nan
+
+    dates = [f"2024{i:04d}" for i in range(n_dates)]
+    codes = [f"{i:06d}" for i in range(n_codes)]
+    return PricePanel(dates=dates, codes=codes, close=close, volume=volume)
+
+
+def test_rule_parsing():
+    """규칙 문자열 파싱"""
+    rule = AlertRule.parse("RSI14 crosses below 30")
+    assert (rule.left, rule.op, rule.right) == ("rsi14", "crosses_below", "30")
+    assert AlertRule.parse("MA5 crosses MA20").op == "crosses"
+    assert AlertRule.parse("volume_ratio > 3").op == ">"
+
+    for bad in ["RSI crosses 30", "MA5 between MA20", "foo > 1"]:
+        try:
+            AlertRule.parse(bad)
+            assert False, bad
+        except ValueError:
+            pass
+    print("   ✓ 규칙 파싱")
+
+
+def test_incremental_matches_scan():
+    """과거 구간 warm-up 후 봉 단위 증분 평가 = 전체 재스캔"""
+    print("=" * 60)
+    print("알림 엔진 증분 평가")
+    print("=" * 60)
+
+    panel = _make_panel(n_dates=130, n_codes=300, seed=5)
+    agent = TechnicalAgent(krx_client=KrxClient(), config=TechnicalAnalysisConfig(indicators=[]))
+    engine = AlertEngine(panel.codes, AlertEngine.default_rules() + ["MA5 crosses MA20"])
+
+    engine.warm_up(panel._replace_rows(slice(0, 120)))
+
+    total_events = 0
+    cross_events = 0
+    for row in range(120, 130):
+        events = engine.update(panel.dates[row], panel.close[row], panel.volume[row])
+        total_events += len(events)
+
+        scan = agent.scan(panel._replace_rows(slice(0, row + 1)))
+        golden = {e.stock_code for e in events if e.rule == "golden_cross"}
+        death = {e.stock_code for e in events if e.rule == "death_cross"}
+        assert golden == set(scan.codes_where(scan.golden_cross)), panel.dates[row]
+        assert death == set(scan.codes_where(scan.death_cross)), panel.dates[row]
+        cross_events += len(golden) + len(death)
+
+        values = engine.current_values()
+        assert np.allclose(values["rsi14"], scan.rsi, equal_nan=True)
+        assert np.allclose(values["ma60"], scan.ma[60], equal_nan=True)
+        assert np.allclose(values["volume_ratio"], scan.volume_ratio, equal_nan=True)
+
+    assert cross_events > 0
+    print(f"   ✓ 10봉 증분 평가 = 재스캔 (알림 {total_events}건, 골든/데드크로스 {cross_events}건)")
+
+
+def test_only_changed_states():
+    """같은 상태가 유지되면 다시 알림하지 않음 / 장중 잠정 봉"""
+    engine = AlertEngine(["A", "B"], ["volume_ratio > 3", "close crosses above 105"])
+
+    for day in range(20):
+        assert engine.update(f"D{day:02d}", np.array([100.0, 100.0]), np.array([100.0, 100.0])) == []
+
+    # 장중: A 거래량 급증 + 105 돌파 → 알림
+    events = engine.update("D20", np.array([106.0, 100.0]), np.array([1000.0, 100.0]), commit=False)
+    assert {(e.stock_code, e.kind) for e in events} == {("A", "triggered"), ("A", "crossed_above")}
+
+    # 같은 상태로 다시 호출 → 알림 없음
+    assert engine.update("D20", np.array([107.0, 100.0]), np.array([1200.0, 100.0]), commit=False) == []
+
+    # 종가 확정 (상태 동일) → 알림 없음, 다음 날 거래량 정상화 → cleared
+    assert engine.update("D20", np.array([107.0, 100.0]), np.array([1200.0, 100.0])) == []
+    events = engine.update("D21", np.array([107.0, 100.0]), np.array([100.0, 100.0]))
+    assert [(e.stock_code, e.kind) for e in events] == [("A", "cleared")]
+    print("   ✓ 상태 변화만 알림")
+
+
+def test_same_date_rerun():
+    """같은 날 재확정은 봉 교체 (버퍼/RSI 이중 전진 없음), 과거 날짜는 거부"""
+    panel = _make_panel(n_dates=80, n_codes=50, seed=9)
+    engine = AlertEngine(panel.codes, AlertEngine.default_rules())
+    reference = AlertEngine(panel.codes, AlertEngine.default_rules())
+    engine.warm_up(panel._replace_rows(slice(0, 79)))
+    reference.warm_up(panel._replace_rows(slice(0, 79)))
+
+    # 잘못된 값으로 확정 후 재실행 → 올바른 값으로 한 번 확정한 것과 동일
+    engine.update(panel.dates[-1], panel.close[-1] * 1.1, panel.volume[-1] * 5)
+    engine.update(panel.dates[-1], panel.close[-1], panel.volume[-1])
+    engine.update(panel.dates[-1], panel.close[-1], panel.volume[-1])
+    reference.update(panel.dates[-1], panel.close[-1], panel.volume[-1])
+    for name, values in reference.current_values().items():
+        assert np.allclose(engine.current_values()[name], values, equal_nan=True), name
+    assert engine._pos == reference._pos and np.array_equal(engine._bars, reference._bars)
+
+    for trade_date, commit in [(panel.dates[-2], True), (panel.dates[-1], False)]:
+        try:
+            engine.update(trade_date, panel.close[-1], panel.volume[-1], commit=commit)
+            assert False, trade_date
+        except ValueError:
+            pass
+    print("   ✓ 같은 날 재확정 = 1회 확정, 과거/확정일 잠정 봉 거부")
+
+
+
+
+if __name__ == "__main__":
+    test_rule_parsing()
+    test_incremental_matches_scan()
+    test_only_changed_states()
+    test_same_date_rerun()
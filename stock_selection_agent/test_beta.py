@@ -0,0 +1,117 @@
+"""
+회귀 Beta 검증 (합성 시세/지수, 네트워크 불필요)
+행렬곱 일괄 계산 및 롤링 증분 갱신 결과를 종목별 np.polyfit 계산과 비교
+"""
+
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+
+from src.agents.risk_agent import RiskAgent
+from src.analytics.beta import RollingBeta, ols_beta, weekly_returns
+from src.models.panel import PricePanel
+
+
+def _business_days(n_dates, start=date(2021, 1, 4)):
+    days, day = [], start
+    while len(days) < n_dates:
+        if day.weekday() < 5:
+            days.append(day.strftime("%Y%m%d"))
+        day += timedelta(days=1)
+    return days
+
+
+def _make_market(n_dates=800, n_codes=40, seed=5):
+    """지수 수익률에 종목별 실제 Beta를 곱한 합성 시세"""
+    rng = np.random.default_rng(seed)
+    market_ret = rng.normal(0.0003, 0.012, size=n_dates)
+    true_beta = rng.uniform(0.3, 1.8, size=n_codes)
+    stock_ret = market_ret[:, None] * true_beta[None, :] + rng.normal(0, 0.015, size=(n_dates, n_codes))
+
+    index_close = 2500 * np.exp(np.cumsum(market_ret))
+    close = 10000 * np.exp(np.cumsum(stock_ret, axis=0))
+    close[:600, 1] = np.nan  # 신규상장 (표본 부족 → NaN)
+    close[300:310, 2] = np.nan  # 거래정지 구간
+
+    dates = _business_days(n_dates)
+    codes = [f"{i:06d}" for i in range(n_codes)]
+    return dates, codes, close, index_close, true_beta
+
+
+def _reference_beta(stock_returns, market_returns):
+    valid = ~np.isnan(stock_returns) & ~np.isnan(market_returns)
+    return np.polyfit(market_returns[valid], stock_returns[valid], 1)[0], int(valid.sum())
+
+
+def test_ols_matches_reference():
+    """일괄 OLS Beta = 종목별 polyfit 기울기"""
+    print("=" * 60)
+    print("주간 OLS Beta vs 종목별 회귀")
+    print("=" * 60)
+
+    dates, codes, close, index_close, true_beta = _make_market()
+    _, stock_returns, market_returns = weekly_returns(dates, close, index_close)
+    assert stock_returns.shape[0] == 159, "800거래일 → 160주 → 159개 주간 수익률"
+
+    result = ols_beta(stock_returns, market_returns, codes, min_observations=52)
+    for col, code in enumerate(codes):
+        beta, n = _reference_beta(stock_returns[:, col], market_returns)
+        if n >= 52:
+            assert np.isclose(result.beta[col], beta), code
+            assert np.isclose(result.beta_adjusted[col], 0.67 * beta + 0.33), code
+        else:
+            assert np.isnan(result.beta[col]), code
+
+    error = np.nanmean(np.abs(result.beta - true_beta))
+    assert error < 0.15
+    print(f"   ✓ {len(codes)}종목 일치, 실제 Beta 대비 평균 오차 {error:.3f}")
+
+
+def test_rolling_incremental():
+    """주 단위 증분 갱신 = 해당 윈도우 일괄 계산"""
+    dates, codes, close, index_close, _ = _make_market()
+    _, stock_returns, market_returns = weekly_returns(dates, close, index_close)
+
+    window = 52
+    rolling = RollingBeta(codes, window=window, min_observations=26)
+    rolling.extend(stock_returns[:100], market_returns[:100])
+    for week in range(100, stock_returns.shape[0]):
+        result = rolling.update(stock_returns[week], market_returns[week])
+        expected = ols_beta(stock_returns[week - window + 1:week + 1], market_returns[week - window + 1:week + 1],
+                            codes, min_observations=26)
+        assert np.allclose(result.beta, expected.beta, equal_nan=True, atol=1e-9)
+        assert np.array_equal(result.observations, expected.observations)
+    print(f"   ✓ {stock_returns.shape[0] - 100}주 증분 갱신 일치")
+
+
+def test_agent_beta():
+    """RiskAgent 단일 종목 Beta = 유니버스 일괄 Beta"""
+    dates, codes, close, index_close, _ = _make_market()
+    panel = PricePanel(dates=dates, codes=codes, close=close)
+    index_closes = dict(zip(dates, index_close))
+
+    agent = RiskAgent()
+    batch = agent.scan_betas(panel, index_closes=index_closes)
+
+    history = panel.to_history("000000")
+    single = agent._analyze_market_risk(history, {"name": "KOSPI", "closes": index_closes})
+    assert single["beta"] == round(float(batch.beta[0]), 2)
+    assert single["beta_adjusted"] == round(float(batch.beta_adjusted[0]), 2)
+    assert single["beta_benchmark"] == "KOSPI"
+
+    # 지수가 없으면 변동성 기반 추정 대신 미산출
+    assert agent._analyze_market_risk(history)["beta"] is None
+    print(f"   ✓ 단일 종목 Beta {single['beta']} (조정 {single['beta_adjusted']}, R² {single['beta_r_squared']})")
+
+
+
+
+if __name__ == "__main__":
+    test_ols_matches_reference()
+    test_rolling_incremental()
+    test_agent_beta()
@@ -0,0 +1,122 @@
+"""
+상관 군집 집중 리스크 검증 (합성 요인 시세, 네트워크 불필요)
+블록 상관행렬/증분 갱신/평균 연결 군집을 직접 계산과 비교
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+
+from src.agents.risk_agent import RiskAgent
+from src.analytics.concentration import RollingCorrelation, cluster_labels, correlation_matrix
+from src.analytics.risk_engine import simple_returns
+from src.models.panel import PricePanel
+
+
+def _make_close(n_dates=300, n_groups=4, group_size=8, n_single=6, seed=17):
+    """섹터 요인 군집 + 독립 종목 합성 시세"""
+    rng = np.random.default_rng(seed)
+    factors = rng.normal(0, 0.02, size=(n_dates, n_groups))
+    columns = []
+    for g in range(n_groups):
+        for _ in range(group_size):
+            columns.append(factors[:, g] + rng.normal(0, 0.008, n_dates))
+    for _ in range(n_single):
+        columns.append(rng.normal(0, 0.02, n_dates))
+    returns = np.column_stack(columns)
+    close = 10000 * np.exp(np.cumsum(returns, axis=0))
+    close[:50, 3] = np.nan  # 신규상장
+    return close
+
+
+def _naive_average_linkage(distance, threshold):
+    """O(N³) 평균 연결 병합 (기준 구현)"""
+    clusters = [[i] for i in range(len(distance))]
+    while len(clusters) > 1:
+        best = None
+        for i in range(len(clusters)):
+            for j in range(i + 1, len(clusters)):
+                value = distance[np.ix_(clusters[i], clusters[j])].mean()
+                if best is None or value < best[0]:
+                    best = (value, i, j)
+        if best[0] > threshold:
+            break
+        _, i, j = best
+        clusters[i] += clusters.pop(j)
+    labels = np.empty(len(distance), dtype=int)
+    for k, members in enumerate(clusters):
+        labels[members] = k
+    return labels
+
+
+def _same_partition(a, b):
+    return np.array_equal(a[:, None] == a[None, :], b[:, None] == b[None, :])
+
+
+def test_correlation_and_clusters():
+    """블록 float32 상관행렬 = np.corrcoef, 군집 = 기준 구현"""
+    print("=" * 60)
+    print("상관 군집")
+    print("=" * 60)
+
+    close = _make_close()
+    returns = np.nan_to_num(simple_returns(close))
+    corr = correlation_matrix(returns, block_size=5)
+    assert corr.dtype == np.float32
+    assert np.allclose(corr, np.corrcoef(returns.T), atol=1e-5)
+
+    labels = cluster_labels(corr, min_correlation=0.6)
+    expected = _naive_average_linkage(1 - corr.astype(float), 0.4)
+    assert _same_partition(labels, expected)
+    assert len(set(labels[:8])) == 1 and len(set(labels[32:])) == 6, "요인 군집 4개 + 독립 종목 6개"
+    print(f"   ✓ {corr.shape[0]}종목 → 군집 {labels.max() + 1}개 (기준 구현과 일치)")
+
+
+def test_rolling_update():
+    """증분 갱신 상관행렬 = 윈도우 재계산"""
+    returns = np.nan_to_num(simple_returns(_make_close()))
+    codes = [f"{i:06d}" for i in range(returns.shape[1])]
+
+    rolling = RollingCorrelation(codes, window=120)
+    rolling.extend(returns[:150])
+    for day in range(150, returns.shape[0]):
+        rolling.update(returns[day])
+    assert np.allclose(rolling.correlation(), correlation_matrix(returns[-120:]), atol=1e-4)
+    print(f"   ✓ {returns.shape[0] - 150}일 증분 갱신 일치")
+
+
+def test_agent_cluster_exposure():
+    """RiskAgent 집중 리스크에 군집 노출 반영"""
+    close = _make_close()
+    codes = [f"{i:06d}" for i in range(close.shape[1])]
+    panel = PricePanel(dates=[f"D{i:04d}" for i in range(close.shape[0])], codes=codes, close=close)
+
+    agent = RiskAgent()
+    assert agent._analyze_concentration_risk(codes[0])["score"] == 50, "군집 계산 전 중립"
+
+    weights = {code: (10.0 if i < 8 else 1.0) for i, code in enumerate(codes)}
+    clusters = agent.scan_concentration(panel, weights=weights)
+    assert clusters.crowded_clusters()[0]["members"] == codes[:8]
+
+    crowded = agent._analyze_concentration_risk(codes[0])
+    single = agent._analyze_concentration_risk(codes[-1])
+    assert crowded["cluster_exposure"]["cluster_size"] == 8
+    assert crowded["score"] > 50 > single["score"]
+    assert crowded["risks"][0]["type"] == "correlation_cluster"
+
+    rolling = agent.rolling_correlation(panel)
+    updated = agent.update_concentration(rolling, weights=weights)
+    assert _same_partition(updated.labels, clusters.labels)
+    print(f"   ✓ {crowded['risks'][0]['description']} → 점수 {crowded['score']}, 독립 종목 {single['score']}")
+
+
+
+
+if __name__ == "__main__":
+    test_correlation_and_clusters()
+    test_rolling_update()
+    test_agent_cluster_exposure()
@@ -0,0 +1,192 @@
+"""
+컨센서스 이력 저장소 검증 (합성 스냅샷, 네트워크 불필요)
+일별 스냅샷 추가 기록/재로드, 일괄 지표와 종목별 직접 계산 비교,
+SentimentAgent 애널리스트 분석의 이력 기반 의견 변화/목표주가 변화/EPS 수정 확인
+"""
+
+import sys
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+
+from src.agents.sentiment_agent import SentimentAgent, SentimentAnalysisConfig
+from src.storage.consensus_store import (
+    RECORD_DTYPE, ConsensusStore, compute_consensus_metrics, to_day
+)
+
+
+def _analyst_data(buy, hold, sell, targets, eps=None):
+    return {
+        "rating_distribution": {"strong_buy": 0, "buy": buy, "hold": hold, "sell": sell, "strong_sell": 0},
+        "target_prices": targets,
+        "eps_consensus_current": eps,
+    }
+
+
+def test_append_only_records():
+    """같은 날 재기록은 마지막 값, 동일 내용은 생략, 중단된 기록은 무시"""
+    print("=" * 60)
+    print("스냅샷 추가 기록")
+    print("=" * 60)
+
+    assert RECORD_DTYPE.itemsize == 30
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ConsensusStore(store_dir=Path(tmp))
+        assert store.record("005930", _analyst_data(5, 1, 0, [90000, 100000]), as_of="2026-10-01")
+        assert not store.record("005930", _analyst_data(5, 1, 0, [90000, 100000]), as_of="2026-10-01")
+        assert store.record("005930", _analyst_data(6, 1, 0, [90000, 100000]), as_of="2026-10-01")
+        assert store.record("005930", _analyst_data(6, 0, 0, [110000]), as_of="2026-10-02")
+
+        history_file = Path(tmp) / "005930.bin"
+        print(f"  파일 크기: {history_file.stat().st_size}바이트 (기록 3회)")
+        assert history_file.stat().st_size == 3 * 30
+
+        # 중단된 마지막 기록(부분 바이트)은 무시하고 재로드
+        with open(history_file, "ab") as f:
+            f.write(b"\x01\x02\x03")
+        history = ConsensusStore(store_dir=Path(tmp)).history("005930")
+        assert [int(d) for d in history["day"]] == [to_day("2026-10-01"), to_day("2026-10-02")]
+        assert history["ratings"][0].tolist() == [0, 6, 1, 0, 0]
+        assert history["avg_target"].tolist() == [95000.0, 110000.0]
+        assert np.isnan(history["eps_current"]).all()
+        assert ConsensusStore(store_dir=Path(tmp)).covered_stocks() == ["005930"]
+
+
+def _reference(history, as_of_day):
+    """종목 1개 직접 계산 (루프)"""
+    rows = [r for r in history if r["day"] <= as_of_day]
+
+    def last_before(day):
+        found = [r for r in rows if r["day"] <= day]
+        return found[-1] if found else None
+
+    def score(r):
+        n = r["ratings"].sum()
+        return np.nan if n == 0 else float(r["ratings"] @ np.array([2, 1, 0, -1, -2])) / n
+
+    def pct(a, b):
+        return np.nan if a is None or b is None or not b or np.isnan(a) or np.isnan(b) else (a - b) / abs(b) * 100
+
+    current = last_before(as_of_day)
+    out = {"tp": {}}
+    for months, days in ((1, 30), (3, 91), (6, 182)):
+        past = last_before(as_of_day - days)
+        out["tp"][months] = pct(current and float(current["avg_target"]), past and float(past["avg_target"]))
+
+    up = down = eps_up = 0
+    for prev, cur in zip(rows, rows[1:]):
+        if cur["day"] <= as_of_day - 91:
+            continue
+        delta = score(cur) - score(prev)
+        up += bool(delta > 1e-9)
+        down += bool(delta < -1e-9)
+        eps_up += bool(float(cur["eps_current"]) - float(prev["eps_current"]) > 1e-9)
+    out["up"], out["down"], out["eps_up"] = up, down, eps_up
+    past = last_before(as_of_day - 91)
+    out["eps_rev"] = pct(current and float(current["eps_current"]), past and float(past["eps_current"]))
+    return out
+
+
+def _random_histories(n_stocks, n_days, seed=47):
+    rng = np.random.default_rng(seed)
+    start = to_day("2025-10-01")
+    histories = []
+    for _ in range(n_stocks):
+        days = np.sort(rng.choice(n_days, size=int(rng.integers(0, min(n_days, 120))), replace=False)) + start
+        records = np.zeros(len(days), dtype=RECORD_DTYPE)
+        records["day"] = days
+        records["ratings"] = rng.integers(0, 6, size=(len(days), 5))
+        records["avg_target"] = np.where(rng.random(len(days)) < 0.1, np.nan, rng.normal(50000, 5000, len(days)))
+        records["median_target"] = records["avg_target"]
+        records["eps_current"] = np.round(rng.normal(3000, 300, len(days)), -1)
+        records["eps_next"] = np.nan
+        histories.append(records)
+    return histories
+
+
+def test_vectorized_matches_reference():
+    """일괄 지표 = 종목별 직접 계산"""
+    print("\n" + "=" * 60)
+    print("일괄 지표 정확성")
+    print("=" * 60)
+
+    histories = _random_histories(60, 365)
+    codes = [f"{i:06d}" for i in range(len(histories))]
+    as_of = "2026-08-15"
+    metrics = compute_consensus_metrics(codes, histories, as_of)
+    as_of_day = to_day(as_of)
+
+    checked = 0
+    for code, history in zip(codes, histories):
+        row = metrics.index_of(code)
+        ref = _reference(history, as_of_day)
+        for months in (1, 3, 6):
+            np.testing.assert_allclose(metrics.target_price_change[months][row], ref["tp"][months], rtol=1e-5)
+        assert metrics.upgrades_3m[row] == ref["up"] and metrics.downgrades_3m[row] == ref["down"]
+        assert metrics.eps_up_3m[row] == ref["eps_up"]
+        np.testing.assert_allclose(metrics.eps_revision_current[row], ref["eps_rev"], rtol=1e-5)
+        checked += metrics.snapshots[row] > 0
+    print(f"  {checked}/{len(codes)}종목 일치 (기준일 {metrics.as_of})")
+
+    empty = compute_consensus_metrics(["999999"], [np.zeros(0, dtype=RECORD_DTYPE)])
+    assert empty.to_dict("999999") is None and np.isnan(empty.rating_momentum[0])
+
+
+def test_agent_uses_history():
+    """애널리스트 분석: 스냅샷 기록 + 이력 기반 변화 지표 (추가 원격 호출 없음)"""
+    print("\n" + "=" * 60)
+    print("SentimentAgent 애널리스트 이력")
+    print("=" * 60)
+
+    today = date.today()
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ConsensusStore(store_dir=Path(tmp))
+        for days_ago, data in (
+            (200, _analyst_data(2, 4, 2, [80000], eps=5000)),
+            (100, _analyst_data(3, 4, 1, [90000], eps=5000)),
+            (60, _analyst_data(4, 3, 1, [90000], eps=5200)),
+            (20, _analyst_data(5, 2, 1, [96000], eps=5500)),
+        ):
+            store.record("000001", data, as_of=today - timedelta(days=days_ago))
+
+        agent = SentimentAgent(krx_client=object(), consensus_store=store)
+        agent.ebest = None
+        calls = []
+        agent._fetch_analyst_data_naver = lambda code: calls.append(code) or _analyst_data(6, 2, 0, [100000], eps=5600)
+
+        result = agent._analyze_analyst_sentiment("000001", "테스트", current_price=80000)
+        print(f"  목표가 변화 1/3/6M: {result['tp_change_1m']}/{result['tp_change_3m']}/{result['tp_change_6m']}%, "
+              f"상향 {result['upgrades']} 하향 {result['downgrades']}, EPS 수정 {result['current_year_revision']}%")
+
+        assert calls == ["000001"]
+        # 1개월 전 기준 = 30일 전 이전 마지막 스냅샷 (60일 전)
+        assert result["tp_change_1m"] == round((100000 / 90000 - 1) * 100, 2)
+        assert result["tp_change_3m"] == round((100000 / 90000 - 1) * 100, 2)
+        assert result["tp_change_6m"] == 25.0
+        assert (result["upgrades"], result["downgrades"], result["rating_momentum"]) == (3, 0, 1.0)
+        assert result["current_year_revision"] == 12.0 and result["up_revisions"] == 3
+        assert result["earnings_momentum"] == "strong_positive"
+        assert len(store.history("000001")) == 5
+
+        # 이력이 없으면 수집값 그대로
+        fresh = SentimentAgent(krx_client=object(), consensus_store=ConsensusStore(persist=False))
+        fresh.ebest = None
+        fresh._fetch_analyst_data_naver = agent._fetch_analyst_data_naver
+        first = fresh._analyze_analyst_sentiment("000002", "테스트", current_price=80000)
+        assert first["tp_change_1m"] is None and first["tp_change_3m"] == 0.0 and first["upgrades"] == 0
+
+        disabled = SentimentAgent(krx_client=object(), config=SentimentAnalysisConfig(consensus_history=False))
+        assert disabled.consensus_store is None
+
+
+if __name__ == "__main__":
+    test_append_only_records()
+    test_vectorized_matches_reference()
+    test_agent_uses_history()
+    print("\n모든 테스트 통과")
@@ -0,0 +1,295 @@
+"""
+크롤링 스케줄러 검증 (가짜 HTTP 풀, 네트워크 불필요)
+호스트별 동시 요청/요청 간격, 일시적 오류 재시도(백오프, Retry-After), 같은 URL 병합,
+파싱 작업자 풀, SentimentAgent 종목 전체 분석 확인
+"""
+
+import sys
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from urllib.parse import urlsplit
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+import requests
+
+from src.agents.sentiment_agent import SentimentAgent, SentimentAnalysisConfig
+from src.api.crawl_scheduler import CrawlJob, CrawlScheduler, CrawlSchedulerConfig
+from src.api.http_pool import PageResponse
+
+
+def _http_error(status, retry_after=None):
+    response = requests.Response()
+    response.status_code = status
+    if retry_after is not None:
+        response.headers["Retry-After"] = str(retry_after)
+    return requests.HTTPError(f"{status} Error", response=response)
+
+
+class FakeHttp:
+    """요청 시각/동시 요청 수를 기록하는 HTTP 풀 대체 (URL별 실패 주입)"""
+
+    def __init__(self, pages=None, latency=0.03, failures=None):
+        self.pages = pages or {}
+        self.latency = latency
+        self.failures = {url: list(errors) for url, errors in (failures or {}).items()}
+        self.lock = threading.Lock()
+        self.starts = defaultdict(list)  # 호스트 -> 요청 시작 시각
+        self.active = defaultdict(int)
+        self.max_active = defaultdict(int)
+        self.calls = defaultdict(int)  # URL -> 요청 수
+
+    def get(self, url, **kwargs):
+        host = urlsplit(url).netloc
+        with self.lock:
+            self.starts[host].append(time.monotonic())
+            self.active[host] += 1
+            self.max_active[host] = max(self.max_active[host], self.active[host])
+            self.calls[url] += 1
+            errors = self.failures.get(url)
+            error = errors.pop(0) if errors else None
+        try:
+            time.sleep(self.latency)
+            if error is not None:
+                raise error
+            text = next((html for marker, html in self.pages.items() if marker in url), f"<p>{url}</p>")
+            return PageResponse(url=url, status_code=200, text=text)
+        finally:
+            with self.lock:
+                self.active[host] -= 1
+
+
+def _scheduler(http, **overrides):
+    config = CrawlSchedulerConfig(random_seed=46, **overrides)
+    return CrawlScheduler(http_pool=http, config=config)
+
+
+def test_host_limits():
+    """호스트별 동시 요청 상한 + 요청 간격(jitter 포함), 호스트 간에는 병행"""
+    print("=" * 60)
+    print("호스트별 동시 요청/간격")
+    print("=" * 60)
+
+    http = FakeHttp(latency=0.08)
+    scheduler = _scheduler(http, max_concurrency_per_host=2, request_interval_seconds=0.03, jitter_ratio=0.3,
+                           host_intervals={"slow.example": 0.1})
+    jobs = [CrawlJob(f"https://fast.example/{i}") for i in range(12)]
+    jobs += [CrawlJob(f"https://slow.example/{i}") for i in range(6)]
+
+    start = time.monotonic()
+    results = scheduler.run(jobs)
+    elapsed = time.monotonic() - start
+    scheduler.close()
+
+    assert all(r.ok for r in results) and [r.job for r in results] == jobs
+    for host, min_gap in (("fast.example", 0.03 * 0.7), ("slow.example", 0.1 * 0.7)):
+        starts = http.starts[host]
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        print(f"  {host}: 최대 동시 {http.max_active[host]}, 최소 간격 {min(gaps) * 1000:.0f}ms")
+        assert http.max_active[host] <= 2
+        assert min(gaps) >= min_gap - 0.005
+
+    # 느린 호스트 간격이 빠른 호스트를 막지 않음 (소요 시간은 참고용 출력)
+    serial = 18 * 0.08
+    print(f"  전체 {elapsed:.2f}초 (직렬 {serial:.2f}초)")
+    assert http.starts["fast.example"][-1] < http.starts["slow.example"][-1]
+
+
+def test_retries():
+    """일시적 오류는 백오프 재시도, 영구 오류는 즉시 실패, 재시도 소진 시 실패"""
+    print("\n" + "=" * 60)
+    print("재시도 / 백오프")
+    print("=" * 60)
+
+    flaky = "https://a.example/flaky"
+    missing = "https://a.example/missing"
+    down = "https://b.example/down"
+    limited = "https://c.example/limited"
+    http = FakeHttp(latency=0.0, failures={
+        flaky: [_http_error(503), requests.ConnectionError("reset")],
+        missing: [_http_error(404)],
+        down: [requests.Timeout("timeout")] * 10,
+        limited: [_http_error(429, retry_after=0.3)],
+    })
+    scheduler = _scheduler(http, request_interval_seconds=0.0, max_retries=2,
+                           backoff_base_seconds=0.05, backoff_max_seconds=1.0)
+
+    ok, not_found, gave_up, rate_limited = scheduler.run(
+        [CrawlJob(flaky), CrawlJob(missing), CrawlJob(down), CrawlJob(limited)]
+    )
+    print(f"  flaky: {ok.attempts}회, missing: {not_found.attempts}회, down: {gave_up.attempts}회, "
+          f"429: {rate_limited.elapsed_seconds:.2f}초, 통계: {scheduler.stats}")
+
+    assert ok.ok and ok.attempts == 3
+    assert not not_found.ok and not_found.attempts == 1 and not_found.error.response.status_code == 404
+    assert not gave_up.ok and gave_up.attempts == 3 and isinstance(gave_up.error, requests.Timeout)
+    assert rate_limited.ok and rate_limited.elapsed_seconds >= 0.3 - 0.01
+
+    # 429는 같은 호스트 다른 요청도 Retry-After 동안 보류
+    http.failures[limited] = [_http_error(429, retry_after=0.3)]
+    first = scheduler.submit(CrawlJob(limited))
+    time.sleep(0.05)
+    other = scheduler.submit(CrawlJob("https://c.example/other")).result()
+    assert first.result().ok and other.elapsed_seconds >= 0.2
+
+    # fetch는 최종 오류를 예외로 전달
+    http.failures[missing] = [_http_error(404)]
+    try:
+        scheduler.fetch(missing)
+    except requests.HTTPError:
+        pass
+    else:
+        raise AssertionError("HTTPError 미발생")
+    scheduler.close()
+
+
+def test_coalesce_and_parse_pool():
+    """같은 URL 동시 요청은 한 번만 수집, 추출기는 파싱 작업자에서 요청별 실행"""
+    print("\n" + "=" * 60)
+    print("요청 병합 / 파싱 작업자 풀")
+    print("=" * 60)
+
+    http = FakeHttp(pages={"main": "<table class='gray'><tr><td>1</td></tr></table>"}, latency=0.1)
+    scheduler = _scheduler(http, request_interval_seconds=0.0)
+    threads = []
+
+    def rows(html):
+        threads.append(threading.current_thread().name)
+        return [html.count("td")]
+
+    def title(html):
+        threads.append(threading.current_thread().name)
+        return html[:6]
+
+    url = "https://finance.example/main?code=1"
+    first = scheduler.submit(CrawlJob(url, parser=rows, tag="analyst"))
+    second = scheduler.submit(CrawlJob(url, parser=title, tag="earnings"))
+    a, b = first.result(), second.result()
+    print(f"  요청 {http.calls[url]}회, 결과 {a.parsed} / {b.parsed}, 파싱 스레드 {sorted(set(threads))}")
+
+    assert http.calls[url] == 1 and scheduler.stats["coalesced"] == 1
+    assert a.parsed == [2] and b.parsed == "<table" and (a.job.tag, b.job.tag) == ("analyst", "earnings")
+    assert all(name.startswith("crawl-parse") for name in threads)
+
+    # 완료 후 재요청은 새로 수집, 같은 본문 추출은 캐시
+    parsed, page = scheduler.fetch(url, parser=rows)
+    assert parsed == [2] and http.calls[url] == 2 and scheduler.html_cache.hits == 1
+
+    # 추출기 오류는 해당 요청만 실패
+    failed = scheduler.submit(CrawlJob(url + "&x", parser=lambda html: 1 / 0)).result()
+    assert not failed.ok and isinstance(failed.error, ZeroDivisionError) and failed.page is not None
+    scheduler.close()
+
+
+def test_deadline_cancels_queued():
+    """제한 시각을 넘긴 요청은 TimeoutError, 대기자가 모두 취소된 작업은 요청하지 않음"""
+    print("\n" + "=" * 60)
+    print("제한 시각 / 취소")
+    print("=" * 60)
+
+    http = FakeHttp(latency=0.05)
+    scheduler = _scheduler(http, max_concurrency_per_host=1, request_interval_seconds=0.3, jitter_ratio=0.0)
+    first = scheduler.submit(CrawlJob("https://slow.example/first"))
+
+    abandoned = "https://slow.example/abandoned"
+    try:
+        scheduler.fetch(abandoned, deadline=time.monotonic() + 0.05)
+        assert False, "제한 시각 초과"
+    except TimeoutError:
+        pass
+
+    # 같은 URL 대기자 중 일부만 취소하면 남은 대기자를 위해 요청
+    shared = "https://slow.example/shared"
+    kept = scheduler.submit(CrawlJob(shared))
+    dropped = scheduler.submit(CrawlJob(shared))
+    assert dropped.cancel()
+
+    last = scheduler.submit(CrawlJob("https://slow.example/last"))
+    assert first.result().ok and kept.result().ok and last.result().ok
+    print(f"  요청 {dict(http.calls)}, 통계 {scheduler.stats}")
+    assert http.calls[abandoned] == 0 and http.calls[shared] == 1
+    assert scheduler.stats["cancelled"] == 1
+    # 버려진 작업은 요청 간격을 쓰지 않음: first → shared → last
+    assert len(http.starts["slow.example"]) == 3
+
+    # 분석 소스 제한 시각은 스레드별로 _crawl에 전달
+    agent = SentimentAgent(krx_client=FakeKrx(), crawl_scheduler=scheduler,
+                           config=SentimentAnalysisConfig(news_dedup=False, consensus_history=False,
+                                                          earnings_cache=False, sentiment_series=False))
+    deadlines = []
+    scheduler.fetch = lambda url, parser, deadline=None: deadlines.append(deadline) or ([], None)
+    agent._run_branch(lambda: agent._crawl("https://slow.example/x", str), 123.0)
+    agent._crawl("https://slow.example/y", str)
+    assert deadlines == [123.0, None]
+    scheduler.close()
+
+
+class FakeKrx:
+    """종목명/현재가만 제공하는 KRX 대체"""
+
+    def _get_stock_name(self, stock_code):
+        return f"종목{stock_code}"
+
+    def get_stock_price(self, stock_code):
+        return {"close_price": 70000}
+
+
+def _naver_pages():
+    news = "".join(
+        f'<tr><td class="title"><span class="articleSubject"><a href="/n/{i}" title="수주 흑자 전환 {i}">x</a>'
+        f'</span></td><td class="date">{time.strftime("%Y.%m.%d")}</td></tr>' for i in range(5)
+    )
+    opinions = "".join(
+        f"<tr><td>증권사{i}</td><td>매수</td><td>{90000 + i * 1000:,}</td><td>2026.10.01</td></tr>" for i in range(4)
+    )
+    return {
+        "news_news": f'<html><table class="type5 newsList">{news}</table></html>',
+        "main.naver": ('<html><div class="sub_section cop_analysis"><table class="tb_type1">'
+                       + opinions + '</table><table class="gray"><tr><th>EPS</th></tr>'
+                       '<tr><td>2026/2Q</td><td>1,200</td><td>1,000</td></tr></table></div></html>'),
+        "news.google.com": '<?xml version="1.0"?><rss version="2.0"><channel></channel></rss>',
+    }
+
+
+def test_agent_universe():
+    """종목 전체 분석: 동시 분석 중에도 네이버 호스트 제한 유지"""
+    print("\n" + "=" * 60)
+    print("SentimentAgent 종목 전체 분석")
+    print("=" * 60)
+
+    http = FakeHttp(pages=_naver_pages(), latency=0.02)
+    scheduler = _scheduler(http, max_concurrency_per_host=2, request_interval_seconds=0.02)
+    config = SentimentAnalysisConfig(news_dedup=False, consensus_history=False, earnings_cache=False,
+                                     sentiment_series=False, universe_workers=6)
+    agent = SentimentAgent(krx_client=FakeKrx(), config=config, crawl_scheduler=scheduler)
+    agent.dart = None
+    agent.ebest = None
+    assert agent.crawler is scheduler
+
+    codes = [f"{i:06d}" for i in range(1, 13)]
+    start = time.monotonic()
+    results = agent.analyze_universe(codes)
+    elapsed = time.monotonic() - start
+    scheduler.close()
+
+    naver = "finance.naver.com"
+    print(f"  {len(results)}종목 {elapsed:.2f}초, 네이버 요청 {len(http.starts[naver])}회 "
+          f"(최대 동시 {http.max_active[naver]}), 통계: {scheduler.stats}")
+    assert list(results) == codes
+    assert all(not r.timed_out_sources for r in results.values())
+    assert all(r.positive_news_count == 5 and r.total_analysts == 4 for r in results.values())
+    assert http.max_active[naver] <= 2
+    # 종목당 뉴스 1 + 메인 1~2 (애널리스트/실적 동시 요청은 병합)
+    assert len(codes) * 2 <= len(http.starts[naver]) <= len(codes) * 3
+
+
+if __name__ == "__main__":
+    test_host_limits()
+    test_retries()
+    test_coalesce_and_parse_pool()
+    test_deadline_cancels_queued()
+    test_agent_universe()
+    print("\n모든 테스트 통과")
@@ -0,0 +1,139 @@
+"""
+신용 리스크 일괄 계산 검증 (합성 재무 테이블, 네트워크 불필요)
+배열 계산 결과를 종목별 dict 계산(기존 RiskAgent 로직)과 비교
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+
+from src.agents.risk_agent import RiskAgent
+from src.analytics.credit import CREDIT_FIELDS, compute_credit_metrics
+from src.models.fundamentals import FundamentalsTable
+
+
+def _reference(fd):
+    """종목별 dict 계산 (기존 단일 종목 로직)"""
+    result = {"score": 50, "z_score": None, "zone": "unknown", "debt_to_equity": None,
+              "net_debt_ratio": None, "interest_coverage": None, "debt_to_ebitda": None, "red_flags": []}
+
+    total_assets = fd.get("total_assets", 0)
+    if total_assets > 0:
+        tl = fd.get("total_liabilities", 1)
+        z = (1.2 * (fd.get("working_capital", 0) / total_assets) + 1.4 * (fd.get("retained_earnings", 0) / total_assets)
+             + 3.3 * (fd.get("ebit", 0) / total_assets) + 0.6 * (fd.get("market_cap", 0) / tl if tl > 0 else 0)
+             + 1.0 * (fd.get("revenue", 0) / total_assets))
+        result["z_score"] = round(z, 2)
+        result["zone"] = "safe" if z > 2.99 else "grey" if z > 1.81 else "distress"
+        if result["zone"] == "distress":
+            result["red_flags"].append(f"Z-Score {z:.2f} - 파산 위험 높음")
+
+    equity, debt = fd.get("equity", 1), fd.get("total_debt", 0)
+    if equity > 0:
+        de = debt / equity
+        result["debt_to_equity"] = round(de, 2)
+        if de > 2.0:
+            result["red_flags"].append(f"부채비율 {de:.1f} - 200% 초과")
+        result["net_debt_ratio"] = round((debt - fd.get("cash", 0)) / equity, 2)
+
+    ie = fd.get("interest_expense", 0)
+    if ie > 0:
+        icr = fd.get("ebit", 0) / ie
+        result["interest_coverage"] = round(icr, 1)
+        if icr < 2.0:
+            result["red_flags"].append(f"이자보상배율 {icr:.1f} - 2배 미만")
+    else:
+        result["interest_coverage"] = float("inf")
+
+    ebitda = fd.get("ebitda", 0)
+    if ebitda > 0:
+        result["debt_to_ebitda"] = round(debt / ebitda, 2)
+        if debt / ebitda > 4.0:
+            result["red_flags"].append(f"Debt/EBITDA {debt / ebitda:.1f} - 4배 초과")
+
+    score = 50 + {"distress": 30, "grey": 15, "safe": -15}.get(result["zone"], 0)
+    if result["debt_to_equity"]:
+        de = result["debt_to_equity"]
+        score += 25 if de > 2.0 else 15 if de > 1.5 else -10 if de < 0.5 else 0
+    icr = result["interest_coverage"]
+    if icr and icr != float("inf"):
+        score += 25 if icr < 2 else 10 if icr < 3 else -15 if icr > 10 else 0
+    result["score"] = max(0, min(100, score))
+    return result
+
+
+def _make_records(n=500, seed=13):
+    rng = np.random.default_rng(seed)
+    records = {}
+    for i in range(n):
+        assets = float(rng.uniform(1e10, 1e13))
+        record = {
+            "total_assets": assets,
+            "working_capital": float(rng.uniform(-0.2, 0.4) * assets),
+            "retained_earnings": float(rng.uniform(-0.3, 0.6) * assets),
+            "ebit": float(rng.uniform(-0.05, 0.15) * assets),
+            "ebitda": float(rng.uniform(-0.02, 0.2) * assets),
+            "total_liabilities": float(rng.uniform(0.1, 0.9) * assets),
+            "total_debt": float(rng.uniform(0, 0.6) * assets),
+            "equity": float(rng.uniform(-0.1, 0.8) * assets),
+            "cash": float(rng.uniform(0, 0.2) * assets),
+            "interest_expense": float(rng.uniform(0, 0.03) * assets),
+            "revenue": float(rng.uniform(0.2, 1.5) * assets),
+            "market_cap": float(rng.uniform(0.1, 3) * assets),
+        }
+        # 일부 항목 누락
+        for name in CREDIT_FIELDS:
+            if rng.random() < 0.05:
+                record.pop(name)
+        records[f"{i:06d}"] = record
+    return records
+
+
+def test_batch_matches_reference():
+    """배치 계산 = 종목별 dict 계산"""
+    print("=" * 60)
+    print("신용 리스크 일괄 계산 vs 종목별 계산")
+    print("=" * 60)
+
+    records = _make_records()
+    metrics = compute_credit_metrics(FundamentalsTable.from_records(records, CREDIT_FIELDS))
+
+    for row, (code, record) in enumerate(records.items()):
+        assert metrics.to_dict(row) == _reference(record), code
+
+    flagged = metrics.flagged("distress_zone")
+    assert flagged == [c for c, r in records.items() if _reference(r)["zone"] == "distress"]
+    print(f"   ✓ {len(records)}종목 일치, 파산위험 {len(flagged)}개, 위험신호 {len(metrics.flagged())}개")
+
+
+def test_agent_single_stock():
+    """RiskAgent 단일 종목 결과 = 배치 결과"""
+    records = _make_records(n=20)
+    agent = RiskAgent()
+    batch = agent.scan_credit_risk(FundamentalsTable.from_records(records, CREDIT_FIELDS))
+    for row, (code, record) in enumerate(records.items()):
+        assert agent._analyze_credit_risk(code, record) == batch.to_dict(row)
+    assert agent._analyze_credit_risk("000000", None)["zone"] == "unknown"
+    print("   ✓ 단일 종목 결과 일치")
+
+
+def test_numpy_scalar_records():
+    """numpy 스칼라 값도 숫자로 보관 (bool/문자열/None은 NaN)"""
+    table = FundamentalsTable.from_records({
+        "000001": {"total_assets": np.float64(1e12), "total_liabilities": np.int64(4e11), "flag": np.bool_(True)},
+        "000002": {"total_assets": 5e11, "total_liabilities": "n/a", "flag": True},
+    }, ["total_assets", "total_liabilities", "flag"])
+    assert table.columns["total_assets"].tolist() == [1e12, 5e11]
+    assert table.columns["total_liabilities"][0] == 4e11 and np.isnan(table.columns["total_liabilities"][1])
+    assert np.isnan(table.columns["flag"]).all()
+    print("   ✓ numpy 스칼라 보관")
+
+
+if __name__ == "__main__":
+    test_batch_matches_reference()
+    test_agent_single_stock()
+    test_numpy_scalar_records()
@@ -0,0 +1,200 @@
+"""
+보고 분기 실적 캐시 검증 (가짜 DART, 네트워크 불필요)
+정기보고서 공시 인식, 보고 분기 저장/재로드, 새 정기보고서 공시 시에만 재수집,
+공시 목록 공용 조회(공시/실적 분석 동시 요청 1회) 확인
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.agents.sentiment_agent import SentimentAgent, SentimentAnalysisConfig
+from src.storage.earnings_store import EarningsStore, latest_periodic_filing, report_quarter
+
+
+def _disclosure(date, title):
+    return {"date": date, "title": title, "type": "Y"}
+
+
+def test_periodic_filings():
+    """정기보고서(정정 포함)만 인식, 결산월 → 보고 분기"""
+    print("=" * 60)
+    print("정기보고서 인식")
+    print("=" * 60)
+
+    assert report_quarter("분기보고서 (2026.03)") == "2026Q1"
+    assert report_quarter("[기재정정]반기보고서 (2026.06)") == "2026Q2"
+    assert report_quarter("사업보고서 (2025.12)") == "2025Q4"
+    assert report_quarter("분기보고서") == ""
+
+    disclosures = [
+        _disclosure("20260814", "반기보고서 (2026.06)"),
+        _disclosure("20260901", "주요사항보고서(자기주식취득결정)"),
+        _disclosure("20260730", "연결재무제표기준영업(잠정)실적(공정공시)"),
+        _disclosure("20260515", "분기보고서 (2026.03)"),
+    ]
+    filing = latest_periodic_filing(disclosures)
+    print(f"  최근 정기보고서: {filing}")
+    assert (filing.filing_date, filing.quarter) == ("20260814", "2026Q2")
+    assert latest_periodic_filing(disclosures[1:3]) is None
+
+
+def test_store_invalidation():
+    """저장값은 더 새로운 정기보고서가 나타날 때만 무효, 공시 목록 없으면 유효 기간"""
+    print("\n" + "=" * 60)
+    print("보고 분기 저장 / 무효화")
+    print("=" * 60)
+
+    rows = [{"quarter": "2026/2Q", "actual_eps": 1200.0, "estimate_eps": 1000.0, "source": "Naver"}]
+    q1 = latest_periodic_filing([_disclosure("20260515", "분기보고서 (2026.03)")])
+    q2 = latest_periodic_filing([_disclosure("20260814", "반기보고서 (2026.06)")])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = EarningsStore(store_dir=Path(tmp))
+        assert store.get("005930", q1) is None
+        store.put("005930", rows, source="Naver", sources={"DART": [], "Naver": rows}, filing=q1)
+
+        reloaded = EarningsStore(store_dir=Path(tmp))
+        record = reloaded.get("005930", q1)
+        assert record is not None and record.quarter == "2026Q1" and record.sources["Naver"] == rows
+        assert reloaded.get("005930", None) is record  # 조회 기간 내 정기보고서 없음 = 새 공시 없음
+        assert reloaded.get("005930", q2) is None  # 새 반기보고서
+
+        reloaded.put("005930", rows, source="DART", filing=q2)
+        assert reloaded.quarters("005930") == ["2026Q1", "2026Q2"]
+        assert reloaded.get("005930", q2).source == "DART"
+
+        # 공시 목록을 쓸 수 없으면 max_age_days 기준
+        no_feed = EarningsStore(store_dir=Path(tmp), max_age_days=30)
+        assert no_feed.get("005930", None, feed_available=False) is not None
+        later = datetime.now() + timedelta(days=31)
+        assert no_feed.get("005930", None, feed_available=False, now=later) is None
+        # 공시 목록에 정기보고서가 없어도(조회 실패로 빈 목록 포함) 유효 기간 적용
+        assert no_feed.get("005930", None, now=later) is None
+        assert no_feed.get("005930", q2, now=later) is not None
+        print(f"  저장 분기: {reloaded.quarters('005930')}")
+
+
+class FakeKrx:
+    """종목명/현재가만 제공하는 KRX 대체"""
+
+    def _get_stock_name(self, stock_code):
+        return "테스트종목"
+
+    def get_stock_price(self, stock_code):
+        return {"close_price": 10000}
+
+
+class FakeDart:
+    """공시 목록만 제공하는 DART 대체 (조회 수 기록)"""
+
+    def __init__(self, disclosures):
+        self.disclosures = disclosures
+        self.list_calls = 0
+        self.fail = False
+        self.lock = threading.Lock()
+
+    def get_corp_code_by_stock_code(self, stock_code):
+        return "00000001"
+
+    def get_disclosure_list(self, corp_code, bgn_de, end_de, page_count=100):
+        with self.lock:
+            self.list_calls += 1
+        time.sleep(0.05)  # 공시/실적 분석 요청이 겹치도록
+        if self.fail:
+            raise RuntimeError("DART API 요청 실패")
+        return {"status": "000", "list": [
+            {"rcept_dt": d["date"], "report_nm": d["title"], "corp_cls": "Y"} for d in self.disclosures
+        ]}
+
+
+def test_agent_reads_locally_until_new_filing():
+    """두 번째 분석부터 로컬 조회, 새 정기보고서 공시 후 재수집"""
+    print("\n" + "=" * 60)
+    print("SentimentAgent 실적 캐시")
+    print("=" * 60)
+
+    dart = FakeDart([_disclosure("20260515", "분기보고서 (2026.03)")])
+    fetches = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config = SentimentAnalysisConfig(news_dedup=False, consensus_history=False)
+        agent = SentimentAgent(krx_client=FakeKrx(), dart_client=dart, config=config,
+                               earnings_store=EarningsStore(store_dir=Path(tmp)))
+        agent.ebest = None
+        agent._analyze_news_sentiment = lambda *args: {"score": 50}
+        agent._analyze_analyst_sentiment = lambda *args: {"score": 50}
+
+        def dart_earnings(code):
+            fetches.append("DART")
+            return [{"quarter": "2026.1Q vs 2025.1Q", "actual_eps": 1100.0, "estimate_eps": 1000.0,
+                     "source": "DART"}], False
+
+        def naver_earnings(code):
+            fetches.append("Naver")
+            return [{"quarter": "2026/1Q", "actual_eps": 1300.0, "estimate_eps": 1000.0, "source": "Naver"}]
+
+        agent._fetch_earnings_data_dart = dart_earnings
+        agent._fetch_earnings_data_naver = naver_earnings
+
+        first = agent.analyze("000001")
+        assert fetches == ["DART", "Naver"] and dart.list_calls == 1
+        assert first.earnings_surprises[0]["surprise_pct"] == 30.0 and first.total_disclosures == 1
+
+        record = agent.earnings_store.latest("000001")
+        print(f"  1차: 소스 {record.source}, 보고 분기 {record.quarter}, 조회 소스 {sorted(record.sources)}")
+        assert record.quarter == "2026Q1" and record.sources["DART"][0]["source"] == "DART"
+
+        # 공시 목록 재사용 시간 내 재분석: 원격 조회 없음
+        second = agent.analyze("000001")
+        assert fetches == ["DART", "Naver"] and dart.list_calls == 1
+        assert second.earnings_surprises == first.earnings_surprises
+
+        # 정기보고서 외 공시는 무효화하지 않음
+        agent.config.disclosure_cache_seconds = 0.0
+        dart.disclosures.insert(0, _disclosure("20260601", "주요사항보고서(유상증자결정)"))
+        agent.analyze("000001")
+        assert fetches == ["DART", "Naver"] and dart.list_calls == 2
+
+        # 새 반기보고서 → 재수집
+        dart.disclosures.insert(0, _disclosure("20260814", "반기보고서 (2026.06)"))
+        third = agent.analyze("000001")
+        print(f"  새 정기보고서 후: 수집 {fetches}, 저장 분기 {agent.earnings_store.quarters('000001')}")
+        assert fetches == ["DART", "Naver", "DART", "Naver"]
+        assert agent.earnings_store.quarters("000001") == ["2026Q1", "2026Q2"]
+        assert third.total_disclosures == 3
+
+        off = SentimentAgent(krx_client=FakeKrx(), config=SentimentAnalysisConfig(earnings_cache=False))
+        assert off.earnings_store is None
+
+
+def test_failed_feed_not_cached():
+    """공시 목록 조회 실패는 빈 목록으로 재사용하지 않고 다음 요청에서 재조회"""
+    dart = FakeDart([_disclosure("20260515", "분기보고서 (2026.03)")])
+    agent = SentimentAgent(krx_client=FakeKrx(), dart_client=dart,
+                           config=SentimentAnalysisConfig(news_dedup=False, consensus_history=False),
+                           earnings_store=EarningsStore(persist=False))
+
+    dart.fail = True
+    assert agent._disclosure_feed("000001") == [] and dart.list_calls == 1
+
+    dart.fail = False
+    assert [d["title"] for d in agent._disclosure_feed("000001")] == ["분기보고서 (2026.03)"]
+    assert dart.list_calls == 2
+    agent._disclosure_feed("000001")
+    assert dart.list_calls == 2, "정상 조회 결과는 재사용"
+    print("  조회 실패 후 재조회, 정상 결과 재사용")
+
+
+if __name__ == "__main__":
+    test_periodic_filings()
+    test_store_invalidation()
+    test_agent_reads_locally_until_new_filing()
+    test_failed_feed_not_cached()
+    print("\n모든 테스트 통과")
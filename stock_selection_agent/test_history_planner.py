@@ -0,0 +1,84 @@
+"""
+히스토리 플래너 검증 (네트워크 불필요)
+최대 요구 구간 1회 조회 및 에이전트별 뷰 분배 확인
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.agents.technical_agent import TechnicalAgent
+from src.agents.risk_agent import RiskAgent
+from src.utils.history_planner import HistoryPlanner, HistoryView
+
+
+class RecordingKrx:
+    """조회 횟수를 기록하는 합성 시세 클라이언트"""
+
+    def __init__(self, n_bars: int = 800):
+        self.calls = []
+        self.history = [
+            {"stock_code": "000000", "trade_date": f"D{i:04d}", "close_price": 10000 + (i % 37) * 10, "volume": 1000 + i}
+            for i in range(n_bars)
+        ]
+
+    def _get_latest_trade_date(self) -> str:
+        return "20240628"
+
+    def _get_stock_name(self, stock_code: str) -> str:
+        return "테스트"
+
+    def get_stock_price_history(self, stock_code, start_date=None, end_date=None):
+        self.calls.append((stock_code, start_date, end_date))
+        return self.history
+
+    def get_investor_trading(self, stock_code, start_date=None, end_date=None):
+        return []
+
+
+def test_history_view():
+    """뷰 슬라이싱이 리스트와 같은 결과를 내는지 확인"""
+    base = list(range(10))
+    view = HistoryView(base)
+
+    assert list(view[-3:]) == base[-3:]
+    assert list(view[2:8][1:3]) == base[2:8][1:3]
+    assert view[-1] == 9 and len(view[-20:]) == 10
+    assert view[::2] == base[::2]
+    assert view[-3:]._base is base  # 복사 없음
+    print("   ✓ HistoryView 슬라이싱")
+
+
+def test_planner_fetches_once():
+    """최대 구간을 한 번 조회하고 에이전트별 구간을 나눠줌"""
+    krx = RecordingKrx()
+    technical = TechnicalAgent(krx_client=krx)
+    risk = RiskAgent(krx_client=krx)
+    planner = HistoryPlanner(krx, [technical, risk])
+
+    assert planner.max_bars == risk.required_history_bars() == 785  # Beta 156주
+    assert technical.required_history_bars() == 121
+
+    history = planner.fetch("000000")
+    technical_view = planner.slice_for(history, technical)
+    risk_view = planner.slice_for(history, risk)
+
+    assert len(krx.calls) == 1
+    assert len(technical_view) == 121
+    assert len(risk_view) == 785
+    assert technical_view[-1] is krx.history[-1]
+
+    result = technical.analyze("000000", price_history=technical_view)
+    assert len(krx.calls) == 1, "히스토리를 전달하면 재조회하지 않아야 함"
+    assert "ma120" in result.ma_positions, "MA120까지 계산되어야 함"
+
+    risk.analyze("000000", price_history=risk_view)
+    assert len(krx.calls) == 1
+    print(f"   ✓ 1회 조회 ({len(history)}봉) → 기술적 {len(technical_view)}봉 / 리스크 {len(risk_view)}봉")
+
+
+if __name__ == "__main__":
+    test_history_view()
+    test_planner_fetches_once()
@@ -0,0 +1,178 @@
+"""
+네이버 금융 부분 파싱 검증 (합성 페이지, 네트워크 불필요)
+lxml + SoupStrainer 대상 영역 파싱 결과를 기존 전체 트리(html.parser) 파싱과 비교하고
+페이지 해시 캐시 확인
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from bs4 import BeautifulSoup
+
+from src.agents.sentiment_agent import SentimentAgent
+from src.api.http_pool import PageResponse
+from src.utils.html_parser import HtmlParseCache, parse_html
+
+
+def _filler(n):
+    """대상 영역 외 페이지 구성 요소 (메뉴, 시세표, 스크립트 등)"""
+    blocks = []
+    for i in range(n):
+        blocks.append(
+            f'<div class="section_{i % 7}"><ul class="menu">'
+            + "".join(f'<li><a href="/m/{i}/{j}">메뉴 {j}</a></li>' for j in range(8))
+            + f'</ul><table class="type_{i % 3}"><tr>'
+            + "".join(f"<td>{i * j:,}</td>" for j in range(10))
+            + f"</tr></table><script>var x{i} = {i};</script></div>"
+        )
+    return "".join(blocks)
+
+
+def _main_page(filler=400):
+    opinions = "".join(
+        f"<tr><td>증권사{i}</td><td>{['매수', '적극매수', '보유', '매도', 'BUY'][i % 5]}</td>"
+        f"<td>{70000 + i * 1000:,}</td><td>2026.01.{i + 1:02d}</td></tr>"
+        for i in range(12)
+    )
+    eps = "".join(
+        f"<tr><td>2025/{q}Q</td><td>{1000 + q * 50:,}</td><td>{980 + q * 40:,}</td></tr>"
+        for q in range(1, 5)
+    )
+    return (
+        "<html><head><title>삼성전자</title></head><body>"
+        + _filler(filler // 2)
+        + '<div class="sub_section cop_analysis"><table class="tb_type1 tb_num">'
+        + "<tr><th>증권사</th><th>의견</th><th>목표가</th><th>일자</th></tr>" + opinions + "</table>"
+        + '<table class="gray"><tr><th>매출액</th></tr><tr><td>2025/1Q</td><td>1</td></tr></table>'
+        + '<table class="gray"><tr><th>EPS(원)</th></tr>' + eps + "</table></div>"
+        + _filler(filler // 2)
+        + "</body></html>"
+    )
+
+
+def _news_page(filler=200):
+    rows = "".join(
+        f'<tr><td class="title"><span class="articleSubject"><a href="/item/news_read.naver?id={i}" '
+        f'title="삼성전자 뉴스 {i} 흑자 전환">삼성전자 뉴스 {i}</a></span></td>'
+        f'<td class="date">2026.10.{(i % 17) + 1:02d}</td></tr>'
+        for i in range(25)
+    )
+    return ("<html><body>" + _filler(filler) + f'<table class="type5 newsList">{rows}</table>'
+            + _filler(filler) + "</body></html>")
+
+
+# 기존 구현 (전체 트리 html.parser)
+def _old_news_rows(html):
+    soup = BeautifulSoup(html, "html.parser")
+    items = soup.select('.newsList .articleSubject a')
+    dates = soup.select('.newsList .date')
+    return [(a.get('title', a.text.strip()), d.text.strip(), a.get('href', '')) for a, d in zip(items[:20], dates[:20])]
+
+
+def _old_opinion_rows(html):
+    soup = BeautifulSoup(html, "html.parser")
+    area = soup.select_one('.cop_analysis')
+    rows = []
+    for item in area.select('.tb_type1 tr'):
+        cells = item.select('td')
+        if len(cells) >= 4:
+            rows.append((cells[1].text.strip(), cells[2].text.strip()))
+    return rows
+
+
+def _old_eps_rows(html):
+    soup = BeautifulSoup(html, "html.parser")
+    if not soup.select('.sub_section.cop_analysis'):
+        return []
+    for table in soup.select('.gray'):
+        header = table.select_one('th')
+        if header and ('EPS' in header.text or '주당순이익' in header.text):
+            return [[c.text.strip() for c in row.select('td')] for row in table.select('tr')]
+    return []
+
+
+class FakeHttp:
+    """고정 페이지를 반환하는 HTTP 풀 대체"""
+
+    def __init__(self, pages):
+        self.pages = pages
+
+    def get(self, url, **kwargs):
+        for marker, html in self.pages.items():
+            if marker in url:
+                return PageResponse(url=url, status_code=200, text=html)
+        raise RuntimeError(f"unexpected url: {url}")
+
+
+def test_parity_with_full_parse():
+    """부분 파싱 결과 = 전체 트리 파싱 결과"""
+    print("=" * 60)
+    print("부분 파싱 결과 일치")
+    print("=" * 60)
+
+    main, news = _main_page(), _news_page()
+    assert SentimentAgent._parse_naver_news_rows(news) == _old_news_rows(news)
+    assert SentimentAgent._parse_naver_opinion_rows(main) == _old_opinion_rows(main)
+    assert SentimentAgent._parse_naver_eps_rows(main) == _old_eps_rows(main)
+    assert len(SentimentAgent._parse_naver_news_rows(news)) == 20
+    assert SentimentAgent._parse_naver_eps_rows("<html><table class='gray'><th>EPS</th></table></html>") == []
+
+    # 다중 클래스 요소도 대상에 포함
+    soup = parse_html('<div class="a"><table class="gray x"><tr><td>1</td></tr></table></div><p>b</p>', ("gray",))
+    assert len(soup.select('.gray')) == 1 and not soup.select('p')
+
+    # 빈 문서 / 인코딩 선언 포함 문서
+    assert parse_html("", ("gray",)).select('.gray') == []
+    xml_declared = '<?xml version="1.0" encoding="utf-8"?><html><table class="gray"><tr><td>1</td></tr></table></html>'
+    assert [td.text for td in parse_html(xml_declared, ("gray",)).select('.gray td')] == ["1"]
+    print("  뉴스/투자의견/EPS 일치")
+
+
+def test_fetchers_use_cache():
+    """수집 함수 결과 + 같은 페이지 재파싱 없음"""
+    print("\n" + "=" * 60)
+    print("수집 함수 + 페이지 해시 캐시")
+    print("=" * 60)
+
+    agent = SentimentAgent(krx_client=object(), http_pool=FakeHttp({
+        "news_news": _news_page(50), "main.naver": _main_page(50)
+    }))
+
+    news = agent._fetch_news_naver("005930", "삼성전자", days=3650)
+    analyst = agent._fetch_analyst_data_naver("005930")
+    earnings = agent._fetch_earnings_data_naver("005930")
+    print(f"  뉴스 {len(news)}건, 의견 {analyst['rating_distribution']}, 실적 {len(earnings)}분기")
+
+    assert len(news) == 20 and news[0]["url"].startswith("https://finance.naver.com/item/news_read")
+    assert analyst["rating_distribution"] == {"strong_buy": 3, "buy": 5, "hold": 2, "sell": 2, "strong_sell": 0}
+    assert analyst["target_prices"][:2] == [70000, 71000]
+    assert [e["quarter"] for e in earnings] == ["2025/1Q", "2025/2Q", "2025/3Q", "2025/4Q"]
+    assert earnings[0]["actual_eps"] == 1050.0 and earnings[0]["estimate_eps"] == 1020.0
+
+    html_cache = agent.crawler.html_cache
+    misses = html_cache.misses
+    agent._fetch_news_naver("005930", "삼성전자", days=3650)
+    agent._fetch_analyst_data_naver("005930")
+    agent._fetch_earnings_data_naver("005930")
+    assert html_cache.misses == misses and html_cache.hits == 3
+
+    # 캐시 결과는 복사본
+    cache = HtmlParseCache(max_entries=2)
+    first = cache.extract("<p>a</p>", lambda html: [1, 2], name="x")
+    first.append(3)
+    assert cache.extract("<p>a</p>", lambda html: [9], name="x") == [1, 2]
+
+    # 이름이 같은 추출기(람다)도 각자 결과
+    extractors = [lambda html: "A", lambda html: "B"]
+    assert extractors[0].__qualname__ == extractors[1].__qualname__
+    assert [cache.extract("<p>x</p>", extractor) for extractor in extractors] == ["A", "B"]
+    assert cache.extract("<p>x</p>", extractors[0]) == "A" and cache.hits == 2
+
+
+if __name__ == "__main__":
+    test_parity_with_full_parse()
+    test_fetchers_use_cache()
+    print("\n모든 테스트 통과")
@@ -0,0 +1,244 @@
+"""
+HTTP 풀 검증 (로컬 테스트 서버, 외부 네트워크 불필요)
+ETag/Last-Modified 조건부 요청, 디스크 페이지 캐시, 파싱 결과 재사용,
+호스트별 동시 연결 제한, 구글 RSS 수집 경로 확인
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import quote
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.api.http_pool import HttpPool, HttpPoolConfig
+
+
+RSS_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>테스트</title>
+<item><title>테스트종목 사상 최대 실적 {version}</title><link>http://example.com/{version}</link>
+<pubDate>{pub_date}</pubDate></item>
+</channel></rss>"""
+
+
+class _State:
+    version = "v1"
+    hits = {}
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        with _State.lock:
+            _State.hits[self.path] = _State.hits.get(self.path, 0) + 1
+            _State.active += 1
+            _State.max_active = max(_State.max_active, _State.active)
+        try:
+            if self.path.startswith("/slow"):
+                time.sleep(0.2)
+                self._send(200, b"slow")
+            elif self.path.startswith("/etag"):
+                etag = f'"{_State.version}"'
+                if self.headers.get("If-None-Match") == etag:
+                    self._send(304, b"", {"ETag": etag})
+                else:
+                    self._send(200, f"<html>{_State.version}</html>".encode(), {"ETag": etag})
+            elif self.path.startswith("/modified"):
+                modified = "Mon, 01 Jan 2024 00:00:00 GMT"
+                if self.headers.get("If-Modified-Since") == modified:
+                    self._send(304, b"", {"Last-Modified": modified})
+                else:
+                    self._send(200, b"<html>modified</html>", {"Last-Modified": modified})
+            elif self.path.startswith("/rss"):
+                pub_date = time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime())
+                body = RSS_TEMPLATE.format(version=_State.version, pub_date=pub_date).encode()
+                etag = f'"rss-{_State.version}"'
+                if self.headers.get("If-None-Match") == etag:
+                    self._send(304, b"", {"ETag": etag})
+                else:
+                    self._send(200, body, {"ETag": etag, "Content-Type": "application/rss+xml"})
+            elif self.path.startswith("/dynamic"):
+                self._send(200, b"<html>dynamic</html>")
+            else:
+                self._send(404, b"not found")
+        finally:
+            with _State.lock:
+                _State.active -= 1
+
+    def _send(self, status, body, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+
+def _start_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_conditional_get():
+    """ETag/Last-Modified 304 + 디스크 캐시"""
+    print("=" * 60)
+    print("조건부 요청")
+    print("=" * 60)
+
+    server, base = _start_server()
+    with tempfile.TemporaryDirectory() as tmp:
+        pool = HttpPool(HttpPoolConfig(cache_dir=Path(tmp)))
+        _State.version = "v1"
+
+        first = pool.get(f"{base}/etag")
+        second = pool.get(f"{base}/etag")
+        assert first.status_code == 200 and not first.not_modified
+        assert second.not_modified and second.text == first.text == "<html>v1</html>"
+
+        # 새 풀(프로세스 재시작)도 디스크 캐시로 304
+        restarted = HttpPool(HttpPoolConfig(cache_dir=Path(tmp)))
+        assert restarted.get(f"{base}/etag").not_modified
+
+        # 페이지 변경 → 200 + 새 본문
+        _State.version = "v2"
+        changed = pool.get(f"{base}/etag")
+        assert not changed.not_modified and changed.text == "<html>v2</html>"
+
+        assert pool.get(f"{base}/modified").status_code == 200
+        assert pool.get(f"{base}/modified").not_modified
+
+        # 검증값 없는 페이지는 저장하지 않음
+        pool.get(f"{base}/dynamic")
+        assert not pool.get(f"{base}/dynamic").not_modified
+
+        for _ in range(2):
+            assert pool.get(f"{base}/etag").text == "<html>v2</html>"
+        print(f"  통계: {pool.stats}")
+        assert pool.stats["not_modified"] >= 4
+    server.shutdown()
+
+
+def test_cache_limits():
+    """메모리 LRU 상한, 디스크 항목 수/보관 기간 정리"""
+    print("\n" + "=" * 60)
+    print("캐시 상한")
+    print("=" * 60)
+
+    server, base = _start_server()
+    with tempfile.TemporaryDirectory() as tmp:
+        config = HttpPoolConfig(cache_dir=Path(tmp), memory_cache_size=3)
+        pool = HttpPool(config)
+        urls = [f"{base}/etag?page={i}" for i in range(6)]
+        for url in urls:
+            pool.get(url)
+            time.sleep(0.01)  # 파일 수정 시각 순서 보장
+        assert len(pool._memory_cache) == 3
+        assert list(pool._memory_cache) == [pool.cache_key(url) for url in urls[3:]]
+
+        # 304 재사용은 디스크 사용 시각 갱신 → 정리 대상에서 제외
+        assert pool.get(urls[0]).not_modified
+        config.disk_cache_max_entries = 4
+        removed = pool.prune_disk_cache()
+        remaining = {path.stem for path in Path(tmp).glob("*.json")}
+        assert removed == 2 and len(remaining) == 4
+        assert pool.cache_key(urls[0]) in remaining and pool.cache_key(urls[1]) not in remaining
+
+        # 저장 시 주기적 정리로 상한 유지
+        for i in range(6, 12):
+            pool.get(f"{base}/etag?page={i}")
+        assert len(list(Path(tmp).glob("*.json"))) <= 4
+
+        # 보관 기간 경과 파일은 조회 시 무시/삭제
+        config.disk_cache_max_entries = 100
+        pool.get(urls[5])
+        stale = Path(tmp) / f"{pool.cache_key(urls[5])}.json"
+        old = time.time() - (config.disk_cache_max_age_days + 1) * 86400
+        os.utime(stale, (old, old))
+        restarted = HttpPool(config)
+        assert not restarted.get(urls[5]).not_modified
+        assert stale.exists() and stale.stat().st_mtime > old
+        print(f"  메모리 {len(pool._memory_cache)}개, 디스크 {len(remaining)}개 유지")
+    server.shutdown()
+
+
+def test_per_host_limit():
+    """호스트별 동시 연결 상한"""
+    print("\n" + "=" * 60)
+    print("호스트별 연결 제한")
+    print("=" * 60)
+
+    server, base = _start_server()
+    with tempfile.TemporaryDirectory() as tmp:
+        pool = HttpPool(HttpPoolConfig(cache_dir=Path(tmp), max_connections_per_host=2))
+        _State.max_active = 0
+
+        threads = [threading.Thread(target=pool.get, args=(f"{base}/slow?{i}",)) for i in range(6)]
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - start
+
+        print(f"  최대 동시 요청: {_State.max_active}, 소요: {elapsed:.2f}초")
+        assert _State.max_active <= 2
+        assert elapsed >= 0.55
+    server.shutdown()
+
+
+def test_google_rss_through_pool():
+    """구글 RSS 수집 경로 (조건부 요청 + 파싱 결과 재사용)"""
+    print("\n" + "=" * 60)
+    print("RSS 수집")
+    print("=" * 60)
+
+    try:
+        import feedparser  # noqa: F401
+    except ImportError:
+        print("  feedparser 미설치 - 건너뜀")
+        return
+
+    from src.agents.sentiment_agent import SentimentAgent
+
+    server, base = _start_server()
+    with tempfile.TemporaryDirectory() as tmp:
+        pool = HttpPool(HttpPoolConfig(cache_dir=Path(tmp)))
+        agent = SentimentAgent(krx_client=object(), http_pool=pool)
+        _State.version = "v1"
+
+        # 구글 RSS URL → 로컬 서버로 연결
+        google_url = ("https://news.google.com/rss/search?q=" + quote("테스트종목 stock OR 주가")
+                      + "&hl=ko&gl=KR&ceid=KR:ko")
+        session_get = pool.session.get
+        pool.session.get = lambda url, **kw: session_get(f"{base}/rss" if url == google_url else url, **kw)
+
+        first = agent._fetch_news_google_rss("테스트종목")
+        second = agent._fetch_news_google_rss("테스트종목")
+
+        print(f"  수집: {[n['headline'] for n in first]}, 통계: {pool.stats}")
+        assert len(first) == 1 and first == second
+        # 304 본문은 같은 본문이므로 크롤링 스케줄러 파싱 캐시 재사용
+        assert pool.stats["not_modified"] == 1 and agent.crawler.html_cache.hits == 1
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    test_conditional_get()
+    test_cache_limits()
+    test_per_host_limit()
+    test_google_rss_through_pool()
+    print("\n모든 테스트 통과")
@@ -0,0 +1,110 @@
+"""
+키워드 오토마톤 검증 (합성 헤드라인, 네트워크 불필요)
+Aho-Corasick 점수를 기존 `keyword in text` 순차 검사와 비교
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+
+from src.agents.sentiment_agent import SentimentAgent
+from src.utils.keyword_automaton import KeywordAutomaton
+
+
+def _naive_score(text, *dicts):
+    """기존 순차 검사 구현"""
+    score = 0
+    for d in dicts:
+        for keyword, weight in d.items():
+            if keyword in text:
+                score += weight
+    return max(-1, min(1, score))
+
+
+def _make_headlines(keywords, n=10000, seed=41):
+    rng = np.random.default_rng(seed)
+    fillers = ["삼성전자", "3분기", "시장", "예상", "대비", "발표", "주가", "이번", "전년", " "]
+    vocabulary = list(keywords) + fillers
+    headlines = []
+    for _ in range(n):
+        words = rng.choice(vocabulary, size=rng.integers(3, 10))
+        # 공백 없이 붙인 헤드라인도 섞어 키워드 경계 겹침 확인
+        headlines.append(("" if rng.random() < 0.3 else " ").join(words))
+    return headlines
+
+
+def test_overlapping_keywords():
+    """겹치거나 포함 관계인 키워드 모두 검출"""
+    print("=" * 60)
+    print("겹치는 키워드")
+    print("=" * 60)
+
+    automaton = KeywordAutomaton({"적자": -0.7, "적자 전환": -0.9, "자 전": 0.1, "전환": 0.2, "환": 0.05})
+    found = dict(automaton.find("영업이익 적자 전환"))
+    print(f"  검출: {found}")
+    assert set(found) == {"적자", "적자 전환", "자 전", "전환", "환"}
+    assert automaton.find("흑자") == []
+    assert automaton.score("") == 0
+
+    # 같은 키워드 반복은 1회만 합산
+    assert automaton.score("적자 적자 적자", clip=10) == -0.7
+
+    merged = KeywordAutomaton.from_dicts({"증자": 0.3}, {"증자": -0.5, "감자": -0.8})
+    assert len(merged) == 2
+    assert abs(merged.score("유상증자 결정") + 0.2) < 1e-12
+
+
+def test_headline_parity():
+    """에이전트 헤드라인/공시 점수 = 기존 순차 검사"""
+    print("\n" + "=" * 60)
+    print("헤드라인/공시 점수 일치")
+    print("=" * 60)
+
+    agent = SentimentAgent(krx_client=object())
+    headline_dicts = (agent.positive_keywords, agent.negative_keywords)
+    disclosure_dicts = (agent.positive_disclosure_keywords, agent.negative_disclosure_keywords)
+
+    headlines = _make_headlines({**agent.positive_keywords, **agent.negative_keywords}, n=3000)
+    scores = agent.score_headlines(headlines)
+    for headline, score in zip(headlines, scores):
+        assert score == _naive_score(headline, *headline_dicts), headline
+        assert agent._analyze_headline(headline) == score
+    print(f"  헤드라인 {len(headlines)}건 일치")
+
+    titles = _make_headlines(
+        {**agent.positive_disclosure_keywords, **agent.negative_disclosure_keywords}, n=2000, seed=7
+    )
+    scores = agent.score_disclosures(titles)
+    for title, score in zip(titles, scores):
+        assert score == _naive_score(title, *disclosure_dicts), title
+        assert agent._calculate_disclosure_sentiment(title) == score
+    print(f"  공시 {len(titles)}건 일치")
+
+    # 사전 수정 후 재컴파일
+    agent.positive_keywords["신고가"] = 0.6
+    agent._compile_keyword_automata()
+    assert agent._analyze_headline("52주 신고가 경신") == _naive_score("52주 신고가 경신", *headline_dicts)
+
+
+def test_large_dictionary_parity():
+    """무작위 음절 키워드 1천여 개 사전에서도 순차 검사와 동일 (공백 없이 붙은 키워드 경계 겹침 포함)"""
+    rng = np.random.default_rng(3)
+    syllables = list("가나다라마바사아자차카타파하강산전환실적증감")
+    keywords = {"".join(rng.choice(syllables, size=rng.integers(2, 5))): float(rng.uniform(-1, 1))
+                for _ in range(1500)}
+    automaton = KeywordAutomaton(keywords)
+    headlines = _make_headlines(list(keywords)[:200], n=2000)
+
+    assert automaton.score_many(headlines) == [_naive_score(h, keywords) for h in headlines]
+    print(f"  확장 사전 {len(keywords)}개: 헤드라인 {len(headlines)}건 일치")
+
+
+if __name__ == "__main__":
+    test_overlapping_keywords()
+    test_headline_parity()
+    test_large_dictionary_parity()
+    print("\n모든 테스트 통과")
@@ -0,0 +1,89 @@
+"""
+키워드-문서 희소 행렬 검증 (합성 헤드라인, 네트워크 불필요)
+행렬-벡터 곱 점수를 헤드라인별 오토마톤 점수와 비교하고,
+가중치 교체/역방향 곱(가중치 보정용) 확인
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+
+from src.agents.sentiment_agent import SentimentAgent
+from src.utils.keyword_automaton import KeywordAutomaton, KeywordMatrix
+
+
+def _make_texts(keywords, n, seed=49):
+    rng = np.random.default_rng(seed)
+    fillers = ["삼성전자", "2분기", "시장", "발표", "주가", "전년", " "]
+    vocabulary = list(keywords) + fillers
+    return [
+        ("" if rng.random() < 0.3 else " ").join(rng.choice(vocabulary, size=rng.integers(2, 9)))
+        for _ in range(n)
+    ]
+
+
+def test_matrix_structure():
+    """행 = 텍스트, 열 = 키워드 (중복 포함 1회), 빈 텍스트는 빈 행"""
+    print("=" * 60)
+    print("희소 행렬 구조")
+    print("=" * 60)
+
+    automaton = KeywordAutomaton({"상승": 0.5, "급상승": 0.8, "하락": -0.5})
+    matrix = automaton.matrix(["급상승 후 상승", "", "하락 하락", "보합"])
+    print(f"  shape {matrix.shape}, 포함 {len(matrix.indices)}개")
+
+    assert isinstance(matrix, KeywordMatrix) and matrix.shape == (4, 3)
+    assert matrix.to_dense().tolist() == [[1, 1, 0], [0, 0, 0], [0, 0, 1], [0, 0, 0]]
+    assert matrix.document_frequency().tolist() == [1, 1, 1]
+    np.testing.assert_allclose(matrix.dot(automaton.weights), [1.3, 0.0, -0.5, 0.0])
+    np.testing.assert_allclose(automaton.score_matrix(matrix), [1.0, 0.0, -0.5, 0.0])
+    np.testing.assert_allclose(matrix.rdot([1.0, 5.0, 2.0, 7.0]), [1.0, 1.0, 2.0])
+
+    empty = automaton.matrix([])
+    assert empty.shape == (0, 3) and len(empty.dot(automaton.weights)) == 0
+
+
+def test_agent_score_texts():
+    """score_texts = score_headlines/score_disclosures, 가중치 교체 시 텍스트 재탐색 없음"""
+    print("\n" + "=" * 60)
+    print("SentimentAgent.score_texts")
+    print("=" * 60)
+
+    agent = SentimentAgent(krx_client=object())
+    headlines = _make_texts(list(agent.positive_keywords) + list(agent.negative_keywords), 3000)
+    titles = _make_texts(list(agent.positive_disclosure_keywords) + list(agent.negative_disclosure_keywords), 1000)
+
+    np.testing.assert_allclose(agent.score_texts(headlines), agent.score_headlines(headlines), atol=1e-12)
+    np.testing.assert_allclose(
+        agent.score_texts(titles, kind="disclosure"), agent.score_disclosures(titles), atol=1e-12
+    )
+
+    # 가중치 보정: 행렬은 한 번만 만들고 후보 가중치로 재계산
+    matrix = agent.keyword_matrix(headlines)
+    weights = agent.keyword_weights()
+    assert matrix.n_keywords == len(weights)
+    doubled = agent.score_texts(matrix, weights=[w * 2 for w in weights.values()], clip=100.0)
+    np.testing.assert_allclose(doubled, 2 * matrix.dot(list(weights.values())))
+
+    # 잔차 → 키워드별 기울기 (Xᵀr)
+    target = np.where(np.arange(len(headlines)) % 2 == 0, 0.5, -0.5)
+    gradient = matrix.rdot(agent.score_texts(matrix) - target)
+    dense = matrix.to_dense().astype(float)
+    np.testing.assert_allclose(gradient, dense.T @ (agent.score_texts(matrix) - target))
+    print(f"  헤드라인 {len(headlines)}개 × 키워드 {matrix.n_keywords}개, 포함 {len(matrix.indices):,}개")
+
+    try:
+        agent.score_texts(headlines, kind="report")
+        assert False, "지원하지 않는 종류"
+    except ValueError:
+        pass
+
+
+if __name__ == "__main__":
+    test_matrix_structure()
+    test_agent_score_texts()
+    print("\n모든 테스트 통과")
@@ -0,0 +1,182 @@
+"""
+유니버스 유동성 지표 검증 (합성 시세, 네트워크 불필요)
+배치 ADTV/회전율/Amihud를 종목별 루프 계산과 비교
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+import pandas as pd
+
+from src.agents.risk_agent import RiskAgent, RiskAnalysisConfig
+from src.agents.screening_agent import ScreeningAgent, ScreeningCriteria
+from src.analytics.liquidity import AMIHUD_SCALE, compute_liquidity_metrics
+from src.models.panel import PricePanel
+
+
+def _make_panel(n_dates=260, n_codes=12, seed=3):
+    """종목별 거래 규모가 다른 합성 패널 (거래정지/신규상장 포함)"""
+    rng = np.random.default_rng(seed)
+    close = 10000 * np.exp(np.cumsum(rng.normal(0, 0.02, size=(n_dates, n_codes)), axis=0))
+    volume = rng.integers(1_000, 50_000, size=(n_dates, n_codes)).astype(float)
+    volume *= np.logspace(0, 3, n_codes)[None, :]
+    trading_value = close * volume * rng.uniform(0.98, 1.02, size=close.shape)
+
+    close[:100, 1] = np.nan  # 신규상장
+    volume[:100, 1] = np.nan
+    trading_value[:100, 1] = np.nan
+    volume[-5:, 2] = 0  # 거래정지
+    trading_value[-5:, 2] = 0
+
+    codes = [f"{i:06d}" for i in range(n_codes)]
+    dates = [f"2024{i:04d}" for i in range(n_dates)]
+    return PricePanel(dates=dates, codes=codes, close=close, volume=volume, trading_value=trading_value)
+
+
+def _loop_reference(panel, col, n, shares):
+    """종목 1개 기준 구현 (거래일만 평균)"""
+    close = panel.close[:, col]
+    value = panel.trading_value[:, col]
+    volume = panel.volume[:, col]
+    days = [t for t in range(len(close) - n, len(close)) if not np.isnan(close[t]) and value[t] > 0]
+    adtv = sum(value[t] for t in days) / len(days)
+    impacts = [
+        abs(close[t] / close[t - 1] - 1) / (value[t] / AMIHUD_SCALE)
+        for t in days if t > 0 and not np.isnan(close[t - 1])
+    ]
+    turnover = sum(volume[t] for t in days) / len(days) * 252 / shares
+    return adtv, sum(impacts) / len(impacts), turnover
+
+
+def test_batch_matches_loop():
+    """배치 지표 = 종목별 루프"""
+    print("=" * 60)
+    print("유니버스 유동성")
+    print("=" * 60)
+
+    panel = _make_panel()
+    shares = np.full(len(panel.codes), 5_000_000.0)
+    metrics = compute_liquidity_metrics(panel, shares)
+
+    for col in range(len(panel.codes)):
+        for n in (20, 60, 252):
+            adtv, amihud, turnover = _loop_reference(panel, col, n, shares[col])
+            assert np.isclose(metrics.adtv[n][col], adtv)
+            assert np.isclose(metrics.amihud[n][col], amihud)
+            assert np.isclose(metrics.turnover_ratio[n][col], turnover)
+
+    grades = list(metrics.grade)
+    assert grades[0] == "F" and grades[-1] == "A", grades
+    assert metrics.passing("A") == [c for c, g in zip(panel.codes, grades) if g == "A"]
+    print(f"   ✓ {len(panel.codes)}종목 × 3기간 루프 계산과 일치, 등급 {''.join(grades)}")
+
+    # 유통비율 반영 시 회전율은 비율만큼 증가
+    adjusted = compute_liquidity_metrics(panel, shares, np.full(len(shares), 0.5))
+    assert np.allclose(adjusted.turnover_ratio[252], metrics.turnover_ratio[252] * 2)
+    print("   ✓ 유통주식 조정 회전율")
+
+
+def test_agent_uses_universe():
+    """RiskAgent 단일 종목 경로 = 배치 결과, scan 이후 같은 거래일은 캐시 사용"""
+    raw = _make_panel()
+    # to_history()는 정수 시세이므로 같은 값으로 비교
+    panel = PricePanel(
+        dates=raw.dates,
+        codes=raw.codes,
+        close=np.floor(raw.close),
+        volume=np.floor(raw.volume),
+        trading_value=np.floor(raw.trading_value)
+    )
+    agent = RiskAgent()
+    code = panel.codes[5]
+
+    history = panel.to_history(code)
+    single = agent._analyze_liquidity_risk(code, history)
+
+    batch = compute_liquidity_metrics(panel).to_dict(code)
+    assert single["avg_daily_trading_value"] == batch["avg_daily_trading_value"]
+    assert single["liquidity_grade"] == batch["liquidity_grade"]
+    assert single["turnover_ratio"] is None
+
+    shares = {c: 5_000_000 for c in panel.codes}
+    scanned = agent.scan_liquidity(panel, shares)
+    assert agent.scan_liquidity(panel, shares) is scanned, "같은 거래일은 캐시"
+    cached = agent._analyze_liquidity_risk(code, history)
+    assert cached["turnover_ratio"] is not None and cached["adtv"]["252"] is not None
+
+    # 다른 거래일 히스토리는 마지막 스캔 결과를 쓰지 않고 히스토리로 계산
+    previous = agent._analyze_liquidity_risk(code, history[:-1])
+    assert previous["turnover_ratio"] is None
+    assert agent._analyze_liquidity_risk(code, [])["avg_daily_trading_value"] is None
+    print(f"   ✓ 단일 종목 ADTV {single['avg_daily_trading_value']:,}원 (등급 {single['liquidity_grade']})")
+
+
+class _FakeKrx:
+    """시세 패널/시가총액 스냅샷만 제공하는 KRX 대역"""
+
+    def __init__(self, panel):
+        self.panel = panel
+        self.panel_calls = 0
+
+    def _get_latest_trade_date(self):
+        return self.panel.dates[-1]
+
+    def get_ohlcv_panel(self, stock_codes=None, n_bars=120, end_date=None, market="ALL"):
+        self.panel_calls += 1
+        return self.panel
+
+    def get_market_cap_snapshot(self, trade_date, market="ALL"):
+        return pd.DataFrame({"상장주식수": 5_000_000}, index=self.panel.codes)
+
+
+def test_screening_grade_filter():
+    """스크리닝 유동성 등급 필터 (거래일별 캐시)"""
+    panel = _make_panel()
+    krx = _FakeKrx(panel)
+    agent = ScreeningAgent(krx_client=krx)
+
+    stocks = [{"stock_code": code} for code in panel.codes]
+    kept = agent._apply_liquidity_filter(stocks, "ALL", "B")
+    agent._apply_liquidity_filter(stocks, "ALL", "B")
+    liquidity = agent.get_liquidity(panel.dates[-1])
+    assert [s["stock_code"] for s in kept] == liquidity.passing("B")
+    assert krx.panel_calls == 1, "거래일별 1회 계산"
+    assert ScreeningCriteria().min_liquidity_grade is None
+    print(f"   ✓ 등급 B 이상 {len(kept)}/{len(stocks)}종목, 패널 조회 {krx.panel_calls}회")
+
+
+def test_shared_provider():
+    """스크리닝/리스크 에이전트 공용 유동성: 설정 등급 기준, 유통비율, 거래일 캐시 공유"""
+    panel = _make_panel()
+    krx = _FakeKrx(panel)
+    config = RiskAnalysisConfig(liquidity_excellent=10 ** 15, liquidity_good=10 ** 14)
+    risk = RiskAgent(krx_client=krx, config=config)
+    screening = ScreeningAgent(krx_client=krx, liquidity_provider=risk.liquidity_provider)
+    risk.liquidity_provider.set_free_float({code: 0.5 for code in panel.codes})
+
+    liquidity = screening.get_liquidity()
+    assert "A" not in liquidity.grade.tolist() and "B" not in liquidity.grade.tolist(), "설정 등급 기준"
+    expected = compute_liquidity_metrics(
+        panel, np.full(len(panel.codes), 5_000_000.0), np.full(len(panel.codes), 0.5),
+        thresholds=risk._liquidity_thresholds()
+    )
+    np.testing.assert_allclose(liquidity.turnover_ratio[252], expected.turnover_ratio[252])
+    assert liquidity.grade.tolist() == expected.grade.tolist()
+
+    # 리스크 분석은 스크리닝이 계산한 같은 거래일 결과를 재사용 (패널 재조회/재계산 없음)
+    code = panel.codes[5]
+    result = risk._analyze_liquidity_risk(code, panel.to_history(code))
+    assert result == liquidity.to_dict(code) and krx.panel_calls == 1
+    assert result["free_float_ratio"] == 0.5
+    print(f"   ✓ 공용 유동성: 등급 {liquidity.to_dict(code)['liquidity_grade']}, 패널 조회 {krx.panel_calls}회")
+
+
+if __name__ == "__main__":
+    test_batch_matches_loop()
+    test_agent_uses_universe()
+    test_screening_grade_filter()
+    test_shared_provider()
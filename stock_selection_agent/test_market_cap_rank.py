@@ -0,0 +1,124 @@
+"""
+시가총액 순위 인덱스 검증 (합성 스냅샷, 네트워크 불필요)
+전체/시장 내/업종 내 순위를 정렬 기준 구현과 비교하고 IndustryAgent 조회 확인
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+import pandas as pd
+
+from src.agents.industry_agent import IndustryAgent
+from src.analytics.market_cap_rank import build_market_cap_ranks
+
+
+def _make_universe(n=2600, seed=8):
+    rng = np.random.default_rng(seed)
+    codes = [f"{i:06d}" for i in range(n)]
+    caps = rng.lognormal(26, 1.5, n)
+    caps[5] = np.nan  # 시가총액 결측
+    markets = np.where(np.arange(n) < 900, "KOSPI", "KOSDAQ")
+    industries = dict(zip(codes, rng.choice(["26410", "21210", "64190", "41221"], size=n)))
+    return codes, caps, markets, industries
+
+
+def _sorted_rank(codes, caps, members):
+    ordered = sorted((c for c in members if not np.isnan(caps[codes.index(c)])),
+                     key=lambda c: -caps[codes.index(c)])
+    return {code: i + 1 for i, code in enumerate(ordered)}
+
+
+def test_ranks_match_sort():
+    """전체/시장/업종 순위 = 그룹별 정렬"""
+    print("=" * 60)
+    print("시가총액 순위 인덱스")
+    print("=" * 60)
+
+    codes, caps, markets, industries = _make_universe(n=400)
+    sectors = [IndustryAgent()._map_industry_to_sector(industries[c])[1] for c in codes]
+    ranks = build_market_cap_ranks(codes, caps, markets, sectors)
+
+    overall = _sorted_rank(codes, caps, codes)
+    kosdaq = _sorted_rank(codes, caps, [c for c, m in zip(codes, markets) if m == "KOSDAQ"])
+    finance = _sorted_rank(codes, caps, [c for c, s in zip(codes, sectors) if s == "금융"])
+    for code in codes:
+        info = ranks.lookup(code)
+        if code == codes[5]:
+            assert info is None
+            continue
+        assert info["rank"] == overall[code]
+        if code in kosdaq:
+            assert info["market_rank"] == kosdaq[code] and info["market_total"] == len(kosdaq)
+        if code in finance:
+            assert info["sector_rank"] == finance[code] and info["sector_total"] == len(finance)
+    assert ranks.total == 399
+    print("   ✓ 400종목 전체/시장/업종 순위 정렬 결과와 일치")
+
+
+class _FakeKrx:
+    def __init__(self, codes, caps, markets):
+        self.frames = {
+            market: pd.DataFrame({"시가총액": caps[markets == market]}, index=np.array(codes)[markets == market])
+            for market in ("KOSPI", "KOSDAQ")
+        }
+        self.snapshot_calls = 0
+
+    def _get_latest_trade_date(self):
+        return "20240614"
+
+    def get_market_cap_snapshot(self, trade_date, market="ALL"):
+        self.snapshot_calls += 1
+        return self.frames[market]
+
+
+class _FakeDart:
+    def __init__(self, industries):
+        self.industries = industries
+
+    def get_industry_codes(self, stock_codes):
+        return {code: self.industries[code] for code in stock_codes if code in self.industries}
+
+
+def test_agent_position():
+    """IndustryAgent 시장 내 위치: 상위 500 밖 종목도 순위, 거래일 1회 생성"""
+    codes, caps, markets, industries = _make_universe()
+    krx = _FakeKrx(codes, caps, markets)
+    agent = IndustryAgent(dart_client=_FakeDart(industries), krx_client=krx)
+
+    start = time.perf_counter()
+    positions = {code: agent._analyze_market_position(code, "") for code in codes}
+    elapsed = time.perf_counter() - start
+    assert krx.snapshot_calls == 2, "거래일별 시장당 1회"
+
+    smallest = min((c for c in codes if positions[c]["rank"]), key=lambda c: caps[codes.index(c)])
+    assert positions[smallest]["rank"] == 2599 and positions[smallest]["score"] == 50, "상위 500 밖은 중립"
+    largest = max((c for c in codes if positions[c]["rank"]), key=lambda c: caps[codes.index(c)])
+    assert positions[largest]["rank"] == 1 and positions[largest]["sector_rank"] == 1
+    assert positions[codes[5]]["rank"] is None
+    print(f"   ✓ 2600종목 순위 조회 {elapsed * 1000:.0f}ms, 최하위 {smallest} → {positions[smallest]['rank']}위")
+
+
+def test_position_score_scale():
+    """점수는 상위 500 내 백분위 (기존 상위 500 순위 목록과 동일), 밖은 중립 50"""
+    codes, caps, markets, industries = _make_universe()
+    agent = IndustryAgent(dart_client=_FakeDart(industries), krx_client=_FakeKrx(codes, caps, markets))
+    positions = [agent._analyze_market_position(code, "") for code in codes]
+    score_by_rank = {p["rank"]: p["score"] for p in positions if p["rank"]}
+
+    assert score_by_rank[1] == 40 + 499 / 500 * 100 * 0.5
+    assert score_by_rank[300] == 60.0
+    assert score_by_rank[500] == 40.0
+    assert score_by_rank[501] == 50 and score_by_rank[2000] == 50
+    print(f"   ✓ 1위 {score_by_rank[1]:.2f}, 300위 {score_by_rank[300]}, 500위 {score_by_rank[500]}, "
+          f"501위 {score_by_rank[501]}")
+
+
+if __name__ == "__main__":
+    test_ranks_match_sort()
+    test_agent_position()
+    test_position_score_scale()
@@ -0,0 +1,200 @@
+"""
+뉴스 저장소 검증 (합성 기사, 네트워크 불필요)
+헤드라인 정규화/SimHash 근사 중복, 소스·실행 간 중복 제거, 헤드라인 점수 캐시,
+SentimentAgent 뉴스 볼륨 집계 확인
+"""
+
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+
+from src.agents.sentiment_agent import SentimentAgent, SentimentAnalysisConfig
+from src.storage.news_store import NewsStore, NewsStory, hamming_distance, normalize_headline, simhash
+
+
+def _fingerprint(headline):
+    return simhash(normalize_headline(headline))
+
+
+def test_near_duplicates():
+    """출처 꼬리표/말머리/문장부호 차이는 중복, 내용이 다르면 별개"""
+    print("=" * 60)
+    print("헤드라인 근사 중복")
+    print("=" * 60)
+
+    duplicates = [
+        ("삼성전자, 3분기 영업이익 10조 돌파", "[속보] 삼성전자 3분기 영업이익 10조 돌파 - 한국경제"),
+        ("SK하이닉스 HBM 공급 계약 체결", "SK하이닉스, HBM 공급계약 체결 - 연합뉴스"),
+        ("현대차 美 공장 가동 시작…전기차 생산 본격화", "현대차 美 공장 가동 시작…전기차 생산 본격화 외"),
+    ]
+    distinct = [
+        ("LG에너지솔루션 유상증자 결정", "LG에너지솔루션 무상증자 결정"),
+        ("셀트리온 신약 FDA 승인 획득", "셀트리온 신약 FDA 승인 실패"),
+        ("삼성전자 주가 하락 외국인 매도세", "삼성전자 주가 상승 외국인 매수세"),
+    ]
+    for a, b in duplicates:
+        distance = hamming_distance(_fingerprint(a), _fingerprint(b))
+        print(f"  중복 {distance:2d}: {a} / {b}")
+        assert distance <= 3
+    for a, b in distinct:
+        distance = hamming_distance(_fingerprint(a), _fingerprint(b))
+        print(f"  별개 {distance:2d}: {a} / {b}")
+        assert distance > 3
+
+    assert normalize_headline("[단독] 카카오, 적자 전환…(종합) - 매일경제") == "카카오 적자 전환"
+
+
+def test_band_index_recall():
+    """해밍 거리 3 이하 스토리는 구간 색인으로 항상 검출"""
+    print("\n" + "=" * 60)
+    print("구간 색인 검출")
+    print("=" * 60)
+
+    rng = np.random.default_rng(45)
+    store = NewsStore(persist=False)
+    store._load_stories("000000")
+    base = [int(rng.integers(0, 2 ** 63)) for _ in range(300)]
+    for i, fingerprint in enumerate(base):
+        store._stories["000000"][i + 1] = NewsStory(i + 1, fingerprint, f"h{i}", "2026-10-01", "s")
+    store._rebuild_index("000000")
+
+    for i, fingerprint in enumerate(base):
+        flipped = fingerprint
+        for bit in rng.choice(64, size=int(rng.integers(0, 4)), replace=False):
+            flipped ^= 1 << int(bit)
+        assert store._find_duplicate("000000", flipped).story_id == i + 1
+    print(f"  {len(base)}건 모두 검출")
+
+
+def test_cross_source_and_reruns():
+    """소스 간 중복 제거 + 재실행 시 기존 스토리 인식 + 디스크 저장"""
+    print("\n" + "=" * 60)
+    print("소스/실행 간 중복 제거")
+    print("=" * 60)
+
+    today = datetime(2026, 10, 18)
+    naver = [{"date": "2026-10-17", "source": "네이버금융", "headline": f"삼성전자 {i}번째 신제품 공개 흑자 전환",
+              "url": f"/n/{i}"} for i in range(10)]
+    google = [{"date": "2026-10-17", "source": "한국경제", "headline": f"[속보] 삼성전자, {i}번째 신제품 공개 흑자 전환 - 한국경제",
+               "url": f"/g/{i}"} for i in range(10)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = NewsStore(store_dir=Path(tmp))
+        batch = store.add_articles("005930", naver + google, today=today)
+        print(f"  1차: 기사 {len(naver + google)}건 → 스토리 {len(batch.stories)}건, 중복 {batch.duplicates}건")
+        assert len(batch.stories) == 10 and batch.duplicates == 10 and batch.new_stories == 10
+        assert batch.stories[0]["sources"] == ["네이버금융", "한국경제"]
+        assert batch.stories[0]["headline"] == naver[0]["headline"]
+
+        # 다음 날 재실행 (새 저장소 = 프로세스 재시작)
+        fresh = [{"date": "2026-10-18", "source": "네이버금융", "headline": "삼성전자 배당 확대 발표", "url": "/n/new"}]
+        rerun = NewsStore(store_dir=Path(tmp)).add_articles("005930", fresh + google, today=today + timedelta(days=1))
+        print(f"  2차: 스토리 {len(rerun.stories)}건, 신규 {rerun.new_stories}건")
+        assert len(rerun.stories) == 11 and rerun.new_stories == 1
+        assert [s["is_new"] for s in rerun.stories[:2]] == [True, False]
+
+        # 보관 기간 경과 스토리 제거
+        later = NewsStore(store_dir=Path(tmp), retention_days=30)
+        later.add_articles("005930", [], today=today + timedelta(days=60))
+        assert later.stories("005930") == []
+
+
+def test_score_cache():
+    """헤드라인 점수는 처음 본 헤드라인만 계산, 사전 버전 변경 시 재계산"""
+    print("\n" + "=" * 60)
+    print("헤드라인 점수 캐시")
+    print("=" * 60)
+
+    calls = []
+
+    def scorer(headlines):
+        calls.append(list(headlines))
+        return [len(h) / 100 for h in headlines]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = NewsStore(store_dir=Path(tmp))
+        first = store.score_headlines(["a", "bb", "a"], scorer, version="v1")
+        assert first == [0.01, 0.02, 0.01] and calls == [["a", "bb"]]
+        assert not (Path(tmp) / "_scores.json").exists(), "새 점수가 모일 때까지 파일 기록 없음"
+        store.flush()
+
+        second_store = NewsStore(store_dir=Path(tmp))
+        second = second_store.score_headlines(["bb", "ccc"], scorer, version="v1")
+        assert second == [0.02, 0.03] and calls[-1] == ["ccc"]
+        second_store.flush()
+
+        store.score_headlines(["a"], scorer, version="v2")
+        assert calls[-1] == ["a"]
+        store.flush()
+
+        # 새 점수 score_flush_every건마다 한 번만 전체 파일 기록
+        batched = NewsStore(store_dir=Path(tmp) / "batched", score_flush_every=10)
+        writes = []
+        save_scores = batched._save_scores
+        batched._save_scores = lambda: writes.append(len(batched._scores)) or save_scores()
+        for i in range(25):
+            batched.score_headlines([f"헤드라인 {i}"], scorer, version="v1")
+        assert writes == [10, 20]
+        batched.flush()
+        batched.flush()
+        assert writes == [10, 20, 25]
+        computed = len(calls)
+        reloaded = NewsStore(store_dir=Path(tmp) / "batched")
+        reloaded.score_headlines(["헤드라인 24"], scorer, version="v1")
+        assert len(calls) == computed, "flush 후 재로드 시 재계산 없음"
+        print(f"  헤드라인 25건 → 캐시 파일 기록 {len(writes)}회")
+
+
+def test_agent_news_volume():
+    """중복 기사가 뉴스 볼륨 시그널을 부풀리지 않음"""
+    print("\n" + "=" * 60)
+    print("에이전트 뉴스 볼륨")
+    print("=" * 60)
+
+    today = datetime.now().strftime("%Y-%m-%d")
+    naver = [{"date": today, "source": "네이버금융", "headline": f"테스트 {i}호 공장 수주 흑자 전환", "url": ""}
+             for i in range(25)]
+    google = [{"date": today, "source": "연합뉴스", "headline": f"테스트, {i}호 공장 수주 흑자 전환 - 연합뉴스", "url": ""}
+              for i in range(25)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        agent = SentimentAgent(krx_client=object(), config=SentimentAnalysisConfig(sentiment_series=False),
+                               news_store=NewsStore(store_dir=Path(tmp)))
+        agent._fetch_news_naver = lambda *args, **kwargs: list(naver)
+        agent._fetch_news_google_rss = lambda *args, **kwargs: list(google)
+
+        scored = []
+        score_headlines = agent.score_headlines
+        agent.score_headlines = lambda headlines: scored.append(len(headlines)) or score_headlines(headlines)
+
+        result = agent._analyze_news_sentiment("000001", "테스트")
+        print(f"  기사 50건 → 볼륨 {result['volume']}, 중복 {result['duplicates_removed']}, "
+              f"시그널 {result['volume_signal']}")
+        assert result["volume"] == 25 and result["duplicates_removed"] == 25
+        assert result["volume_signal"] == "normal"
+        assert result["positive_count"] == 25
+
+        again = agent._analyze_news_sentiment("000001", "테스트")
+        assert again["score"] == result["score"] and scored == [25]
+        agent.news_store.flush()
+
+        undeduped = SentimentAgent(krx_client=object(), config=SentimentAnalysisConfig(news_dedup=False, sentiment_series=False))
+        undeduped._fetch_news_naver = agent._fetch_news_naver
+        undeduped._fetch_news_google_rss = agent._fetch_news_google_rss
+        assert undeduped.news_store is None
+        assert undeduped._analyze_news_sentiment("000001", "테스트")["volume_signal"] == "surge"
+
+
+if __name__ == "__main__":
+    test_near_duplicates()
+    test_band_index_recall()
+    test_cross_source_and_reruns()
+    test_score_cache()
+    test_agent_news_volume()
+    print("\n모든 테스트 통과")
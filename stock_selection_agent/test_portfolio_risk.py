@@ -0,0 +1,118 @@
+"""
+포트폴리오 리스크 검증 (합성 시세, 네트워크 불필요)
+Ledoit-Wolf 공분산을 밀집 행렬 float64 계산과 비교하고 VaR 분해 확인
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+
+from src.agents.risk_agent import RiskAgent
+from src.analytics.portfolio_risk import compute_portfolio_risk, ledoit_wolf_covariance
+from src.analytics.risk_engine import simple_returns
+from src.models.panel import PricePanel
+
+
+def _make_close(n_dates=253, n_codes=40, seed=21):
+    """공통 시장 요인 + 개별 요인 합성 시세"""
+    rng = np.random.default_rng(seed)
+    factor = rng.normal(0, 0.01, size=(n_dates, 1))
+    loadings = rng.uniform(0.5, 1.5, size=(1, n_codes))
+    returns = factor * loadings + rng.normal(0, 0.015, size=(n_dates, n_codes))
+    close = 10000 * np.exp(np.cumsum(returns, axis=0))
+    close[:220, 1] = np.nan  # 신규상장 (표본 부족 → 제외)
+    return close
+
+
+def _reference_ledoit_wolf(returns):
+    """밀집 행렬 float64 Ledoit-Wolf (항등 타깃)"""
+    x = returns - returns.mean(axis=0)
+    t, n = x.shape
+    s = x.T @ x / t
+    mu = np.trace(s) / n
+    delta = np.sum((s - mu * np.eye(n)) ** 2) / n
+    beta = sum(np.sum((np.outer(row, row) - s) ** 2) for row in x) / (t * t * n)
+    shrinkage = min(beta, delta) / delta
+    return (1 - shrinkage) * s + shrinkage * mu * np.eye(n), shrinkage
+
+
+def test_ledoit_wolf_matches_reference():
+    """블록/float32 계산 = 밀집 float64 계산"""
+    print("=" * 60)
+    print("Ledoit-Wolf 축소 공분산")
+    print("=" * 60)
+
+    returns = simple_returns(_make_close(n_codes=30))[:, 2:]
+    expected, shrinkage = _reference_ledoit_wolf(returns)
+
+    cov = ledoit_wolf_covariance(returns, block_size=7)
+    assert np.isclose(cov.shrinkage, shrinkage, rtol=1e-3)
+    assert np.allclose(cov.to_dense(block_size=8), expected, rtol=1e-3, atol=1e-9)
+
+    w = np.linspace(1, 2, returns.shape[1])
+    assert np.allclose(cov.matvec(w), expected @ w, rtol=1e-3)
+    assert np.allclose(cov.variances(), np.diag(expected), rtol=1e-3)
+    print(f"   ✓ 축소 계수 {cov.shrinkage:.4f} 일치")
+
+
+def test_var_decomposition():
+    """구성 VaR 합 = 포트폴리오 VaR, 한계 VaR = 수치 미분"""
+    close = _make_close()
+    codes = [f"{i:06d}" for i in range(close.shape[1])]
+    weights = np.linspace(1, 3, len(codes))
+
+    result = compute_portfolio_risk(close, codes, weights=weights)
+    assert result.excluded == ["000001"]
+    assert np.isclose(result.weights.sum(), 1.0)
+
+    for level in (0.95, 0.99):
+        assert np.isclose(result.component_var[level].sum(), result.parametric_var[level])
+        assert result.parametric_cvar[level] > result.parametric_var[level]
+        assert result.historical_cvar[level] >= result.historical_var[level]
+
+    # 한계 VaR 수치 미분 (비중 정규화 없이 w_i만 증가)
+    returns = simple_returns(close)[-252:][:, [c not in result.excluded for c in codes]]
+    cov = ledoit_wolf_covariance(returns)
+    mean = returns.mean(axis=0)
+    z = 1.6448536269514722
+
+    def var_of(w):
+        return -(w @ mean) + z * np.sqrt(w @ cov.matvec(w))
+
+    eps = 1e-5
+    bumped = result.weights.copy()
+    bumped[3] += eps
+    numeric = (var_of(bumped) - var_of(result.weights)) / eps
+    assert np.isclose(result.marginal_var[0.95][3], numeric, rtol=1e-3)
+
+    assert result.diversification_ratio > 1.0
+    top = result.contributions(0.95)[0]
+    print(f"   ✓ VaR95 {result.parametric_var[0.95]:.4f}, 분산투자비율 {result.diversification_ratio:.2f}")
+    print(f"   ✓ 최대 기여 종목 {top['stock_code']} ({top['contribution_pct']:.1f}%)")
+
+
+def test_agent_portfolio():
+    """RiskAgent.analyze_portfolio - 종목 선택/비중 딕셔너리"""
+    close = _make_close()
+    codes = [f"{i:06d}" for i in range(close.shape[1])]
+    panel = PricePanel(dates=[f"D{i:04d}" for i in range(close.shape[0])], codes=codes, close=close)
+
+    agent = RiskAgent()
+    basket = codes[2:12]
+    portfolio = agent.analyze_portfolio(panel, basket, weights={code: 1.0 for code in basket})
+    direct = compute_portfolio_risk(close[:, 2:12], basket)
+    assert portfolio.codes == basket
+    assert np.isclose(portfolio.parametric_var[0.99], direct.parametric_var[0.99])
+    print(f"   ✓ 10종목 바스켓 연변동성 {portfolio.annual_volatility:.1%}")
+
+
+
+
+if __name__ == "__main__":
+    test_ledoit_wolf_matches_reference()
+    test_var_decomposition()
+    test_agent_portfolio()
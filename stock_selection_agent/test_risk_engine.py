@@ -0,0 +1,114 @@
+"""
+리스크 엔진 검증 (합성 시세, 네트워크 불필요)
+배열 계산 결과를 종목별 반복문 계산과 비교
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+
+from src.agents.risk_agent import RiskAgent, norm_ppf
+from src.analytics.risk_engine import compute_risk_metrics
+from src.models.panel import PricePanel
+
+
+def _reference(prices):
+    """종목별 반복문 계산 (최근 252개 수익률, 전체 구간 MDD)"""
+    returns = np.array([prices[i] / prices[i - 1] - 1 for i in range(1, len(prices))])[-252:]
+    daily_vol = np.std(returns)
+    var_95 = -(np.mean(returns) + norm_ppf(0.05) * daily_vol)
+    threshold = np.percentile(returns, 5)
+    cvar_95 = -np.mean(returns[returns <= threshold])
+
+    peak, max_dd, dd_start, dd_end, current_start = prices[0], 0, 0, 0, 0
+    for i, price in enumerate(prices):
+        if price > peak:
+            peak, current_start = price, i
+        if (peak - price) / peak > max_dd:
+            max_dd, dd_start, dd_end = (peak - price) / peak, current_start, i
+
+    recovery = None
+    for i in range(dd_end + 1, len(prices)):
+        if prices[i] >= prices[dd_start]:
+            recovery = i - dd_end
+            break
+
+    return daily_vol * np.sqrt(252), var_95, cvar_95, max_dd, recovery
+
+
+def _make_close(n_dates=400, n_codes=50, seed=9):
+    rng = np.random.default_rng(seed)
+    close = np.round(10000 * np.exp(np.cumsum(rng.normal(0.0003, 0.022, size=(n_dates, n_codes)), axis=0)))
+    close[:150, 1] = np.nan  # 250봉 (VaR 계산 불가, MDD 가능)
+    close[:320, 2] = np.nan  # 80봉 (MDD 계산 불가)
+    close[200:205, 3] = np.nan  # 거래정지 구간
+    return close
+
+
+def test_engine_matches_reference():
+    """변동성/VaR/CVaR/MDD/회복기간 일치"""
+    print("=" * 60)
+    print("리스크 엔진 vs 종목별 계산")
+    print("=" * 60)
+
+    close = _make_close()
+    codes = [f"{i:06d}" for i in range(close.shape[1])]
+    metrics = compute_risk_metrics(close, codes, confidence_levels=[0.95, 0.99])
+
+    for col, code in enumerate(codes):
+        prices = [p for p in close[:, col] if not np.isnan(p)]
+        if col == 3:
+            # 거래정지 구간은 직전 종가로 채움
+            prices = list(np.nan_to_num(close[:, col], nan=0))
+            for i in range(len(prices)):
+                if prices[i] == 0:
+                    prices[i] = prices[i - 1]
+
+        vol, var_95, cvar_95, mdd, recovery = _reference(prices)
+
+        if len(prices) >= 252:
+            assert np.isclose(metrics.annual_volatility[col], vol), code
+            assert np.isclose(metrics.parametric_var[0.95][col], var_95), code
+            assert np.isclose(metrics.historical_cvar[0.95][col], cvar_95), code
+        else:
+            assert np.isnan(metrics.annual_volatility[col]), code
+
+        if len(prices) >= 100:
+            assert np.isclose(metrics.max_drawdown[col], mdd), code
+            expected = np.nan if recovery is None else recovery
+            assert np.isclose(metrics.recovery_days[col], expected, equal_nan=True), code
+        else:
+            assert np.isnan(metrics.max_drawdown[col]), code
+
+    valid = ~np.isnan(metrics.historical_var[0.99])
+    assert np.all(metrics.historical_cvar[0.99][valid] >= metrics.historical_var[0.99][valid] - 1e-12)
+    print(f"   ✓ {len(codes)}종목 일치")
+    print(f"   ✓ 꼬리손실(CVaR99) 상위: {[c for c, _ in metrics.ranked(metrics.historical_cvar[0.99])[:3]]}")
+
+
+def test_agent_uses_engine():
+    """RiskAgent 단일 종목 결과 = 배치 결과"""
+    close = _make_close()
+    codes = [f"{i:06d}" for i in range(close.shape[1])]
+    panel = PricePanel(dates=[f"D{i:04d}" for i in range(close.shape[0])], codes=codes, close=close)
+
+    agent = RiskAgent()
+    batch = agent.scan_market_risk(panel)
+
+    history = panel.to_history("000000")
+    single = agent._analyze_market_risk(history)
+    assert single["annual_volatility"] == round(float(batch.annual_volatility[0]), 4)
+    assert single["max_drawdown"] == round(float(batch.max_drawdown[0]), 4)
+    assert set(single["var_by_confidence"]) == {"0.95", "0.99"}
+    print(f"   ✓ 단일 종목: 변동성 {single['annual_volatility']}, VaR95 {single['var_95']}, MDD {single['max_drawdown']}")
+
+
+
+
+if __name__ == "__main__":
+    test_engine_matches_reference()
+    test_agent_uses_engine()
@@ -0,0 +1,89 @@
+"""
+RSI 분포 스캔 검증 (합성 패널, 네트워크 불필요)
+패널 1회 조회로 여러 임계값 적용, 단일 종목 RSI와 일치 확인
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+
+from src.agents.master_orchestrator import MasterOrchestrator, OrchestratorConfig
+from src.models.panel import PricePanel
+from src.models.stock import Market, Stock, StockPrice, ScreeningResult
+
+
+def _make_orchestrator(n_codes: int = 30, n_dates: int = 121):
+    rng = np.random.default_rng(11)
+    close = np.round(20000 * np.exp(np.cumsum(rng.normal(0, 0.025, size=(n_dates, n_codes)), axis=0)))
+    close[:n_dates - 10, 0] = np.nan  # 신규상장 (20봉 미만 → 제외)
+    codes = [f"{i:06d}" for i in range(n_codes)]
+    panel = PricePanel(dates=[f"2024{i:04d}" for i in range(n_dates)], codes=codes, close=close)
+
+    orchestrator = MasterOrchestrator(OrchestratorConfig(output_dir=tempfile.mkdtemp()))
+    calls = {"screening": 0, "panel": 0}
+
+    def run_screening(market="ALL", criteria=None, top_n=100):
+        calls["screening"] += 1
+        return [
+            ScreeningResult(
+                stock=Stock(code=code, name=f"종목{i}", market=Market.KOSPI),
+                price=StockPrice(stock_code=code, trade_date="20240120", close_price=int(close[-1, i] if i else 0),
+                                 market_cap=(i + 1) * 10 ** 12)
+            )
+            for i, code in enumerate(codes)
+        ]
+
+    def get_ohlcv_panel(stock_codes=None, n_bars=120, end_date=None, market="ALL"):
+        calls["panel"] += 1
+        return panel.select(stock_codes).tail(n_bars)
+
+    orchestrator.screening_agent.run_screening = run_screening
+    orchestrator.krx_client.get_ohlcv_panel = get_ohlcv_panel
+    return orchestrator, panel, calls
+
+
+def test_rsi_distribution():
+    """분포 1회 계산 후 임계값 반복 적용"""
+    print("=" * 60)
+    print("RSI 분포 스캔")
+    print("=" * 60)
+
+    orchestrator, panel, calls = _make_orchestrator()
+    distribution = orchestrator.run_rsi_scan(top_n=30)
+
+    assert calls == {"screening": 1, "panel": 1}
+    assert len(distribution) == 29, "20봉 미만 종목 제외"
+
+    oversold = distribution.below(30)
+    relaxed = distribution.below(40)
+    assert calls == {"screening": 1, "panel": 1}, "임계값 적용 시 재조회 없음"
+    assert all(e["rsi_14"] <= 40 for e in relaxed) and len(relaxed) >= len(oversold)
+    assert [e["rsi_14"] for e in distribution.entries] == sorted(e["rsi_14"] for e in distribution.entries)
+    assert sum(distribution.histogram().values()) == len(distribution)
+
+    # TechnicalAgent 단일 종목 RSI와 일치
+    for entry in distribution.entries[:5]:
+        prices = [p["close_price"] for p in panel.to_history(entry["stock_code"])]
+        rsi = orchestrator.technical_agent._calculate_rsi(prices, 14)
+        assert entry["rsi_14"] == round(rsi, 1)
+
+    # 다른 기간은 기간 무관 키만 (rsi_14로 표시하지 않음)
+    rsi_9 = orchestrator.run_rsi_scan(top_n=30, period=9)
+    assert rsi_9.period == 9 and all("rsi_14" not in e for e in rsi_9.entries)
+    assert [e["rsi"] for e in rsi_9.below(100)] == sorted(e["rsi"] for e in rsi_9.entries)
+    entry = rsi_9.entries[0]
+    prices = [p["close_price"] for p in panel.to_history(entry["stock_code"])]
+    assert entry["rsi"] == round(orchestrator.technical_agent._calculate_rsi(prices, 9), 1)
+    assert all(e["rsi"] == e["rsi_14"] for e in distribution.entries)
+
+    print(f"   ✓ 분포 요약: {distribution.summary()}")
+    print(f"   ✓ RSI<=30: {len(oversold)}개 / RSI<=40: {len(relaxed)}개")
+
+
+if __name__ == "__main__":
+    test_rsi_distribution()
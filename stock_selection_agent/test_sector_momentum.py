@@ -0,0 +1,112 @@
+"""
+업종지수 모멘텀 검증 (합성 지수, 네트워크 불필요)
+상대강도/추세/변동성을 직접 계산과 비교하고 IndustryAgent 업종 전망 반영 확인
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+import pandas as pd
+
+from src.agents.industry_agent import IndustryAgent
+from src.analytics.sector import compute_sector_momentum, percentile_rank
+from src.models.panel import PricePanel
+
+
+def _make_indices(n_dates=170, seed=11):
+    """시장지수 + 업종별 추세가 다른 합성 업종지수"""
+    rng = np.random.default_rng(seed)
+    dates = [d.strftime("%Y%m%d") for d in pd.bdate_range("2024-01-02", periods=n_dates)]
+    market = 2500 * np.exp(np.cumsum(rng.normal(0.0002, 0.01, n_dates)))
+    drifts = np.linspace(-0.002, 0.002, len(IndustryAgent.SECTOR_INDEX))
+    sectors = {}
+    for drift, name in zip(drifts, IndustryAgent.SECTOR_INDEX):
+        noise = rng.normal(drift, 0.012, n_dates)
+        sectors[name] = market * np.exp(np.cumsum(noise))
+    return dates, market, sectors
+
+
+def test_momentum_matches_direct():
+    """배치 모멘텀 = 업종별 직접 계산"""
+    print("=" * 60)
+    print("업종지수 모멘텀")
+    print("=" * 60)
+
+    dates, market, sectors = _make_indices()
+    names = list(sectors)
+    close = np.column_stack([sectors[n] for n in names])
+    close[5:8, 2] = np.nan  # 지수 결측 구간
+    panel = PricePanel(dates=dates, codes=names, close=close)
+
+    momentum = compute_sector_momentum(panel, market)
+    for col, name in enumerate(names):
+        series = sectors[name]
+        rs60 = series[-1] / series[-61] - 1 - (market[-1] / market[-61] - 1)
+        trend = series[-1] / series[-60:].mean() - 1
+        vol = np.std(np.diff(series[-61:]) / series[-61:-1], ddof=1) * np.sqrt(252)
+        assert np.isclose(momentum.relative_strength[60][col], rs60)
+        assert np.isclose(momentum.trend[col], trend)
+        assert np.isclose(momentum.volatility[col], vol)
+
+    assert np.all((momentum.score >= 0) & (momentum.score <= 100))
+    ranking = momentum.ranking()
+    assert momentum.score[momentum.index_of(ranking[0])] == momentum.score.max()
+    print(f"   ✓ {len(names)}개 업종 직접 계산과 일치, 상위: {ranking[:3]}")
+
+    ranks = percentile_rank(np.array([3.0, 1.0, np.nan, 3.0, 2.0]))
+    assert np.allclose(ranks[[0, 1, 3, 4]], [83.333333, 0, 83.333333, 33.333333])
+    assert np.isnan(ranks[2])
+    print("   ✓ 백분위 순위 (동률 평균, NaN 유지)")
+
+
+class _FakeKrx:
+    """업종지수 패널/시장지수만 제공하는 KRX 대역"""
+
+    def __init__(self):
+        self.dates, self.market, self.sectors = _make_indices()
+        self.panel_calls = 0
+
+    def _get_latest_trade_date(self):
+        return self.dates[-1]
+
+    def get_index_panel(self, indices, start_date=None, end_date=None):
+        self.panel_calls += 1
+        close = np.column_stack([self.sectors[name] for name in indices])
+        return PricePanel(dates=self.dates, codes=list(indices), close=close)
+
+    def get_index_close_series(self, index="KOSPI", start_date=None, end_date=None):
+        return dict(zip(self.dates, self.market))
+
+
+def test_agent_sector_outlook():
+    """IndustryAgent 업종 전망 = 기본 점수와 모멘텀 합성 (거래일별 1회 계산)"""
+    krx = _FakeKrx()
+    agent = IndustryAgent(krx_client=krx)
+
+    strong = agent._sector_outlook("운송")  # 가장 높은 드리프트
+    weak = agent._sector_outlook("IT/전자")  # 가장 낮은 드리프트
+    agent._sector_outlook("부동산")  # 업종지수 없음
+    assert krx.panel_calls == 1, "거래일별 1회"
+
+    assert strong["momentum"]["momentum_score"] > weak["momentum"]["momentum_score"]
+    expected = round(0.5 * strong["static_score"] + 0.5 * strong["momentum"]["momentum_score"], 1)
+    assert strong["score"] == expected
+    assert agent._sector_outlook("부동산") == {"score": 40, "static_score": 40, "momentum": None}
+
+    comment = agent._generate_comment("테스트", "운송", {}, strong["score"], {}, strong["momentum"])
+    assert "KOSPI 대비" in comment
+    print(f"   ✓ 운송 {strong['score']} (모멘텀 {strong['momentum']['momentum_score']}), "
+          f"IT/전자 {weak['score']} (모멘텀 {weak['momentum']['momentum_score']})")
+
+    static_only = IndustryAgent(krx_client=krx)
+    static_only.config.sector_momentum_weight = 0
+    assert static_only._sector_outlook("운송")["score"] == IndustryAgent.SECTOR_OUTLOOK["운송"]
+
+
+if __name__ == "__main__":
+    test_momentum_matches_direct()
+    test_agent_sector_outlook()
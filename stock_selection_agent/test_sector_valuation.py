@@ -0,0 +1,205 @@
+"""
+업종별 밸류에이션 집계 검증 (합성 PER/PBR, 네트워크 불필요)
+업종코드 그룹 평균/중앙값/절사평균을 직접 계산과 비교하고 IndustryAgent 동종업계 비교 확인
+"""
+
+import json
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+import pandas as pd
+
+from src.agents.industry_agent import IndustryAgent
+from src.agents.master_orchestrator import MasterOrchestrator, OrchestratorConfig
+from src.api.dart_client import DartClient, DartQuotaError
+from src.analytics.sector_valuation import MARKET_GROUP, compute_sector_valuations
+
+
+def _make_snapshot(n=2600, seed=21):
+    """업종별 PER 수준이 다른 합성 밸류에이션 스냅샷 + 업종코드"""
+    rng = np.random.default_rng(seed)
+    codes = [f"{i:06d}" for i in range(n)]
+    industries = rng.choice(["26410", "26299", "21210", "64190", "41221", "58221"], size=n)
+    base_per = {"26": 15.0, "21": 40.0, "64": 6.0, "41": 8.0, "58": 25.0}
+    per = np.array([base_per[code[:2]] for code in industries]) * rng.lognormal(0, 0.3, n)
+    per[rng.random(n) < 0.1] = 0  # 적자
+    pbr = rng.lognormal(0, 0.5, n)
+    df = pd.DataFrame({"PER": per, "PBR": pbr}, index=codes)
+    return df, dict(zip(codes, industries))
+
+
+def _direct_stats(values):
+    values = np.sort(values)
+    cut = int(len(values) * 0.1)
+    return values.mean(), np.median(values), values[cut:len(values) - cut].mean()
+
+
+def test_group_stats():
+    """그룹 통계 = 업종별 직접 계산"""
+    print("=" * 60)
+    print("업종별 밸류에이션 집계")
+    print("=" * 60)
+
+    df, industries = _make_snapshot()
+    codes = list(df.index)
+    start = time.perf_counter()
+    valuations = compute_sector_valuations(codes, df["PER"].to_numpy(), df["PBR"].to_numpy(), industries)
+    elapsed = time.perf_counter() - start
+
+    for prefix in ("264", "262", "26", "64", MARKET_GROUP):
+        members = [c for c in codes if prefix == MARKET_GROUP or industries[c].startswith(prefix)]
+        per = df.loc[members, "PER"].to_numpy()
+        per = per[(per > 0) & (per < 100)]
+        mean, median, trimmed = _direct_stats(per)
+        group = valuations.groups[prefix]
+        assert group.members == len(members)
+        assert group.per.count == len(per)
+        assert np.isclose(group.per.mean, mean)
+        assert np.isclose(group.per.median, median)
+        assert np.isclose(group.per.trimmed_mean, trimmed)
+
+    assert valuations.peer_group(codes[0]).group == industries[codes[0]][:3]
+    assert valuations.peer_group("999999").group == MARKET_GROUP
+    print(f"   ✓ 2600종목, 그룹 {len(valuations.groups)}개 직접 계산과 일치 ({elapsed * 1000:.0f}ms)")
+
+
+def test_peer_fallback():
+    """소그룹 종목 부족 시 상위 업종 → 시장 전체"""
+    codes = [f"{i:06d}" for i in range(12)]
+    industries = {code: ("26410" if i < 10 else "26999") for i, code in enumerate(codes)}
+    industries[codes[11]] = "99999"
+    per = np.full(12, 10.0)
+    valuations = compute_sector_valuations(codes, per, np.ones(12), industries, min_peers=5)
+
+    assert valuations.peer_group(codes[0]).group == "264"
+    assert valuations.peer_group(codes[10]).group == "26", "269 그룹 1종목 → 26"
+    assert valuations.peer_group(codes[11]).group == MARKET_GROUP
+    print("   ✓ 동종업계 단계 대체 (264 → 26 → ALL)")
+
+
+class _FakeKrx:
+    def __init__(self, df):
+        self.df = df
+        self.snapshot_calls = 0
+
+    def _get_latest_trade_date(self):
+        return "20240614"
+
+    def get_market_fundamental_snapshot(self, trade_date, market="ALL"):
+        self.snapshot_calls += 1
+        return self.df
+
+
+class _FakeDart:
+    def __init__(self, industries):
+        self.industries = industries
+
+    def get_industry_codes(self, stock_codes):
+        return {code: self.industries[code] for code in stock_codes if code in self.industries}
+
+
+def test_agent_peer_lookup():
+    """IndustryAgent 동종업계 비교는 거래일 1회 집계 후 조회만"""
+    df, industries = _make_snapshot()
+    krx = _FakeKrx(df)
+    agent = IndustryAgent(dart_client=_FakeDart(industries), krx_client=krx)
+    agent.config.sector_momentum_weight = 0
+
+    bank = next(c for c in df.index if industries[c].startswith("64") and df.loc[c, "PER"] > 0)
+    pharma = next(c for c in df.index if industries[c].startswith("21") and df.loc[c, "PER"] > 0)
+    results = [agent._analyze_peers(code, industries[code], "") for code in (bank, pharma)]
+    assert krx.snapshot_calls == 1, "거래일별 1회 집계"
+
+    bank_peers, pharma_peers = results
+    assert bank_peers["peer_group"] == "641" and pharma_peers["peer_group"] == "212"
+    assert bank_peers["sector_avg_per"] < 10 < 30 < pharma_peers["sector_avg_per"]
+    assert abs(bank_peers["per_vs_sector"] - (df.loc[bank, "PER"] - bank_peers["sector_avg_per"])) < 0.01
+
+    comment = agent._generate_comment("은행", "금융", bank_peers, 50, {})
+    assert "시장 평균" not in comment
+    print(f"   ✓ 은행 업종 PER {bank_peers['sector_avg_per']}, 제약 업종 PER {pharma_peers['sector_avg_per']}, "
+          f"스냅샷 조회 {krx.snapshot_calls}회")
+
+
+def test_industry_code_warmup():
+    """업종코드 조회는 저장 매핑만, 사전 조회는 주기 저장 + 일일 한도 도달 시 중단"""
+    codes = [f"{i:06d}" for i in range(10)]
+    with tempfile.TemporaryDirectory() as tmp:
+        client = DartClient(api_key="offline")
+        client.industry_code_file = Path(tmp) / "industry_code_mapping.json"
+        client.get_corp_code_by_stock_code = lambda code: f"corp{code}"
+        calls = []
+
+        def company_info(corp_code):
+            calls.append(corp_code)
+            if len(calls) > 7:
+                raise DartQuotaError("요청 제한 초과")
+            return {"induty_code": "26410"}
+
+        client.get_company_info = company_info
+        assert client.get_industry_codes(codes) == {} and calls == []
+
+        fetched = client.warm_industry_codes(codes, request_interval=0, save_every=3)
+        saved = json.loads(client.industry_code_file.read_text(encoding="utf-8"))["stock_to_industry"]
+        assert fetched == 7 and len(calls) == 8, "한도 오류 후 추가 호출 없음"
+        assert sorted(saved) == codes[:7]
+        assert len(client.get_industry_codes(codes)) == 7 and len(calls) == 8
+
+        # 재실행은 남은 종목만 조회
+        calls.clear()
+        resumed = DartClient(api_key="offline")
+        resumed.industry_code_file = client.industry_code_file
+        resumed.get_corp_code_by_stock_code = client.get_corp_code_by_stock_code
+        resumed.get_company_info = lambda corp_code: calls.append(corp_code) or {"induty_code": "64190"}
+        assert resumed.warm_industry_codes(codes, request_interval=0) == 3
+        assert calls == [f"corp{code}" for code in codes[7:]]
+    print("   ✓ 업종코드 사전 조회: 주기 저장, 한도 도달 시 중단, 재실행 시 이어서 조회")
+
+
+class _Records(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def test_missing_industry_codes_warning():
+    """업종코드 매핑이 비면 경고 후 시장 전체 평균, 오케스트레이터 사전 조회 단계는 호출 수 한도 전달"""
+    df, industries = _make_snapshot()
+    agent = IndustryAgent(dart_client=_FakeDart({}), krx_client=_FakeKrx(df))
+    records = _Records()
+    agent.logger.addHandler(records)
+    try:
+        code = next(c for c in df.index if df.loc[c, "PER"] > 0)
+        peers = agent._analyze_peers(code, "", "")
+    finally:
+        agent.logger.removeHandler(records)
+    assert peers["peer_group"] == MARKET_GROUP
+    assert any("업종코드 매핑 없음" in message for message in records.messages)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        orchestrator = MasterOrchestrator(OrchestratorConfig(dart_api_key="offline", output_dir=tmp))
+        calls = []
+        orchestrator.industry_agent.warm_industry_codes = lambda max_requests=None: calls.append(max_requests) or 3
+        assert orchestrator.warm_industry_codes(max_requests=500) == 3 and calls == [500]
+
+        orchestrator.dart_client = None
+        assert orchestrator.warm_industry_codes() == 0 and calls == [500]
+    print("   ✓ 업종코드 매핑 없음 경고, 오케스트레이터 사전 조회 단계")
+
+
+if __name__ == "__main__":
+    test_group_stats()
+    test_peer_fallback()
+    test_agent_peer_lookup()
+    test_industry_code_warmup()
+    test_missing_industry_codes_warning()
@@ -0,0 +1,113 @@
+"""
+센티먼트 소스 동시 수집 검증 (지연 소스 주입, 네트워크 불필요)
+소스 4개를 동시에 실행해 지연이 합계가 아닌 최댓값으로 제한되고
+제한 시간 초과/오류 소스는 중립(50) 처리되는지 확인
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.agents.sentiment_agent import SentimentAgent, SentimentAnalysisConfig
+
+
+class FakeKrx:
+    """종목명/현재가만 제공하는 KRX 대체"""
+
+    def _get_stock_name(self, stock_code):
+        return "테스트종목"
+
+    def get_stock_price(self, stock_code):
+        return {"close_price": 10000}
+
+
+def _make_agent(delays, deadline=2.0, parallel=True, fail=()):
+    """소스별 지연(초)을 주입한 에이전트"""
+    config = SentimentAnalysisConfig(parallel_sources=parallel, source_deadline_seconds=deadline,
+                                     sentiment_series=False)
+    agent = SentimentAgent(krx_client=FakeKrx(), config=config)
+    agent.dart = None
+    agent.ebest = None
+    agent.running = {"now": 0, "max": 0}  # 동시 실행 중인 소스 수
+    lock = threading.Lock()
+
+    def branch(name, score, extra):
+        def run(*args):
+            with lock:
+                agent.running["now"] += 1
+                agent.running["max"] = max(agent.running["max"], agent.running["now"])
+            try:
+                time.sleep(delays[name])
+            finally:
+                with lock:
+                    agent.running["now"] -= 1
+            if name in fail:
+                raise RuntimeError(f"{name} 실패")
+            return {"score": score, **extra}
+        return run
+
+    agent._analyze_news_sentiment = branch("news", 80, {"volume_signal": "surge"})
+    agent._analyze_analyst_sentiment = branch("analyst", 70, {"consensus": "Buy"})
+    agent._analyze_disclosure_sentiment = branch("disclosure", 60, {"positive_count": 2})
+    agent._analyze_earnings_surprise = branch("earnings", 90, {"consecutive_beats": 3})
+    return agent
+
+
+def test_latency_bounded_by_slowest():
+    """동시 실행 지연 ≈ 가장 느린 소스"""
+    print("=" * 60)
+    print("소스 동시 수집")
+    print("=" * 60)
+
+    delays = {"news": 0.4, "analyst": 0.3, "disclosure": 0.2, "earnings": 0.4}
+
+    sequential_agent, parallel_agent = _make_agent(delays, parallel=False), _make_agent(delays)
+    start = time.perf_counter()
+    sequential = sequential_agent.analyze("000001")
+    sequential_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parallel = parallel_agent.analyze("000001")
+    parallel_time = time.perf_counter() - start
+
+    print(f"  순차: {sequential_time:.2f}초, 동시: {parallel_time:.2f}초 "
+          f"(최대 동시 소스 {sequential_agent.running['max']} → {parallel_agent.running['max']})")
+    assert sequential_agent.running["max"] == 1 and parallel_agent.running["max"] == 4
+    assert parallel.timed_out_sources == []
+    assert parallel.total_score == sequential.total_score
+    assert parallel.key_drivers == sequential.key_drivers
+    assert parallel.news_score == 80 and parallel.analyst_consensus == "Buy"
+
+
+def test_deadline_degrades_to_neutral():
+    """제한 시간 초과/오류 소스는 중립"""
+    print("\n" + "=" * 60)
+    print("제한 시간 초과 처리")
+    print("=" * 60)
+
+    delays = {"news": 0.1, "analyst": 3.0, "disclosure": 0.1, "earnings": 0.1}
+    agent = _make_agent(delays, deadline=0.5, fail=("disclosure",))
+
+    start = time.perf_counter()
+    result = agent.analyze("000001")
+    elapsed = time.perf_counter() - start
+
+    print(f"  소요: {elapsed:.2f}초, 중립 처리: {result.timed_out_sources}")
+    assert result.timed_out_sources == ["analyst", "disclosure"]
+    assert result.analyst_score == 50 and result.analyst_consensus == "Hold"
+    assert result.disclosure_score == 50 and result.positive_disclosures == 0
+    assert result.news_score == 80 and result.earnings_surprise_score == 90
+
+    expected = (80 * agent.config.news_weight + 50 * agent.config.analyst_weight +
+                50 * agent.config.disclosure_weight + 90 * agent.config.earnings_surprise_weight)
+    assert result.total_score == round(expected, 1)
+
+
+if __name__ == "__main__":
+    test_latency_bounded_by_slowest()
+    test_deadline_degrades_to_neutral()
+    print("\n모든 테스트 통과")
@@ -0,0 +1,178 @@
+"""
+뉴스 센티먼트 시계열 저장소 검증 (합성 기사, 네트워크 불필요)
+일별 집계 추가 기록/재로드, 증분 감쇠 상태와 전체 재계산/직접 계산 비교,
+SentimentAgent 뉴스 분석의 감쇠 센티먼트/볼륨 급증 확인
+"""
+
+import sys
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+
+from src.agents.sentiment_agent import SentimentAgent, SentimentAnalysisConfig
+from src.storage.consensus_store import from_day, to_day
+from src.storage.sentiment_store import DAILY_DTYPE, SentimentSeriesStore, daily_aggregates, fold_series
+
+
+def test_daily_records():
+    """새 기사는 그날 집계에 더하고, 교체 모드는 기사 수가 줄어든 날 유지, 중단된 기록은 무시"""
+    print("=" * 60)
+    print("일별 집계 기록")
+    print("=" * 60)
+
+    assert DAILY_DTYPE.itemsize == 24
+    records = daily_aggregates([("2026-10-02", 0.5), ("2026-10-01", -0.6), ("2026-10-02", 0.1)])
+    assert records["day"].tolist() == [to_day("2026-10-01"), to_day("2026-10-02")]
+    assert records["count"].tolist() == [1, 2] and records["positive"].tolist() == [0, 1]
+    assert records["negative"].tolist() == [1, 0]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SentimentSeriesStore(store_dir=Path(tmp))
+        assert store.add("005930", [("2026-10-01", 0.5), ("2026-10-02", 0.4)]) == 2
+        assert store.add("005930", [("2026-10-02", -0.8)]) == 1
+        assert store.add("005930", []) == 0
+
+        # 교체 모드: 같은 수집 재실행은 변경 없음, 잘린 조회(기사 수 감소)는 유지
+        assert store.add("000660", [("2026-10-02", 0.5), ("2026-10-02", 0.2)], replace=True) == 1
+        assert store.add("000660", [("2026-10-02", 0.5), ("2026-10-02", 0.2)], replace=True) == 0
+        assert store.add("000660", [("2026-10-02", 0.5)], replace=True) == 0
+
+        series_file = Path(tmp) / "005930.bin"
+        assert series_file.stat().st_size == 3 * 24
+        with open(series_file, "ab") as f:
+            f.write(b"\x01\x02\x03")
+
+        reloaded = SentimentSeriesStore(store_dir=Path(tmp))
+        series = reloaded.series("005930")
+        print(f"  재로드: {[(from_day(r['day']), int(r['count'])) for r in series]}")
+        assert series["count"].tolist() == [1, 2]
+        np.testing.assert_allclose(series["sentiment_sum"], [0.5, -0.4])
+        assert reloaded.covered_stocks() == ["000660", "005930"]
+
+
+def _reference(series, half_life, as_of_day):
+    """직접 계산: 첫 집계일 ~ 기준일 매일 가중치 λ^(t-d)"""
+    lam = 0.5 ** (1 / half_life)
+    series = series[series["day"] <= as_of_day]
+    days = np.arange(series["day"][0], as_of_day + 1)
+    counts = np.zeros(len(days))
+    sums = np.zeros(len(days))
+    counts[series["day"] - days[0]] = series["count"]
+    sums[series["day"] - days[0]] = series["sentiment_sum"]
+    weights = lam ** (as_of_day - days)
+
+    past, today = weights[:-1], counts[-1]
+    mean = (past * counts[:-1]).sum() / past.sum()
+    variance = (past * counts[:-1] ** 2).sum() / past.sum() - mean ** 2
+    std = np.sqrt(max(variance, mean))
+    return {
+        "sentiment": (weights * sums).sum() / (weights * counts).sum(),
+        "volume": (weights * counts).sum() / weights.sum(),
+        "zscore": (today - mean) / std,
+    }
+
+
+def test_incremental_matches_reference():
+    """순서 없는 증분 추가 = 전체 재계산 = 직접 계산 (과거/첫 집계일 이전 날짜 수정 포함)"""
+    print("\n" + "=" * 60)
+    print("증분 감쇠 상태 정확성")
+    print("=" * 60)
+
+    rng = np.random.default_rng(50)
+    start = to_day("2026-05-01")
+    store = SentimentSeriesStore(half_lives=(3, 10, 30), persist=False)
+    codes = [f"{i:06d}" for i in range(20)]
+    for code in codes:
+        for _ in range(30):
+            batch = [(from_day(start + int(rng.integers(0, 120))), float(rng.uniform(-1, 1)))
+                     for _ in range(int(rng.integers(1, 15)))]
+            store.add(code, batch)
+
+    for code in codes:
+        state, rebuilt = store.state(code), fold_series(store.series(code), store.half_lives)
+        assert (state.day, state.first_day) == (rebuilt.day, rebuilt.first_day)
+        np.testing.assert_allclose(state.sums, rebuilt.sums, rtol=1e-9, atol=1e-9)
+
+    for as_of in ("2026-07-20", "2026-09-10"):  # 마지막 집계일 이전(재구성) / 이후(O(1) 이동)
+        as_of_day = to_day(as_of)
+        metrics = store.metrics(codes, as_of=as_of, min_history_days=0)
+        for code in codes:
+            row = metrics.index_of(code)
+            series = store.series(code)
+            for half_life in store.half_lives:
+                ref = _reference(series, half_life, as_of_day)
+                np.testing.assert_allclose(metrics.decayed_sentiment[half_life][row], ref["sentiment"], rtol=1e-7)
+                np.testing.assert_allclose(metrics.decayed_volume[half_life][row], ref["volume"], rtol=1e-7)
+            np.testing.assert_allclose(metrics.volume_zscore[row], _reference(series, 30, as_of_day)["zscore"],
+                                       rtol=1e-7)
+        print(f"  {len(codes)}종목 일치 (기준일 {metrics.as_of})")
+
+    empty = store.metrics(["999999"])
+    assert empty.to_dict("999999") is None and empty.volume_signal == ["normal"]
+
+    # 최소 이력 경계: 관측 일수 = min_history_days이면 z-score 계산, 하루 부족하면 NaN
+    boundary = SentimentSeriesStore(persist=False)
+    boundary.add("000001", [(from_day(start + day), 0.1) for day in range(14) for _ in range(1 + day % 3)])
+    as_of = from_day(start + 13)
+    assert boundary.metrics(["000001"], as_of=as_of, min_history_days=14).days_observed[0] == 14
+    assert not np.isnan(boundary.metrics(["000001"], as_of=as_of, min_history_days=14).volume_zscore[0])
+    assert np.isnan(boundary.metrics(["000001"], as_of=as_of, min_history_days=15).volume_zscore[0])
+
+
+class FakeKrx:
+    def _get_stock_name(self, stock_code):
+        return "테스트종목"
+
+
+def test_agent_news_series():
+    """뉴스 분석: 감쇠 센티먼트 사용, 이력 대비 당일 기사 급증 → surge, 전 종목 조회는 원격 호출 없음"""
+    print("\n" + "=" * 60)
+    print("SentimentAgent 뉴스 시계열")
+    print("=" * 60)
+
+    today = date.today()
+    history = [{"date": (today - timedelta(days=d)).strftime("%Y-%m-%d"), "source": "네이버",
+                "headline": f"테스트종목 {d}일 전 {'수주' if d % 2 else '적자'} 소식", "url": ""}
+               for d in range(1, 31) for _ in range(2)]
+    todays = [{"date": today.strftime("%Y-%m-%d"), "source": "네이버",
+               "headline": f"테스트종목 {i}호 공장 수주", "url": ""} for i in range(15)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config = SentimentAnalysisConfig(news_dedup=False)
+        agent = SentimentAgent(krx_client=FakeKrx(), config=config,
+                               sentiment_store=SentimentSeriesStore(store_dir=Path(tmp)))
+        agent._fetch_news_google_rss = lambda *args, **kwargs: []
+
+        agent._fetch_news_naver = lambda *args, **kwargs: todays[:2] + history
+        calm = agent._analyze_news_sentiment("000001", "테스트종목")
+        print(f"  평소: 시그널 {calm['volume_signal']}, z {calm['volume_zscore']}, "
+              f"감쇠 센티먼트 {calm['decayed_sentiment']}")
+        assert calm["volume_signal"] == "normal" and calm["volume_zscore"] == 0.0
+        assert calm["weighted_sentiment"] == calm["decayed_sentiment"][3.0]
+
+        agent._fetch_news_naver = lambda *args, **kwargs: todays + history
+        spike = agent._analyze_news_sentiment("000001", "테스트종목")
+        print(f"  급증: 시그널 {spike['volume_signal']}, z {spike['volume_zscore']}")
+        assert spike["volume_signal"] == "surge" and spike["volume_zscore"] > 3.0
+        assert spike["weighted_sentiment"] > calm["weighted_sentiment"]
+
+        # 전 종목 시그널: 저장된 시계열만 사용
+        agent._fetch_news_naver = None
+        signals = agent.news_volume_signals(["000001", "000002"])
+        assert signals.to_dict("000001")["volume_signal"] == "surge" and signals.to_dict("000002") is None
+        assert signals.to_dict("000001")["count_today"] == 15
+
+        disabled = SentimentAgent(krx_client=FakeKrx(), config=SentimentAnalysisConfig(sentiment_series=False))
+        assert disabled.sentiment_store is None
+
+
+if __name__ == "__main__":
+    test_daily_records()
+    test_incremental_matches_reference()
+    test_agent_news_series()
+    print("\n모든 테스트 통과")
@@ -0,0 +1,145 @@
+"""
+스트레스 엔진 검증 (합성 노출, 네트워크 불필요)
+시나리오 행렬곱 결과를 종목별 계산과 비교하고 Monte Carlo 꼬리 지표 확인
+"""
+
+import sys
+from pathlib import Path
+from statistics import NormalDist
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+
+from src.agents.risk_agent import RiskAgent
+from src.analytics.stress import (
+    DEFAULT_SCENARIOS,
+    MonteCarloConfig,
+    Scenario,
+    apply_scenarios,
+    build_exposures,
+    factor_loadings,
+    monte_carlo_stress,
+    systematic_daily_vol
+)
+
+
+class OfflineKrx:
+    """과거 구간 지수 시세만 제공하는 합성 클라이언트"""
+
+    def get_index_close_series(self, index="KOSPI", start_date=None, end_date=None):
+        return {start_date: 2000.0, end_date: 1300.0}
+
+
+def test_scenarios_match_loop():
+    """노출 @ 충격 = 종목별 시나리오 계산"""
+    print("=" * 60)
+    print("시나리오 행렬 적용")
+    print("=" * 60)
+
+    rng = np.random.default_rng(2)
+    n = 300
+    codes = [f"{i:06d}" for i in range(n)]
+    betas = list(rng.uniform(0.3, 1.8, n))
+    betas[5] = None
+    debt = list(rng.uniform(0, 3, n))
+    debt[7] = None
+    krw = list(rng.uniform(-0.5, 0.8, n))
+    sectors = [["반도체", "은행", "화학", None][i % 4] for i in range(n)]
+
+    scenarios = list(DEFAULT_SCENARIOS) + [Scenario("chip_bust", "반도체 급락", {"market": -0.05, "sector:반도체": -0.25})]
+    exposures = build_exposures(codes, betas, debt, krw, sectors)
+    weights = np.vstack([np.full(n, 1 / n), np.eye(n)[0]])
+    result = apply_scenarios(exposures, scenarios, weights)
+
+    for i in range(n):
+        beta = 1.0 if betas[i] is None else betas[i]
+        de = 1.0 if debt[i] is None else debt[i]
+        expected = [
+            beta * -0.20,
+            -5 * de * 0.02,
+            krw[i] * 0.15,
+            0.8 * -0.15,
+            beta * -0.05 + (0.8 * -0.25 if sectors[i] == "반도체" else 0.0),
+        ]
+        assert np.allclose(result.stock_returns[i], expected), codes[i]
+
+    assert np.allclose(result.portfolio_returns[0], result.stock_returns.mean(axis=0))
+    assert np.allclose(result.portfolio_returns[1], result.stock_returns[0])
+    worst, names = result.worst()
+    print(f"   ✓ {n}종목 × {len(scenarios)}시나리오 일치, 최악 시나리오 예: {names[0]} {worst[0]:.1%}")
+
+
+def test_monte_carlo():
+    """시드 재현성, 정규 근사 VaR, 포트폴리오 꼬리"""
+    n = 50
+    codes = [f"{i:06d}" for i in range(n)]
+    exposures = build_exposures(codes, betas=[1.0] * n, debt_to_equity=[0.0] * n)
+    config = MonteCarloConfig(n_paths=20_000, horizon_days=20, chunk_size=3_000, seed=7,
+                              factor_daily_vol={"market": 0.012})
+
+    first = monte_carlo_stress(exposures, np.zeros(n), config, portfolio_weights=np.full((1, n), 1 / n))
+    second = monte_carlo_stress(exposures, np.zeros(n), config, portfolio_weights=np.full((1, n), 1 / n))
+    assert np.array_equal(first.var[0.99], second.var[0.99]), "시드 고정 시 동일 결과"
+
+    # 시장 요인만 있으면 VaR99 ≈ 2.326 × 0.012 × √20
+    expected = NormalDist().inv_cdf(0.99) * 0.012 * np.sqrt(20)
+    assert np.allclose(first.var[0.99], expected, rtol=0.05)
+    assert np.all(first.cvar[0.99] >= first.var[0.99])
+    assert np.isclose(first.portfolio_var[0.99][0], first.var[0.99][0], rtol=1e-4)
+    print(f"   ✓ VaR99 {first.var[0.99][0]:.4f} (이론값 {expected:.4f})")
+
+
+def test_agent_stress():
+    """RiskAgent 스트레스 테스트 - 과거 구간 재현 + Monte Carlo"""
+    agent = RiskAgent(krx_client=OfflineKrx())
+    results = agent._perform_stress_test(
+        "000000", [{"close_price": 50000}], 1.5, {"debt_to_equity": 0.5}, annual_volatility=0.35
+    )
+    assert results["market_crash"]["estimated_loss_pct"] == -30.0
+    assert results["market_crash"]["severity"] == "high"
+    assert results["interest_rate_shock"]["estimated_loss_pct"] == -5.0
+    assert results["gfc_2008"]["estimated_loss_pct"] == -52.5  # 1.5 × -35%
+    assert results["monte_carlo"]["var_pct"]["0.99"] < results["monte_carlo"]["var_pct"]["0.95"] < 0
+    print(f"   ✓ {results['gfc_2008']['description']}: {results['gfc_2008']['estimated_loss_pct']}%")
+    print(f"   ✓ {results['monte_carlo']['description']}: VaR99 {results['monte_carlo']['var_pct']['0.99']}%")
+
+
+def test_universe_monte_carlo_total_volatility():
+    """개별 변동성에서 시장/금리/섹터 요인 분산을 모두 빼므로 시뮬레이션 표준편차 ≈ 입력 연변동성"""
+    n = 40
+    rng = np.random.default_rng(5)
+    codes = [f"{i:06d}" for i in range(n)]
+    betas = list(rng.uniform(0.5, 1.5, n))
+    debt = list(rng.uniform(0, 2, n))
+    sectors = [["반도체", "은행", None][i % 3] for i in range(n)]
+    annual_vol = list(rng.uniform(0.30, 0.60, n))
+
+    agent = RiskAgent(krx_client=OfflineKrx())
+    config = MonteCarloConfig(n_paths=40_000, horizon_days=1, chunk_size=10_000, seed=3)
+    agent.config.stress_monte_carlo = config
+
+    # 요인 분산 + 개별 분산 = 입력 분산 (해석적)
+    exposures = build_exposures(codes, betas, debt, sectors=sectors)
+    systematic = systematic_daily_vol(exposures, config)
+    daily_vol = np.array(annual_vol) / np.sqrt(252)
+    assert np.all(systematic < daily_vol)
+    assert np.allclose((factor_loadings(exposures, config) ** 2).sum(axis=0), systematic ** 2)
+    assert np.any(systematic > np.abs(exposures.values[:, 0]) * config.factor_daily_vol["market"] + 1e-6)
+
+    # 시뮬레이션: VaR99 ≈ 2.326 × 일간 변동성
+    result = agent.monte_carlo_universe(codes, betas, debt, annual_vol, sectors=sectors)
+    simulated_vol = result.var[0.99] / NormalDist().inv_cdf(0.99)
+    assert np.allclose(simulated_vol, daily_vol, rtol=0.05), np.max(np.abs(simulated_vol / daily_vol - 1))
+    print(f"   ✓ 시뮬레이션/입력 변동성 비율 {np.min(simulated_vol / daily_vol):.3f} ~ "
+          f"{np.max(simulated_vol / daily_vol):.3f}")
+
+
+
+
+if __name__ == "__main__":
+    test_scenarios_match_loop()
+    test_monte_carlo()
+    test_agent_stress()
+    test_universe_monte_carlo_total_volatility()
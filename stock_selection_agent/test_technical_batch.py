@@ -0,0 +1,124 @@
+"""
+기술적 일괄 분석 검증 (합성 시세 패널, 네트워크 불필요)
+배열 연산 결과가 단일 종목 계산과 같은지 확인
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+
+from src.api.krx_client import KrxClient
+from src.models.panel import PricePanel
+from src.agents.technical_agent import TechnicalAgent
+
+
+def _make_panel(n_dates: int = 130, n_codes: int = 40, seed: int = 7) -> PricePanel:
+    """랜덤워크 합성 패널 (일부 종목은 신규상장으로 히스토리가 짧음)"""
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(0.0005, 0.02, size=(n_dates, n_codes))
+    close = np.round(10000 * np.exp(np.cumsum(returns, axis=0)))
+    volume = np.round(rng.lognormal(12, 0.5, size=(n_dates, n_codes)))
+
+    # 신규상장 종목 (앞 구간 NaN)
+    for col, listed_bars in [(1, 10), (2, 30), (3, 61), (4, 100)]:
+        close[:n_dates - listed_bars, col] = np.nan
+        volume[:n_dates - listed_bars, col] = np.nan
+
+    # 거래량 급증
+    volume[-1, 5] = volume[-21:-1, 5].mean() * 3
+
+    dates = [f"2024{i:04d}" for i in range(n_dates)]
+    codes = [f"{i:06d}" for i in range(n_codes)]
+    return PricePanel(dates=dates, codes=codes, close=close, volume=volume)
+
+
+def _make_agent() -> TechnicalAgent:
+    krx = KrxClient()
+    krx._ticker_cache.update({f"{i:06d}": f"종목{i}" for i in range(40)})
+    return TechnicalAgent(krx_client=krx)
+
+
+def test_scan_matches_scalar():
+    """스캔 점수/지표가 단일 종목 계산과 일치"""
+    print("=" * 60)
+    print("기술적 일괄 분석 vs 단일 종목 분석")
+    print("=" * 60)
+
+    agent = _make_agent()
+    panel = _make_panel()
+    scan = agent.scan(panel)
+
+    for col, code in enumerate(panel.codes):
+        history = panel.to_history(code)
+        prices = [p["close_price"] for p in history]
+        volumes = [p.get("volume", 0) for p in history]
+
+        trend = agent._analyze_trend(prices)
+        momentum = agent._analyze_momentum(prices)
+        volume = agent._analyze_volume(volumes)
+
+        assert scan.bars[col] == len(prices), code
+        assert scan.trend_score[col] == trend["score"], (code, scan.trend_score[col], trend["score"])
+        assert scan.momentum_score[col] == momentum["score"], (code, scan.momentum_score[col], momentum["score"])
+        assert scan.volume_score[col] == volume["score"], (code, scan.volume_score[col], volume["score"])
+
+        if momentum["rsi"] is None:
+            assert np.isnan(scan.rsi[col])
+        else:
+            assert round(scan.rsi[col], 1) == momentum["rsi"]
+        if momentum["macd"] is not None:
+            assert round(scan.macd_histogram[col], 2) == momentum["macd_histogram"]
+
+        golden = any(s["type"] == "golden_cross" for s in trend["signals"])
+        death = any(s["type"] == "death_cross" for s in trend["signals"])
+        assert bool(scan.golden_cross[col]) == golden
+        assert bool(scan.death_cross[col]) == death
+
+    print(f"   ✓ {len(panel.codes)}종목 점수 일치")
+    print(f"   ✓ 과매도(RSI<30): {scan.codes_where(scan.rsi < 30)}")
+    print(f"   ✓ 정배열: {len(scan.codes_where(scan.arrangement == 1))}종목")
+
+
+def test_analyze_many_results():
+    """요청 종목만 결과 생성"""
+    agent = _make_agent()
+    panel = _make_panel()
+
+    results = agent.analyze_many(["000000", "000001", "000005", "999999"], panel=panel, include_supply_demand=False)
+
+    assert set(results) == {"000000", "000001", "000005", "999999"}
+    assert results["000001"].recommendation == "데이터 부족으로 분석 불가"
+    assert results["999999"].current_price == 0
+    assert type(results["000000"].current_price) is int
+    assert results["000000"].current_price == int(panel.close[-1, 0])
+    assert results["000005"].volume_status == "surge"
+    assert results["000000"].ma_positions, "MA120까지 계산되어야 함"
+    print(f"   ✓ 000000 종합점수: {results['000000'].total_score} ({results['000000'].ma_arrangement})")
+
+
+def test_snapshot_cache_bounded():
+    """거래일 스냅샷 캐시는 상한 내 LRU (최근 사용 항목 유지)"""
+    cache, fetched = KrxClient()._ohlcv_snapshot_cache, []
+
+    def fetch(day):
+        return lambda: fetched.append(day) or f"snapshot-{day}"
+
+    for day in ("20240101", "20240102", "20240103"):
+        KrxClient._cached_snapshot(cache, (day, "ALL"), 2, fetch(day))
+    assert list(cache) == [("20240102", "ALL"), ("20240103", "ALL")]
+
+    assert KrxClient._cached_snapshot(cache, ("20240102", "ALL"), 2, fetch("20240102")) == "snapshot-20240102"
+    KrxClient._cached_snapshot(cache, ("20240104", "ALL"), 2, fetch("20240104"))
+    assert list(cache) == [("20240102", "ALL"), ("20240104", "ALL")]
+    assert fetched == ["20240101", "20240102", "20240103", "20240104"], "캐시 적중은 재조회 없음"
+    print(f"   ✓ 스냅샷 캐시 상한 2: {[key[0] for key in cache]}")
+
+
+if __name__ == "__main__":
+    test_scan_matches_scalar()
+    test_analyze_many_results()
+    test_snapshot_cache_bounded()
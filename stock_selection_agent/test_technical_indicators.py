@@ -0,0 +1,134 @@
+"""
+보조지표 레지스트리 검증 (합성 OHLCV, 네트워크 불필요)
+배열 커널 결과를 종목별 단순 계산과 비교
+"""
+
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+import pandas as pd
+
+from src.api.krx_client import KrxClient
+from src.models.panel import PricePanel
+from src.agents.technical_agent import TechnicalAgent, TechnicalAnalysisConfig
+from src.analytics.indicator_registry import (
+    available_indicators,
+    evaluate_indicators,
+    get_indicator,
+    indicator_lookback,
+    prepare_ohlcv
+)
+
+
+def _make_ohlcv_panel(n_dates: int = 90, n_codes: int = 12, seed: int = 3) -> PricePanel:
+    """고가/저가가 있는 합성 패널 (1번 종목은 40봉만 상장)"""
+    rng = np.random.default_rng(seed)
+    close = np.round(5000 * np.exp(np.cumsum(rng.normal(0, 0.02, size=(n_dates, n_codes)), axis=0)))
+    spread = np.abs(rng.normal(0, 0.01, size=(n_dates, n_codes))) * close
+    high = np.round(close + spread)
+    low = np.round(close - spread)
+    volume = np.round(rng.lognormal(11, 0.4, size=(n_dates, n_codes)))
+
+    for arr in (close, high, low, volume):
+        arr[:n_dates - 40, 1] = np.nan
+
+    dates = [f"2024{i:04d}" for i in range(n_dates)]
+    codes = [f"{i:06d}" for i in range(n_codes)]
+    return PricePanel(dates=dates, codes=codes, close=close, high=high, low=low, volume=volume)
+
+
+def _wilder(values, period):
+    avg = sum(values[:period]) / period
+    for x in values[period:]:
+        avg = (avg * (period - 1) + x) / period
+    return avg
+
+
+def test_kernels_match_reference():
+    """볼린저/ATR/스토캐스틱을 종목별 계산과 비교"""
+    print("=" * 60)
+    print("보조지표 커널 검증")
+    print("=" * 60)
+
+    panel = _make_ohlcv_panel()
+    outputs = evaluate_indicators(["bollinger", "atr", "stochastic"], panel)
+
+    for col, code in enumerate(panel.codes):
+        valid = ~np.isnan(panel.close[:, col])
+        close = pd.Series(panel.close[valid, col])
+        high = pd.Series(panel.high[valid, col])
+        low = pd.Series(panel.low[valid, col])
+
+        # 볼린저
+        middle = close.rolling(20).mean().iloc[-1]
+        std = close.rolling(20).std(ddof=0).iloc[-1]
+        assert np.isclose(outputs["bollinger"]["upper"][col], middle + 2 * std), code
+
+        # ATR
+        prev = close.shift(1)
+        tr = pd.concat([high - low, (high - prev).abs(), (low - prev).abs()], axis=1).max(axis=1).iloc[1:]
+        assert np.isclose(outputs["atr"]["atr"][col], _wilder(list(tr), 14)), code
+
+        # 스토캐스틱 %K, %D
+        k = (close - low.rolling(14).min()) / (high.rolling(14).max() - low.rolling(14).min()) * 100
+        assert np.isclose(outputs["stochastic"]["k"][col], k.iloc[-1]), code
+        assert np.isclose(outputs["stochastic"]["d"][col], k.iloc[-3:].mean()), code
+
+    print(f"   ✓ {len(panel.codes)}종목 일치 (등록 지표: {', '.join(available_indicators())})")
+
+
+def test_lookback_from_params():
+    """필요 봉 수는 파라미터에서 계산: 정확히 그만큼 있으면 값, 한 봉 부족하면 NaN"""
+    panel = _make_ohlcv_panel(n_dates=120)
+    outputs = {"bollinger": "middle", "atr": "atr", "obv": "obv_change", "adx": "adx"}
+    cases = [("bollinger", {}), ("bollinger", {"period": 30}), ("atr", {"period": 5}),
+             ("obv", {}), ("obv", {"period": 40}), ("adx", {}), ("adx", {"period": 20})]
+
+    for name, params in cases:
+        definition = replace(get_indicator(name), params=params)
+        bars = definition.required_bars()
+        for rows, finite in ((bars, True), (bars - 1, False)):
+            ohlcv = prepare_ohlcv(panel._replace_rows(slice(120 - rows, 120)))
+            with np.errstate(divide="ignore", invalid="ignore"):
+                value = definition.kernel(ohlcv, **definition.resolved_params())[outputs[name]][0]
+            assert np.isfinite(value) == finite, (name, params, rows)
+
+    # 스토캐스틱: 전일 %D(교차 판정)까지 k_period + d_period봉
+    stochastic = replace(get_indicator("stochastic"), params={"k_period": 9, "d_period": 5})
+    assert stochastic.required_bars() == 14 and get_indicator("stochastic").required_bars() == 17
+    assert indicator_lookback(["adx", "obv"]) == 28
+    print("   ✓ 파라미터별 필요 봉 수 = 첫 유효값 봉 수")
+
+
+def test_agent_uses_registry():
+    """설정으로 지표 선택, 단일/일괄 분석 결과 일치"""
+    krx = KrxClient()
+    krx._ticker_cache.update({f"{i:06d}": f"종목{i}" for i in range(12)})
+    agent = TechnicalAgent(krx_client=krx, config=TechnicalAnalysisConfig(indicators=["adx", "obv", "unknown"]))
+    panel = _make_ohlcv_panel()
+
+    assert agent.required_history_bars() >= indicator_lookback(["adx", "obv"])
+
+    batch = agent.analyze_many(["000000", "000001"], panel=panel, include_supply_demand=False)
+    assert set(batch["000000"].indicators) == {"adx", "obv"}
+
+    for code in ("000000", "000001"):
+        single = agent._analyze_indicators(panel.select([code]))
+        assert single["values"] == batch[code].indicators, code
+
+        indicator_types = {s["type"] for s in single["signals"]}
+        collected = {s.signal_type: s.action for s in batch[code].signals}
+        for s in single["signals"]:
+            assert collected[s["type"]] == s["action"]
+        print(f"   ✓ {code} ADX {batch[code].indicators['adx']['adx']} / 시그널 {sorted(indicator_types) or '없음'}")
+
+
+if __name__ == "__main__":
+    test_kernels_match_reference()
+    test_lookback_from_params()
+    test_agent_uses_registry()